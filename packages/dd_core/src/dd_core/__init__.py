@@ -47,11 +47,13 @@ _IMPORT_STRUCTURE = {
         "ConcatData",
         "JoinData",
         "BatchData",
+        "TimedBatchData",
         "CacheData",
         "CustomDataFromList",
         "CustomDataFromIterable",
         "FileClosingIterator",
         "SerializerJsonlines",
+        "SerializerColumnar",
         "SerializerTabsepFiles",
         "SerializerFiles",
         "CocoParser",
@@ -91,6 +93,9 @@ _IMPORT_STRUCTURE = {
         "merge_boxes",
         "rescale_coords",
         "intersection_boxes",
+        "np_round_box_coords",
+        "np_valid_box_coords",
+        "intersecting_pairs",
         "convert_b64_to_np_array",
         "convert_np_array_to_b64",
         "convert_np_array_to_b64_b",
@@ -99,7 +104,13 @@ _IMPORT_STRUCTURE = {
         "convert_np_array_to_torch",
         "MetaAnnotation",
         "ImageFormats",
+        "AnnotationBoxArray",
         "Image",
+        "COLUMNAR_FORMAT_VERSION",
+        "ColumnarWriter",
+        "ColumnarReader",
+        "save_columnar",
+        "load_columnar",
         "Text_",
         "ImageAnnotationBaseView",
         "Word",
@@ -138,6 +149,7 @@ _IMPORT_STRUCTURE = {
         "maybe_get_fake_score",
         "LabelSummarizer",
         "match_anns_by_intersection",
+        "match_boxes_by_intersection",
         "match_anns_by_distance",
         "to_image",
         "maybe_load_image",
@@ -192,6 +204,7 @@ _IMPORT_STRUCTURE = {
         "detectron2_available",
         "get_detectron2_requirement",
         "tesseract_available",
+        "tesserocr_available",
         "set_tesseract_path",
         "get_tesseract_version",
         "get_tesseract_requirement",
@@ -237,6 +250,8 @@ _IMPORT_STRUCTURE = {
         "is_uuid_like",
         "get_uuid_from_str",
         "get_uuid",
+        "get_uuids",
+        "get_np_array_digest",
         "LoggingRecord",
         "logger",
         "set_logger_dir",
@@ -282,7 +297,10 @@ _IMPORT_STRUCTURE = {
         "get_pdf_file_reader",
         "get_pdf_file_writer",
         "PDFStreamer",
+        "PdfDocumentSession",
+        "PdfPage",
         "pdf_to_np_array_poppler",
+        "pdf_pages_to_np_arrays_poppler",
         "pdf_to_np_array_pdfmium",
         "pdf_to_np_array",
         "split_pdf",
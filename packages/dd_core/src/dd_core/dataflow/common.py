@@ -20,8 +20,9 @@ Some DataFlows for transforming and processing datapoints
 """
 
 import itertools
+import time
 from copy import copy
-from typing import Any, Callable, Iterator, Union
+from typing import Any, Callable, Iterator, Optional, Union
 
 import tqdm
 
@@ -364,3 +365,58 @@ class BatchData(ProxyDataFlow):
                 holder = []
         if self.remainder and len(holder) > 0:
             yield holder
+
+
+class TimedBatchData(ProxyDataFlow):
+    """
+    TimedBatchData groups datapoints into lists like `BatchData`, but flushes a batch as soon as either `batch_size`
+    datapoints have been collected or `max_wait` seconds have elapsed since the first datapoint of the batch has been
+    received. The last incomplete batch is always yielded.
+
+    As dataflows are pulled, the deadline is checked after each received datapoint. A slow upstream (e.g. rendering
+    of large pdf pages) will therefore not hold back already collected datapoints longer than the time it takes to
+    produce the next datapoint.
+
+    Example:
+        ```python
+        df produces: [c1], [c2], [c3]
+        batch_size = 2
+        yields: [[c1], [c2]], [[c3]]
+        ```
+    """
+
+    def __init__(self, df: DataFlow, batch_size: int, max_wait: Optional[float] = None) -> None:
+        """
+        Args:
+            df: A DataFlow.
+            batch_size: Maximum batch size.
+            max_wait: Maximum number of seconds a datapoint waits for the batch to be completed. If `None`, batches
+                      will only be flushed once `batch_size` datapoints have been collected.
+        """
+        super().__init__(df)
+        self.batch_size = int(batch_size)
+        if self.batch_size <= 0:
+            raise ValueError("batch_size must be a positive integer")
+        if max_wait is not None and max_wait < 0:
+            raise ValueError("max_wait must be a non-negative number")
+        self.max_wait = max_wait
+
+    def __len__(self) -> int:
+        raise NotImplementedError("Length of TimedBatchData cannot be determined in advance")
+
+    def __iter__(self) -> Iterator[Any]:
+        if not self._reset_called:
+            raise DataFlowResetStateNotCalledError()
+        holder: list[Any] = []
+        start = 0.0
+        for data in self.df:
+            if not holder:
+                start = time.perf_counter()
+            holder.append(data)
+            if len(holder) == self.batch_size or (
+                self.max_wait is not None and time.perf_counter() - start >= self.max_wait
+            ):
+                yield holder
+                holder = []
+        if holder:
+            yield holder
@@ -32,10 +32,12 @@ from lazy_imports import try_import
 from tabulate import tabulate
 from termcolor import colored
 
+from ..datapoint.columnar import ColumnarReader, ColumnarWriter
 from ..utils.context import timed_operation
 from ..utils.error import FileExtensionError
+from ..utils.file_utils import pypdfium2_available
 from ..utils.identifier import get_uuid_from_str
-from ..utils.pdf_utils import PDFStreamer
+from ..utils.pdf_utils import PdfDocumentSession, PdfPage, PDFStreamer
 from ..utils.tqdm import get_tqdm
 from ..utils.types import JsonDict, PathLikeOrStr
 from ..utils.utils import is_file_extension
@@ -48,6 +50,7 @@ with try_import() as jsonlines_import_guard:
 
 __all__ = [
     "SerializerJsonlines",
+    "SerializerColumnar",
     "SerializerFiles",
     "CocoParser",
     "SerializerCoco",
@@ -184,6 +187,70 @@ class SerializerJsonlines:
                     break
 
 
+class SerializerColumnar:
+    """
+    Serialize a dataflow from a columnar `.npz` file. Alternatively, save a dataflow of `Image`s to a `.npz` file.
+    See `dd_core.datapoint.columnar` for the file format.
+
+    Example:
+        ```python
+          df = SerializerColumnar.load("path/to/file.npz")
+          df.reset_state()
+
+          for dp in df:
+              ... # is a dict with the same structure as `Image.as_dict()`
+        ```
+    """
+
+    @staticmethod
+    def load(path: PathLikeOrStr, max_datapoints: Optional[int] = None) -> CustomDataFromIterable:
+        """
+        Args:
+            path: a path to a .npz file.
+            max_datapoints: Will stop the iteration once max_datapoints have been streamed
+
+        Returns:
+            Dataflow to iterate from. Pixels of images are read from the file while iterating.
+        """
+
+        def _iterate() -> Iterator[JsonDict]:
+            with ColumnarReader(path) as reader:
+                yield from reader
+
+        return CustomDataFromIterable(_iterate(), max_datapoints=max_datapoints)
+
+    @staticmethod
+    def save(
+        df: DataFlow,
+        path: PathLikeOrStr,
+        file_name: str,
+        max_datapoints: Optional[int] = None,
+        image_to_blob: bool = True,
+    ) -> None:
+        """
+        Writes a dataflow of `Image`s iteratively to a `.npz` file.
+
+        Args:
+            df: The dataflow to write from.
+            path: The path, the .npz file to write to.
+            file_name: name of the target file.
+            max_datapoints: maximum number of datapoint to consider writing to a file.
+            image_to_blob: Whether to save the pixels of the images.
+        """
+
+        if not os.path.isdir(path):
+            raise NotADirectoryError(path)
+        if not is_file_extension(file_name, ".npz"):
+            raise FileExtensionError(f"Expected .npz file got {path}")
+
+        df.reset_state()
+        with ColumnarWriter(os.path.join(path, file_name)) as writer:
+            for k, dp in enumerate(df):
+                if max_datapoints is not None and k >= max_datapoints:
+                    break
+                writer.write(dp, image_to_blob=image_to_blob)
+
+
 class SerializerTabsepFiles:
     """
     Serialize a dataflow from a tab separated text file. Alternatively, save a dataflow of plain text
@@ -622,12 +689,13 @@ def make_pdf_page_mapper(
     prefix: str,
     suffix: str,
     document_id: Optional[str],
-) -> Callable[[Tuple[bytes, int]], Dict[str, Any]]:
+) -> Callable[[Tuple[Union[bytes, PdfPage], int]], Dict[str, Any]]:
     """
     Build a mapping function that converts a ``(pdf_bytes, page_number)`` tuple from
-    ``PDFStreamer`` into the standard page datapoint dict.
+    ``PDFStreamer`` or a ``(pdf_page, page_number)`` tuple from ``PdfDocumentSession`` into the standard page
+    datapoint dict. Page references are passed with key ``pdf_page``, page bytes with key ``pdf_bytes``.
 
-    ``page_number`` is already 1-based (``PDFStreamer`` guarantees this).  Both
+    ``page_number`` is already 1-based (both iterables guarantee this).  Both
     ``SerializerPdfDoc.load`` and ``DoctectionPipe.bytes_to_dataflow`` use this
     helper so the two ingestion routes stay identical.
 
@@ -639,15 +707,15 @@ def make_pdf_page_mapper(
             UUID derived from ``prefix``.
 
     Returns:
-        A callable that maps ``(bytes, int)`` → ``dict``.
+        A callable that maps ``(bytes | PdfPage, int)`` → ``dict``.
     """
     _doc_id = document_id or get_uuid_from_str(prefix)
 
-    def _mapper(dp: Tuple[bytes, int]) -> Dict[str, Any]:
+    def _mapper(dp: Tuple[Union[bytes, PdfPage], int]) -> Dict[str, Any]:
         return {
             "path": path,
             "file_name": prefix + f"_{dp[1]}" + suffix,
-            "pdf_bytes": dp[0],
+            "pdf_page" if isinstance(dp[0], PdfPage) else "pdf_bytes": dp[0],
             "page_number": dp[1],
             "document_id": _doc_id,
         }
@@ -665,9 +733,12 @@ class SerializerPdfDoc:
 
         will yield datapoints:
 
-        {"path": "path/to/document.pdf", "file_name" document_page_1.pdf, "pdf_bytes": b"some-bytes"}
+        {"path": "path/to/document.pdf", "file_name" document_page_1.pdf, "pdf_page": PdfPage(...)}
         ```
 
+    If `pypdfium2` is installed, the document is parsed only once and pages are passed as `PdfPage` references to a
+    shared `PdfDocumentSession`. Otherwise, every page is passed as a single-page PDF with key `pdf_bytes`.
+
     """
 
     @staticmethod
@@ -681,14 +752,19 @@ class SerializerPdfDoc:
             document_id: A unique identifier for the document.
 
         Returns:
-            A dict with structure `{"path":... ,"file_name": ..., "pdf_bytes": ...}`. The file name is a
-            concatenation of the physical file name and the current page number.
+            A dict with structure `{"path":... ,"file_name": ..., "pdf_page": ...}` (or `"pdf_bytes"`). The file name
+            is a concatenation of the physical file name and the current page number.
         """
 
         file_name = os.path.split(path)[1]
         prefix, suffix = os.path.splitext(file_name)
         df: DataFlow
-        df = CustomDataFromIterable(PDFStreamer(path_or_bytes=path), max_datapoints=max_datapoints)
+        pages: Union[PdfDocumentSession, PDFStreamer]
+        if pypdfium2_available():
+            pages = PdfDocumentSession(path_or_bytes=path)
+        else:
+            pages = PDFStreamer(path_or_bytes=path)
+        df = CustomDataFromIterable(pages, max_datapoints=max_datapoints)
         df = MapData(df, make_pdf_page_mapper(path, prefix, suffix, document_id))
         return df
 
@@ -714,4 +790,4 @@ class SerializerPdfDoc:
         df.reset_state()
         for dp in df:
             with open(os.path.join(path_target, dp["file_name"]), "wb") as page:
-                page.write(dp["pdf_bytes"])
+                page.write(dp["pdf_page"].to_bytes() if "pdf_page" in dp else dp["pdf_bytes"])
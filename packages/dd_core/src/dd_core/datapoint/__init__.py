@@ -33,6 +33,7 @@ After all, the point here is not to provide an optimal processing environment.
 
 from .annotation import *
 from .box import *
+from .columnar import *
 from .convert import *
-from .image import Extras, Image, ImageFormats, MetaAnnotation
+from .image import AnnotationBoxArray, Extras, Image, ImageFormats, MetaAnnotation
 from .view import *
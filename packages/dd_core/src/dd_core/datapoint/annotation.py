@@ -28,6 +28,7 @@ from dataclasses import dataclass, field
 from typing import Any, Callable, Literal, Mapping, Optional, Type, TypeVar, Union
 
 import catalogue  # type: ignore
+import numpy as np
 from pydantic import (
     BaseModel,
     Field,
@@ -44,7 +45,15 @@ from ..utils.identifier import get_uuid, is_uuid_like
 from ..utils.logger import LoggingRecord, logger
 from ..utils.object_types import DefaultType, ObjectTypes, TypeOrStr, get_type
 from ..utils.types import AnnotationDict
-from .box import BoundingBox
+from .box import (
+    BoundingBox,
+    _GeometryOwners,
+    _GeometryVersion,
+    add_geometry_version,
+    bump_geometry_version,
+    construct_trusted,
+    get_geometry_versions,
+)
 
 
 def to_json_compatible(node: Any) -> Any:
@@ -268,6 +277,46 @@ T = TypeVar("T", str, list[str], None)
 A = TypeVar("A", bound="Annotation")
 
 
+class StateCache:
+    """
+    Cache of a state hash. The cached `value` is valid as long as the object has not been modified and the `key`,
+    built from the state ids of all nested objects, has not changed. A cache never takes part in equality checks.
+    """
+
+    __slots__ = ("key", "value")
+
+    def __init__(self) -> None:
+        self.key: Optional[tuple[Any, ...]] = None
+        self.value: Optional[str] = None
+
+    def get(self, key: tuple[Any, ...]) -> Optional[str]:
+        """Returns the cached value if the cache is valid for `key`"""
+        if self.key is not None and self.key == key:
+            return self.value
+        return None
+
+    def set(self, key: tuple[Any, ...], value: str) -> None:
+        """Stores `value` for `key`"""
+        self.key = key
+        self.value = value
+
+    def clear(self) -> None:
+        """Invalidates the cache"""
+        self.key = None
+        self.value = None
+
+    def __eq__(self, other: object) -> bool:
+        return other is None or isinstance(other, StateCache)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __getstate__(self) -> tuple[Optional[tuple[Any, ...]], Optional[str]]:
+        return self.key, self.value
+
+    def __setstate__(self, state: tuple[Optional[tuple[Any, ...]], Optional[str]]) -> None:
+        self.key, self.value = state
+
+
 class Annotation(BaseModel, ABC):
     """
     Abstract base class for all types of annotations. This abstract base class only implements general methods for
@@ -293,6 +342,10 @@ class Annotation(BaseModel, ABC):
         _annotation_id: Unique id for annotations. Will always be given as string representation of a md5-hash.
         service_id: Service that generated the annotation. This will be the name of a pipeline component
         model_id: Model that generated the annotation. This will be the name of a model in a component
+        _state_cache: Cache of the `state_id`. Assigning an attribute invalidates the cache. Nested annotations and
+                      images are validated through their own caches, so that only changed parts are recomputed.
+                      Modify `sub_categories` and `relationships` with the provided `dump_*`, `pop_*` and `remove_*`
+                      methods, otherwise the cache will not notice the change.
     """
 
     model_config = {
@@ -306,6 +359,7 @@ class Annotation(BaseModel, ABC):
     _annotation_id: Optional[str] = PrivateAttr(default=None)
     service_id: Optional[str] = Field(default=None)
     model_id: Optional[str] = Field(default=None)
+    _state_cache: StateCache = PrivateAttr(default_factory=StateCache)
 
     def __init__(self, **data: Any) -> None:
         """
@@ -320,6 +374,11 @@ class Annotation(BaseModel, ABC):
         if _annotation_id is not None:
             object.__setattr__(self, "_annotation_id", _annotation_id)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name != "_state_cache":
+            self._state_cache.clear()
+
     @model_validator(mode="after")
     def _setup_annotation_id(self) -> Annotation:
         """Set up annotation_id from external_id if provided."""
@@ -419,6 +478,42 @@ class Annotation(BaseModel, ABC):
         """
         return cls(**kwargs)
 
+    @classmethod
+    def from_trusted(cls: Type[A], **data: Any) -> A:
+        """
+        Fast construction path for known-good inputs, e.g. for dicts generated by `as_dict` or for predictions whose
+        boxes have already been validated. The pydantic validation is skipped entirely: Relationship ids are neither
+        checked for being uuids nor deduplicated, bounding boxes are not validated and nested annotations and images
+        are built with `from_trusted` as well. Only payloads are converted into the types of the model, i.e. category
+        names and keys into `ObjectTypes`, dicts into bounding boxes, annotations and images, while `category_id` and
+        `score` are normalized like in the constructor.
+
+        Note:
+            Only use this method for inputs you trust. Everything else must be passed to the constructor.
+
+        Args:
+            data: `Annotation` attributes, including the private `_annotation_id`
+
+        Returns:
+            Annotation instance
+        """
+        annotation_id = data.pop("_annotation_id", None)
+        data.pop("session_id", None)
+        cls._convert_trusted(data)
+        external_id = data.get("external_id")
+        if annotation_id is None and external_id is not None:
+            external_id = str(external_id)
+            annotation_id = external_id if is_uuid_like(external_id) else get_uuid(external_id)
+        annotation = construct_trusted(cls, data)
+        if annotation_id is not None:
+            # set in the same way as in `__init__`
+            object.__setattr__(annotation, "_annotation_id", annotation_id)
+        return annotation
+
+    @classmethod
+    def _convert_trusted(cls, data: dict[str, Any]) -> None:
+        """Converts the payloads of `from_trusted` in place into the types of the model"""
+
     @staticmethod
     @abstractmethod
     def get_state_attributes() -> list[str]:
@@ -430,9 +525,29 @@ class Annotation(BaseModel, ABC):
         """
         raise NotImplementedError()
 
+    def _get_nested_state_ids(self) -> tuple[str, ...]:
+        nested_state_ids: list[str] = []
+        for attribute in self.get_state_attributes():
+            attr = getattr(self, attribute)
+            if isinstance(attr, dict):
+                nested_state_ids.extend(value.state_id for value in attr.values() if isinstance(value, Annotation))
+            elif isinstance(attr, list):
+                nested_state_ids.extend(element.state_id for element in attr if isinstance(element, Annotation))
+            elif hasattr(attr, "state_id"):
+                nested_state_ids.append(attr.state_id)
+        return tuple(nested_state_ids)
+
     @property
     def state_id(self) -> str:
-        """Generate state_id from state attributes."""
+        """
+        Generate state_id from state attributes. The state id is cached and will only be recomputed, if the annotation
+        or one of its nested annotations has changed.
+        """
+        cache_key = self._get_nested_state_ids()
+        cached_state_id = self._state_cache.get(cache_key)
+        if cached_state_id is not None:
+            return cached_state_id
+
         container_ids = []
         attributes = self.get_state_attributes()
 
@@ -459,19 +574,28 @@ class Annotation(BaseModel, ABC):
             else:
                 container_ids.append(str(attr))
 
-        return get_uuid(self.annotation_id, *container_ids)
+        state_id = get_uuid(self.annotation_id, *container_ids)
+        self._state_cache.set(cache_key, state_id)
+        return state_id
 
 
 container_annotation_registry = catalogue.create("dd_core", "container_annotation_factory", entry_points=True)
 
 
-def build_container_annotation(payload: dict[str, Any]) -> ContainerAnnotation:
-    """Building container annotation from payload with registered container ann sub classes."""
-    return (
-        container_annotation_registry.get(payload["_container_type"])(**payload)
+def build_container_annotation(payload: dict[str, Any], trusted: bool = False) -> ContainerAnnotation:
+    """
+    Building container annotation from payload with registered container ann sub classes.
+
+    Args:
+        payload: dict with `ContainerAnnotation` attributes
+        trusted: If `True`, the annotation will be built with `from_trusted`.
+    """
+    container_cls = (
+        container_annotation_registry.get(payload["_container_type"])
         if "_container_type" in payload
-        else ContainerAnnotation(**payload)
+        else ContainerAnnotation
     )
+    return container_cls.from_trusted(**payload) if trusted else container_cls(**payload)
 
 
 class CategoryAnnotation(Annotation):
@@ -583,6 +707,37 @@ class CategoryAnnotation(Annotation):
             new[key_type] = deduped
         return new
 
+    @classmethod
+    def _convert_trusted(cls, data: dict[str, Any]) -> None:
+        super()._convert_trusted(data)
+        if "category_name" in data:
+            data["category_name"] = get_type(data["category_name"])
+        if "category_id" in data:
+            data["category_id"] = cls._validate_category_id(data["category_id"])
+        if data.get("score") is not None:
+            data["score"] = cls._validate_score(data["score"])
+        sub_categories = data.get("sub_categories")
+        if sub_categories:
+            data["sub_categories"] = {
+                get_type(key): (
+                    val
+                    if isinstance(val, CategoryAnnotation)
+                    else (
+                        build_container_annotation(val, trusted=True)
+                        if "value" in val
+                        else CategoryAnnotation.from_trusted(**val)
+                    )
+                )
+                for key, val in sub_categories.items()
+            }
+        elif sub_categories is None:
+            data.pop("sub_categories", None)
+        relationships = data.get("relationships")
+        if relationships:
+            data["relationships"] = {get_type(key): list(val) for key, val in relationships.items()}
+        elif relationships is None:
+            data.pop("relationships", None)
+
     def dump_sub_category(
         self, sub_category_name: TypeOrStr, annotation: CategoryAnnotation, *container_id_context: Optional[str]
     ) -> None:
@@ -617,6 +772,7 @@ class CategoryAnnotation(Annotation):
                 )
 
         self.sub_categories[key] = annotation
+        self._state_cache.clear()
 
     def get_sub_category(self, sub_category_name: ObjectTypes) -> CategoryAnnotation:
         """
@@ -640,6 +796,7 @@ class CategoryAnnotation(Annotation):
         """
 
         if key in self.sub_categories:
+            self._state_cache.clear()
             return self.sub_categories.pop(key)  # pylint: disable=E1101
         return None
 
@@ -662,6 +819,7 @@ class CategoryAnnotation(Annotation):
             self.relationships[key_type] = []
         if annotation_id not in self.relationships[key_type]:
             self.relationships[key_type].append(annotation_id)
+            self._state_cache.clear()
 
     def get_relationship(self, key: TypeOrStr) -> list[str]:
         """
@@ -688,6 +846,7 @@ class CategoryAnnotation(Annotation):
             annotation_ids: A single annotation_id or a list. Will remove only the relation with given
                             `annotation_ids`, provided not None is passed as argument.
         """
+        self._state_cache.clear()
         if annotation_ids is not None:
             if isinstance(annotation_ids, str):
                 annotation_ids = [annotation_ids]
@@ -744,6 +903,27 @@ class ImageAnnotation(CategoryAnnotation):
 
     bounding_box: Optional[BoundingBox] = Field(default=None)
     image: Optional[Any] = Field(default=None)
+    _geometry_owners: Optional[_GeometryOwners] = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in ("bounding_box", "image"):
+            for version in get_geometry_versions(self):
+                self._add_geometry_version_to_geometry(getattr(self, name), version)
+            bump_geometry_version(self)
+
+    def _add_geometry_version(self, version: _GeometryVersion) -> None:
+        # registers the geometry version of an image this annotation has been dumped to
+        if add_geometry_version(self, version):
+            self._add_geometry_version_to_geometry(self.bounding_box, version)
+            self._add_geometry_version_to_geometry(self.image, version)
+
+    @staticmethod
+    def _add_geometry_version_to_geometry(geometry: Any, version: _GeometryVersion) -> None:
+        if isinstance(geometry, BoundingBox):
+            add_geometry_version(geometry, version)
+        elif geometry is not None:
+            geometry._add_geometry_version(version)  # pylint: disable=W0212
 
     @field_validator("image", mode="before")
     @classmethod
@@ -775,6 +955,18 @@ class ImageAnnotation(CategoryAnnotation):
             return BoundingBox(**v)
         raise TypeError("bounding_box must be a BoundingBox or a dict")
 
+    @classmethod
+    def _convert_trusted(cls, data: dict[str, Any]) -> None:
+        super()._convert_trusted(data)
+        bounding_box = data.get("bounding_box")
+        if isinstance(bounding_box, dict):
+            data["bounding_box"] = BoundingBox.from_trusted(**bounding_box)
+        image = data.get("image")
+        if isinstance(image, dict):
+            from .image import Image  # pylint: disable=C0415 # local import to avoid circular import
+
+            data["image"] = Image.from_trusted(**image)
+
     def get_defining_attributes(self) -> list[str]:
         """Return attributes used to generate the annotation id."""
         return ["category_name", "bounding_box"]
@@ -890,6 +1082,21 @@ class ContainerAnnotation(CategoryAnnotation):
 
         return from_json_compatible(value)
 
+    @classmethod
+    def _convert_trusted(cls, data: dict[str, Any]) -> None:
+        super()._convert_trusted(data)
+        value = data.get("value")
+        if isinstance(value, np.generic):
+            # numpy scalars are converted by the field validation, but not by the trusted path
+            value = value.item()
+        if value is not None:
+            value = cls._deserialize_reference_value(value)
+            if isinstance(value, list) and not all(isinstance(el, str) for el in value):
+                value = [str(el) for el in value]
+            data["value"] = value
+            if data.get("value_type") is None:
+                data["value_type"] = _infer_value_type(value)
+
     @field_serializer("value")
     def _serialize_value(self, value: Any, _info: Any) -> Any:
         """Serialize ``value`` so that any nested ``ReferencePayload``/``AnnotationRef`` instances are written
@@ -908,22 +1115,11 @@ class ContainerAnnotation(CategoryAnnotation):
         if effective_type is None:
             if self.value is None:
                 return self
-            if isinstance(self.value, ReferencePayload):
-                self.value_type = "reference_payload"
-            elif isinstance(self.value, int):
-                self.value_type = "int"
-            elif isinstance(self.value, float):
-                self.value_type = "float"
-            elif isinstance(self.value, str):
-                self.value_type = "str"
-            elif isinstance(self.value, list):
-                if all(isinstance(el, str) for el in self.value):
-                    self.value_type = "list[str]"
-                else:
-                    object.__setattr__(self, "value", [str(el) for el in self.value])
-                    self.value_type = "list[str]"
-            elif isinstance(self.value, dict):
-                self.value_type = "dict[str,Any]"
+            if isinstance(self.value, list) and not all(isinstance(el, str) for el in self.value):
+                object.__setattr__(self, "value", [str(el) for el in self.value])
+            value_type = _infer_value_type(self.value)
+            if value_type is not None:
+                self.value_type = value_type
             return self
 
         if self.value is None:
@@ -1044,6 +1240,25 @@ class ContainerAnnotation(CategoryAnnotation):
         )
 
 
+def _infer_value_type(
+    value: Any,
+) -> Optional[Literal["str", "int", "float", "list[str]", "dict[str,Any]", "reference_payload"]]:
+    """Infers the `value_type` of a `ContainerAnnotation` from its value"""
+    if isinstance(value, ReferencePayload):
+        return "reference_payload"
+    if isinstance(value, int):
+        return "int"
+    if isinstance(value, float):
+        return "float"
+    if isinstance(value, str):
+        return "str"
+    if isinstance(value, list):
+        return "list[str]"
+    if isinstance(value, dict):
+        return "dict[str,Any]"
+    return None
+
+
 @container_annotation_registry.register("llm")
 class LLMContainerAnnotation(ContainerAnnotation):
     """
@@ -22,7 +22,7 @@
 from __future__ import annotations
 
 from math import floor
-from typing import Any, ClassVar, Literal, Optional, Sequence, TypedDict, Union, cast
+from typing import Any, Callable, ClassVar, Literal, Optional, Sequence, TypedDict, TypeVar, Union, cast
 
 import numpy as np
 import numpy.typing as npt
@@ -54,6 +54,9 @@ __all__ = [
     "crop_box_from_image",
     "merge_boxes",
     "rescale_coords",
+    "np_round_box_coords",
+    "np_valid_box_coords",
+    "intersecting_pairs",
 ]
 
 # taken from https://github.com/tensorpack/tensorpack/blob/master/examples/FasterRCNN/common.py
@@ -193,6 +196,74 @@ def ioa(boxes1: npt.NDArray[float32], boxes2: npt.NDArray[float32]) -> npt.NDArr
     return intersect * inv_areas
 
 
+def _get_grid_cells(
+    boxes: npt.NDArray[np.float64], origin: npt.NDArray[np.float64], cell_size: float, num_cells_x: int
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+    """Cell keys of all grid cells covered by each box, together with the index of the box for every key"""
+    cells = np.floor((boxes - np.concatenate([origin, origin])) / cell_size).astype(np.int64)
+    cells_x = cells[:, 2] - cells[:, 0] + 1
+    cells_y = cells[:, 3] - cells[:, 1] + 1
+    counts = cells_x * cells_y
+    box_indices = np.repeat(np.arange(len(boxes)), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    grid_x = cells[box_indices, 0] + offsets % cells_x[box_indices]
+    grid_y = cells[box_indices, 1] + offsets // cells_x[box_indices]
+    return grid_y * num_cells_x + grid_x, box_indices
+
+
+def intersecting_pairs(
+    boxes1: npt.NDArray[float32], boxes2: npt.NDArray[float32], max_cells_per_axis: int = 256
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64], npt.NDArray[float32]]:
+    """
+    Finds all pairs of boxes with positive intersection area without computing the dense `N×M` intersection matrix.
+
+    Both box collections are put into a uniform grid, whose cell size is the median side length of all boxes. Only pairs
+    of boxes that share a grid cell are compared, so that the costs grow with the number of overlapping pairs rather
+    than with `N·M`.
+
+    Args:
+        boxes1: A `np.array` with shape `[N, 4]` holding `N` boxes in `xyxy` format
+        boxes2: A `np.array` with shape `[M, 4]` holding `M` boxes in `xyxy` format
+        max_cells_per_axis: Upper bound for the number of grid cells along each axis. Limits the number of cells a
+                            large box is put into.
+
+    Returns:
+        Indices into `boxes1`, indices into `boxes2` and intersection areas of all intersecting pairs, sorted by the
+        index into `boxes1` and then by the index into `boxes2`. Areas are computed like in `intersection`.
+    """
+    if boxes1.shape[0] == 0 or boxes2.shape[0] == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0, dtype=float32)
+    all_boxes = np.concatenate([boxes1, boxes2]).astype(np.float64)
+    origin = all_boxes[:, :2].min(axis=0)
+    extent = float((all_boxes[:, 2:].max(axis=0) - origin).max())
+    sides = np.concatenate([all_boxes[:, 2] - all_boxes[:, 0], all_boxes[:, 3] - all_boxes[:, 1]])
+    # all boxes being degenerate to one point leaves a zero cell size
+    cell_size = max(float(np.median(sides)), extent / max_cells_per_axis) or 1.0
+    num_cells_x = int(extent // cell_size) + 2
+
+    keys1, indices1 = _get_grid_cells(all_boxes[: len(boxes1)], origin, cell_size, num_cells_x)
+    keys2, indices2 = _get_grid_cells(all_boxes[len(boxes1) :], origin, cell_size, num_cells_x)
+
+    # join both collections on their grid cells
+    order2 = np.argsort(keys2, kind="stable")
+    keys2, indices2 = keys2[order2], indices2[order2]
+    lower = np.searchsorted(keys2, keys1, side="left")
+    counts = np.searchsorted(keys2, keys1, side="right") - lower
+    candidates1 = np.repeat(indices1, counts)
+    positions = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts) + np.repeat(lower, counts)
+    candidates2 = indices2[positions]
+
+    # boxes sharing more than one cell are compared only once
+    pair_keys = np.unique(candidates1 * len(boxes2) + candidates2)
+    pairs1, pairs2 = pair_keys // len(boxes2), pair_keys % len(boxes2)
+
+    box_pairs1, box_pairs2 = boxes1[pairs1], boxes2[pairs2]
+    widths = np.minimum(box_pairs1[:, 2], box_pairs2[:, 2]) - np.maximum(box_pairs1[:, 0], box_pairs2[:, 0])
+    heights = np.minimum(box_pairs1[:, 3], box_pairs2[:, 3]) - np.maximum(box_pairs1[:, 1], box_pairs2[:, 1])
+    intersecting = (widths > 0) & (heights > 0)
+    return pairs1[intersecting], pairs2[intersecting], widths[intersecting] * heights[intersecting]
+
+
 class BoxDict(TypedDict):
     """Bounding box dict: `absolute_coords` flag and coordinates `ulx`, `uly`, `lrx`, `lry`."""
 
@@ -203,6 +274,156 @@ class BoxDict(TypedDict):
     lry: BoxCoordinate
 
 
+class _GeometryVersion:  # pylint: disable=R0903
+    """
+    Counts in-place changes of the bounding boxes and embeddings of the annotations of one `Image`. Arrays derived
+    from the boxes of many annotations (e.g. `Image.get_box_array`) store the version they have been computed for and
+    are rebuilt once the version has changed. The version never takes part in equality checks.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0
+
+    def __eq__(self, other: object) -> bool:
+        return other is None or isinstance(other, _GeometryVersion)
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+class _GeometryOwners:
+    """
+    Geometry versions of the images whose derived arrays depend on a bounding box, an annotation or a sub image.
+    Modifying the object in place bumps these versions only. Never takes part in equality checks.
+    """
+
+    __slots__ = ("versions",)
+
+    def __init__(self) -> None:
+        self.versions: list[_GeometryVersion] = []
+
+    def add(self, version: _GeometryVersion) -> bool:
+        """Adds `version` and returns `False`, if it has already been added before"""
+        for known in self.versions:
+            if known is version:
+                return False
+        self.versions.append(version)
+        return True
+
+    def bump(self) -> None:
+        """Marks the arrays of all owning images as out of date"""
+        for version in self.versions:
+            version.value += 1
+
+    def __eq__(self, other: object) -> bool:
+        return other is None or isinstance(other, _GeometryOwners)
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+def add_geometry_version(model: BaseModel, version: _GeometryVersion) -> bool:
+    """
+    Registers the geometry version of an image whose derived arrays depend on `model`. The private attribute
+    `_geometry_owners` of `model` is set directly, so that registering does not count as a modification of `model`.
+
+    Args:
+        model: A `BoundingBox`, `ImageAnnotation` or `Image` with a private attribute `_geometry_owners`
+        version: Geometry version of the owning image
+
+    Returns:
+        `False`, if `version` has already been registered for `model`
+    """
+    private = model.__pydantic_private__
+    owners = private.get("_geometry_owners")  # type: ignore[union-attr]
+    if owners is None:
+        owners = private["_geometry_owners"] = _GeometryOwners()  # type: ignore[index]
+    return owners.add(version)
+
+
+def get_geometry_versions(model: BaseModel) -> list[_GeometryVersion]:
+    """
+    Returns:
+        The geometry versions of all images whose derived arrays depend on `model`
+    """
+    owners = model.__pydantic_private__.get("_geometry_owners")  # type: ignore[union-attr]
+    return owners.versions if owners is not None else []
+
+
+def bump_geometry_version(model: BaseModel) -> None:
+    """Marks all arrays derived from the bounding boxes of `model` as out of date"""
+    owners = model.__pydantic_private__.get("_geometry_owners")  # type: ignore[union-attr]
+    if owners is not None:
+        owners.bump()
+
+
+M = TypeVar("M", bound=BaseModel)
+
+_Factories = tuple[tuple[str, Callable[[], Any]], ...]
+_TRUSTED_DEFAULTS: dict[type[BaseModel], tuple[dict[str, Any], _Factories, dict[str, Any], _Factories]] = {}
+
+
+def _get_trusted_defaults(cls: type[BaseModel]) -> tuple[dict[str, Any], _Factories, dict[str, Any], _Factories]:
+    defaults = _TRUSTED_DEFAULTS.get(cls)
+    if defaults is None:
+        attributes = (cls.model_fields, cls.__private_attributes__)
+        defaults = _TRUSTED_DEFAULTS[cls] = (
+            # fields with a factory are kept as placeholders, so that the order of the fields is preserved
+            {name: info.default if info.default_factory is None else None for name, info in attributes[0].items()},
+            tuple(
+                (name, info.default_factory)  # type: ignore
+                for name, info in attributes[0].items()
+                if info.default_factory is not None
+            ),
+            {name: attr.default if attr.default_factory is None else None for name, attr in attributes[1].items()},
+            tuple(
+                (name, attr.default_factory)  # type: ignore
+                for name, attr in attributes[1].items()
+                if attr.default_factory is not None
+            ),
+        )
+    return defaults
+
+
+def construct_trusted(cls: type[M], values: dict[str, Any]) -> M:
+    """
+    Creates an instance of a pydantic model from known-good values without any validation. Works like
+    `BaseModel.model_construct`, but resolves the defaults of the fields and of the private attributes only once per
+    class, which makes it several times faster. Values of private attributes are taken from `values` as well, other
+    keys are ignored.
+
+    Note:
+        Defaults that are not generated by a `default_factory` are not copied.
+
+    Args:
+        cls: A pydantic model class
+        values: Values of the fields and private attributes
+
+    Returns:
+        An instance of `cls`
+    """
+    field_defaults, field_factories, private_defaults, private_factories = _get_trusted_defaults(cls)
+    fields_values = field_defaults.copy()
+    private_values = private_defaults.copy()
+    for name, factory in field_factories:
+        fields_values[name] = factory()
+    for name, factory in private_factories:
+        private_values[name] = factory()
+    fields_set = set()
+    for key, value in values.items():
+        if key in fields_values:
+            fields_values[key] = value
+            fields_set.add(key)
+        elif key in private_values:
+            private_values[key] = value
+    instance = cls.__new__(cls)
+    object.__setattr__(instance, "__dict__", fields_values)
+    object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", private_values)
+    return instance
+
+
 def _round_half_up(x: float) -> int:
     return int(floor(x + 0.5))
 
@@ -212,6 +433,51 @@ def _round_half_down(x: float) -> int:
     return int(f if (x - f) <= 0.5 else f + 1)
 
 
+def np_round_box_coords(boxes: npt.NDArray[np.float64], absolute_coords: bool) -> npt.NDArray[np.int64]:
+    """
+    Vectorized version of the coordinate rounding of `BoundingBox`. Converts boxes into the integer representation
+    `BoundingBox` stores internally.
+
+    Args:
+        boxes: Array of shape Nx4 in `xyxy` format
+        absolute_coords: Whether the coordinates are absolute or relative
+
+    Returns:
+        Integer array of shape Nx4
+    """
+    boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+    if not absolute_coords:
+        return np.round(boxes * BoundingBox.RELATIVE_COORD_SCALE_FACTOR).astype(np.int64)
+    upper_left = boxes[:, :2]
+    floor_upper_left = np.floor(upper_left)
+    int_boxes = np.empty(boxes.shape, dtype=np.int64)
+    int_boxes[:, :2] = np.where(upper_left - floor_upper_left <= 0.5, floor_upper_left, floor_upper_left + 1)
+    int_boxes[:, 2:] = np.floor(boxes[:, 2:] + 0.5)
+    return int_boxes
+
+
+def np_valid_box_coords(int_boxes: npt.NDArray[np.int64], absolute_coords: bool) -> npt.NDArray[np.bool_]:
+    """
+    Vectorized version of the validation of `BoundingBox`.
+
+    Args:
+        int_boxes: Integer array of shape Nx4 as returned by `np_round_box_coords`
+        absolute_coords: Whether the coordinates are absolute or relative
+
+    Returns:
+        Boolean array of shape N, `True` for all boxes `BoundingBox` accepts
+    """
+    valid = (
+        (int_boxes[:, 0] >= 0)
+        & (int_boxes[:, 1] >= 0)
+        & (int_boxes[:, 2] > int_boxes[:, 0])
+        & (int_boxes[:, 3] > int_boxes[:, 1])
+    )
+    if not absolute_coords:
+        valid &= np.all(int_boxes <= BoundingBox.RELATIVE_COORD_SCALE_FACTOR, axis=1)
+    return valid
+
+
 class BoundingBox(BaseModel):
     """
     Rectangular bounding box that stores coordinates and allows different representations.
@@ -239,6 +505,8 @@ class BoundingBox(BaseModel):
         _uly: Upper-left y-coordinate, stored as an integer.
         _lrx: Lower-right x-coordinate, stored as an integer.
         _lry: Lower-right y-coordinate, stored as an integer.
+        _geometry_owners: Geometry versions of the images whose box arrays contain this box. Modifying a coordinate
+                          in place marks these arrays as out of date.
 
 
     """
@@ -255,6 +523,7 @@ class BoundingBox(BaseModel):
     _uly: int = PrivateAttr(default=0)
     _lrx: int = PrivateAttr(default=0)
     _lry: int = PrivateAttr(default=0)
+    _geometry_owners: Optional[_GeometryOwners] = PrivateAttr(default=None)
 
     def __init__(
         self,
@@ -293,6 +562,49 @@ class BoundingBox(BaseModel):
         object.__setattr__(self, "_lry", i_lry)
         self._validate()
 
+    @classmethod
+    def from_trusted(
+        cls,
+        absolute_coords: bool,
+        ulx: BoxCoordinate,
+        uly: BoxCoordinate,
+        lrx: BoxCoordinate,
+        lry: BoxCoordinate,
+    ) -> BoundingBox:
+        """
+        Fast construction path for known-good coordinates, e.g. for dicts generated by `as_dict` or for boxes that
+        have already been validated with `np_valid_box_coords`. Coordinates are rounded like in the constructor, but
+        the box is not validated.
+
+        Args:
+            absolute_coords: Absolute or relative coordinates
+            ulx: Upper left x
+            uly: Upper left y
+            lrx: Lower right x
+            lry: Lower right y
+
+        Returns:
+            BoundingBox instance
+        """
+        if absolute_coords:
+            values = {
+                "absolute_coords": True,
+                "_ulx": _round_half_down(float(ulx)),
+                "_uly": _round_half_down(float(uly)),
+                "_lrx": _round_half_up(float(lrx)),
+                "_lry": _round_half_up(float(lry)),
+            }
+        else:
+            scale = cls.RELATIVE_COORD_SCALE_FACTOR
+            values = {
+                "absolute_coords": False,
+                "_ulx": round(ulx * scale),
+                "_uly": round(uly * scale),
+                "_lrx": round(lrx * scale),
+                "_lry": round(lry * scale),
+            }
+        return construct_trusted(cls, values)
+
     @model_serializer(mode="plain")
     def _serialize(self) -> dict[str, Any]:
         return {
@@ -334,6 +646,7 @@ class BoundingBox(BaseModel):
         else:
             new_val = round(value * self.RELATIVE_COORD_SCALE_FACTOR)
         object.__setattr__(self, "_ulx", new_val)
+        bump_geometry_version(self)
         self._validate_width(self._lrx, self._ulx)
 
     @property
@@ -349,6 +662,7 @@ class BoundingBox(BaseModel):
         else:
             new_val = round(value * self.RELATIVE_COORD_SCALE_FACTOR)
         object.__setattr__(self, "_uly", new_val)
+        bump_geometry_version(self)
         self._validate_height(self._lry, self._uly)
 
     @property
@@ -364,6 +678,7 @@ class BoundingBox(BaseModel):
         else:
             new_val = round(value * self.RELATIVE_COORD_SCALE_FACTOR)
         object.__setattr__(self, "_lrx", new_val)
+        bump_geometry_version(self)
         self._validate_width(self._lrx, self._ulx)
 
     @property
@@ -379,6 +694,7 @@ class BoundingBox(BaseModel):
         else:
             new_val = round(value * self.RELATIVE_COORD_SCALE_FACTOR)
         object.__setattr__(self, "_lry", new_val)
+        bump_geometry_version(self)
         self._validate_height(self._lry, self._uly)
 
     @property
@@ -398,6 +714,7 @@ class BoundingBox(BaseModel):
         else:
             new_lrx = self._ulx + _round_half_up(float(value))
         object.__setattr__(self, "_lrx", new_lrx)
+        bump_geometry_version(self)
         self._validate_width(self._lrx, self._ulx)
 
     @property
@@ -417,6 +734,7 @@ class BoundingBox(BaseModel):
         else:
             new_lry = self._uly + _round_half_up(float(value))
         object.__setattr__(self, "_lry", new_lry)
+        bump_geometry_version(self)
         self._validate_height(self._lry, self._uly)
 
     @property
@@ -0,0 +1,601 @@
+# -*- coding: utf-8 -*-
+# File: columnar.py
+
+# Copyright 2025 Dr. Janis Meyer. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Binary columnar serialization of `Image`s.
+
+Images are saved to a `.npz` archive, i.e. a zip file of NumPy arrays. All annotations of all images, including
+sub categories and summaries, are rows of one annotation table. Every attribute of the table (ids, category names,
+category ids, scores, bounding boxes, ...) is stored as an array of its own, so that it can be read without reading
+the other ones. Relationships and embeddings are stored in tables of their own. Pixels are stored as raw arrays.
+
+String columns are stored as one UTF-8 encoded array of all values together with the character offsets of the
+values, values of mixed types (e.g. `external_id` or the `value` of a `ContainerAnnotation`) as JSON strings.
+
+Loading the archive returns the same dicts as `Image.as_dict`, with the pixels as `np.array`s instead of `base64`
+strings. Hence, `Image(**image_dict)` or the faster `Image.from_trusted(**image_dict)` restore exactly the image that
+has been saved to `JSON`.
+
+Example:
+    ```python
+    save_columnar([image_1, image_2], "path/to/images.npz")
+
+    with ColumnarReader("path/to/images.npz") as reader:
+        category_names = reader.column("annotation.category_name")  # only reads the category names
+        images = [Image(**image_dict) for image_dict in reader]
+    ```
+"""
+from __future__ import annotations
+
+import json
+import zipfile
+from collections import defaultdict
+from os import fspath
+from types import TracebackType
+from typing import Any, Iterator, Optional, Sequence, Union
+
+import numpy as np
+import numpy.typing as npt
+
+from ..utils.object_types import ObjectTypes
+from ..utils.types import ImageDict, JsonDict, PathLikeOrStr, PixelValues
+from .annotation import CategoryAnnotation, ContainerAnnotation, ImageAnnotation, to_json_compatible
+from .box import BoundingBox
+from .image import Image
+
+__all__ = ["COLUMNAR_FORMAT_VERSION", "ColumnarWriter", "ColumnarReader", "save_columnar", "load_columnar"]
+
+COLUMNAR_FORMAT_VERSION = 1
+_FORMAT_NAME = "dd_core.columnar"
+_META_KEY = "meta"
+
+# position of an annotation row in the image
+_ROLE_ANNOTATION = 0
+_ROLE_SUB_CATEGORY = 1
+_ROLE_SUMMARY = 2
+
+# annotation class of an annotation row, which determines the keys of the annotation dict
+_KIND_CATEGORY = 0
+_KIND_IMAGE = 1
+_KIND_CONTAINER = 2
+
+_JSON_COLUMNS = frozenset(("image.external_id", "annotation.external_id", "annotation.value", "annotation.extra"))
+_BASE_CLASSES = (CategoryAnnotation, ImageAnnotation, ContainerAnnotation)
+_BASE_KEYS = {"_annotation_id", *ImageAnnotation.model_fields, *ContainerAnnotation.model_fields}
+
+ColumnValues = Union[npt.NDArray[Any], list[Any]]
+
+
+def _dump_json(value: Any) -> str:
+    return json.dumps(value)
+
+
+def _get_value(category: Union[ObjectTypes, str]) -> str:
+    return category.value if isinstance(category, ObjectTypes) else category
+
+
+def _box_coords(box: Optional[BoundingBox]) -> tuple[float, float, float, float]:
+    if box is None:
+        return (np.nan, np.nan, np.nan, np.nan)
+    return (box.ulx, box.uly, box.lrx, box.lry)
+
+
+def _box_dict(coords: Sequence[float], absolute_coords: bool) -> Optional[dict[str, Any]]:
+    if coords[0] != coords[0]:  # NaN
+        return None
+    if absolute_coords:
+        return {
+            "absolute_coords": True,
+            "ulx": int(coords[0]),
+            "uly": int(coords[1]),
+            "lrx": int(coords[2]),
+            "lry": int(coords[3]),
+        }
+    return {"absolute_coords": False, "ulx": coords[0], "uly": coords[1], "lrx": coords[2], "lry": coords[3]}
+
+
+class ColumnarWriter:
+    """
+    Writes `Image`s to a columnar `.npz` archive. Pixels are written to the archive as soon as an image is added,
+    annotation columns are written when the writer is closed. Hence, images of a dataflow can be saved without
+    keeping them in memory.
+
+    Example:
+        ```python
+        with ColumnarWriter("path/to/images.npz") as writer:
+            for image in df:
+                writer.write(image)
+        ```
+    """
+
+    def __init__(self, path: PathLikeOrStr, compress: bool = True) -> None:
+        """
+        Args:
+            path: Path of the `.npz` file.
+            compress: Whether to compress the archive with zlib. Compression is lossless.
+        """
+        self.path = fspath(path)
+        self.metadata: JsonDict = {}
+        self._zip = zipfile.ZipFile(  # pylint: disable=R1732
+            self.path,
+            mode="w",
+            compression=zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED,
+            compresslevel=1 if compress else None,
+            allowZip64=True,
+        )
+        self._images: defaultdict[str, list[Any]] = defaultdict(list)
+        self._embeddings: defaultdict[str, list[Any]] = defaultdict(list)
+        self._annotations: defaultdict[str, list[Any]] = defaultdict(list)
+        self._relationships: defaultdict[str, list[Any]] = defaultdict(list)
+
+    def write(self, image: Image, image_to_blob: bool = True) -> None:
+        """
+        Adds an image with all its annotations and all images of its annotations.
+
+        Args:
+            image: The image to add.
+            image_to_blob: Whether to save the pixels of the image and of the images of its annotations.
+        """
+        self._add_image(image, -1, image_to_blob)
+
+    def close(self) -> None:
+        """Writes all columns and closes the archive."""
+        if self._zip.fp is None:
+            return
+        images, embeddings, annotations = self._images, self._embeddings, self._annotations
+        for name in ("file_name", "location", "document_id", "image_id"):
+            self._write_strings(f"image.{name}", images[name])
+        self._write_strings("image.external_id", images["external_id"])
+        self._write_array("image.page_number", np.asarray(images["page_number"], dtype=np.int64))
+        self._write_array("image.parent", np.asarray(images["parent"], dtype=np.int64))
+        self._write_array("image.summary", np.asarray(images["summary"], dtype=np.int64))
+        self._write_array("image.has_pixels", np.asarray(images["has_pixels"], dtype=bool))
+        self._write_boxes("image.bbox", images["bbox"], images["bbox_absolute"])
+
+        self._write_array("embedding.image", np.asarray(embeddings["image"], dtype=np.int64))
+        self._write_strings("embedding.key", embeddings["key"])
+        self._write_boxes("embedding.box", embeddings["box"], embeddings["box_absolute"])
+
+        for name in ("image", "parent", "image_ref", "category_id"):
+            self._write_array(f"annotation.{name}", np.asarray(annotations[name], dtype=np.int64))
+        for name in ("role", "kind"):
+            self._write_array(f"annotation.{name}", np.asarray(annotations[name], dtype=np.uint8))
+        self._write_array("annotation.active", np.asarray(annotations["active"], dtype=bool))
+        self._write_array("annotation.score", np.asarray(annotations["score"], dtype=np.float64))
+        for name in (
+            "key",
+            "annotation_id",
+            "category_name",
+            "service_id",
+            "model_id",
+            "external_id",
+            "value",
+            "extra",
+        ):
+            self._write_strings(f"annotation.{name}", annotations[name])
+        self._write_boxes("annotation.box", annotations["box"], annotations["box_absolute"])
+
+        self._write_array("relationship.annotation", np.asarray(self._relationships["annotation"], dtype=np.int64))
+        self._write_strings("relationship.key", self._relationships["key"])
+        self._write_array("relationship.num_ids", np.asarray(self._relationships["num_ids"], dtype=np.int64))
+        self._write_strings("relationship.ids", self._relationships["ids"])
+
+        meta = {"format": _FORMAT_NAME, "version": COLUMNAR_FORMAT_VERSION, "metadata": self.metadata}
+        self._write_array(_META_KEY, np.frombuffer(json.dumps(meta).encode("utf-8"), dtype=np.uint8))
+        self._zip.close()
+
+    def __enter__(self) -> ColumnarWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def _add_image(self, image: Image, parent: int, image_to_blob: bool) -> int:
+        images = self._images
+        row = len(images["image_id"])
+        images["file_name"].append(image.file_name)
+        images["location"].append(fspath(image.location))
+        images["external_id"].append(_dump_json(image.external_id))
+        images["document_id"].append(image.document_id)
+        images["page_number"].append(image.page_number)
+        images["image_id"].append(image.image_id)
+        images["parent"].append(parent)
+        bbox = image._bbox  # pylint: disable=W0212
+        images["bbox"].append(_box_coords(bbox))
+        images["bbox_absolute"].append(bbox.absolute_coords if bbox is not None else False)
+        images["summary"].append(-1)
+        pixels = image.image if image_to_blob else None
+        images["has_pixels"].append(pixels is not None)
+        if pixels is not None:
+            self._write_array(f"pixels.{row}", pixels)
+
+        for key, box in image.embeddings.items():
+            self._embeddings["image"].append(row)
+            self._embeddings["key"].append(key)
+            self._embeddings["box"].append(_box_coords(box))
+            self._embeddings["box_absolute"].append(box.absolute_coords)
+
+        for ann in image.annotations:
+            self._add_annotation(ann, row, -1, None, _ROLE_ANNOTATION, image_to_blob)
+        summary = image._summary  # pylint: disable=W0212
+        if summary is not None:
+            images["summary"][row] = self._add_annotation(summary, row, -1, None, _ROLE_SUMMARY, image_to_blob)
+        return row
+
+    def _add_annotation(
+        self,
+        ann: CategoryAnnotation,
+        image_row: int,
+        parent: int,
+        key: Optional[ObjectTypes],
+        role: int,
+        image_to_blob: bool,
+    ) -> int:
+        annotations = self._annotations
+        row = len(annotations["annotation_id"])
+        if isinstance(ann, ImageAnnotation):
+            kind = _KIND_IMAGE
+        elif isinstance(ann, ContainerAnnotation):
+            kind = _KIND_CONTAINER
+        else:
+            kind = _KIND_CATEGORY
+
+        annotations["image"].append(image_row)
+        annotations["parent"].append(parent)
+        annotations["key"].append(_get_value(key) if key is not None else None)
+        annotations["role"].append(role)
+        annotations["kind"].append(kind)
+        annotations["annotation_id"].append(ann._annotation_id)  # pylint: disable=W0212
+        annotations["category_name"].append(_get_value(ann.category_name))
+        annotations["category_id"].append(ann.category_id)
+        annotations["score"].append(ann.score if ann.score is not None else np.nan)
+        annotations["active"].append(ann.active)
+        annotations["service_id"].append(ann.service_id)
+        annotations["model_id"].append(ann.model_id)
+        annotations["external_id"].append(_dump_json(ann.external_id))
+        box = ann.bounding_box if isinstance(ann, ImageAnnotation) else None
+        annotations["box"].append(_box_coords(box))
+        annotations["box_absolute"].append(box.absolute_coords if box is not None else False)
+        annotations["image_ref"].append(-1)
+        annotations["value"].append(
+            _dump_json(to_json_compatible(ann.value)) if isinstance(ann, ContainerAnnotation) else None
+        )
+        if type(ann) in _BASE_CLASSES:
+            annotations["extra"].append(None)
+        else:
+            # attributes of registered sub classes, e.g. of `LLMContainerAnnotation`
+            extra = {
+                name: value
+                for name, value in ann.model_dump(by_alias=True, exclude={"sub_categories", "image"}).items()
+                if name not in _BASE_KEYS
+            }
+            annotations["extra"].append(_dump_json(extra) if extra else None)
+
+        for sub_key, sub_ann in ann.sub_categories.items():
+            self._add_annotation(sub_ann, image_row, row, sub_key, _ROLE_SUB_CATEGORY, image_to_blob)
+        for rel_key, ids in ann.relationships.items():
+            self._relationships["annotation"].append(row)
+            self._relationships["key"].append(_get_value(rel_key))
+            self._relationships["num_ids"].append(len(ids))
+            self._relationships["ids"].extend(ids)
+        if isinstance(ann, ImageAnnotation) and isinstance(ann.image, Image):
+            annotations["image_ref"][row] = self._add_image(ann.image, row, image_to_blob)
+        return row
+
+    def _write_array(self, name: str, array: npt.NDArray[Any]) -> None:
+        with self._zip.open(f"{name}.npy", mode="w", force_zip64=True) as file:
+            np.lib.format.write_array(file, np.asanyarray(array), allow_pickle=False)
+
+    def _write_strings(self, name: str, values: Sequence[Optional[str]]) -> None:
+        texts = ["" if value is None else value for value in values]
+        offsets = np.zeros(len(texts) + 1, dtype=np.int64)
+        np.cumsum([len(text) for text in texts], out=offsets[1:])
+        self._write_array(name, np.frombuffer("".join(texts).encode("utf-8"), dtype=np.uint8))
+        self._write_array(f"{name}.offsets", offsets)
+        nulls = np.fromiter((value is None for value in values), dtype=bool, count=len(values))
+        if nulls.any():
+            self._write_array(f"{name}.null", nulls)
+
+    def _write_boxes(self, name: str, boxes: Sequence[tuple[float, float, float, float]], absolute: list[bool]) -> None:
+        self._write_array(name, np.asarray(boxes, dtype=np.float64).reshape(-1, 4))
+        self._write_array(f"{name}_absolute", np.asarray(absolute, dtype=bool))
+
+
+class ColumnarReader:
+    """
+    Reads a columnar `.npz` archive written by `ColumnarWriter`. Columns are read from the archive when they are
+    accessed for the first time. Iterating over the reader yields the dicts of the images that have been added to
+    the writer, in the same order. The images of annotations are part of the dicts of their annotations.
+
+    Example:
+        ```python
+        with ColumnarReader("path/to/images.npz") as reader:
+            scores = reader.column("annotation.score")
+            image = Image(**reader.get_image_dict(0))
+        ```
+    """
+
+    def __init__(self, path: PathLikeOrStr) -> None:
+        """
+        Args:
+            path: Path of the `.npz` file.
+
+        Raises:
+            ValueError: If the file is not a columnar archive of a supported version.
+        """
+        self.path = fspath(path)
+        self._files = np.load(self.path, allow_pickle=False)
+        if _META_KEY not in self._files:
+            self._files.close()
+            raise ValueError(f"{self.path} is not a columnar archive")
+        meta = json.loads(self._files[_META_KEY].tobytes().decode("utf-8"))
+        if meta.get("format") != _FORMAT_NAME or meta.get("version", 0) > COLUMNAR_FORMAT_VERSION:
+            self._files.close()
+            raise ValueError(f"Unsupported columnar archive {self.path}: {meta.get('format')}, {meta.get('version')}")
+        self.metadata: JsonDict = meta["metadata"]
+        self._columns: dict[str, ColumnValues] = {}
+        self._index: Optional[_ColumnarIndex] = None
+
+    @property
+    def columns(self) -> list[str]:
+        """Names of all columns of the archive."""
+        return sorted(
+            name
+            for name in self._files.files
+            if name != _META_KEY
+            and not name.startswith("pixels.")
+            and not name.endswith((".offsets", ".null", "_absolute"))
+        )
+
+    def column(self, name: str) -> ColumnValues:
+        """
+        Returns a column of the archive. String columns are returned as lists of `str`, JSON columns as lists of
+        the decoded values and all other columns as `np.array`s. Bounding boxes are returned as arrays of shape
+        `(N, 4)` with `nan`s for missing boxes.
+
+        Args:
+            name: Column name, e.g. `annotation.category_name` or `annotation.box`.
+
+        Returns:
+            The values of the column.
+        """
+        values = self._columns.get(name)
+        if values is None:
+            if f"{name}.offsets" in self._files:
+                values = self._read_strings(name)
+                if name in _JSON_COLUMNS:
+                    values = [json.loads(value) if value is not None else None for value in values]
+            else:
+                values = self._files[name]
+            self._columns[name] = values
+        return values
+
+    def get_pixels(self, image_row: int) -> Optional[PixelValues]:
+        """
+        Args:
+            image_row: Row of the image in the image table.
+
+        Returns:
+            The pixels of the image, if they have been saved.
+        """
+        if not self.column("image.has_pixels")[image_row]:
+            return None
+        return self._files[f"pixels.{image_row}"]
+
+    def get_image_dict(self, index: int) -> ImageDict:
+        """
+        Args:
+            index: The position of the image, i.e. the number of images that have been written before the image.
+
+        Returns:
+            The dict of the image, the same as `Image.as_dict` but with pixels as `np.array`.
+        """
+        return self._image_dict(self._get_index().roots[index])
+
+    def __len__(self) -> int:
+        return len(self._get_index().roots)
+
+    def __iter__(self) -> Iterator[ImageDict]:
+        for image_row in self._get_index().roots:
+            yield self._image_dict(image_row)
+
+    def close(self) -> None:
+        """Closes the archive."""
+        self._files.close()
+
+    def __enter__(self) -> ColumnarReader:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def _read_strings(self, name: str) -> list[Optional[str]]:
+        text = self._files[name].tobytes().decode("utf-8")
+        offsets = self._files[f"{name}.offsets"].tolist()
+        values: list[Optional[str]] = [text[start:end] for start, end in zip(offsets, offsets[1:])]
+        if f"{name}.null" in self._files:
+            for row in np.flatnonzero(self._files[f"{name}.null"]).tolist():
+                values[row] = None
+        return values
+
+    def _get_index(self) -> _ColumnarIndex:
+        if self._index is None:
+            self._index = _ColumnarIndex(self)
+        return self._index
+
+    def _image_dict(self, image_row: int) -> ImageDict:
+        index = self._get_index()
+        summary_row = index.image_summary[image_row]
+        return {
+            "file_name": index.image_file_name[image_row],
+            "location": index.image_location[image_row],
+            "external_id": index.image_external_id[image_row],
+            "document_id": index.image_document_id[image_row],
+            "page_number": index.image_page_number[image_row],
+            "embeddings": {
+                index.embedding_key[row]: index.embedding_box[row] for row in index.image_embeddings[image_row]
+            },
+            "annotations": [self._annotation_dict(row) for row in index.image_annotations[image_row]],
+            "_bbox": index.image_bbox[image_row],
+            "_image": self.get_pixels(image_row),
+            "_summary": self._annotation_dict(summary_row) if summary_row >= 0 else None,
+            "_image_id": index.image_id[image_row],
+        }
+
+    def _annotation_dict(self, row: int) -> JsonDict:
+        index = self._get_index()
+        ann: JsonDict = {
+            "active": index.active[row],
+            "external_id": index.external_id[row],
+            "service_id": index.service_id[row],
+            "model_id": index.model_id[row],
+            "category_name": index.category_name[row],
+            "category_id": index.category_id[row],
+            "score": None if index.score[row] != index.score[row] else index.score[row],
+            "sub_categories": {index.key[child]: self._annotation_dict(child) for child in index.children[row]},
+            "relationships": {
+                key: index.relationship_ids[start:end] for key, start, end in index.relationships.get(row, ())
+            },
+        }
+        kind = index.kind[row]
+        if kind == _KIND_IMAGE:
+            image_ref = index.image_ref[row]
+            ann["bounding_box"] = index.box[row]
+            ann["image"] = self._image_dict(image_ref) if image_ref >= 0 else None
+        elif kind == _KIND_CONTAINER:
+            ann["value"] = index.value[row]
+        extra = index.extra[row]
+        if extra is not None:
+            ann.update(extra)
+        ann["_annotation_id"] = index.annotation_id[row]
+        return ann
+
+
+class _ColumnarIndex:  # pylint: disable=R0902,R0903
+    """Python values of all columns of a `ColumnarReader` and the positions of nested rows."""
+
+    def __init__(self, reader: ColumnarReader) -> None:
+        def _list(name: str) -> list[Any]:
+            values = reader.column(name)
+            return values.tolist() if isinstance(values, np.ndarray) else values
+
+        def _boxes(name: str) -> list[Optional[dict[str, Any]]]:
+            return [_box_dict(coords, absolute) for coords, absolute in zip(_list(name), _list(f"{name}_absolute"))]
+
+        self.image_file_name = _list("image.file_name")
+        self.image_location = _list("image.location")
+        self.image_external_id = _list("image.external_id")
+        self.image_document_id = _list("image.document_id")
+        self.image_page_number = _list("image.page_number")
+        self.image_id = _list("image.image_id")
+        self.image_summary = _list("image.summary")
+        self.image_bbox = _boxes("image.bbox")
+        self.embedding_key = _list("embedding.key")
+        self.embedding_box = _boxes("embedding.box")
+
+        self.key = _list("annotation.key")
+        self.kind = _list("annotation.kind")
+        self.annotation_id = _list("annotation.annotation_id")
+        self.category_name = _list("annotation.category_name")
+        self.category_id = _list("annotation.category_id")
+        self.score = _list("annotation.score")
+        self.active = _list("annotation.active")
+        self.service_id = _list("annotation.service_id")
+        self.model_id = _list("annotation.model_id")
+        self.external_id = _list("annotation.external_id")
+        self.box = _boxes("annotation.box")
+        self.image_ref = _list("annotation.image_ref")
+        self.value = _list("annotation.value")
+        self.extra = _list("annotation.extra")
+        self.relationship_ids = _list("relationship.ids")
+
+        self.roots = [row for row, parent in enumerate(_list("image.parent")) if parent < 0]
+        self.image_embeddings: defaultdict[int, list[int]] = defaultdict(list)
+        for row, image_row in enumerate(_list("embedding.image")):
+            self.image_embeddings[image_row].append(row)
+        self.image_annotations: defaultdict[int, list[int]] = defaultdict(list)
+        self.children: defaultdict[int, list[int]] = defaultdict(list)
+        for row, (image_row, parent, role) in enumerate(
+            zip(_list("annotation.image"), _list("annotation.parent"), _list("annotation.role"))
+        ):
+            if role == _ROLE_ANNOTATION:
+                self.image_annotations[image_row].append(row)
+            elif role == _ROLE_SUB_CATEGORY:
+                self.children[parent].append(row)
+        self.relationships: defaultdict[int, list[tuple[str, int, int]]] = defaultdict(list)
+        start = 0
+        for row, key, num_ids in zip(
+            _list("relationship.annotation"), _list("relationship.key"), _list("relationship.num_ids")
+        ):
+            self.relationships[row].append((key, start, start + num_ids))
+            start += num_ids
+
+
+def save_columnar(
+    images: Sequence[Image],
+    path: PathLikeOrStr,
+    image_to_blob: bool = True,
+    compress: bool = True,
+    metadata: Optional[JsonDict] = None,
+) -> str:
+    """
+    Saves images to a columnar `.npz` archive.
+
+    Args:
+        images: The images to save.
+        path: Path of the `.npz` file.
+        image_to_blob: Whether to save the pixels of the images.
+        compress: Whether to compress the archive with zlib.
+        metadata: A JSON serializable dict that will be saved alongside the images, e.g. the metadata of a
+                  `Document`.
+
+    Returns:
+        The path of the `.npz` file.
+    """
+    with ColumnarWriter(path, compress=compress) as writer:
+        if metadata is not None:
+            writer.metadata = metadata
+        for image in images:
+            writer.write(image, image_to_blob=image_to_blob)
+    return writer.path
+
+
+def load_columnar(path: PathLikeOrStr, trusted: bool = False) -> list[Image]:
+    """
+    Loads all images of a columnar `.npz` archive.
+
+    Args:
+        path: Path of the `.npz` file.
+        trusted: If `True`, the images are built with `Image.from_trusted`, i.e. without validation. Only use it for
+            archives that have been written by `save_columnar` and that have not been modified afterwards.
+
+    Returns:
+        The images in the order they have been saved.
+    """
+    constructor = Image.from_trusted if trusted else Image
+    with ColumnarReader(path) as reader:
+        return [constructor(**image_dict) for image_dict in reader]
@@ -21,6 +21,7 @@ Dataclass `Image`
 from __future__ import annotations
 
 import json
+from bisect import bisect_left
 from collections import defaultdict
 from dataclasses import dataclass, field
 from os import environ, fspath
@@ -28,17 +29,39 @@ from pathlib import Path
 from typing import Any, Callable, Literal, Optional, Sequence, TypedDict, Union
 
 import numpy as np
+import numpy.typing as npt
 from lazy_imports import try_import
 from numpy import uint8
-from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_serializer, model_validator
+from pydantic import (
+    BaseModel,
+    Field,
+    PrivateAttr,
+    SerializationInfo,
+    field_validator,
+    model_serializer,
+    model_validator,
+)
 
 from ..utils.error import AnnotationError, BoundingBoxError, ImageError
-from ..utils.identifier import get_uuid, is_uuid_like
+from ..utils.identifier import get_np_array_digest, get_uuid, get_uuids, is_uuid_like
 from ..utils.logger import LoggingRecord, logger
 from ..utils.object_types import ObjectTypes, SummaryKey, get_type
-from ..utils.types import BoxCoordinate, ImageDict, PathLikeOrStr, PixelValues
-from .annotation import Annotation, AnnotationMap, BoundingBox, CategoryAnnotation, ImageAnnotation
-from .box import crop_box_from_image, global_to_local_coords, intersection_box
+from ..utils.pdf_utils import PdfPage
+from ..utils.types import BoxCoordinate, ImageDict, PathLikeOrStr, PixelExportPolicy, PixelValues
+from ..utils.viz import viz_handler
+from .annotation import Annotation, AnnotationMap, BoundingBox, CategoryAnnotation, ImageAnnotation, StateCache
+from .box import (
+    _GeometryOwners,
+    _GeometryVersion,
+    add_geometry_version,
+    bump_geometry_version,
+    construct_trusted,
+    crop_box_from_image,
+    get_geometry_versions,
+    global_to_local_coords,
+    intersection_box,
+    np_round_box_coords,
+)
 from .convert import (
     convert_b64_to_np_array,
     convert_np_array_to_b64,
@@ -232,6 +255,168 @@ class Extras:
         return self._schema == other._schema and self._data == other._data
 
 
+class _AnnotationIndex:
+    """
+    Secondary indexes over the annotation list of an `Image`.
+
+    Annotations are keyed by their `annotation_id`. Every annotation receives an increasing position when it is added,
+    which reflects its position in `Image.annotations`. The category, service and model indexes map onto insertion
+    ordered sets of annotation ids. Indexes are derived data and never take part in equality checks.
+    """
+
+    def __init__(self, annotations: list[ImageAnnotation], geometry_version: _GeometryVersion) -> None:
+        self.annotations = annotations
+        self.geometry_version = geometry_version
+        self.size = 0
+        self.next_position = 0
+        self.by_id: dict[str, ImageAnnotation] = {}
+        self.position: dict[str, int] = {}
+        self.by_category: defaultdict[ObjectTypes, dict[str, None]] = defaultdict(dict)
+        self.by_service: defaultdict[Optional[str], dict[str, None]] = defaultdict(dict)
+        self.by_model: defaultdict[Optional[str], dict[str, None]] = defaultdict(dict)
+        for annotation in annotations:
+            self.add(annotation)
+
+    def _key(self, annotation: ImageAnnotation) -> str:
+        # annotations passed to the constructor of `Image` might not have an id
+        return annotation._annotation_id or f"__{self.next_position}"  # pylint: disable=W0212
+
+    def add(self, annotation: ImageAnnotation) -> None:
+        """Add an annotation that has been appended to the annotation list"""
+        key = self._key(annotation)
+        self.by_id[key] = annotation
+        self.position[key] = self.next_position
+        self.by_category[annotation.category_name][key] = None  # type: ignore[index]
+        self.by_service[annotation.service_id][key] = None
+        self.by_model[annotation.model_id][key] = None
+        self.next_position += 1
+        self.size += 1
+        # in-place changes of the box of the annotation must invalidate the box array of the image
+        annotation._add_geometry_version(self.geometry_version)  # pylint: disable=W0212
+
+    def remove(self, annotation: ImageAnnotation) -> None:
+        """Remove an annotation that has been popped from the annotation list"""
+        key = annotation.annotation_id
+        self.by_id.pop(key, None)
+        self.position.pop(key, None)
+        for table, value in (
+            (self.by_category, annotation.category_name),
+            (self.by_service, annotation.service_id),
+            (self.by_model, annotation.model_id),
+        ):
+            keys = table.get(value)  # type: ignore[call-overload]
+            if keys is not None:
+                keys.pop(key, None)
+                if not keys:
+                    del table[value]  # type: ignore[arg-type]
+        self.size -= 1
+
+    def is_stale(self, annotations: list[ImageAnnotation]) -> bool:
+        """Whether the annotation list has been replaced or changed without passing through the index"""
+        return annotations is not self.annotations or len(annotations) != self.size
+
+    def lookup(
+        self, table: defaultdict[Any, dict[str, None]], values: Sequence[Optional[Union[str, ObjectTypes]]]
+    ) -> dict[str, None]:
+        """Union of all annotation ids stored under `values` in one of the category, service or model indexes"""
+        if len(values) == 1:
+            return table.get(values[0], {})
+        keys: dict[str, None] = {}
+        for value in values:
+            keys.update(table.get(value, {}))
+        return keys
+
+    def resolve(self, keys: dict[str, None]) -> list[ImageAnnotation]:
+        """Annotations of the given keys in the order of the annotation list"""
+        return [self.by_id[key] for key in sorted(keys, key=self.position.__getitem__)]
+
+    def list_index(self, annotation: ImageAnnotation) -> int:
+        """Position of the annotation in the annotation list"""
+        position = self.position[annotation.annotation_id]
+        idx = bisect_left(
+            self.annotations, position, key=lambda ann: self.position.get(ann._annotation_id, -1)  # type: ignore
+        )
+        if idx < len(self.annotations) and self.annotations[idx] is annotation:
+            return idx
+        return next(idx for idx, ann in enumerate(self.annotations) if ann is annotation)
+
+    def __eq__(self, other: object) -> bool:
+        return other is None or isinstance(other, _AnnotationIndex)
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+@dataclass(frozen=True, eq=False)
+class AnnotationBoxArray:
+    """
+    Columnar view of the bounding boxes of all annotations of an `Image`. Row `i` describes `Image.annotations[i]`.
+    Use `Image.get_box_array` to get the view of an image and `Image.get_annotation_boxes` to select rows of given
+    annotations.
+
+    Attributes:
+        boxes: Array of shape `(N,4)` with the absolute `xyxy` coordinates of the bounding boxes with respect to the
+               image, i.e. `ann.get_bounding_box(image.image_id).transform(width, height, absolute_coords=True)`. Rows
+               of annotations whose bounding box is not available are `nan`.
+        category_ids: `category_id` of the annotations.
+        category_names: `category_name` of the annotations.
+        service_ids: `service_id` of the annotations.
+        annotation_indices: Position of the annotations in `Image.annotations`.
+        rows: Mapping of `annotation_id` to row.
+    """
+
+    boxes: npt.NDArray[np.float32]
+    category_ids: npt.NDArray[np.int64]
+    category_names: npt.NDArray[np.object_]
+    service_ids: npt.NDArray[np.object_]
+    annotation_indices: npt.NDArray[np.int64]
+    rows: dict[str, int]
+    # rows keyed by `id(ann)`. Avoids reading the private `annotation_id` of every looked up annotation
+    _object_rows: dict[int, int] = field(default_factory=dict, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.annotation_indices)
+
+
+class _BoxArrayCache:
+    """
+    Cache of the `AnnotationBoxArray` of an image. The array is valid as long as the annotation index, the geometry
+    version and the image size have not changed. The cache never takes part in equality checks and is not pickled.
+    """
+
+    __slots__ = ("index", "key", "value")
+
+    def __init__(self) -> None:
+        self.index: Optional[_AnnotationIndex] = None
+        self.key: Optional[tuple[Any, ...]] = None
+        self.value: Optional[AnnotationBoxArray] = None
+
+    def get(self, index: _AnnotationIndex, key: tuple[Any, ...]) -> Optional[AnnotationBoxArray]:
+        """Returns the cached array if the cache is valid for `index` and `key`"""
+        if self.index is index and self.key == key:
+            return self.value
+        return None
+
+    def set(self, index: _AnnotationIndex, key: tuple[Any, ...], value: AnnotationBoxArray) -> None:
+        """Stores `value` for `index` and `key`"""
+        self.index = index
+        self.key = key
+        self.value = value
+
+    def clear(self) -> None:
+        """Invalidates the cache"""
+        self.index = None
+        self.key = None
+        self.value = None
+
+    def __eq__(self, other: object) -> bool:
+        return other is None or isinstance(other, _BoxArrayCache)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __reduce__(self) -> tuple[type[_BoxArrayCache], tuple[()]]:
+        return _BoxArrayCache, ()
+
+
 class Image(BaseModel):
     """
     The image object is the enclosing data class that is used in the core data model to manage, retrieve or store
@@ -272,8 +457,24 @@ class Image(BaseModel):
         _bbox: The bounding box of the image. If not set, it will be set to None. Do not set this attribute directly.
         embeddings: A dictionary of `image_id` to `BoundingBox`es. If not set, it will be set to an empty dict.
         annotations: A list of `ImageAnnotation` objects. Use `get_annotation` to retrieve annotations.
-        _annotation_ids: A list of `annotation_id`s. Used internally to ensure uniqueness of annotations.
+        _annotation_index: Secondary indexes over `annotations` by `annotation_id`, `category_name`, `service_id`
+                           and `model_id`. Used internally to ensure uniqueness of annotations and for fast lookups
+                           in `get_annotation`. The index will be rebuilt, whenever `annotations` has been changed
+                           without using `dump` or `remove`.
         _summary: A `CategoryAnnotation` for image-level informations. If not set, it will be set to None.
+        _pdf_page: A reference to the page in an open `PdfDocumentSession`, if the image has been generated from a
+                   PDF document. `pdf_bytes` will be generated from this reference on demand.
+        _pixel_cache: Cache of the content hash of `_image` that contributes to the `state_id`. Assigning `_image`
+                      or returning it from `image` invalidates the cache, as the caller might modify the pixel array
+                      in place. Modifying an array that has been returned before the last `state_id` call will not
+                      be noticed.
+        _box_array_cache: Cache of the `AnnotationBoxArray` returned by `get_box_array`. It is rebuilt when the
+                          annotation index changes or when a bounding box or an embedding has been modified. Changing
+                          `embeddings` in place without `set_embedding` or `remove_embedding` will not be noticed.
+        _geometry_version: Counts in-place changes of the bounding boxes and embeddings of the annotations of this
+                           image. Changes of boxes of other images do not affect it.
+        _geometry_owners: Geometry versions of the images that contain an annotation whose `image` is this image.
+                          Changing `embeddings` marks their box arrays as out of date.
         _extras: A `dict` for storing additional transient messages or metadata. Not persisted in
                  serialization and silently ignored when present in constructor kwargs.
 
@@ -296,22 +497,29 @@ class Image(BaseModel):
 
     _image: Optional[PixelValues] = PrivateAttr(default=None)
     _bbox: Optional[BoundingBox] = PrivateAttr(default=None)
-    _annotation_ids: list[str] = PrivateAttr(default_factory=list)
+    _annotation_index: Optional[_AnnotationIndex] = PrivateAttr(default=None)
     _summary: Optional[CategoryAnnotation] = PrivateAttr(default=None)
     _image_id: Optional[str] = PrivateAttr(default=None)
     _pdf_bytes: Optional[bytes] = PrivateAttr(default=None)
+    _pdf_page: Optional[PdfPage] = PrivateAttr(default=None)
     _extras: Extras = PrivateAttr(default_factory=Extras)
+    _pixel_cache: StateCache = PrivateAttr(default_factory=StateCache)
+    _box_array_cache: _BoxArrayCache = PrivateAttr(default_factory=_BoxArrayCache)
+    _geometry_version: _GeometryVersion = PrivateAttr(default_factory=_GeometryVersion)
+    _geometry_owners: Optional[_GeometryOwners] = PrivateAttr(default=None)
 
     def __init__(self, **data: Any) -> None:
         """
         Accept private attrs in kwargs (e.g. `_image_id`, `_summary`, `_bbox`, `_annotation_ids`, `_image`,
          `_pdf_bytes`, `_extras`)
         Remove them before BaseModel initialization and set the PrivateAttr values afterwards so that
-        `Image(**inputs)` works when legacy code passes private keys. `_extras` is restored when a dict
+        `Image(**inputs)` works when legacy code passes private keys. `_annotation_ids` is ignored, as the annotation
+        index is derived from `annotations`. `_extras` is restored when a dict
         produced by ``as_dict(add_extras=True)`` is passed; otherwise a fresh ``Extras`` instance is used.
         """
-        private_keys = ["_image", "_bbox", "_annotation_ids", "_summary", "_image_id", "_pdf_bytes"]
+        private_keys = ["_image", "_bbox", "_summary", "_image_id", "_pdf_bytes"]
         extras_raw = data.pop("_extras", None)
+        data.pop("_annotation_ids", None)
         priv: dict[str, Any] = {}
         for key in private_keys:
             if key in data:
@@ -335,6 +543,76 @@ class Image(BaseModel):
         if isinstance(extras_raw, dict):
             object.__setattr__(self, "_extras", Extras.from_dict(extras_raw))
 
+    @classmethod
+    def from_trusted(cls, **data: Any) -> Image:
+        """
+        Fast construction path for known-good inputs, e.g. for dicts generated by `as_dict`. Accepts the same keys as
+        the constructor, but skips field validation. Annotations, embeddings and the summary are built with
+        `from_trusted` of their classes, see `Annotation.from_trusted`.
+
+        Note:
+            Only use this method for inputs you trust. Everything else must be passed to the constructor.
+
+        Args:
+            data: `Image` attributes, including private attributes like `_image_id`, `_image` or `_summary`
+
+        Returns:
+            Image instance
+        """
+        data.pop("_annotation_ids", None)
+        extras_raw = data.pop("_extras", None)
+        priv = {key: data.pop(key) for key in ("_image", "_bbox", "_summary", "_image_id", "_pdf_bytes") if key in data}
+        embeddings = data.get("embeddings")
+        if embeddings:
+            data["embeddings"] = {
+                key: val if isinstance(val, BoundingBox) else BoundingBox.from_trusted(**val)
+                for key, val in embeddings.items()
+            }
+        elif embeddings is None:
+            data.pop("embeddings", None)
+        annotations = data.get("annotations")
+        if annotations:
+            data["annotations"] = [
+                ann if isinstance(ann, ImageAnnotation) else ImageAnnotation.from_trusted(**ann) for ann in annotations
+            ]
+        elif annotations is None:
+            data.pop("annotations", None)
+
+        image = construct_trusted(cls, data)
+        # private attributes are set in the same way as in `__init__`
+        if priv.get("_image_id") is not None:
+            object.__setattr__(image, "_image_id", priv.pop("_image_id"))
+        image._setup_ids()  # type: ignore[operator]  # pylint: disable=W0212
+        raw_image = priv.pop("_image", None)
+        if raw_image is not None:
+            image.image = raw_image
+        for key, val in priv.items():
+            if key == "_bbox" and isinstance(val, dict):
+                object.__setattr__(image, key, BoundingBox.from_trusted(**val))
+            elif key == "_summary" and isinstance(val, dict):
+                object.__setattr__(image, key, CategoryAnnotation.from_trusted(**val))
+            else:
+                object.__setattr__(image, key, val)
+        if isinstance(extras_raw, dict):
+            object.__setattr__(image, "_extras", Extras.from_dict(extras_raw))
+        return image
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "_image":
+            self._pixel_cache.clear()
+        super().__setattr__(name, value)
+        if name == "embeddings":
+            for version in get_geometry_versions(self):
+                for bounding_box in self.embeddings.values():
+                    add_geometry_version(bounding_box, version)
+            bump_geometry_version(self)
+
+    def _add_geometry_version(self, version: _GeometryVersion) -> None:
+        # registers the geometry version of an image that contains an annotation whose `image` is this image
+        if add_geometry_version(self, version):
+            for bounding_box in self.embeddings.values():
+                add_geometry_version(bounding_box, version)
+
     @field_validator("embeddings", mode="before")
     @classmethod
     def _coerce_embeddings(cls, v: Any) -> dict[str, BoundingBox]:
@@ -413,7 +691,12 @@ class Image(BaseModel):
     def image(self) -> Optional[PixelValues]:
         """
         image
+
+        Note:
+            The pixel array is returned without copying it. As it might be modified in place, the cached content hash
+            of the pixels is invalidated and will be recomputed with the next `state_id` call.
         """
+        self._pixel_cache.clear()
         return self._image
 
     @image.setter
@@ -451,8 +734,16 @@ class Image(BaseModel):
         if not isinstance(image, np.ndarray):
             raise ImageError(f"Cannot load image. Unsupported type: {type(image)}")
 
-        self._image = image.astype(uint8)
-        self.set_width_height(self._image.shape[1], self._image.shape[0])
+        self._set_np_image(image.astype(uint8))
+
+    def _set_np_image(self, np_image: PixelValues) -> None:
+        """
+        Stores a `uint8` numpy array without copying it. Only used for arrays that have been created internally, e.g.
+        crops of `image_ann_to_image`, so that no array of a caller is shared with this image.
+        """
+        object.__setattr__(self, "_image_formats", None)
+        self._image = np_image
+        self.set_width_height(np_image.shape[1], np_image.shape[0])
         self._self_embedding()
 
     @property
@@ -477,8 +768,11 @@ class Image(BaseModel):
     @property
     def pdf_bytes(self) -> Optional[bytes]:
         """
-        `pdf_bytes`. This attribute will be set dynamically and is not part of the core Image data model
+        `pdf_bytes`. This attribute will be set dynamically and is not part of the core Image data model. If only a
+        `pdf_page` reference is available, the single-page PDF will be generated and cached on first access.
         """
+        if self._pdf_bytes is None and self._pdf_page is not None:
+            self._pdf_bytes = self._pdf_page.to_bytes()
         return self._pdf_bytes
 
     @pdf_bytes.setter
@@ -490,6 +784,23 @@ class Image(BaseModel):
             assert isinstance(pdf_bytes, bytes)
             self._pdf_bytes = pdf_bytes
 
+    @property
+    def pdf_page(self) -> Optional[PdfPage]:
+        """
+        `pdf_page`. Reference to the page of an open `PdfDocumentSession`. This attribute will be set dynamically and
+        is not part of the core Image data model
+        """
+        return self._pdf_page
+
+    @pdf_page.setter
+    def pdf_page(self, pdf_page: PdfPage) -> None:
+        """
+        `pdf_page` setter
+        """
+        if self._pdf_page is None:
+            assert isinstance(pdf_page, PdfPage)
+            self._pdf_page = pdf_page
+
     @property
     def extras(self) -> Extras:
         """
@@ -576,6 +887,9 @@ class Image(BaseModel):
         if not isinstance(bounding_box, BoundingBox):
             raise BoundingBoxError(f"Bounding box must be BoundingBox, got {type(bounding_box)}")
         self.embeddings[image_id] = bounding_box
+        for version in get_geometry_versions(self):
+            add_geometry_version(bounding_box, version)
+        bump_geometry_version(self)
 
     def get_embedding(self, image_id: str) -> BoundingBox:
         """
@@ -599,6 +913,7 @@ class Image(BaseModel):
         if isinstance(embeddings, dict):
             if image_id in embeddings:  # pylint: disable=E1135
                 embeddings.pop(image_id, None)
+                bump_geometry_version(self)
 
     def _self_embedding(self) -> None:
         if self._bbox is not None:
@@ -619,21 +934,184 @@ class Image(BaseModel):
         if annotation._annotation_id is None:
             annotation.annotation_id = self.define_annotation_id(annotation)
 
-        ann_ids = getattr(self, "_annotation_ids", None)
-        if ann_ids is None or not isinstance(ann_ids, list):
-            ann_ids = []
-            setattr(self, "_annotation_ids", ann_ids)
-
-        if annotation.annotation_id in ann_ids:
+        index = self._get_annotation_index()
+        if annotation.annotation_id in index.by_id:
             raise ImageError(f"Cannot dump annotation with existing id {annotation.annotation_id}")
 
-        anns = getattr(self, "annotations", None)
-        if anns is None or not isinstance(anns, list):
-            anns = []
-            setattr(self, "annotations", anns)
+        self.annotations.append(annotation)
+        index.add(annotation)
+
+    def dump_annotations(self, annotations: Sequence[ImageAnnotation]) -> None:
+        """
+        Batched version of `dump`. Missing `annotation_id`s are generated in one pass and all annotations are appended
+        with a single update of the annotation list. Either all or none of the annotations are dumped.
+
+        Args:
+            annotations: image annotations to store
+
+        Raises:
+            ImageError: If an `annotation_id` already exists or appears more than once in `annotations`.
+        """
+        if not all(isinstance(annotation, ImageAnnotation) for annotation in annotations):
+            raise AnnotationError("Annotation must be ImageAnnotation")
+
+        without_id = [annotation for annotation in annotations if annotation._annotation_id is None]
+        for annotation, annotation_id in zip(without_id, self.define_annotation_ids(without_id)):
+            annotation.annotation_id = annotation_id
+
+        index = self._get_annotation_index()
+        annotation_ids = [annotation.annotation_id for annotation in annotations]
+        if len(set(annotation_ids)) != len(annotation_ids) or any(
+            annotation_id in index.by_id for annotation_id in annotation_ids
+        ):
+            raise ImageError("Cannot dump annotations with existing or duplicate ids")
+
+        self.annotations.extend(annotations)
+        for annotation in annotations:
+            index.add(annotation)
+
+    def _get_annotation_index(self) -> _AnnotationIndex:
+        index = self._annotation_index
+        if index is None or index.is_stale(self.annotations):
+            index = _AnnotationIndex(self.annotations, self._geometry_version)
+            self._annotation_index = index
+        return index
+
+    def reindex_annotations(self) -> None:
+        """
+        Rebuild the annotation index. `category_name`, `service_id` and `model_id` of an annotation are indexed, when
+        the annotation is dumped. If one of these attributes of a dumped annotation is changed in place, call this
+        method so that `get_annotation` keeps returning the annotation for the new value.
+        """
+        self._annotation_index = None
+        self._box_array_cache.clear()
+
+    def get_box_array(self) -> AnnotationBoxArray:
+        """
+        Columnar view of the bounding boxes, category ids and service ids of all annotations, including inactive ones.
+        The view is computed once and cached until an annotation is dumped or removed, until a bounding box or an
+        embedding is modified or until `reindex_annotations` is called.
+
+        Returns:
+            `AnnotationBoxArray` with one row per annotation in `annotations`.
+        """
+        index = self._get_annotation_index()
+        key = self._box_array_key(index)
+        box_array = self._box_array_cache.get(index, key)
+        if box_array is None:
+            box_array = self._build_box_array()
+            self._box_array_cache.set(index, key, box_array)
+        return box_array
+
+    def _box_array_key(self, index: _AnnotationIndex) -> tuple[Any, ...]:
+        return (
+            index.next_position,
+            index.size,
+            self._geometry_version.value,
+            self._bbox.width if self._bbox is not None else None,
+            self._bbox.height if self._bbox is not None else None,
+        )
+
+    def _build_box_array(self) -> AnnotationBoxArray:
+        num_annotations = len(self.annotations)
+        rows: dict[str, int] = {}
+        object_rows: dict[int, int] = {}
+        for idx, ann in enumerate(self.annotations):
+            object_rows[id(ann)] = idx
+            if ann._annotation_id is not None:
+                rows[ann._annotation_id] = idx
+        boxes = self._compute_boxes(self.annotations)
+
+        return AnnotationBoxArray(
+            boxes=boxes,
+            category_ids=np.array([ann.category_id for ann in self.annotations], dtype=np.int64),
+            category_names=np.array([ann.category_name for ann in self.annotations], dtype=object),
+            service_ids=np.array([ann.service_id for ann in self.annotations], dtype=object),
+            annotation_indices=np.arange(num_annotations, dtype=np.int64),
+            rows=rows,
+            _object_rows=object_rows,
+        )
+
+    def _compute_boxes(self, annotations: Sequence[ImageAnnotation]) -> npt.NDArray[np.float32]:
+        num_annotations = len(annotations)
+        raw_boxes = np.full((num_annotations, 4), np.nan, dtype=np.float64)
+        absolute_coords = np.ones(num_annotations, dtype=bool)
+        for idx, ann in enumerate(annotations):
+            try:
+                box = ann.get_bounding_box(self.image_id)
+            except (AnnotationError, KeyError):
+                continue
+            raw_boxes[idx] = (box._ulx, box._uly, box._lrx, box._lry)
+            absolute_coords[idx] = box.absolute_coords
+
+        boxes = raw_boxes.copy()
+        relative = ~absolute_coords
+        if relative.any():
+            if self._bbox is None:
+                boxes[relative] = np.nan
+            else:
+                # same arithmetic as `BoundingBox.transform`, so that the rounding of both agrees
+                relative_boxes = (
+                    raw_boxes[relative]
+                    / BoundingBox.RELATIVE_COORD_SCALE_FACTOR
+                    * [
+                        self.width,
+                        self.height,
+                        self.width,
+                        self.height,
+                    ]
+                )
+                available = ~np.isnan(relative_boxes).any(axis=1)
+                relative_boxes[available] = np_round_box_coords(relative_boxes[available], True)
+                boxes[relative] = relative_boxes
+        return boxes.astype(np.float32)
+
+    def get_annotation_boxes(self, annotations: Sequence[ImageAnnotation]) -> npt.NDArray[np.float32]:
+        """
+        Absolute `xyxy` coordinates of the given annotations of this image, taken from `get_box_array`. This replaces
+        building an array from `ann.get_bounding_box(image_id).transform(...).to_list(mode="xyxy")` for every
+        annotation.
+
+        Args:
+            annotations: Annotations of this image
+
+        Returns:
+            Array of shape `(len(annotations), 4)`
+
+        Raises:
+            ImageError: If one of the annotations does not belong to this image.
+            AnnotationError: If the bounding box of one of the annotations is not available.
 
-        ann_ids.append(annotation.annotation_id)
-        anns.append(annotation)
+        Note:
+            If the cached view is outdated and only a small part of the annotations is requested, the boxes are
+            computed for these annotations only and the view is not rebuilt. Services that modify boxes while working
+            on a subset of annotations, e.g. table segmentation with one table at a time, would otherwise rebuild the
+            view of the whole page for every step.
+        """
+        index = self._get_annotation_index()
+        if (
+            2 * len(annotations) < index.size
+            and self._box_array_cache.get(index, self._box_array_key(index)) is None
+            and all(index.by_id.get(ann._annotation_id) is ann for ann in annotations)  # type: ignore[arg-type]
+        ):
+            boxes = self._compute_boxes(annotations)
+        else:
+            boxes = self._get_rows_of_box_array(annotations)
+        if np.isnan(boxes).any():
+            raise AnnotationError(f"bounding_box is not available for some annotations of image {self.image_id}")
+        return boxes
+
+    def _get_rows_of_box_array(self, annotations: Sequence[ImageAnnotation]) -> npt.NDArray[np.float32]:
+        box_array = self.get_box_array()
+        object_rows = box_array._object_rows  # pylint: disable=W0212
+        try:
+            rows = [
+                object_rows[id(ann)] if id(ann) in object_rows else box_array.rows[ann.annotation_id]
+                for ann in annotations
+            ]
+        except KeyError as err:
+            raise ImageError(f"Annotation {err} is not an annotation of image {self.image_id}") from err
+        return box_array.boxes[rows]
 
     def get_annotation(
         self,
@@ -668,20 +1146,44 @@ class Image(BaseModel):
                 else tuple(get_type(cat_name) for cat_name in category_names)
             )
 
-        ann_ids = [annotation_ids] if isinstance(annotation_ids, str) else annotation_ids
-        service_ids = [service_ids] if isinstance(service_ids, str) else service_ids
-        model_id = [model_id] if isinstance(model_id, str) else model_id
-
-        anns = filter(lambda x: x.active, self.annotations) if ignore_inactive else self.annotations
-        if category_names is not None:
-            anns = filter(lambda x: x.category_name in category_names, anns)
+        ann_ids = {annotation_ids} if isinstance(annotation_ids, str) else annotation_ids
+        if ann_ids is not None:
+            ann_ids = set(ann_ids)
+        service_ids = (service_ids,) if isinstance(service_ids, str) else service_ids
+        model_id = (model_id,) if isinstance(model_id, str) else model_id
+
+        if ann_ids is None and category_names is None and service_ids is None and model_id is None:
+            if ignore_inactive:
+                return [ann for ann in self.annotations if ann.active]
+            return list(self.annotations)
+
+        # Start with the smallest candidate set from the indexes and check all conditions on the candidates. This
+        # also guards against annotations whose attributes have been changed after indexing.
+        index = self._get_annotation_index()
+        candidates: list[dict[str, None]] = []
         if ann_ids is not None:
-            anns = filter(lambda x: x.annotation_id in ann_ids, anns)
+            candidates.append(dict.fromkeys(ann_id for ann_id in ann_ids if ann_id in index.by_id))
+        if category_names is not None:
+            candidates.append(index.lookup(index.by_category, category_names))
         if service_ids is not None:
-            anns = filter(lambda x: x.service_id in service_ids, anns)
+            candidates.append(index.lookup(index.by_service, service_ids))
         if model_id is not None:
-            anns = filter(lambda x: x.model_id in model_id, anns)
-        return list(anns)
+            candidates.append(index.lookup(index.by_model, model_id))
+
+        anns: list[ImageAnnotation] = []
+        for ann in index.resolve(min(candidates, key=len)):
+            if ignore_inactive and not ann.active:
+                continue
+            if category_names is not None and ann.category_name not in category_names:
+                continue
+            if ann_ids is not None and ann.annotation_id not in ann_ids:
+                continue
+            if service_ids is not None and ann.service_id not in service_ids:
+                continue
+            if model_id is not None and ann.model_id not in model_id:
+                continue
+            anns.append(ann)
+        return anns
 
     def define_annotation_id(self, annotation: Annotation) -> str:
         """
@@ -694,7 +1196,21 @@ class Image(BaseModel):
         Returns:
             uuid string
         """
+        return get_uuid(*self._get_annotation_id_inputs(annotation))
+
+    def define_annotation_ids(self, annotations: Sequence[Annotation]) -> list[str]:
+        """
+        Batched version of `define_annotation_id`. Generates the uuids of many annotations at once.
+
+        Args:
+            annotations: Annotations to generate the `uuid`s for
+
+        Returns:
+            List of uuid strings in the order of `annotations`
+        """
+        return get_uuids(self._get_annotation_id_inputs(annotation) for annotation in annotations)
 
+    def _get_annotation_id_inputs(self, annotation: Annotation) -> list[str]:
         attributes = annotation.get_defining_attributes()
         attributes_values = [
             (
@@ -704,7 +1220,8 @@ class Image(BaseModel):
             )
             for attribute in attributes
         ]
-        return get_uuid(*attributes_values, str(self.image_id))
+        attributes_values.append(str(self.image_id))
+        return attributes_values
 
     @staticmethod
     def get_state_attributes() -> list[str]:
@@ -716,11 +1233,20 @@ class Image(BaseModel):
         """
         return ["annotations", "embeddings", "_image", "_summary"]
 
+    def _get_pixel_digest(self, np_image: PixelValues) -> str:
+        cache_key = (np_image.shape, np_image.dtype.str)
+        digest = self._pixel_cache.get(cache_key)
+        if digest is None:
+            digest = get_np_array_digest(np_image)
+            self._pixel_cache.set(cache_key, digest)
+        return digest
+
     @property
     def state_id(self) -> str:
         """
         Different to `image_id` this id does depend on every state attributes and might therefore change
-        over time.
+        over time. State ids of annotations and the content hash of the pixel values are cached, so that only
+        changed parts will be recomputed.
 
         Returns:
             Annotation state instance
@@ -747,44 +1273,50 @@ class Image(BaseModel):
                     else:
                         container_ids.append(str(element))
             elif isinstance(attr, np.ndarray):
-                container_ids.append(convert_np_array_to_b64(attr))
+                container_ids.append(self._get_pixel_digest(attr))
             else:
                 container_ids.append(str(attr))
         return get_uuid(self.image_id, *container_ids)
 
     @model_serializer(mode="wrap")
-    def _serialize(self, handler: Callable[[Any], Any]) -> Any:
+    def _serialize(self, handler: Callable[[Any], Any], info: SerializationInfo) -> Any:
         """
         Use Pydantic core serializer as base, then inject legacy/private-derived keys.
         Ensures fast JSON via model_dump_json while keeping original export shape.
+
+        Pixels are only encoded if the serialization context does not pass a `pixel_policy` other than `embed`.
+        The context is passed down to the images of all annotations.
         """
         data = handler(self)
+        pixel_policy = info.context.get("pixel_policy", "embed") if info.context else "embed"
 
         data["embeddings"] = {k: v.as_dict() for k, v in self.embeddings.items()}  # pylint: disable=E1101
         data["_bbox"] = self._bbox.as_dict() if self._bbox else None
-        data["_image"] = convert_np_array_to_b64(self._image) if self._image is not None else None
+        data["_image"] = (
+            convert_np_array_to_b64(self._image) if self._image is not None and pixel_policy == "embed" else None
+        )
         data["_summary"] = self._summary.as_dict() if self._summary is not None else None
         data["_image_id"] = self._image_id
 
         if "location" in data:
             data["location"] = fspath(data["location"])
 
-        data.pop("_annotation_ids", None)
-
         return data
 
-    def as_dict(self, add_extras: bool = False) -> dict[str, Any]:
+    def as_dict(self, add_extras: bool = False, pixel_policy: PixelExportPolicy = "embed") -> dict[str, Any]:
         """
         Returns the full image dataclass as dict.
 
         Args:
             add_extras: When ``True``, the ``_extras`` store is included under the ``"_extras"`` key.
                         Defaults to ``False`` so that normal serialization is unchanged.
+            pixel_policy: With `embed`, pixels of the image and of the images of all annotations are converted into
+                          `base64` encodings. Otherwise, `_image` will be `None` and no pixels will be encoded.
 
         Returns:
             A custom `dict`.
         """
-        result = self.model_dump(by_alias=True, exclude_none=False)
+        result = self.model_dump(by_alias=True, exclude_none=False, context={"pixel_policy": pixel_policy})
         if add_extras:
             result["_extras"] = self._extras.as_dict()
         return result
@@ -801,18 +1333,27 @@ class Image(BaseModel):
         return self.model_dump_json(by_alias=True, exclude_none=False, indent=4)
 
     @classmethod
-    def from_file(cls, file_path: str) -> Image:
+    def from_file(cls, file_path: str, trusted: bool = False) -> Image:
         """
-        Create `Image` instance from `.json` file.
+        Create `Image` instance from `.json` file or from a columnar `.npz` file. If the `.npz` file contains
+        several images, the first one will be returned.
 
         Args:
             file_path: file_path
+            trusted: If `True`, the image is loaded with `from_trusted`, i.e. without validation. Only use it for
+                files that have been written by `save` and that have not been modified afterwards.
 
         Returns:
             Initialized image
         """
+        constructor = cls.from_trusted if trusted else cls
+        if fspath(file_path).endswith(".npz"):
+            from .columnar import ColumnarReader  # pylint: disable=C0415 # local import to avoid circular import
+
+            with ColumnarReader(file_path) as reader:
+                return constructor(**reader.get_image_dict(0))
         with open(file_path, "r", encoding="UTF-8") as f:
-            return cls(**json.load(f))
+            return constructor(**json.load(f))
 
     def image_ann_to_image(self, annotation_id: str, crop_image: bool = False) -> None:
         """
@@ -821,6 +1362,11 @@ class Image(BaseModel):
         by the bounding box. The image is cut out and the determinable fields such as height, width and the embeddings
         are determined. The partial image is not saved if `crop_image = 'False'` is set.
 
+        Note:
+            The cropped image is a read-only view into `image` and does not copy any pixels. Call
+            `materialize_image` on the image of the annotation, if you need to modify the pixels in place or if you
+            want to keep the crop after the pixels of this image have been released.
+
         Args:
             annotation_id: An annotation id of the image annotations.
             crop_image: Whether to store the cropped image as `np.array`.
@@ -845,7 +1391,10 @@ class Image(BaseModel):
         new_image.set_embedding(self.image_id, bounding_box=new_bounding_box)
 
         if crop_image and self.image is not None:
-            new_image.image = crop_box_from_image(self.image, ann.bounding_box, self.width, self.height)
+            crop = crop_box_from_image(self.image, ann.bounding_box, self.width, self.height)
+            # the crop is a view into the pixels of this image. Writing to it would change this image as well.
+            crop.flags.writeable = False
+            new_image._set_np_image(crop.astype(uint8, copy=False))
         elif crop_image and self.image is None:
             raise ImageError("crop_image = True requires self.image to be not None")
 
@@ -866,17 +1415,16 @@ class Image(BaseModel):
         ann = self.get_annotation(annotation_ids=annotation_id)[0]
         if ann.image is None:
             raise ImageError("When adding sub images to ImageAnnotation then ImageAnnotation.image must not be None")
-        box = ann.get_bounding_box(self.image_id).to_list("xyxy")
         proposals = self.get_annotation(category_names)
-        points = np.array([prop.get_bounding_box(self.image_id).center for prop in proposals])
-        if not points.size:
+        if not proposals:
             return
-        ann_ids = np.array([prop.annotation_id for prop in proposals])
+        box = self.get_annotation_boxes([ann])[0]
+        proposal_boxes = self.get_annotation_boxes(proposals)
+        points = (proposal_boxes[:, :2] + proposal_boxes[:, 2:]) / 2
         indices = np.where(
             (box[0] < points[:, 0]) & (box[1] < points[:, 1]) & (box[2] > points[:, 0]) & (box[3] > points[:, 1])
         )[0]
-        selected_ids = ann_ids[indices]
-        sub_images = self.get_annotation(annotation_ids=selected_ids.tolist())
+        sub_images = [proposals[idx] for idx in indices]
         ann_box = ann.get_bounding_box(self.image_id)
         if not ann_box.absolute_coords:
             ann_box = ann_box.transform(self.width, self.height, absolute_coords=True)
@@ -907,6 +1455,15 @@ class Image(BaseModel):
                 ann.bounding_box = absolute_bounding_box
                 ann.image = None
 
+    def materialize_image(self) -> None:
+        """
+        Replaces `image` by a writable copy, if `image` shares its pixels with another array, e.g. if it is a crop
+        generated by `image_ann_to_image`. The copy does not keep the pixels of the parent image alive.
+        """
+        if self._image is not None and (not self._image.flags.owndata or not self._image.flags.writeable):
+            self._image = self._image.copy()
+            object.__setattr__(self, "_image_formats", None)
+
     def clear_image(self, clear_bbox: bool = False) -> None:
         """
         Removes the `Image.image`. Useful, if the image must be a lightweight object.
@@ -1054,10 +1611,9 @@ class Image(BaseModel):
             and location_dict.relationship_key is None
             and location_dict.summary_key is None
         ):
-            index = self.annotations.index(annotation)  # pylint: disable=E1101
-            ann = self.annotations.pop(index)  # pylint: disable=E1101
-            if annotation.annotation_id in self._annotation_ids:
-                self._annotation_ids.remove(annotation.annotation_id)
+            index = self._get_annotation_index()
+            ann = self.annotations.pop(index.list_index(annotation))
+            index.remove(annotation)
 
         sub_category_key = location_dict.sub_category_key
         if sub_category_key is not None:
@@ -1123,6 +1679,8 @@ class Image(BaseModel):
         highest_hierarchy_only: bool = False,
         path: Optional[PathLikeOrStr] = None,
         dry: bool = False,
+        file_format: Literal["json", "npz"] = "json",
+        pixel_policy: Optional[PixelExportPolicy] = None,
     ) -> Optional[Union[ImageDict, str]]:
         """
         Export image as dictionary. As `np.array` cannot be serialized `image` values will be converted into
@@ -1134,21 +1692,16 @@ class Image(BaseModel):
             path: Path to save the .json file to. If `None` results will be saved in the folder of the original
                   document.
             dry: Will run dry, i.e. without saving anything but returning the `dict`
+            file_format: `json` or `npz`. With `npz` the image will be saved in the binary columnar format of
+                         `dd_core.datapoint.columnar`, with raw pixels instead of `base64` encodings.
+            pixel_policy: `embed` saves the pixels in the output, `external` writes them to a `.png` file next to
+                          the output and `omit` does not save them at all. Pixels are only encoded if they are
+                          saved. Defaults to `embed` if `image_to_json` is `True`, otherwise to `omit`.
 
         :return: optional dict
         """
-
-        def set_image_keys_to_none(d: Any) -> None:
-            if isinstance(d, dict):
-                for key, value in d.items():
-                    if key == "_image":
-                        d[key] = None
-                    else:
-                        set_image_keys_to_none(value)
-            elif isinstance(d, list):
-                for item in d:
-                    set_image_keys_to_none(item)
-
+        if pixel_policy is None:
+            pixel_policy = "embed" if image_to_json else "omit"
         if path is None:
             path = Path(self.location)
         path = Path(path)
@@ -1156,19 +1709,23 @@ class Image(BaseModel):
             path = path / self.image_id
         suffix = path.suffix
         if suffix:
-            path_json = fspath(path).replace(suffix, ".json")
+            path_file = fspath(path).replace(suffix, f".{file_format}")
         else:
-            path_json = fspath(path) + ".json"
+            path_file = fspath(path) + f".{file_format}"
         if highest_hierarchy_only:
             self.remove_image_from_lower_hierarchy()
         else:
             self.remove_image_from_lower_hierarchy(pixel_values_only=True)
-        export_dict = self.as_dict()
+        if pixel_policy == "external" and self._image is not None and not dry:
+            viz_handler.write_image(path_file[: -len(file_format)] + "png", self._image)
+        if file_format == "npz" and not dry:
+            from .columnar import save_columnar  # pylint: disable=C0415 # local import to avoid circular import
+
+            return save_columnar([self], path_file, image_to_blob=pixel_policy == "embed")
+        export_dict = self.as_dict(pixel_policy=pixel_policy)
         export_dict["location"] = fspath(export_dict["location"])
-        if not image_to_json:
-            set_image_keys_to_none(export_dict)
         if dry:
             return export_dict
-        with open(path_json, "w", encoding="UTF-8") as file:
+        with open(path_file, "w", encoding="UTF-8") as file:
             json.dump(export_dict, file, indent=2)
-        return path_json
+        return path_file
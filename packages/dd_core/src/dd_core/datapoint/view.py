@@ -22,7 +22,7 @@ Dataclass `Page`, `ImageAnnotationBaseView` and derived classes
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, Mapping, Optional, Sequence, Tuple, Type, Union, no_type_check
+from typing import Any, Dict, Literal, Mapping, Optional, Sequence, Tuple, Type, Union, no_type_check
 
 import numpy as np
 
@@ -41,7 +41,7 @@ from ..utils.object_types import (
     get_type,
 )
 from ..utils.transform import ResizeTransform, box_to_point4, point4_to_box
-from ..utils.types import HTML, Chunks, ImageDict, PathLikeOrStr, PixelValues, csv
+from ..utils.types import HTML, Chunks, ImageDict, PathLikeOrStr, PixelExportPolicy, PixelValues, csv
 from ..utils.viz import draw_boxes, interactive_imshow, viz_handler
 from .annotation import (
     CategoryAnnotation,
@@ -1701,6 +1701,8 @@ class Page:
         highest_hierarchy_only: bool = False,
         path: Optional[PathLikeOrStr] = None,
         dry: bool = False,
+        file_format: Literal["json", "npz"] = "json",
+        pixel_policy: Optional[PixelExportPolicy] = None,
     ) -> Optional[Union[ImageDict, str]]:
         """
         Export image as dictionary. As numpy array cannot be serialized `image` values will be converted into
@@ -1712,11 +1714,13 @@ class Page:
             path: Path to save the `.json` file to. If `None` results will be saved in the folder of the original
                   document.
             dry: Will run dry, i.e. without saving anything but returning the dict
+            file_format: `json` or `npz`. With `npz` the page will be saved in the binary columnar format.
+            pixel_policy: `embed`, `external` or `omit`. See `Image.save`.
 
         Returns:
             optional dict
         """
-        return self._base_image.save(image_to_json, highest_hierarchy_only, path, dry)
+        return self._base_image.save(image_to_json, highest_hierarchy_only, path, dry, file_format, pixel_policy)
 
     @classmethod
     @no_type_check
@@ -1729,7 +1733,7 @@ class Page:
         include_residual_text_container: bool = True,
     ) -> Page:
         """
-        Reading JSON file and building a `Page` object with given config.
+        Reading a JSON file or a columnar `.npz` file and building a `Page` object with given config.
 
         Args:
             file_path: Path to file
@@ -29,14 +29,14 @@ from __future__ import annotations
 
 import json
 import os
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any, Iterator, Mapping, Optional, Sequence, Union, cast
+from typing import Any, Iterator, Literal, Mapping, Optional, Sequence, Union, cast
 
 from .dataflow.base import DataFlow
 from .dataflow.common import MapData
-from .dataflow.custom_serialize import SerializerFiles, SerializerPdfDoc
+from .dataflow.custom_serialize import SerializerFiles
 from .dataflow.serialize import DataFromList
 from .datapoint.annotation import (
     AnnotationMap,
@@ -46,13 +46,15 @@ from .datapoint.annotation import (
     ReferencePayload,
     from_json_compatible,
 )
+from .datapoint.columnar import ColumnarReader, save_columnar
 from .datapoint.image import Extras, Image
 from .datapoint.view import ImageAnnotationBaseView, Page
 from .mapper.maputils import curry
-from .utils import get_uuid_from_str
-from .utils.file_utils import mkdir_p, pypdf_available
+from .utils import get_uuid, get_uuid_from_str
+from .utils.file_utils import mkdir_p, pypdf_available, pypdfium2_available
 from .utils.object_types import DocumentFileLabel, ObjectTypes, SummaryKey, get_type
-from .utils.types import PathLikeOrStr
+from .utils.pdf_utils import PdfDocumentSession, PdfPage, PDFStreamer
+from .utils.types import PathLikeOrStr, PixelExportPolicy
 from .utils.viz import viz_handler
 
 
@@ -60,11 +62,20 @@ from .utils.viz import viz_handler
 class PageReference:
     """
     Lightweight reference to a page.
+
+    Attributes:
+        source_path: Path to the document or to the image file of the page.
+        page_number: 1-based page number.
+        image_id: `image_id` of the page `Image`.
+        width: Width of the media box of a PDF page in PDF points.
+        height: Height of the media box of a PDF page in PDF points.
     """
 
     source_path: str
     page_number: int | None = None
     image_id: str | None = None
+    width: float | None = None
+    height: float | None = None
 
 
 @dataclass(frozen=True)
@@ -150,7 +161,8 @@ class Document:
     Document class for managing multi-page documents.
 
     Supports PDF documents and image collections with:
-    - Lazy loading for memory efficiency
+    - Lazy loading for memory efficiency. Only page references are created on initialization. Pages are loaded from
+      the source when they are requested. The pixels of at most `max_cached_pages` loaded pages are kept in memory.
     - Page-level and document-level annotations
     - JSON serialization/deserialization
     - Pipeline metadata tracking
@@ -162,6 +174,10 @@ class Document:
         external_id: Optional external identifier
         document_id: UUID-like identifier used to identify the document instance.
         compute_metadata: Whether to compute page references during initialization.
+        max_cached_pages: Maximum number of pages loaded from the source whose pixels are kept in memory. If the
+            limit is exceeded, the pixels of the least recently used page are released. The `Image` of the page stays
+            in the document, as the caller might still hold it. Use `evict_page` to drop pages. Pages that have been
+            stored with `set_image` are not counted.
         pipeline_jobs: Stored pipeline jobs metadata.
 
     Example:
@@ -191,11 +207,15 @@ class Document:
     external_id: Optional[str] = None
     document_id: str = ""
     compute_metadata: bool = True
+    max_cached_pages: int = 32
 
     pipeline_jobs: dict[str, PipelineJobs] = field(default_factory=dict)
 
     _page_references: dict[int, PageReference] = field(default_factory=dict, init=False, repr=False)
     _images: dict[str, Image] = field(default_factory=dict, init=False, repr=False)
+    _cached_pages: OrderedDict[int, str] = field(default_factory=OrderedDict, init=False, repr=False)
+    _loaded_pages: set[int] = field(default_factory=set, init=False, repr=False)
+    _pdf_source: Optional[Union[PdfDocumentSession, PDFStreamer]] = field(default=None, init=False, repr=False)
     _summary: Optional[CategoryAnnotation] = field(default=None, init=False, repr=False)
     _pdf_bytes: Optional[bytes] = field(default=None, init=False, repr=False)
     _extras: Extras = field(default_factory=Extras, init=False, repr=False)
@@ -268,57 +288,113 @@ class Document:
         return len(self._page_references)
 
     def _load_image_metadata(self) -> None:
-
+        """Create page references for all image files of the directory without loading any image."""
         df = SerializerFiles.load(self.location, file_type=(".png", ".jpg", ".jpeg"))
         df.reset_state()
 
-        refs: dict[int, PageReference] = {}
-        loaded: dict[str, Image] = {}
-
-        for page_number, dp in enumerate(df, start=1):
-            location = Path(dp)
-            image = Image(
-                file_name=location.name,
-                location=dp,
-                page_number=page_number,
-            )
-            loaded[image.image_id] = image
-
-            refs[page_number] = PageReference(source_path=dp, page_number=page_number, image_id=image.image_id)
+        self._page_references = {
+            page_number: PageReference(source_path=dp, page_number=page_number, image_id=get_uuid(dp, Path(dp).name))
+            for page_number, dp in enumerate(df, start=1)
+        }
 
-        self._page_references = refs
-        self._images = loaded
+    def _get_pdf_source(self) -> Union[PdfDocumentSession, PDFStreamer]:
+        """The open PDF document from which pages are loaded. The document is opened only once."""
+        if self._pdf_source is None:
+            if pypdfium2_available():
+                self._pdf_source = PdfDocumentSession(self.location)
+            else:
+                self._pdf_source = PDFStreamer(self.location)
+        return self._pdf_source
 
     def _load_pdf_metadata(self) -> None:
+        """Create page references with the page count and the media boxes of the PDF without loading any page."""
         location_path = Path(self.location)
         if not location_path.exists() or not pypdf_available():
             return
 
-        df = SerializerPdfDoc.load(path=location_path)
-        df.reset_state()
+        page_document_id = get_uuid_from_str(location_path.stem)
+        self._page_references = {
+            page_number: PageReference(
+                source_path=os.fspath(location_path),
+                page_number=page_number,
+                image_id=get_uuid(f"{page_document_id}_{page_number}"),
+                width=width,
+                height=height,
+            )
+            for page_number, (width, height) in enumerate(self._get_pdf_source().get_page_sizes(), start=1)
+        }
 
-        refs: dict[int, PageReference] = {}
-        loaded: dict[str, Image] = {}
+    def _load_page(self, page_number: int) -> Image:
+        """
+        Load a page from the source and add it to the page cache. If the cache is full, the pixels of the least
+        recently used pages are released.
+
+        Args:
+            page_number: 1-based page number
 
-        for dp in df:
+        Returns:
+            The `Image` of the page without pixels
+        """
+        ref = self._page_references[page_number]
+        source_path = Path(ref.source_path)
+        if self.document_type == DocumentFileLabel.PDF:
+            page_document_id = get_uuid_from_str(source_path.stem)
             image = Image(
-                file_name=dp["file_name"],
-                location=os.fspath(location_path),
-                external_id=f"{dp['document_id']}_{dp['page_number']}",
-                document_id=dp["document_id"],
-                page_number=dp["page_number"],
+                file_name=f"{source_path.stem}_{page_number}{source_path.suffix}",
+                location=ref.source_path,
+                external_id=f"{page_document_id}_{page_number}",
+                document_id=page_document_id,
+                page_number=page_number,
             )
-            image.pdf_bytes = dp["pdf_bytes"]
+            page = self._get_pdf_source()[page_number - 1]
+            if isinstance(page, PdfPage):
+                image.pdf_page = page
+            else:
+                image.pdf_bytes = page
+        else:
+            image = Image(file_name=source_path.name, location=ref.source_path, page_number=page_number)
 
-            refs[dp["page_number"]] = PageReference(
-                page_number=dp["page_number"],
-                source_path=os.fspath(location_path),
-                image_id=image.image_id,
-            )
-            loaded[image.image_id] = image
+        self._images[image.image_id] = image
+        self._loaded_pages.add(page_number)
+        self._touch_cached_page(page_number, image.image_id)
+        return image
 
-        self._page_references = refs
-        self._images = loaded
+    def _touch_cached_page(self, page_number: int, image_id: str) -> None:
+        """
+        Mark a page loaded from the source as most recently used. If the cache is full, the pixels of the least
+        recently used pages are released. The pages themselves are not dropped, as they might still be held and
+        annotated by the caller.
+        """
+        self._cached_pages[page_number] = image_id
+        self._cached_pages.move_to_end(page_number)
+        while len(self._cached_pages) > max(self.max_cached_pages, 1):
+            _, released_image_id = self._cached_pages.popitem(last=False)
+            released_image = self._images.get(released_image_id)
+            if released_image is not None:
+                released_image.clear_image()
+
+    def _load_pdf_page_bytes(self, page_number: int) -> bytes:
+        page = self._get_pdf_source()[page_number - 1]
+        return page.to_bytes() if isinstance(page, PdfPage) else page
+
+    def _get_image_by_id(self, image_id: str) -> Image:
+        """Return the `Image` of a page by its `image_id`. Pages that are not in memory are loaded from the source."""
+        if image_id in self._images:
+            return self._images[image_id]
+        for page_number, ref in self._page_references.items():
+            if ref.image_id == image_id:
+                return self._get_image_by_page_number(page_number)
+        raise KeyError(image_id)
+
+    def _get_image_by_page_number(self, page_number: int) -> Image:
+        ref = self._page_references.get(page_number)
+        if ref is not None and ref.image_id and ref.image_id in self._images:
+            if page_number in self._loaded_pages:
+                self._touch_cached_page(page_number, ref.image_id)
+            return self._images[ref.image_id]
+        if ref is not None and self.document_type is not None and Path(ref.source_path).exists():
+            return self._load_page(page_number)
+        raise ValueError(f"Image for page {page_number} could not be found.")
 
     def get_page_reference(self, page_number: int) -> PageReference:
         """get page reference from page number."""
@@ -444,7 +520,8 @@ class Document:
         Resolution order:
         1) fetch by `image_id` from `_images`
         2) ensure `_page_references` initialized, then fetch by `page_number`
-        3) load/clear pixel payload based on `load_pixels` and `document_type`
+        3) load the page from the source, if it is not in memory
+        4) load/clear pixel payload based on `load_pixels` and `document_type`
 
         Args:
             page_number: 1-based page number to fetch (first page = 1).
@@ -458,15 +535,7 @@ class Document:
         if page_number is None and image_id is None:
             raise ValueError("Page number or image_id must be provided")
 
-        def _load_pdf_page_bytes(target_page_number: Optional[int]) -> Optional[bytes]:
-            df = SerializerPdfDoc.load(path=self.location)
-            df.reset_state()
-            for dp in enumerate(df):
-                if dp[1]["page_number"] == target_page_number:
-                    return dp[1]["pdf_bytes"]
-            return None
-
-        def _apply_pixel_policy(img: Image, target_page_number: Optional[int]) -> Image:
+        def _apply_pixel_policy(img: Image) -> Image:
             if load_pixels and img._image is not None:
                 return img
 
@@ -479,14 +548,18 @@ class Document:
                 return img
 
             if load_pixels and self.document_type == DocumentFileLabel.PDF:
-                img.image = _load_pdf_page_bytes(target_page_number)
+                if img.pdf_page is not None:
+                    img.image = img.pdf_page.render(dpi=int(os.environ["DPI"]))
+                elif img.pdf_bytes is not None:
+                    img.image = img.pdf_bytes
+                else:
+                    img.image = self._load_pdf_page_bytes(img.page_number)
                 return img
 
             return img
 
         if image_id is not None:
-            img = self._images[image_id]
-            return _apply_pixel_policy(img, page_number)
+            return _apply_pixel_policy(self._get_image_by_id(image_id))
 
         if not self._page_references:
             self._initialize_page_references()
@@ -497,12 +570,7 @@ class Document:
         if page_number < 1 or page_number > self.number_of_pages:
             raise IndexError(f"Page number {page_number} out of range (1-{self.number_of_pages})")
 
-        ref = self._page_references.get(page_number)
-        if ref is not None and ref.image_id and ref.image_id in self._images:
-            img = self._images[ref.image_id]
-            return _apply_pixel_policy(img, page_number)
-
-        raise ValueError(f"Image for page {page_number} could not be found.")
+        return _apply_pixel_policy(self._get_image_by_page_number(page_number))
 
     def get_page(
         self, page_number: Optional[int] = None, image_id: Optional[str] = None, load_image: bool = False
@@ -547,8 +615,11 @@ class Document:
 
     def set_image(self, image: Image, page_number: int) -> None:
         """
-        Store a processed `Image` for a page and update the corresponding `PageReference.image_id`.
+        Store a processed `Image` for a page and update the corresponding `PageReference.image_id`. The image is not
+        part of the page cache and will therefore never be evicted.
         """
+        self._cached_pages.pop(page_number, None)
+        self._loaded_pages.discard(page_number)
         maybe_reference = self._page_references.get(page_number)
         if maybe_reference:
             if (
@@ -590,7 +661,7 @@ class Document:
         Returns:
             list[ImageAnnotationBaseView]: List of matching annotation views.
         """
-        img = self._images[image_id]
+        img = self._get_image_by_id(image_id)
         page = Page.from_image(img)
         return page.get_annotation(
             category_names=category_names,
@@ -618,17 +689,57 @@ class Document:
         """
         if page_number in self._page_references:
             image_id = self._page_references[page_number].image_id
-            del self._images[image_id]  # type: ignore
+            self._images.pop(image_id, None)  # type: ignore
+            self._cached_pages.pop(page_number, None)
+            self._loaded_pages.discard(page_number)
             del self._page_references[page_number]
 
+    def evict_page(self, page_number: int) -> None:
+        """
+        Release the memory of a page while keeping the page in the document.
+
+        A page that has been loaded from the source and carries no annotations is dropped and will be loaded again
+        on the next access. For all other pages only the pixels are released.
+
+        Args:
+            page_number: 1-indexed page number
+        """
+        ref = self._page_references.get(page_number)
+        if ref is None or ref.image_id not in self._images:
+            return
+        image = self._images[ref.image_id]
+        self._cached_pages.pop(page_number, None)
+        has_summary = image._summary is not None and bool(image._summary.sub_categories)
+        if page_number in self._loaded_pages and not image.annotations and not has_summary:
+            self._loaded_pages.discard(page_number)
+            del self._images[ref.image_id]
+        else:
+            image.clear_image()
+
+    def evict_all_pages(self) -> None:
+        """Release the memory of all pages while keeping the page references. See `evict_page`."""
+        for page_number in list(self._page_references):
+            self.evict_page(page_number)
+
     def unload_all_pages(self) -> None:
         """Unload all pages from memory."""
         self._images.clear()
+        self._cached_pages.clear()
+        self._loaded_pages.clear()
         self._page_references.clear()
 
-    def as_dict(self) -> dict[str, Any]:
-        """Return document metadata as dict."""
-        return {
+    def as_dict(self, pixel_policy: PixelExportPolicy = "embed") -> dict[str, Any]:
+        """
+        Return document metadata as dict.
+
+        Args:
+            pixel_policy: `embed` encodes the pixels of the loaded pages as base64 strings, `external` and `omit` leave
+                them out. See `Image.as_dict`.
+        """
+        return self._export_dict(with_images=True, pixel_policy=pixel_policy)
+
+    def _export_dict(self, with_images: bool, pixel_policy: PixelExportPolicy = "embed") -> dict[str, Any]:
+        export_dict: dict[str, Any] = {
             "file_name": self.file_name,
             "location": os.fspath(self.location) if self.location is not None else None,
             "document_type": self.document_type,
@@ -637,9 +748,11 @@ class Document:
             "compute_metadata": self.compute_metadata,
             "pipeline_jobs": {k: asdict(v) for k, v in self.pipeline_jobs.items()},
             "_summary": self._summary.as_dict() if self._summary is not None else None,
-            "_images": {key: val.as_dict() for key, val in self._images.items()},
-            "_page_references": {key: asdict(value) for key, value in self._page_references.items()},
         }
+        if with_images:
+            export_dict["_images"] = {key: val.as_dict(pixel_policy=pixel_policy) for key, val in self._images.items()}
+        export_dict["_page_references"] = {key: asdict(value) for key, value in self._page_references.items()}
+        return export_dict
 
     def as_json(self) -> str:
         """Return document metadata as JSON string."""
@@ -668,12 +781,14 @@ class Document:
         path: Optional[PathLikeOrStr] = None,
         dry: bool = False,
         extra_file: bool = False,
+        file_format: Literal["json", "npz"] = "json",
     ) -> Optional[Union[dict[str, Any], str]]:
         """
         Save the document instance to a JSON file (or return a dict when `dry=True`).
 
         Args:
-            image_to_json: If `True` keeps image payloads when present; if `False` strips `_image` keys recursively.
+            image_to_json: If `True` keeps image payloads when present; if `False` exports `_image` keys as `None`
+                without encoding any pixels.
             image_to_dir: If True, export pixel payloads as image files in a directory.
             highest_hierarchy_only: If `True` removes heavier/low level image data more aggressively.
             path: Path to save the `.json` file to. If `None`, uses `self.location`.
@@ -684,24 +799,16 @@ class Document:
                 summary, then written to a sidecar file named
                 ``<path_without_.json>_extra.json``.  The main JSON will not contain those
                 annotations.  When ``dry=True`` this step is skipped entirely.
+            file_format: `json` or `npz`. With `npz` all loaded pages are saved in the binary columnar format of
+                `dd_core.datapoint.columnar` and the document metadata is saved alongside. Pixels are saved as raw
+                arrays. Load the file with :meth:`from_file`.
 
         Returns:
-            A dict if `dry=True`, otherwise the JSON file path as string.
+            A dict if `dry=True`, otherwise the JSON (resp. `.npz`) file path as string.
         """
-
-        def set_image_keys_to_none(d: Any) -> None:
-            if isinstance(d, dict):
-                for key, value in d.items():
-                    if key == "_image":
-                        d[key] = None
-                    else:
-                        set_image_keys_to_none(value)
-            elif isinstance(d, list):
-                for item in d:
-                    set_image_keys_to_none(item)
-
         if image_to_dir:
             image_to_json = False
+        pixel_policy: PixelExportPolicy = "external" if image_to_dir else "embed" if image_to_json else "omit"
 
         if image_to_dir:
             loc = Path(self.location) if self.location else Path()
@@ -754,13 +861,18 @@ class Document:
             else:
                 img.remove_image_from_lower_hierarchy(pixel_values_only=True)
 
-        export_dict = self.as_dict()
+        if file_format == "npz" and not dry:
+            return save_columnar(
+                list(self._images.values()),
+                path_json[: -len(".json")] + ".npz",
+                image_to_blob=pixel_policy == "embed",
+                metadata=self._export_dict(with_images=False),
+            )
+
+        export_dict = self.as_dict(pixel_policy=pixel_policy)
         if "location" in export_dict and export_dict["location"] is not None:
             export_dict["location"] = os.fspath(export_dict["location"])
 
-        if not image_to_json:
-            set_image_keys_to_none(export_dict)
-
         if dry:
             return export_dict
 
@@ -770,7 +882,7 @@ class Document:
         return path_json
 
     @classmethod
-    def from_dict(cls, inputs: dict[str, Any]) -> Document:
+    def from_dict(cls, inputs: dict[str, Any], trusted: bool = False) -> Document:
         """
         Create a ``Document`` instance from a dict that has the same shape as
         ``as_dict()`` / ``from_json()``.
@@ -782,6 +894,9 @@ class Document:
 
         Args:
             inputs: Dict with the same keys as produced by :meth:`as_dict`.
+            trusted: If `True`, pages and the summary are built with `Image.from_trusted` resp.
+                `CategoryAnnotation.from_trusted`, i.e. without validation. Only use it for dicts produced by
+                :meth:`as_dict`.
 
         Returns:
             Document: Fully restored ``Document`` instance.
@@ -817,7 +932,11 @@ class Document:
             doc._summary = (
                 summary_raw
                 if isinstance(summary_raw, CategoryAnnotation)
-                else CategoryAnnotation.from_dict(**summary_raw)
+                else (
+                    CategoryAnnotation.from_trusted(**summary_raw)
+                    if trusted
+                    else CategoryAnnotation.from_dict(**summary_raw)
+                )
             )
 
         if images_raw is not None:
@@ -825,6 +944,8 @@ class Document:
             for image_id, img in images_raw.items():
                 if isinstance(img, Image):
                     restored_images[image_id] = img
+                elif trusted:
+                    restored_images[image_id] = Image.from_trusted(**img)
                 else:
                     restored_images[image_id] = Image(**img)
                     if img.get("_image"):
@@ -840,7 +961,7 @@ class Document:
         return doc
 
     @classmethod
-    def from_json(cls, file_path: PathLikeOrStr, extra_file: bool = False) -> Document:
+    def from_json(cls, file_path: PathLikeOrStr, extra_file: bool = False, trusted: bool = False) -> Document:
         """
         Create `Document` instance from `.json` file.
 
@@ -852,6 +973,8 @@ class Document:
             extra_file: If `True`, also loads the sidecar ``_extra.json`` file (expected in the same
                 directory) and dumps each annotation back into its original location using the
                 accompanying `AnnotationMap`.
+            trusted: If `True`, pages and the summary are loaded without validation. Only use it for files that
+                have been written by :meth:`save` and that have not been modified afterwards. See :meth:`from_dict`.
 
         Returns:
             Document: Fully restored ``Document`` instance.
@@ -859,27 +982,57 @@ class Document:
         with open(file_path, "r", encoding="UTF-8") as f:
             raw: dict[str, Any] = json.load(f)
 
-        doc = cls.from_dict(raw)
+        doc = cls.from_dict(raw, trusted=trusted)
 
         if extra_file:
-            extra_path = os.fspath(file_path).replace(".json", "_extra.json")
-            with open(extra_path, "r", encoding="UTF-8") as ef:
-                extra_data: list[dict[str, Any]] = json.load(ef)
-
-            for ann_data in extra_data:
-                ann_maps = [AnnotationMap.from_dict(**map_dict) for map_dict in ann_data["annotation_maps"]]
-                ann = CategoryAnnotation.from_dict(**ann_data["annotation"])
-                if ann.active:
-                    for ann_map in ann_maps:
-                        if (
-                            ann_map.sub_category_key is not None
-                            or ann_map.summary_key is not None
-                            or ann_map.doc_summary_key is not None
-                        ):
-                            doc._dump_by_annotation_map(ann_map, ann)
+            doc._load_extra_file(os.fspath(file_path).replace(".json", "_extra.json"))
 
         return doc
 
+    @classmethod
+    def from_file(cls, file_path: PathLikeOrStr, extra_file: bool = False, trusted: bool = False) -> Document:
+        """
+        Create `Document` instance from a `.json` file or from a columnar `.npz` file produced by :meth:`save`.
+
+        Args:
+            file_path: Path to the `.json` or `.npz` file.
+            extra_file: If `True`, also loads the sidecar ``_extra.json`` file. See :meth:`from_json`.
+            trusted: If `True`, pages and the summary are loaded without validation. See :meth:`from_json`.
+
+        Returns:
+            Document: Fully restored ``Document`` instance.
+        """
+        if not os.fspath(file_path).endswith(".npz"):
+            return cls.from_json(file_path, extra_file=extra_file, trusted=trusted)
+
+        constructor = Image.from_trusted if trusted else Image
+        with ColumnarReader(file_path) as reader:
+            raw: dict[str, Any] = dict(reader.metadata)
+            raw["_images"] = {image.image_id: image for image in (constructor(**image_dict) for image_dict in reader)}
+
+        doc = cls.from_dict(raw, trusted=trusted)
+
+        if extra_file:
+            doc._load_extra_file(os.fspath(file_path).replace(".npz", "_extra.json"))
+
+        return doc
+
+    def _load_extra_file(self, extra_path: str) -> None:
+        with open(extra_path, "r", encoding="UTF-8") as ef:
+            extra_data: list[dict[str, Any]] = json.load(ef)
+
+        for ann_data in extra_data:
+            ann_maps = [AnnotationMap.from_dict(**map_dict) for map_dict in ann_data["annotation_maps"]]
+            ann = CategoryAnnotation.from_dict(**ann_data["annotation"])
+            if ann.active:
+                for ann_map in ann_maps:
+                    if (
+                        ann_map.sub_category_key is not None
+                        or ann_map.summary_key is not None
+                        or ann_map.doc_summary_key is not None
+                    ):
+                        self._dump_by_annotation_map(ann_map, ann)
+
     def viz_entities(  # type
         self,
         scaled_width: int = 900,
@@ -77,6 +77,7 @@ def cat_to_sub_cat(
         if sub_cat:
             ann.category_name = sub_cat.category_name
             ann.category_id = categories_dict_names_as_key.get(ann.category_name, DEFAULT_CATEGORY_ID)
+    dp.reindex_annotations()
 
     return dp
 
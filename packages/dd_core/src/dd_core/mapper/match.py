@@ -26,6 +26,7 @@ from lazy_imports import try_import
 from numpy.typing import NDArray
 
 from ..datapoint.annotation import ImageAnnotation
+from ..datapoint.box import area, intersecting_pairs
 from ..datapoint.box import ioa as np_ioa
 from ..datapoint.box import iou
 from ..datapoint.image import Image
@@ -35,6 +36,115 @@ with try_import() as scipy_import_guard:
     from scipy.spatial import distance
 
 
+def _match_boxes_by_sparse_intersection(
+    child_boxes: NDArray[np.float32],
+    parent_boxes: NDArray[np.float32],
+    matching_rule: Literal["iou", "ioa"],
+    threshold: float,
+    use_weighted_intersections: bool,
+    max_parent_only: bool,
+) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+    """
+    Same as the dense branch of `match_anns_by_intersection` but only evaluates pairs of boxes that intersect. Requires
+    `threshold >= 0` or `max_parent_only`, because only then pairs without intersection can never be matched.
+    """
+    child_index, parent_index, intersect = intersecting_pairs(child_boxes, parent_boxes)
+    if matching_rule == "iou":
+        union = area(child_boxes)[child_index] + area(parent_boxes)[parent_index] - intersect
+        output = intersect / union > threshold
+        return child_index[output], parent_index[output]
+
+    ioa_values = intersect * (1.0 / area(child_boxes))[child_index]
+    if max_parent_only:
+        candidates = (ioa_values >= threshold) & (ioa_values > 0)
+        child_index, parent_index, ioa_values = (
+            child_index[candidates],
+            parent_index[candidates],
+            ioa_values[candidates],
+        )
+        # for each child, pick the parent with the highest ioa and the lowest index among equal ones
+        order = np.lexsort((parent_index, -ioa_values, child_index))
+        child_index, parent_index = child_index[order], parent_index[order]
+        first = np.ones(len(child_index), dtype=bool)
+        first[1:] = child_index[1:] != child_index[:-1]
+        return child_index[first], parent_index[first]
+
+    if use_weighted_intersections:
+        num_intersections = np.bincount(child_index, minlength=len(child_boxes)).astype(np.float64)
+        output = num_intersections[child_index] * ioa_values > threshold
+    else:
+        output = ioa_values > threshold
+    return child_index[output], parent_index[output]
+
+
+def match_boxes_by_intersection(
+    child_boxes: NDArray[np.float32],
+    parent_boxes: NDArray[np.float32],
+    matching_rule: Literal["iou", "ioa"],
+    threshold: float,
+    use_weighted_intersections: bool = False,
+    max_parent_only: bool = False,
+    use_spatial_index: bool = False,
+) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+    """
+    Box level version of `match_anns_by_intersection`. Returns pairs of child/parent indices of boxes with iou/ioa above
+    some threshold.
+
+    Args:
+        child_boxes: Array of shape `(N, 4)` of child boxes in `xyxy` format.
+        parent_boxes: Array of shape `(M, 4)` of parent boxes in `xyxy` format.
+        matching_rule: Intersection measure type, either `iou` or `ioa`.
+        threshold: Threshold for the given matching rule.
+        use_weighted_intersections: Multiplies each ioa with the number of intersections of the child.
+        max_parent_only: Will assign to each child at most one parent with maximum ioa.
+        use_spatial_index: Only evaluates intersecting pairs of children and parents instead of computing the full
+            iou/ioa-matrix.
+
+    Returns:
+        child indices and parent indices
+    """
+    if len(child_boxes) == 0 or len(parent_boxes) == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+    if use_spatial_index and (threshold >= 0 or (matching_rule == "ioa" and max_parent_only)):
+        return _match_boxes_by_sparse_intersection(
+            child_boxes, parent_boxes, matching_rule, threshold, use_weighted_intersections, max_parent_only
+        )
+    if matching_rule in ["iou"]:
+        iou_matrix = iou(child_boxes, parent_boxes)
+        output = iou_matrix > threshold
+        child_index, parent_index = output.nonzero()
+    elif matching_rule in ["ioa"]:
+        ioa_matrix = np.transpose(np_ioa(parent_boxes, child_boxes))
+
+        if max_parent_only:
+            # set all matrix values below threshold to 0
+            ioa_matrix[ioa_matrix < threshold] = 0
+            # add a dummy column to the left. argmax will choose this column if all ioa values of one child are 0.
+            # This index will be ignored in output
+            ioa_matrix = np.hstack([np.zeros((ioa_matrix.shape[0], 1)), ioa_matrix])
+            child_index_arg_max = ioa_matrix.argmax(1)
+            child_index = child_index_arg_max.nonzero()[0]
+            child_index_nonzero = child_index_arg_max[child_index]
+            # reduce parent index by one, as all indices have been increased by one because of the dummy column
+            parent_index = child_index_nonzero - np.ones(child_index_nonzero.shape[0], dtype=np.intc)
+        else:
+
+            def _weighted_ioa_matrix(mat: NDArray[np.float32]) -> NDArray[np.float32]:
+                sum_of_rows = (mat != 0).sum(1)
+                multiplier = np.transpose(sum_of_rows * np.ones((mat.shape[1], mat.shape[0])))
+                return multiplier * mat
+
+            if use_weighted_intersections:
+                ioa_matrix = _weighted_ioa_matrix(ioa_matrix)
+            output = ioa_matrix > threshold
+            child_index, parent_index = output.nonzero()
+    else:
+        raise ValueError(f"matching rule must be either iou or ioa, got {matching_rule}")
+
+    return child_index, parent_index
+
+
 def match_anns_by_intersection(
     dp: Image,
     matching_rule: Literal["iou", "ioa"],
@@ -47,6 +157,7 @@ def match_anns_by_intersection(
     parent_ann_service_ids: Optional[Union[str, Sequence[str]]] = None,
     child_ann_service_ids: Optional[Union[str, Sequence[str]]] = None,
     max_parent_only: bool = False,
+    use_spatial_index: bool = False,
 ) -> tuple[Any, Any, Sequence[ImageAnnotation], Sequence[ImageAnnotation]]:
     """
     Generates an iou/ioa-matrix for `parent_ann_categories` and `child_ann_categories` and returns pairs of child/parent
@@ -84,6 +195,11 @@ def match_anns_by_intersection(
             In some situations, you want to assign to each child at most one parent. Setting `max_parent_only` to `True`
             will select the parent with the highest ioa. There is currently no implementation for iou.
 
+        Note:
+            Setting `use_spatial_index` to `True` will not compute the full iou/ioa-matrix but only evaluate pairs of
+            children and parents whose boxes intersect (see `intersecting_pairs`). This is much faster for pages with
+            many annotations and returns the same indices. Negative thresholds always use the full matrix.
+
     Args:
         dp: Image datapoint.
         matching_rule: Intersection measure type, either `iou` or `ioa`.
@@ -104,6 +220,8 @@ def match_anns_by_intersection(
         child_ann_service_ids: Additional filter condition. If some ids are selected, it will ignore all other children
             candidates which are not in the list.
         max_parent_only: Will assign to each child at most one parent with maximum ioa.
+        use_spatial_index: Only evaluates intersecting pairs of children and parents instead of computing the full
+            iou/ioa-matrix.
 
     Returns:
         child indices, parent indices (see Example), list of parent ids and list of children ids.
@@ -114,56 +232,25 @@ def match_anns_by_intersection(
     child_anns = dp.get_annotation(
         annotation_ids=child_ann_ids, category_names=child_ann_category_names, service_ids=child_ann_service_ids
     )
-    child_ann_boxes = np.array(
-        [
-            ann.get_bounding_box(dp.image_id).transform(dp.width, dp.height, absolute_coords=True).to_list(mode="xyxy")
-            for ann in child_anns
-        ]
-    )
+    child_ann_boxes = dp.get_annotation_boxes(child_anns)
 
     parent_anns = dp.get_annotation(
         annotation_ids=parent_ann_ids, category_names=parent_ann_category_names, service_ids=parent_ann_service_ids
     )
-    parent_ann_boxes = np.array(
-        [
-            ann.get_bounding_box(dp.image_id).transform(dp.width, dp.height, absolute_coords=True).to_list(mode="xyxy")
-            for ann in parent_anns
-        ]
-    )
-
-    if matching_rule in ["iou"] and parent_anns and child_anns:
-        iou_matrix = iou(child_ann_boxes, parent_ann_boxes)
-        output = iou_matrix > threshold
-        child_index, parent_index = output.nonzero()
-    elif matching_rule in ["ioa"] and parent_anns and child_anns:
-        ioa_matrix = np.transpose(np_ioa(parent_ann_boxes, child_ann_boxes))
-
-        if max_parent_only:
-            # set all matrix values below threshold to 0
-            ioa_matrix[ioa_matrix < threshold] = 0
-            # add a dummy column to the left. argmax will choose this column if all ioa values of one child are 0.
-            # This index will be ignored in output
-            ioa_matrix = np.hstack([np.zeros((ioa_matrix.shape[0], 1)), ioa_matrix])
-            child_index_arg_max = ioa_matrix.argmax(1)
-            child_index = child_index_arg_max.nonzero()[0]
-            child_index_nonzero = child_index_arg_max[child_index]
-            # reduce parent index by one, as all indices have been increased by one because of the dummy column
-            parent_index = child_index_nonzero - np.ones(child_index_nonzero.shape[0], dtype=np.intc)
-        else:
-
-            def _weighted_ioa_matrix(mat: NDArray[np.float32]) -> NDArray[np.float32]:
-                sum_of_rows = (mat != 0).sum(1)
-                multiplier = np.transpose(sum_of_rows * np.ones((mat.shape[1], mat.shape[0])))
-                return multiplier * mat
-
-            if use_weighted_intersections:
-                ioa_matrix = _weighted_ioa_matrix(ioa_matrix)
-            output = ioa_matrix > threshold
-            child_index, parent_index = output.nonzero()
+    parent_ann_boxes = dp.get_annotation_boxes(parent_anns)
 
-    else:
+    if not parent_anns or not child_anns:
         return [], [], [], []
 
+    child_index, parent_index = match_boxes_by_intersection(
+        child_ann_boxes,
+        parent_ann_boxes,
+        matching_rule,
+        threshold,
+        use_weighted_intersections=use_weighted_intersections,
+        max_parent_only=max_parent_only,
+        use_spatial_index=use_spatial_index,
+    )
     return child_index, parent_index, child_anns, parent_anns
 
 
@@ -206,6 +293,8 @@ def match_anns_by_distance(
     child_anns = dp.get_annotation(
         annotation_ids=child_ann_ids, category_names=child_ann_category_names, service_ids=child_ann_service_ids
     )
+    # Centers are taken in the coordinates of each bounding box, i.e. relative coordinates are not scaled with the
+    # size of the image
     child_centers = [block.get_bounding_box(dp.image_id).center for block in child_anns]
     parent_centers = [block.get_bounding_box(dp.image_id).center for block in parent_anns]
     if child_centers and parent_centers:
@@ -30,6 +30,7 @@ from lazy_imports import try_import
 from ..datapoint.convert import convert_bytes_to_np_array, convert_pdf_bytes_to_np_array_v2
 from ..datapoint.image import Image
 from ..utils.fs import get_load_image_func, load_image_from_file
+from ..utils.pdf_utils import PdfPage
 from ..utils.types import JsonDict
 from ..utils.utils import is_file_extension
 from .maputils import MappingContextManager, curry
@@ -88,10 +89,14 @@ def to_image(
             dp_image.document_id = document_id
         if file_name is not None:
             if is_file_extension(file_name, ".pdf") and isinstance(dp, dict):
+                pdf_page = dp.get("pdf_page")
                 pdf_bytes_from_dict = dp.get("pdf_bytes")
-                if pdf_bytes_from_dict is not None and isinstance(pdf_bytes_from_dict, bytes):
+                if isinstance(pdf_page, PdfPage):
+                    dp_image.pdf_page = pdf_page
+                    dp_image.image = pdf_page.render(dpi=dpi, width=width, height=height)
+                elif pdf_bytes_from_dict is not None and isinstance(pdf_bytes_from_dict, bytes):
                     dp_image.pdf_bytes = pdf_bytes_from_dict
-                if dp_image.pdf_bytes is not None:
+                if dp_image.pdf_page is None and dp_image.pdf_bytes is not None:
                     if isinstance(dp_image.pdf_bytes, bytes):
                         dp_image.image = convert_pdf_bytes_to_np_array_v2(
                             dp_image.pdf_bytes, dpi=dpi, width=width, height=height
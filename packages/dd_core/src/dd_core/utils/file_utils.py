@@ -332,6 +332,20 @@ def get_tesseract_requirement() -> Requirement:
     return "tesseract", False, _TESS_ERR_MSG
 
 
+# tesserocr, an in-process API for Tesseract
+_TESSEROCR_AVAILABLE = importlib.util.find_spec("tesserocr") is not None
+
+
+def tesserocr_available() -> bool:
+    """
+    Returns whether `tesserocr` is installed.
+
+    Returns:
+        bool: `True` if `tesserocr` is installed, False otherwise.
+    """
+    return bool(_TESSEROCR_AVAILABLE)
+
+
 # Poppler utils or resp. pdftoppm and pdftocairo for Linux platforms
 _PDF_TO_PPM_AVAILABLE = which("pdftoppm") is not None
 _PDF_TO_CAIRO_AVAILABLE = which("pdftocairo") is not None
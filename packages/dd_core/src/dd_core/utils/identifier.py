@@ -21,17 +21,27 @@ Generating and checking uuids
 from __future__ import annotations
 
 import hashlib
+import re
 import uuid
+from typing import Iterable, Sequence
 
-from .types import PathLikeOrStr
+import numpy as np
 
-__all__ = ["is_uuid_like", "get_uuid_from_str", "get_uuid"]
+from .types import PathLikeOrStr, PixelValues
+
+__all__ = ["is_uuid_like", "get_uuid_from_str", "get_uuid", "get_uuids", "get_np_array_digest"]
+
+_UUID_PATTERN = re.compile(r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}")
+_UUID3_NAMESPACE_HASH = hashlib.md5(uuid.NAMESPACE_DNS.bytes, usedforsecurity=False)
 
 
 def is_uuid_like(input_id: str) -> bool:
     """
     Check if the input string has a UUID3 string representation format.
 
+    The canonical hyphenated representation is checked with a regular expression. Only other representations that
+    are accepted by `uuid.UUID` (e.g. with braces or without hyphens) fall back to constructing a `uuid.UUID`.
+
     Example:
         ```python
         is_uuid_like("886313e1-3b8a-5372-9b90-0c9aee199e5d")
@@ -43,13 +53,29 @@ def is_uuid_like(input_id: str) -> bool:
     Returns:
         A boolean output.
     """
+    input_id = str(input_id)
+    if len(input_id) == 36 and _UUID_PATTERN.fullmatch(input_id):
+        return True
+    if len(input_id) < 32:
+        return False
     try:
-        uuid.UUID(str(input_id))
+        uuid.UUID(input_id)
         return True
     except ValueError:
         return False
 
 
+def _uuid3_from_bytes(name: bytes) -> str:
+    # same result as `str(uuid.uuid3(uuid.NAMESPACE_DNS, name))` without constructing a `uuid.UUID`
+    hash_md5 = _UUID3_NAMESPACE_HASH.copy()
+    hash_md5.update(name)
+    digest = bytearray(hash_md5.digest())
+    digest[6] = (digest[6] & 0x0F) | 0x30
+    digest[8] = (digest[8] & 0x3F) | 0x80
+    hex_str = digest.hex()
+    return f"{hex_str[:8]}-{hex_str[8:12]}-{hex_str[12:16]}-{hex_str[16:20]}-{hex_str[20:]}"
+
+
 def get_uuid_from_str(input_id: str) -> str:
     """
     Return a UUID3 string representation generated from an input string.
@@ -60,7 +86,7 @@ def get_uuid_from_str(input_id: str) -> str:
     Returns:
         UUID3 string representation.
     """
-    return str(uuid.uuid3(uuid.NAMESPACE_DNS, input_id))
+    return _uuid3_from_bytes(input_id.encode("utf-8"))
 
 
 def get_uuid(*inputs: str) -> str:
@@ -77,6 +103,26 @@ def get_uuid(*inputs: str) -> str:
     return get_uuid_from_str(str_input)
 
 
+def get_uuids(inputs: Iterable[Sequence[str]]) -> list[str]:
+    """
+    Batched version of `get_uuid`. Generates one UUID for every sequence of string inputs. The result is identical to
+    `[get_uuid(*item) for item in inputs]` but avoids the per call overhead when generating ids for many
+    annotations at once.
+
+    Example:
+        ```python
+        get_uuids([("word", "Bounding Box ulx: 1.0, ..."), ("word", "Bounding Box ulx: 5.0, ...")])
+        ```
+
+    Args:
+        inputs: An iterable of sequences of string inputs.
+
+    Returns:
+        List of UUID3 string representations.
+    """
+    return [_uuid3_from_bytes("".join(item).encode("utf-8")) for item in inputs]
+
+
 def get_md5_hash(path: PathLikeOrStr, buffer_size: int = 65536) -> str:
     """
     Calculate an MD5 hash for a given file.
@@ -96,3 +142,20 @@ def get_md5_hash(path: PathLikeOrStr, buffer_size: int = 65536) -> str:
             hash_md5.update(chunk)
 
     return hash_md5.hexdigest()
+
+
+def get_np_array_digest(np_array: PixelValues) -> str:
+    """
+    Calculate a content hash of a numpy array. Hashes the raw buffer together with shape and dtype, which is much
+    cheaper than encoding the array into an image format.
+
+    Args:
+        np_array: A numpy array.
+
+    Returns:
+        Hex digest string.
+    """
+    hash_blake = hashlib.blake2b(digest_size=16)
+    hash_blake.update(f"{np_array.shape}{np_array.dtype.str}".encode())
+    hash_blake.update(np.ascontiguousarray(np_array).data)
+    return hash_blake.hexdigest()
@@ -126,7 +126,10 @@ def _get_black_list() -> list[str]:
 
 def update_black_list(item: str) -> None:
     """Updates the black list, i.e. set of elements that must not be lowered"""
-    _BLACK_LIST.append(item)
+    global _GET_TYPE_MEMO  # pylint: disable=W0603
+    with _TYPES_INDEX_LOCK:
+        _BLACK_LIST.append(item)
+        _GET_TYPE_MEMO = {}
 
 
 def _normalize_object_type_value(obj_type: str) -> str:
@@ -212,9 +215,14 @@ def _rebuild_types_index_locked() -> None:
     """
     Rebuild the global lookup index from the registry.
     Caller must hold _TYPES_INDEX_LOCK.
+
+    The index is never mutated in place but swapped for a new dict, so that `get_type` can read it without taking
+    the lock. The memo of `get_type` is swapped after the index, so that a reader that sees the new memo also sees
+    the new index.
     """
-    global _ALL_TYPES_DICT  # pylint: disable=W0603
+    global _ALL_TYPES_DICT, _GET_TYPE_MEMO  # pylint: disable=W0603
     _ALL_TYPES_DICT = _build_types_index_from_registry()
+    _GET_TYPE_MEMO = {}
 
 
 def _rebuild_types_index() -> None:
@@ -337,6 +345,9 @@ def get_type(obj_type: Union[str, ObjectTypes]) -> ObjectTypes:
 
     If ENABLE_DYNAMIC_OBJECT_TYPES is enabled, unknown string values are dynamically
     registered under DYNAMIC_OBJECT_TYPES_ENUM_NAME.
+
+    Lookups do not take a lock. Resolved strings are memoized, so that repeated lookups of the same string are a
+    single dict access. The memo is reset whenever the lookup index is rebuilt or the black list is updated.
     """
     if isinstance(obj_type, ObjectTypes):
         return obj_type
@@ -344,9 +355,27 @@ def get_type(obj_type: Union[str, ObjectTypes]) -> ObjectTypes:
     if not isinstance(obj_type, str):
         raise TypeError(f"get_type expects str or ObjectTypes, got {type(obj_type)}")
 
+    # Lock-free read path: The memo is read before the index, see `_rebuild_types_index_locked`
+    memo = _GET_TYPE_MEMO
+    member = memo.get(obj_type)
+    if member is not None:
+        return member
+
     normalized = _normalize_object_type_value(obj_type)
+    member = _ALL_TYPES_DICT.get(normalized)
+    if member is None:
+        member = _register_dynamic_type(normalized)
+    memo[obj_type] = member
+    return member
+
 
+def _register_dynamic_type(normalized: str) -> ObjectTypes:
+    """
+    Registers a normalized string that is not in the lookup index under `DYNAMIC_OBJECT_TYPES`, if
+    ENABLE_DYNAMIC_OBJECT_TYPES is enabled.
+    """
     with _TYPES_INDEX_LOCK:
+        # another thread might have registered the value in the meantime
         member = _ALL_TYPES_DICT.get(normalized)
         if member is not None:
             return member
@@ -385,6 +414,7 @@ object_types_registry.register = _wrapped_register
 
 _TYPES_INDEX_LOCK = threading.RLock()
 _ALL_TYPES_DICT: dict[str, ObjectTypes] = {}
+_GET_TYPE_MEMO: dict[str, ObjectTypes] = {}
 
 
 _rebuild_types_index()
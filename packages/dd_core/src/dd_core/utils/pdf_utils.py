@@ -21,24 +21,35 @@ Pdf processing tools
 
 from __future__ import annotations
 
+import hashlib
+import multiprocessing as mp
 import os
 import platform
 import subprocess
 import sys
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from errno import ENOENT
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Generator, Literal, Optional, Union
+from typing import Any, Generator, Literal, Optional, Sequence, Union
 
+import numpy as np
 from lazy_imports import try_import
 from numpy import uint8
 
-from .context import save_tmp_file, timeout_manager
 from .env_info import ENV_VARS_TRUE
 from .error import DependencyError, FileExtensionError, PopplerError
-from .file_utils import pdf_to_cairo_available, pdf_to_ppm_available, pikepdf_available, pypdf_available
+from .file_utils import (
+    pdf_to_cairo_available,
+    pdf_to_ppm_available,
+    pikepdf_available,
+    pypdf_available,
+    pypdfium2_available,
+)
 from .logger import LoggingRecord, logger
 from .types import B64, PathLikeOrStr, PixelValues
 from .utils import is_file_extension
@@ -65,11 +76,14 @@ __all__ = [
     "get_pdf_file_reader",
     "get_pdf_file_writer",
     "PDFStreamer",
+    "PdfDocumentSession",
+    "PdfPage",
     "pdf_to_np_array",
     "split_pdf",
     "load_bytes_from_pdf_file",
     "PopplerError",
     "pdf_to_np_array_poppler",
+    "pdf_pages_to_np_arrays_poppler",
     "pdf_to_np_array_pdfmium",
 ]
 
@@ -493,6 +507,19 @@ class PDFStreamer:
                 self._close_reader(reader)
         return self._num_pages
 
+    def get_page_sizes(self) -> list[tuple[float, float]]:
+        """
+        Width and height of the media boxes of all pages in PDF points. Pages are not converted into single-page PDFs.
+
+        Returns:
+            List of `(width, height)`, one per page
+        """
+        reader = self._new_reader()
+        try:
+            return [(float(page.mediabox.width), float(page.mediabox.height)) for page in reader.pages]
+        finally:
+            self._close_reader(reader)
+
     def __iter__(self) -> Generator[tuple[bytes, int], None, None]:
         reader = self._new_reader()
         try:
@@ -540,18 +567,406 @@ class PDFStreamer:
         # self._source_bytes = None
 
 
+# pdfium is not thread-safe, not even across different documents
+_PDFIUM_LOCK = threading.RLock()
+_SESSIONS_BY_PATH: weakref.WeakValueDictionary[str, PdfDocumentSession] = weakref.WeakValueDictionary()
+
+
+def _get_session(path: str) -> PdfDocumentSession:
+    """Returns the open session of a path within the current process or creates a new one. Used when unpickling."""
+    session = _SESSIONS_BY_PATH.get(path)
+    if session is None:
+        session = PdfDocumentSession(path, check_file_extension=False)
+    return session
+
+
+def _render_pages_pdfium(
+    session: PdfDocumentSession,
+    indices: Sequence[int],
+    dpi: Optional[int],
+    width: Optional[int],
+    height: Optional[int],
+) -> list[PixelValues]:
+    return [session.render(index, dpi=dpi, width=width, height=height) for index in indices]
+
+
+# Keeps the session of the last task of a worker process alive, so that a reused worker opens the document only once
+_WORKER_SESSION: Optional[PdfDocumentSession] = None
+
+
+def _render_pages_pdfium_in_worker(
+    session: PdfDocumentSession,
+    indices: Sequence[int],
+    dpi: Optional[int],
+    width: Optional[int],
+    height: Optional[int],
+) -> list[PixelValues]:
+    global _WORKER_SESSION  # pylint: disable=W0603
+    _WORKER_SESSION = session
+    return _render_pages_pdfium(session, indices, dpi, width, height)
+
+
+class PdfDocumentSession:
+    """
+    Opens a PDF document once with pdfium and serves page rendering, page sizes, text extraction and single-page PDF
+    bytes directly from the open document by page index.
+
+    Compared to `PDFStreamer`, pages are not re-serialized into standalone single-page PDFs. Iterating yields
+    lightweight `PdfPage` references together with the 1-based page number.
+
+    Example:
+        ```python
+        session = PdfDocumentSession("path/to/document.pdf")
+        for page, page_number in session:
+            np_image = page.render(dpi=300)
+            width, height = page.get_size()
+        session.close()
+        ```
+
+    Note:
+        Sessions can be pickled. A session of a file path is re-opened lazily in the receiving process, and all
+        pages of the same path share one open document per process.
+    """
+
+    def __init__(self, path_or_bytes: Union[PathLikeOrStr, bytes], check_file_extension: bool = True) -> None:
+        if not pypdfium2_available():
+            raise DependencyError("PdfDocumentSession requires pypdfium2 to be installed")
+        self._source_path: Optional[str] = None
+        self._source_bytes: Optional[bytes] = None
+        self._document: Optional[pypdfium2.PdfDocument] = None
+        self._num_pages: Optional[int] = None
+        self._source_digest: Optional[str] = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_workers = 0
+
+        if isinstance(path_or_bytes, bytes):
+            self._source_bytes = path_or_bytes
+        else:
+            path = Path(path_or_bytes)
+            if check_file_extension and path.suffix.lower() != ".pdf":
+                raise FileExtensionError(f"File must have extension '.pdf', got '{path.suffix}'")
+            if not path.is_file():
+                raise FileNotFoundError(str(path))
+            self._source_path = os.fspath(path)
+            _SESSIONS_BY_PATH.setdefault(self._source_path, self)
+
+    @property
+    def source_path(self) -> Optional[str]:
+        """Path of the document, if the session has been opened from a file"""
+        return self._source_path
+
+    def get_source_bytes(self) -> bytes:
+        """Bytes of the whole document"""
+        if self._source_bytes is not None:
+            return self._source_bytes
+        return Path(self._source_path).read_bytes()  # type: ignore
+
+    def get_source_digest(self) -> str:
+        """Content hash of the whole document. It is computed once per session."""
+        if self._source_digest is None:
+            self._source_digest = hashlib.blake2b(self.get_source_bytes(), digest_size=16).hexdigest()
+        return self._source_digest
+
+    def _get_document(self) -> pypdfium2.PdfDocument:
+        if self._document is None:
+            source: Union[str, bytes] = self._source_bytes if self._source_bytes is not None else self._source_path  # type: ignore
+            try:
+                self._document = pypdfium2.PdfDocument(source)
+            except pypdfium2.PdfiumError:
+                # Damaged or encrypted documents: try to repair and decrypt with pikepdf
+                self._document = pypdfium2.PdfDocument(decrypt_pdf_document_from_bytes(self.get_source_bytes()))
+        return self._document
+
+    def __len__(self) -> int:
+        if self._num_pages is None:
+            with _PDFIUM_LOCK:
+                self._num_pages = len(self._get_document())
+        return self._num_pages
+
+    def __iter__(self) -> Generator[tuple[PdfPage, int], None, None]:
+        for index in range(len(self)):
+            yield PdfPage(self, index), index + 1
+
+    def __getitem__(self, index: int) -> PdfPage:
+        num_pages = len(self)
+        if index < 0:
+            index += num_pages
+        if index < 0 or index >= num_pages:
+            raise IndexError(f"PDF page index out of range: {index}")
+        return PdfPage(self, index)
+
+    def get_page_size(self, index: int) -> tuple[float, float]:
+        """
+        Width and height of a page in PDF points.
+
+        Args:
+            index: 0-based page index.
+
+        Returns:
+            `(width, height)`
+        """
+        with _PDFIUM_LOCK:
+            page = self._get_document()[index]
+            try:
+                return page.get_size()
+            finally:
+                page.close()
+
+    def get_page_sizes(self) -> list[tuple[float, float]]:
+        """
+        Width and height of all pages in PDF points. Sizes are read from the page tree without loading the pages.
+
+        Returns:
+            List of `(width, height)`, one per page
+        """
+        with _PDFIUM_LOCK:
+            document = self._get_document()
+            return [document.get_page_size(index) for index in range(len(document))]
+
+    def render(
+        self, index: int, dpi: Optional[int] = None, width: Optional[int] = None, height: Optional[int] = None
+    ) -> PixelValues:
+        """
+        Renders a page into a numpy array with pdfium.
+
+        Args:
+            index: 0-based page index.
+            dpi: Image quality in DPI/dots-per-inch.
+            width: Target width of the image. Only used if `dpi` is not provided. The aspect ratio of the page is kept.
+            height: Target height of the image. Only used if neither `dpi` nor `width` is provided.
+
+        Returns:
+            `np.array` in BGR format. Without `dpi`, `width` and `height` the page is rendered in the size of its
+            media box.
+        """
+        with _PDFIUM_LOCK:
+            page = self._get_document()[index]
+            try:
+                if dpi is not None:
+                    scale = dpi / 72
+                elif width is not None:
+                    scale = width / page.get_width()
+                elif height is not None:
+                    scale = height / page.get_height()
+                else:
+                    scale = 1.0
+                return page.render(scale=scale).to_numpy().astype(uint8)
+            finally:
+                page.close()
+
+    def render_pages(
+        self,
+        indices: Optional[Sequence[int]] = None,
+        dpi: Optional[int] = None,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        num_workers: int = 1,
+    ) -> list[PixelValues]:
+        """
+        Renders several pages into numpy arrays with the selected render engine (see `pdf_to_np_array`).
+
+        With pdfium, pages are rendered from the open document. pdfium is not thread-safe, so for `num_workers > 1`
+        the pages are split into contiguous chunks that are rendered in worker processes, each of them opening the
+        document only once. The worker processes are started with the first call and reused by all further calls
+        until the session is closed. With Poppler, every contiguous run of pages is rendered in one subprocess call
+        and for `num_workers > 1` several subprocesses are run concurrently.
+
+        Args:
+            indices: 0-based page indices. If `None`, all pages will be rendered.
+            dpi: Image quality in DPI/dots-per-inch.
+            width: Target width of the images. Only used if `dpi` is not provided.
+            height: Target height of the images. Only used if `dpi` is not provided.
+            num_workers: Number of worker processes (pdfium) or concurrent subprocesses (Poppler).
+
+        Returns:
+            List of `np.array`, in the order of `indices`.
+        """
+        if indices is None:
+            indices = range(len(self))
+        indices = list(indices)
+        num_workers = max(1, min(num_workers, len(indices)))
+
+        if os.environ["USE_DD_PDFIUM"] in ENV_VARS_TRUE:
+            if num_workers == 1:
+                return _render_pages_pdfium(self, indices, dpi, width, height)
+            chunk_size = -(-len(indices) // num_workers)
+            chunks = [indices[k : k + chunk_size] for k in range(0, len(indices), chunk_size)]
+            executor = self._get_executor(len(chunks))
+            futures = [
+                executor.submit(_render_pages_pdfium_in_worker, self, chunk, dpi, width, height) for chunk in chunks
+            ]
+            return [np_image for future in futures for np_image in future.result()]
+
+        size: Optional[tuple[int, int]] = None
+        if dpi is None:
+            if width is None and height is None:
+                dpi = 72
+            else:
+                size = (width or -1, height or -1)
+        runs: list[list[int]] = []
+        for index in indices:
+            if runs and runs[-1][-1] + 1 == index:
+                runs[-1].append(index)
+            else:
+                runs.append([index])
+        source: Union[str, bytes] = self._source_path if self._source_path is not None else self.get_source_bytes()
+
+        def _render_run(run: list[int]) -> list[PixelValues]:
+            return pdf_pages_to_np_arrays_poppler(source, run[0] + 1, run[-1] + 1, size=size, dpi=dpi)
+
+        with ThreadPoolExecutor(max_workers=num_workers) as thread_executor:
+            return [np_image for np_images in thread_executor.map(_render_run, runs) for np_image in np_images]
+
+    def _get_executor(self, num_workers: int) -> ProcessPoolExecutor:
+        """Returns the process pool of the session. The pool is only re-created if more workers are required."""
+        if self._executor is None or self._executor_workers < num_workers:
+            if self._executor is not None:
+                self._executor.shutdown()
+            self._executor = ProcessPoolExecutor(max_workers=num_workers, mp_context=mp.get_context())
+            self._executor_workers = num_workers
+        return self._executor
+
+    def get_text_objects(self, index: int) -> list[dict[str, Union[str, float]]]:
+        """
+        Extracts text objects of a page with pdfium. Coordinates are given with respect to the upper left corner of
+        the page.
+
+        Args:
+            index: 0-based page index.
+
+        Returns:
+            A list of dicts with keys `text`, `x0`, `x1`, `top`, `bottom`.
+        """
+        with _PDFIUM_LOCK:
+            page = self._get_document()[index]
+            text_page = page.get_textpage()
+            try:
+                words: list[dict[str, Union[str, float]]] = []
+                height = page.get_height()
+                for obj in page.get_objects((pypdfium2.raw.FPDF_PAGEOBJ_TEXT,)):
+                    box = obj.get_pos()
+                    if all(x > 0 for x in box):
+                        words.append(
+                            {
+                                "text": text_page.get_text_bounded(*box),
+                                "x0": box[0],
+                                "x1": box[2],
+                                "top": height - box[3],
+                                "bottom": height - box[1],
+                            }
+                        )
+                return words
+            finally:
+                text_page.close()
+                page.close()
+
+    def get_page_bytes(self, index: int) -> bytes:
+        """
+        Single-page PDF of a page. Only use this, if a consumer requires the bytes of a standalone PDF.
+
+        Args:
+            index: 0-based page index.
+
+        Returns:
+            Bytes of a PDF with one page
+        """
+        with _PDFIUM_LOCK:
+            page_document = pypdfium2.PdfDocument.new()
+            try:
+                page_document.import_pages(self._get_document(), [index])
+                buffer = BytesIO()
+                page_document.save(buffer)
+                return buffer.getvalue()
+            finally:
+                page_document.close()
+
+    def close(self) -> None:
+        """
+        Closes the document and shuts down the worker processes of `render_pages`. The session can still be used
+        afterwards and will re-open the document.
+        """
+        with _PDFIUM_LOCK:
+            if self._document is not None:
+                self._document.close()
+                self._document = None
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+            self._executor_workers = 0
+
+    def __enter__(self) -> PdfDocumentSession:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __copy__(self) -> PdfDocumentSession:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> PdfDocumentSession:
+        # Sessions are shared, read-only resources
+        return self
+
+    def __reduce__(self) -> Any:
+        if self._source_path is not None:
+            return _get_session, (self._source_path,)
+        return PdfDocumentSession, (self._source_bytes,)
+
+
+@dataclass(frozen=True)
+class PdfPage:
+    """
+    Lightweight reference to a page of a `PdfDocumentSession`.
+
+    Attributes:
+        session: The session of the document.
+        index: 0-based page index.
+    """
+
+    session: PdfDocumentSession
+    index: int
+
+    def get_size(self) -> tuple[float, float]:
+        """Width and height of the page in PDF points"""
+        return self.session.get_page_size(self.index)
+
+    def render(
+        self, dpi: Optional[int] = None, width: Optional[int] = None, height: Optional[int] = None
+    ) -> PixelValues:
+        """
+        Renders the page into a numpy array. Uses pdfium on the open document, unless Poppler has been selected as
+        render engine (see `PdfDocumentSession.render_pages`).
+
+        Args:
+            dpi: Image quality in DPI/dots-per-inch.
+            width: Target width of the image. Only used if `dpi` is not provided.
+            height: Target height of the image. Only used if `dpi` is not provided.
+
+        Returns:
+            `np.array`
+        """
+        return self.session.render_pages([self.index], dpi=dpi, width=width, height=height)[0]
+
+    def get_text_objects(self) -> list[dict[str, Union[str, float]]]:
+        """Text objects of the page. See `PdfDocumentSession.get_text_objects`"""
+        return self.session.get_text_objects(self.index)
+
+    def to_bytes(self) -> bytes:
+        """Single-page PDF of the page"""
+        return self.session.get_page_bytes(self.index)
+
+    def __reduce__(self) -> Any:
+        if self.session.source_path is not None:
+            return PdfPage, (self.session, self.index)
+        # Do not send the whole document, if the session has been opened from bytes
+        return PdfPage, (PdfDocumentSession(self.to_bytes()), 0)
+
+
 # The following functions are modified versions from the Python poppler wrapper
 # https://github.com/Belval/pdf2image/blob/master/pdf2image/pdf2image.py
 
 
-def _input_to_cli_str(
-    input_file_name: PathLikeOrStr,
-    output_file_name: PathLikeOrStr,
-    dpi: Optional[int] = None,
-    size: Optional[tuple[int, int]] = None,
-) -> list[str]:
-    cmd_args: list[str] = []
-
+def _get_poppler_command() -> str:
     if pdf_to_ppm_available():
         command = "pdftoppm"
     elif pdf_to_cairo_available():
@@ -561,13 +976,27 @@ def _input_to_cli_str(
 
     if platform.system() == "Windows":
         command = command + ".exe"
-    cmd_args.append(command)
+    return command
+
+
+def _input_to_cli_str(
+    command: str,
+    input_file_name: PathLikeOrStr,
+    dpi: Optional[int] = None,
+    size: Optional[tuple[int, int]] = None,
+    first_page: Optional[int] = None,
+    last_page: Optional[int] = None,
+) -> list[str]:
+    # `pdftoppm` writes all pages of the range as concatenated PPM images to stdout. `pdftocairo` can only write a
+    # single PNG image to stdout. Passing "-" as input file name reads the PDF from stdin.
+    cmd_args: list[str] = [command]
 
     if dpi:
         cmd_args.extend(["-r", str(dpi)])
-    cmd_args.append(str(input_file_name))
-    cmd_args.append("-png")
-    cmd_args.append(str(output_file_name))
+    if first_page is not None:
+        cmd_args.extend(["-f", str(first_page)])
+    if last_page is not None:
+        cmd_args.extend(["-l", str(last_page)])
 
     if size:
         assert len(size) == 2, size
@@ -575,20 +1004,125 @@ def _input_to_cli_str(
         cmd_args.extend(["-scale-to-x", str(size[0])])
         cmd_args.extend(["-scale-to-y", str(size[1])])
 
+    if command.startswith("pdftocairo"):
+        cmd_args.extend(["-png", "-singlefile", os.fspath(input_file_name), "-"])
+    else:
+        cmd_args.append(os.fspath(input_file_name))
     return cmd_args
 
 
-def _run_poppler(poppler_args: list[str]) -> None:
+def _run_poppler(poppler_args: list[str], pdf_bytes: Optional[bytes] = None) -> bytes:
     try:
-        proc = subprocess.Popen(poppler_args)  # pylint: disable=R1732
+        proc = subprocess.Popen(
+            poppler_args,
+            stdin=subprocess.PIPE if pdf_bytes is not None else subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
     except OSError as error:
         if error.errno != ENOENT:
             raise error from error
         raise DependencyError("Poppler not found. Please install or add to your PATH.") from error
 
-    with timeout_manager(proc, 0):
-        if proc.returncode:
-            raise PopplerError(status=proc.returncode, message="Syntax Error: PDF cannot be read with Poppler")
+    with proc:
+        output, _ = proc.communicate(input=pdf_bytes)
+    if proc.returncode:
+        raise PopplerError(status=proc.returncode, message="Syntax Error: PDF cannot be read with Poppler")
+    return output
+
+
+def _parse_ppm_stream(stream: bytes) -> list[PixelValues]:
+    """
+    Splits a stream of concatenated binary PPM (P6) or PGM (P5) images into numpy arrays in BGR format.
+    """
+    images: list[PixelValues] = []
+    offset = 0
+    while offset < len(stream):
+        tokens: list[bytes] = []
+        # The header consists of magic number, width, height and maximum value separated by whitespace and is
+        # terminated by exactly one whitespace character
+        while len(tokens) < 4:
+            while stream[offset : offset + 1].isspace():
+                offset += 1
+            token_end = offset
+            while token_end < len(stream) and not stream[token_end : token_end + 1].isspace():
+                token_end += 1
+            if token_end == offset:
+                raise PopplerError(status=0, message="Unexpected end of Poppler output")
+            tokens.append(stream[offset:token_end])
+            offset = token_end
+        offset += 1
+        magic, width, height, max_value = tokens[0], int(tokens[1]), int(tokens[2]), int(tokens[3])
+        if magic not in (b"P5", b"P6") or max_value > 255:
+            raise PopplerError(status=0, message=f"Unsupported Poppler output format: {magic!r}, {max_value}")
+        channels = 3 if magic == b"P6" else 1
+        num_bytes = width * height * channels
+        if offset + num_bytes > len(stream):
+            raise PopplerError(status=0, message="Unexpected end of Poppler output")
+        pixels = np.frombuffer(stream, dtype=uint8, count=num_bytes, offset=offset).reshape(height, width, channels)
+        if channels == 1:
+            images.append(np.repeat(pixels, 3, axis=2))
+        else:
+            images.append(np.ascontiguousarray(pixels[:, :, ::-1]))
+        offset += num_bytes
+    return images
+
+
+def pdf_pages_to_np_arrays_poppler(
+    path_or_bytes: Union[PathLikeOrStr, bytes],
+    first_page: int = 1,
+    last_page: Optional[int] = None,
+    size: Optional[tuple[int, int]] = None,
+    dpi: Optional[int] = None,
+) -> list[PixelValues]:
+    """
+    Render a range of pages of a PDF document into numpy arrays using Poppler.
+
+    Bytes are passed to Poppler via stdin and the rendered pages are streamed back over stdout. With `pdftoppm` the
+    whole page range is rendered in one subprocess call and the uncompressed PPM output is read directly into numpy
+    arrays, i.e. there is no disk round-trip and no PNG encoding. `pdftocairo` can only stream one PNG page at a
+    time and will therefore be called once per page.
+
+    Example:
+        ```python
+        np_images = pdf_pages_to_np_arrays_poppler("path/to/document.pdf", first_page=1, last_page=10, dpi=200)
+        ```
+
+    Args:
+        path_or_bytes: Path to a PDF file or bytes of a PDF document.
+        first_page: 1-based number of the first page to render.
+        last_page: 1-based number of the last page to render. If `None`, only `first_page` will be rendered.
+        size: Size of the resulting image(s), as (width, height). Pass `-1` for one of the sides to keep the aspect
+              ratio of the page.
+        dpi: Image quality in DPI/dots-per-inch.
+
+    Returns:
+        List of `np.array` in BGR format, one for each page of the range.
+
+    Raises:
+        ValueError: If neither `dpi` nor `size` is provided.
+    """
+    if dpi is None and size is None:
+        raise ValueError("Either dpi or size must be provided.")
+    if last_page is None:
+        last_page = first_page
+    if isinstance(path_or_bytes, bytes):
+        input_file_name: PathLikeOrStr = "-"
+        pdf_bytes: Optional[bytes] = path_or_bytes
+    else:
+        input_file_name, pdf_bytes = path_or_bytes, None
+
+    command = _get_poppler_command()
+    if command.startswith("pdftocairo"):
+        return [
+            viz_handler.convert_bytes_to_np(
+                _run_poppler(_input_to_cli_str(command, input_file_name, dpi, size, page, page), pdf_bytes)
+            ).astype(uint8)
+            for page in range(first_page, last_page + 1)
+        ]
+    return _parse_ppm_stream(
+        _run_poppler(_input_to_cli_str(command, input_file_name, dpi, size, first_page, last_page), pdf_bytes)
+    )
 
 
 def pdf_to_np_array_poppler(
@@ -597,7 +1131,8 @@ def pdf_to_np_array_poppler(
     """
     Convert a single PDF page from its byte representation to a numpy array using Poppler.
 
-    This function will save the PDF as a temporary file and then call Poppler via `pdftoppm` or `pdftocairo`.
+    The PDF is passed to `pdftoppm` or `pdftocairo` via stdin and the rendered page is read from stdout. See
+    `pdf_pages_to_np_arrays_poppler` for rendering multiple pages at once.
 
     Raises:
         ValueError: If neither `dpi` nor `size` is provided.
@@ -610,13 +1145,7 @@ def pdf_to_np_array_poppler(
     Returns:
         `np.array`.
     """
-    if dpi is None and size is None:
-        raise ValueError("Either dpi or size must be provided.")
-    with save_tmp_file(pdf_bytes, "pdf_") as (tmp_name, input_file_name):
-        _run_poppler(_input_to_cli_str(input_file_name, tmp_name, dpi, size))
-        image = viz_handler.read_image(tmp_name + "-1.png")
-
-    return image.astype(uint8)
+    return pdf_pages_to_np_arrays_poppler(pdf_bytes, size=size, dpi=dpi)[0]
 
 
 def pdf_to_np_array_pdfmium(pdf_bytes: bytes, dpi: Optional[int] = None) -> PixelValues:
@@ -21,7 +21,7 @@ Typing sheet for the whole package
 
 import os
 import queue
-from typing import TYPE_CHECKING, Any, Protocol, Type, TypeAlias, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Literal, Protocol, Type, TypeAlias, TypeVar, Union
 
 import numpy.typing as npt
 import tqdm
@@ -43,6 +43,8 @@ PixelValues = npt.NDArray[uint8]
 B64Str: TypeAlias = str
 # b64 encoded image in bytes
 B64: TypeAlias = bytes
+# How pixels are exported: embedded into the export, written to an image file of its own or not at all
+PixelExportPolicy: TypeAlias = Literal["embed", "external", "omit"]
 
 # Typing for curry decorator
 DP = TypeVar("DP")
@@ -32,6 +32,7 @@ from dd_core.dataflow.common import (
     MapDataComponent,
     RepeatedData,
     TestDataSpeed,
+    TimedBatchData,
 )
 
 
@@ -302,3 +303,33 @@ def test_batch_data_dict_elements() -> None:
     assert len(output) == 2
     assert output[0] == [{"id": 1}, {"id": 2}]
     assert output[1] == [{"id": 3}, {"id": 4}]
+
+
+def test_timed_batch_data_flushes_on_batch_size() -> None:
+    """
+    Test TimedBatchData creates full batches and yields the remainder
+    """
+    # Arrange
+    df = DataFromList([["a"], ["b"], ["c"], ["d"], ["e"]], shuffle=False)
+    df_batch = TimedBatchData(df, batch_size=2)
+
+    # Act
+    output: list[list[str]] = stu.collect_datapoint_from_dataflow(df=df_batch)
+
+    # Assert
+    assert output == [[["a"], ["b"]], [["c"], ["d"]], [["e"]]]
+
+
+def test_timed_batch_data_flushes_on_deadline() -> None:
+    """
+    Test TimedBatchData flushes each datapoint when the deadline has already passed
+    """
+    # Arrange
+    df = DataFromList([["a"], ["b"], ["c"]], shuffle=False)
+    df_batch = TimedBatchData(df, batch_size=10, max_wait=0.0)
+
+    # Act
+    output: list[list[str]] = stu.collect_datapoint_from_dataflow(df=df_batch)
+
+    # Assert
+    assert output == [[["a"]], [["b"]], [["c"]]]
@@ -34,12 +34,16 @@ from dd_core.dataflow import (
     CustomDataFromList,
     FileClosingIterator,
     SerializerCoco,
+    SerializerColumnar,
     SerializerFiles,
     SerializerJsonlines,
     SerializerPdfDoc,
     SerializerTabsepFiles,
 )
+from dd_core.datapoint import BoundingBox, Image, ImageAnnotation
 from dd_core.utils import file_utils as fu
+from dd_core.utils.object_types import LayoutLabel
+from dd_core.utils.pdf_utils import PdfPage
 
 with try_import() as pt_import_guard:
     import jsonlines
@@ -120,6 +124,27 @@ def test_serializer_jsonlines_save(temp_dir: str, simple_dict_list: list[dict[st
     assert saved_data[0]["key1"] == "a"
 
 
+def test_serializer_columnar_save_and_load(temp_dir: str) -> None:
+    """
+    Test that SerializerColumnar saves a dataflow of images and streams their dicts back
+    """
+    images = [Image(file_name=f"page_{idx}.png", location=temp_dir, page_number=idx) for idx in range(1, 4)]
+    for image in images:
+        image.dump(
+            ImageAnnotation(
+                category_name=LayoutLabel.TEXT,
+                bounding_box=BoundingBox(ulx=1, uly=2, lrx=10, lry=20, absolute_coords=True),
+            )
+        )
+
+    SerializerColumnar.save(CustomDataFromList(images), temp_dir, "images.npz", max_datapoints=2)
+    df = SerializerColumnar.load(Path(temp_dir) / "images.npz")
+    df.reset_state()
+    loaded = [Image(**dp) for dp in df]
+
+    assert [image.as_dict() for image in loaded] == [image.as_dict() for image in images[:2]]
+
+
 def test_serializer_tabsep_files_load(text_file: Path) -> None:
     """
     Test SerializerTabsepFiles loading from text file
@@ -219,10 +244,14 @@ def test_serializer_pdf_doc_load(pdf_file_path_two_pages: Path) -> None:
     first_page = result[0]
     assert "path" in first_page
     assert "file_name" in first_page
-    assert "pdf_bytes" in first_page
     assert "page_number" in first_page
     assert "document_id" in first_page
-    assert isinstance(first_page["pdf_bytes"], bytes)
+    if fu.pypdfium2_available():
+        assert isinstance(first_page["pdf_page"], PdfPage)
+        assert first_page["pdf_page"].index == 0
+        assert first_page["pdf_page"].session is result[1]["pdf_page"].session
+    else:
+        assert isinstance(first_page["pdf_bytes"], bytes)
     assert first_page["page_number"] == 1
     assert first_page["file_name"].endswith("_1.pdf")
 
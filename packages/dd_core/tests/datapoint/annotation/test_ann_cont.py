@@ -28,6 +28,7 @@ objects and helps enforce correct behavior under various conditions.
 import json
 import re
 
+import numpy as np
 import pytest
 from pydantic import ValidationError
 
@@ -155,6 +156,16 @@ class TestContainerAnnotationAdvanced:
             container2.set_type("int")
 
 
+def test_container_annotation_from_trusted_converts_numpy_scalars() -> None:
+    """numpy scalars are converted to Python types like with the validating constructor"""
+    trusted = ContainerAnnotation.from_trusted(category_name="characters", value=np.float32(0.5))
+    validated = ContainerAnnotation(category_name="characters", value=np.float32(0.5))
+
+    assert type(trusted.value) is float  # pylint: disable=C0123
+    assert trusted.value_type == validated.value_type == "float"
+    assert json.dumps(trusted.as_dict()) == json.dumps(validated.as_dict())
+
+
 class TestContainerAnnotationReferencePayloadSerialization:
     """Tests for serialization/round-trip of ReferencePayload/AnnotationRef container values."""
 
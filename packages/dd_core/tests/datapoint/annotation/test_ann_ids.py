@@ -139,6 +139,29 @@ class TestStateId:
         state_id_2 = cat2.state_id
         assert state_id_1 != state_id_2
 
+    def test_state_id_cache_is_invalidated_on_assignment(self) -> None:
+        """Test that a cached state_id is recomputed after an attribute has been assigned"""
+        cat = CategoryAnnotation(
+            category_name="test_cat_1", category_id=1, external_id="c822f8c3-1148-30c4-90eb-cb4896b1ebe5"
+        )
+        state_id_1 = cat.state_id
+        assert cat.state_id == state_id_1
+        cat.active = False
+        assert cat.state_id != state_id_1
+        cat.active = True
+        assert cat.state_id == state_id_1
+
+    def test_state_id_cache_does_not_affect_equality(self) -> None:
+        """Test that computing the state_id does not change equality of annotations"""
+        cat1 = CategoryAnnotation(
+            category_name="test_cat_1", category_id=1, external_id="c822f8c3-1148-30c4-90eb-cb4896b1ebe5"
+        )
+        cat2 = CategoryAnnotation(
+            category_name="test_cat_1", category_id=1, external_id="c822f8c3-1148-30c4-90eb-cb4896b1ebe5"
+        )
+        _ = cat1.state_id
+        assert cat1 == cat2
+
 
 class TestAnnotationIdContextPropagation:
     """Tests for annotation_id context propagation through nested structures"""
@@ -26,10 +26,14 @@ determinism, and testing the BoundingBox integration.
 import pytest
 
 from dd_core.datapoint.annotation import (
+    CategoryAnnotation,
+    ContainerAnnotation,
     ImageAnnotation,
+    LLMContainerAnnotation,
 )
 from dd_core.datapoint.box import BoundingBox
 from dd_core.utils.error import AnnotationError
+from dd_core.utils.identifier import get_uuid
 from dd_core.utils.object_types import get_type
 
 
@@ -101,3 +105,56 @@ class TestBoundingBoxIntegration:
         assert isinstance(img_ann.bounding_box, BoundingBox)
         assert img_ann.bounding_box.ulx == 5  # pylint:disable=E1101
         assert img_ann.bounding_box.uly == 10  # pylint:disable=E1101
+
+
+class TestImageAnnotationFromTrusted:
+    """Tests for ImageAnnotation.from_trusted"""
+
+    @staticmethod
+    def _get_annotation() -> ImageAnnotation:
+        ann = ImageAnnotation(
+            category_name="test_cat_1",
+            category_id=1,
+            score=0.123456789,
+            bounding_box=BoundingBox(ulx=10, uly=20, width=30, height=40, absolute_coords=True),
+            service_id="service",
+        )
+        ann.annotation_id = get_uuid("ann")
+        ann.dump_sub_category("test_cat_2", CategoryAnnotation(category_name="test_cat_2", category_id=2, score=0.5))
+        ann.dump_sub_category("test_cat_3", ContainerAnnotation(category_name="test_cat_3", value=["a", "b"]))
+        ann.dump_sub_category(
+            "test_cat_4",
+            LLMContainerAnnotation(
+                category_name="test_cat_4", value={"x": 1}, task_id="t", prompt_id="p", output_format_id="o"
+            ),
+        )
+        ann.dump_relationship("child", get_uuid("child"))
+        return ann
+
+    def test_from_trusted_equals_constructor(self) -> None:
+        """from_trusted restores the same annotation from its dict as the constructor"""
+        ann = self._get_annotation()
+
+        trusted = ImageAnnotation.from_trusted(**ann.as_dict())
+        validated = ImageAnnotation(**ann.as_dict())
+
+        assert trusted == validated
+        assert trusted.as_dict() == ann.as_dict()
+        assert trusted.state_id == ann.state_id
+        assert isinstance(trusted.get_sub_category(get_type("test_cat_4")), LLMContainerAnnotation)
+        assert trusted.get_sub_category(get_type("test_cat_3")).value_type == "list[str]"  # type: ignore
+
+    def test_from_trusted_does_not_share_payload(self) -> None:
+        """Changing an annotation built with from_trusted does not change the dict it has been built from"""
+        payload = self._get_annotation().as_dict()
+
+        trusted = ImageAnnotation.from_trusted(**payload)
+        trusted.dump_relationship("child", get_uuid("other_child"))
+
+        assert payload["relationships"]["child"] == [get_uuid("child")]
+
+    def test_from_trusted_external_id(self) -> None:
+        """from_trusted derives the annotation id from the external id like the constructor"""
+        trusted = CategoryAnnotation.from_trusted(category_name="test_cat_1", external_id="ext")
+
+        assert trusted.annotation_id == CategoryAnnotation(category_name="test_cat_1", external_id="ext").annotation_id
@@ -239,3 +239,21 @@ class TestBBoxInitValidate:
         assert pytest.approx(rebuilt.uly, rel=0, abs=1e-9) == 0.34
         assert pytest.approx(rebuilt.lrx, rel=0, abs=1e-9) == 0.56
         assert pytest.approx(rebuilt.lry, rel=0, abs=1e-9) == 0.78
+
+    @pytest.mark.parametrize(
+        "box",
+        [
+            BoundingBox(absolute_coords=True, ulx=10.5, uly=20.2, lrx=30.5, lry=40.7),
+            BoundingBox(absolute_coords=False, ulx=0.12, uly=0.34, lrx=0.56, lry=0.78),
+        ],
+    )
+    def test_from_trusted_equals_constructor(self, box: BoundingBox) -> None:
+        """from_trusted builds the same box as the constructor from its dict"""
+        rebuilt = BoundingBox.from_trusted(**box.as_dict())
+        assert rebuilt == box
+        assert rebuilt.as_dict() == box.as_dict()
+
+    def test_from_trusted_does_not_validate(self) -> None:
+        """from_trusted skips the validation of the constructor"""
+        box = BoundingBox.from_trusted(absolute_coords=True, ulx=10, uly=10, lrx=10, lry=20)
+        assert box.width == 0
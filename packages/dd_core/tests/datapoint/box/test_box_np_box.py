@@ -25,7 +25,16 @@ import numpy as np
 import pytest
 from numpy.typing import NDArray
 
-from dd_core.datapoint.box import area, intersection, ioa, np_iou
+from dd_core.datapoint.box import (
+    BoundingBox,
+    area,
+    intersecting_pairs,
+    intersection,
+    ioa,
+    np_iou,
+    np_round_box_coords,
+    np_valid_box_coords,
+)
 
 
 @pytest.mark.parametrize(
@@ -137,3 +146,52 @@ def test_ioa(boxes1: NDArray[np.float32], boxes2: NDArray[np.float32], expected:
     out = ioa(boxes1, boxes2)
     assert out.shape == expected.shape
     assert np.allclose(out, expected, rtol=1e-6, atol=1e-6)
+
+
+@pytest.mark.parametrize(
+    "box, absolute_coords",
+    [
+        ([10.5, 10.5, 20.5, 20.5], True),
+        ([0.4, 1.6, 7.49, 8.51], True),
+        ([0.123456789, 0.2, 0.3000000049, 0.9], False),
+    ],
+)
+def test_np_round_box_coords_equals_bounding_box(box: list[float], absolute_coords: bool) -> None:
+    """np_round_box_coords rounds like BoundingBox"""
+    bounding_box = BoundingBox(ulx=box[0], uly=box[1], lrx=box[2], lry=box[3], absolute_coords=absolute_coords)
+
+    int_boxes = np_round_box_coords(np.array([box]), absolute_coords)
+
+    assert int_boxes.tolist() == [[bounding_box._ulx, bounding_box._uly, bounding_box._lrx, bounding_box._lry]]
+
+
+def test_np_valid_box_coords() -> None:
+    """np_valid_box_coords rejects boxes BoundingBox would not accept"""
+    int_boxes = np.array([[0, 0, 10, 10], [5, 5, 5, 10], [-1, 0, 10, 10]], dtype=np.int64)
+    relative_boxes = np.array([[0, 0, 10**8, 10**8], [0, 0, 10**8 + 1, 10**8]], dtype=np.int64)
+
+    assert np_valid_box_coords(int_boxes, True).tolist() == [True, False, False]
+    assert np_valid_box_coords(relative_boxes, False).tolist() == [True, False]
+
+
+@pytest.mark.parametrize("max_side", [5, 50, 1000])
+def test_intersecting_pairs_equals_intersection(max_side: int) -> None:
+    """intersecting_pairs returns the positive entries of the dense intersection matrix"""
+    rng = np.random.default_rng(42)
+    boxes = []
+    for num_boxes in (200, 30):
+        upper_left = rng.integers(0, 1000, (num_boxes, 2))
+        boxes.append(
+            np.concatenate([upper_left, upper_left + rng.integers(1, max_side, (num_boxes, 2))], axis=1).astype(
+                np.float32
+            )
+        )
+
+    index1, index2, areas = intersecting_pairs(boxes[0], boxes[1])
+
+    dense = intersection(boxes[0], boxes[1])
+    expected_index1, expected_index2 = (dense > 0).nonzero()
+    assert index1.tolist() == expected_index1.tolist()
+    assert index2.tolist() == expected_index2.tolist()
+    assert np.array_equal(areas, dense[expected_index1, expected_index2])
+    assert len(intersecting_pairs(boxes[0], boxes[1][:0])[0]) == 0
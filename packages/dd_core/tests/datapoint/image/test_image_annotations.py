@@ -43,14 +43,14 @@ class TestImageAnnotations:
         assert ann.annotation_id is not None
 
     def test_dump_tracks_annotation_ids(self, white_image: WhiteImage) -> None:
-        """dump() tracks annotation_id in internal list"""
+        """dump() tracks annotation_id in internal index"""
         img = Image(file_name=white_image.file_name)
         ann = ImageAnnotation(
             category_name="test_cat_1",
             bounding_box=BoundingBox(ulx=10, uly=10, width=20, height=20, absolute_coords=True),
         )
         img.dump(ann)
-        assert ann.annotation_id in img._annotation_ids
+        assert ann.annotation_id in img._annotation_index.by_id
 
     def test_dump_rejects_duplicate_annotation(self, white_image: WhiteImage) -> None:
         """dump() raises error for duplicate annotation"""
@@ -79,7 +79,7 @@ class TestImageAnnotations:
         img.dump(ann2)
 
         assert len(img.annotations) == 2
-        assert len(img._annotation_ids) == 2
+        assert len(img._annotation_index.by_id) == 2
 
     def test_get_annotation_returns_all_by_default(self, white_image: WhiteImage) -> None:
         """get_annotation() returns all active annotations by default"""
@@ -246,3 +246,102 @@ class TestImageAnnotations:
 
         annotation_ids = [ann.annotation_id for ann in annotations]
         assert len(set(annotation_ids)) == 5  # All IDs should be unique
+
+    def test_get_annotation_keeps_order_of_annotations(self, white_image: WhiteImage) -> None:
+        """get_annotation() returns annotations of several categories in dump order"""
+        img = Image(file_name=white_image.file_name)
+        for i in range(6):
+            img.dump(
+                ImageAnnotation(
+                    category_name="test_cat_1" if i % 2 else "test_cat_2",
+                    bounding_box=BoundingBox(ulx=i * 10, uly=i * 10, width=5, height=5, absolute_coords=True),
+                )
+            )
+
+        result = img.get_annotation(category_names=["test_cat_1", "test_cat_2"])
+        assert result == img.annotations
+
+    def test_get_annotation_rebuilds_index_for_annotations_not_dumped(self, white_image: WhiteImage) -> None:
+        """get_annotation() finds annotations passed to the constructor or appended to the list directly"""
+        ann1 = ImageAnnotation(
+            category_name="test_cat_1",
+            bounding_box=BoundingBox(ulx=10, uly=10, width=20, height=20, absolute_coords=True),
+        )
+        img = Image(file_name=white_image.file_name)
+        img.dump(ann1)
+        img_2 = Image(file_name=white_image.file_name, annotations=[ann1.as_dict()])
+        ann2 = ImageAnnotation(
+            category_name="test_cat_1",
+            bounding_box=BoundingBox(ulx=50, uly=50, width=20, height=20, absolute_coords=True),
+            external_id="ann_2",
+        )
+        img_2.annotations.append(ann2)
+
+        result = img_2.get_annotation(category_names="test_cat_1")
+        assert [ann.annotation_id for ann in result] == [ann1.annotation_id, ann2.annotation_id]
+        assert img_2.get_annotation(annotation_ids=ann2.annotation_id) == [ann2]
+
+    def test_reindex_annotations_after_category_change(self, white_image: WhiteImage) -> None:
+        """reindex_annotations() makes get_annotation() aware of category names changed in place"""
+        img = Image(file_name=white_image.file_name)
+        ann = ImageAnnotation(
+            category_name="test_cat_1",
+            bounding_box=BoundingBox(ulx=10, uly=10, width=20, height=20, absolute_coords=True),
+        )
+        img.dump(ann)
+        ann.category_name = "test_cat_2"
+
+        assert not img.get_annotation(category_names="test_cat_1")
+
+        img.reindex_annotations()
+        assert img.get_annotation(category_names="test_cat_2") == [ann]
+
+    def test_define_annotation_ids_equals_define_annotation_id(self, white_image: WhiteImage) -> None:
+        """define_annotation_ids() generates the same ids as define_annotation_id()"""
+        img = Image(file_name=white_image.file_name)
+        anns = [
+            ImageAnnotation(
+                category_name="test_cat_1",
+                bounding_box=BoundingBox(ulx=i * 10, uly=i * 10, width=5, height=5, absolute_coords=True),
+            )
+            for i in range(3)
+        ]
+
+        assert img.define_annotation_ids(anns) == [img.define_annotation_id(ann) for ann in anns]
+
+    def test_dump_annotations_equals_dump(self, white_image: WhiteImage) -> None:
+        """dump_annotations() generates the same ids and index as repeated dump()"""
+        img = Image(file_name=white_image.file_name)
+        other_img = Image(file_name=white_image.file_name)
+        anns, other_anns = [
+            [
+                ImageAnnotation(
+                    category_name="test_cat_1",
+                    bounding_box=BoundingBox(ulx=i * 10, uly=i * 10, width=5, height=5, absolute_coords=True),
+                )
+                for i in range(3)
+            ]
+            for _ in range(2)
+        ]
+
+        img.dump_annotations(anns)
+        for ann in other_anns:
+            other_img.dump(ann)
+
+        assert [ann.annotation_id for ann in anns] == [ann.annotation_id for ann in other_anns]
+        assert img.get_annotation(category_names="test_cat_1") == anns
+
+    def test_dump_annotations_rejects_duplicates(self, white_image: WhiteImage) -> None:
+        """dump_annotations() dumps nothing if one annotation id is duplicated"""
+        img = Image(file_name=white_image.file_name)
+        anns = [
+            ImageAnnotation(
+                category_name="test_cat_1",
+                bounding_box=BoundingBox(ulx=10, uly=10, width=5, height=5, absolute_coords=True),
+            )
+            for _ in range(2)
+        ]
+
+        with raises(ImageError):
+            img.dump_annotations(anns)
+        assert not img.annotations
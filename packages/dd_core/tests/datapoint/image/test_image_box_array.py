@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+# File: test_image_box_array.py
+
+# Copyright 2025 Dr. Janis Meyer. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Testing the columnar box view of Image annotations
+"""
+
+import pickle
+from copy import deepcopy
+
+import numpy as np
+from pytest import raises
+
+from dd_core.datapoint import BoundingBox, Image, ImageAnnotation
+from dd_core.utils.error import ImageError
+
+from ..conftest import WhiteImage
+
+
+def _image_with_annotations(white_image: WhiteImage) -> Image:
+    img = Image(file_name=white_image.file_name)
+    img.set_width_height(white_image.image.shape[1], white_image.image.shape[0])
+    img.dump(
+        ImageAnnotation(
+            category_name="test_cat_1",
+            bounding_box=BoundingBox(ulx=10, uly=20, lrx=110, lry=60, absolute_coords=True),
+            service_id="svc_1",
+        )
+    )
+    img.dump(
+        ImageAnnotation(
+            category_name="test_cat_2",
+            bounding_box=BoundingBox(ulx=0.1234567, uly=0.25, lrx=0.5, lry=0.7777777, absolute_coords=False),
+            category_id=3,
+        )
+    )
+    return img
+
+
+class TestImageBoxArray:
+    """Test Image.get_box_array and Image.get_annotation_boxes"""
+
+    def test_box_array_equals_transformed_boxes(self, white_image: WhiteImage) -> None:
+        """rows agree with the absolute boxes of the single annotations"""
+        img = _image_with_annotations(white_image)
+        img.image_ann_to_image(img.annotations[0].annotation_id)
+
+        box_array = img.get_box_array()
+
+        expected = [
+            ann.get_bounding_box(img.image_id)
+            .transform(img.width, img.height, absolute_coords=True)
+            .to_list(mode="xyxy")
+            for ann in img.annotations
+        ]
+        assert box_array.boxes.tolist() == expected
+        assert box_array.category_ids.tolist() == [ann.category_id for ann in img.annotations]
+        assert box_array.category_names.tolist() == ["test_cat_1", "test_cat_2"]
+        assert box_array.service_ids.tolist() == ["svc_1", None]
+        assert box_array.annotation_indices.tolist() == [0, 1]
+        assert img.get_annotation_boxes(img.annotations[::-1]).tolist() == expected[::-1]
+
+    def test_box_array_is_cached_until_boxes_change(self, white_image: WhiteImage) -> None:
+        """the view is reused and rebuilt after dumping annotations or changing boxes and embeddings"""
+        img = _image_with_annotations(white_image)
+        box_array = img.get_box_array()
+        assert img.get_box_array() is box_array
+
+        img.annotations[0].bounding_box.lrx = 200  # type: ignore
+        assert img.get_box_array() is not box_array
+        assert img.get_box_array().boxes[0].tolist() == [10, 20, 200, 60]
+
+        img.image_ann_to_image(img.annotations[0].annotation_id)
+        img.annotations[0].image.set_embedding(  # type: ignore
+            img.image_id, BoundingBox(ulx=1, uly=2, lrx=3, lry=4, absolute_coords=True)
+        )
+        assert img.get_box_array().boxes[0].tolist() == [1, 2, 3, 4]
+
+        img.dump(
+            ImageAnnotation(
+                category_name="test_cat_1",
+                bounding_box=BoundingBox(ulx=5, uly=5, lrx=15, lry=15, absolute_coords=True),
+            )
+        )
+        assert len(img.get_box_array()) == 3
+
+    def test_box_array_is_kept_when_boxes_of_other_images_change(self, white_image: WhiteImage) -> None:
+        """changing boxes and embeddings of another image does not rebuild the view of this image"""
+        img = _image_with_annotations(white_image)
+        other_img = _image_with_annotations(white_image)
+        other_img.image_ann_to_image(other_img.annotations[0].annotation_id)
+        box_array = img.get_box_array()
+        other_box_array = other_img.get_box_array()
+
+        other_img.annotations[1].bounding_box.lrx = 0.6  # type: ignore
+        other_img.annotations[0].image.set_embedding(  # type: ignore
+            other_img.image_id, BoundingBox(ulx=1, uly=2, lrx=3, lry=4, absolute_coords=True)
+        )
+
+        assert img.get_box_array() is box_array
+        assert other_img.get_box_array() is not other_box_array
+        assert other_img.get_box_array().boxes[0].tolist() == [1, 2, 3, 4]
+
+    def test_box_array_notices_changes_of_boxes_of_restored_images(self, white_image: WhiteImage) -> None:
+        """in-place changes are noticed for annotations that have not been dumped, e.g. of images loaded from dicts"""
+        img = Image(**_image_with_annotations(white_image).as_dict())
+        box_array = img.get_box_array()
+
+        img.annotations[0].bounding_box.lrx = 200  # type: ignore
+
+        assert img.get_box_array() is not box_array
+        assert img.get_box_array().boxes[0].tolist() == [10, 20, 200, 60]
+
+    def test_get_annotation_boxes_rejects_foreign_annotations(self, white_image: WhiteImage) -> None:
+        """annotations of other images cannot be looked up"""
+        img = _image_with_annotations(white_image)
+        other_img = _image_with_annotations(white_image)
+        other_img.dump(
+            ImageAnnotation(
+                category_name="test_cat_1",
+                bounding_box=BoundingBox(ulx=1, uly=1, lrx=2, lry=2, absolute_coords=True),
+            )
+        )
+
+        with raises(ImageError):
+            img.get_annotation_boxes([other_img.annotations[-1]])
+        assert img.get_annotation_boxes([]).shape == (0, 4)
+
+    def test_box_array_is_not_copied(self, white_image: WhiteImage) -> None:
+        """copies of an image do not share the cached view and compare equal"""
+        img = _image_with_annotations(white_image)
+        box_array = img.get_box_array()
+
+        for copied in (deepcopy(img), pickle.loads(pickle.dumps(img))):
+            assert copied == img
+            assert copied.get_box_array() is not box_array
+            assert np.array_equal(copied.get_box_array().boxes, box_array.boxes)
+
+    def test_get_annotation_boxes_of_few_annotations_does_not_rebuild_view(self, white_image: WhiteImage) -> None:
+        """boxes of a small subset are computed directly when the view is outdated"""
+        img = _image_with_annotations(white_image)
+        for offset in range(4):
+            img.dump(
+                ImageAnnotation(
+                    category_name="test_cat_1",
+                    bounding_box=BoundingBox(ulx=offset, uly=5, lrx=offset + 10, lry=15, absolute_coords=True),
+                )
+            )
+        box_array = img.get_box_array()
+        img.annotations[1].bounding_box.lry = 0.8  # type: ignore
+
+        boxes = img.get_annotation_boxes(img.annotations[:2])
+
+        assert img._box_array_cache.value is box_array  # pylint: disable=W0212
+        assert boxes.tolist() == img.get_box_array().boxes[:2].tolist()
+        assert boxes[1].tolist() == [74, 100, 300, 320]
+
+        other_img = _image_with_annotations(white_image)
+        other_img.dump(
+            ImageAnnotation(
+                category_name="test_cat_1",
+                bounding_box=BoundingBox(ulx=1, uly=1, lrx=2, lry=2, absolute_coords=True),
+            )
+        )
+        img.annotations[0].bounding_box.lrx = 120  # type: ignore
+        with raises(ImageError):
+            img.get_annotation_boxes([other_img.annotations[-1]])
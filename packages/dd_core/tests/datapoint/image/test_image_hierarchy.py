@@ -19,7 +19,7 @@
 Testing Image hierarchy operations (image_ann_to_image, maybe_ann_to_sub_image, etc.)
 """
 
-from numpy import float32, ones
+from numpy import float32, ones, shares_memory, uint8
 from pytest import raises
 
 from dd_core.datapoint import BoundingBox, Image, ImageAnnotation
@@ -88,6 +88,45 @@ class TestImageHierarchy:
         assert ann.image is not None
         assert ann.image.image.shape == (4, 10, 3)  # pylint:disable=E1101
 
+    def test_image_ann_to_image_crop_image_is_read_only_view(self, white_image: WhiteImage) -> None:
+        """image_ann_to_image with crop_image=True does not copy pixels until the crop is materialized"""
+        img = Image(file_name=white_image.file_name, location=white_image.location)
+        img.image = ones((24, 85, 3), dtype=uint8)
+        ann = ImageAnnotation(
+            category_name="test_cat_1",
+            bounding_box=BoundingBox(ulx=15.0, uly=2.0, width=10.0, height=8.0, absolute_coords=True),
+        )
+        img.dump(ann)
+        img.image_ann_to_image(annotation_id=ann.annotation_id, crop_image=True)
+
+        assert ann.image is not None
+        crop = ann.image.image  # pylint:disable=E1101
+        assert crop is not None
+        assert shares_memory(crop, img.image)
+        with raises(ValueError):
+            crop[0, 0, 0] = 0
+
+        ann.image.materialize_image()  # pylint:disable=E1101
+        materialized = ann.image.image  # pylint:disable=E1101
+        assert materialized is not None
+        assert not shares_memory(materialized, img.image)
+        assert (materialized == crop).all()
+        materialized[0, 0, 0] = 0
+        assert img.image[2, 15, 0] == 1  # type: ignore
+
+    def test_image_setter_copies_numpy_array(self, white_image: WhiteImage) -> None:
+        """setting image with a numpy array does not share pixels with the array of the caller"""
+        img = Image(file_name=white_image.file_name, location=white_image.location)
+        np_image = ones((24, 85, 3), dtype=uint8)
+        img.image = np_image
+        state_id = img.state_id
+
+        np_image[0, 0, 0] = 0
+
+        assert not shares_memory(np_image, img.image)
+        assert img.image[0, 0, 0] == 1  # type: ignore
+        assert img.state_id == state_id
+
     def test_image_ann_to_image_no_crop_leaves_no_pixels(self, white_image: WhiteImage) -> None:
         """image_ann_to_image with crop_image=False doesn't create pixels"""
         img = Image(file_name=white_image.file_name, location=white_image.location)
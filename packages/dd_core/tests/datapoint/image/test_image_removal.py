@@ -115,18 +115,18 @@ class TestImageRemoval:
 
     @staticmethod
     def test_remove_updates_annotation_ids_list(white_image: WhiteImage) -> None:
-        """remove() updates internal _annotation_ids list"""
+        """remove() updates internal annotation index"""
         img = Image(file_name=white_image.file_name)
         ann = ImageAnnotation(
             category_name="test_cat_1",
             bounding_box=BoundingBox(ulx=10, uly=10, width=20, height=20, absolute_coords=True),
         )
         img.dump(ann)
-        assert ann.annotation_id in img._annotation_ids
+        assert ann.annotation_id in img._annotation_index.by_id
 
         img.remove(annotation_ids=ann.annotation_id)
 
-        assert ann.annotation_id not in img._annotation_ids
+        assert ann.annotation_id not in img._annotation_index.by_id
 
     @staticmethod
     def test_remove_preserves_other_annotations(white_image: WhiteImage) -> None:
@@ -156,6 +156,28 @@ class TestImageRemoval:
         assert ann1.annotation_id in result_ids
         assert ann3.annotation_id in result_ids
 
+    @staticmethod
+    def test_remove_keeps_lookups_consistent(white_image: WhiteImage) -> None:
+        """remove() keeps category and service lookups as well as the order of annotations consistent"""
+        img = Image(file_name=white_image.file_name)
+        anns = [
+            ImageAnnotation(
+                category_name="test_cat_1",
+                bounding_box=BoundingBox(ulx=i * 10, uly=i * 10, width=5, height=5, absolute_coords=True),
+                service_id="service_a" if i % 2 else "service_b",
+            )
+            for i in range(6)
+        ]
+        for ann in anns:
+            img.dump(ann)
+
+        img.remove(service_ids="service_a")
+        img.remove(annotation_ids=anns[2].annotation_id)
+
+        assert img.get_annotation(category_names="test_cat_1") == [anns[0], anns[4]]
+        assert not img.get_annotation(service_ids="service_a")
+        assert img.annotations == [anns[0], anns[4]]
+
     @staticmethod
     def test_get_service_id_to_annotation_id_mapping(white_image: WhiteImage) -> None:
         """get_service_id_to_annotation_id returns correct mapping"""
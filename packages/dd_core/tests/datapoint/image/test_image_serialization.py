@@ -19,9 +19,16 @@
 Testing Image serialization (as_dict, as_json, from_file, save)
 """
 
+import json
 from pathlib import Path
 
-from dd_core.datapoint import BoundingBox, Image, ImageAnnotation
+import numpy as np
+import pytest
+
+from dd_core.datapoint import BoundingBox, CategoryAnnotation, Image, ImageAnnotation
+from dd_core.datapoint import image as image_module
+from dd_core.utils.error import BoundingBoxError
+from dd_core.utils.viz import viz_handler
 
 from ..conftest import WhiteImage
 
@@ -111,6 +118,61 @@ class TestImageSerialization:
         assert isinstance(result, dict)
         assert result["_image"] is None
 
+    @staticmethod
+    def test_as_dict_omit_does_not_encode_pixels(white_image: WhiteImage, monkeypatch: pytest.MonkeyPatch) -> None:
+        """as_dict(pixel_policy="omit") does not encode pixels of the image and of nested images"""
+        img = Image(file_name=white_image.file_name)
+        img.image = white_image.image
+        ann = ImageAnnotation(
+            category_name="test_cat_1",
+            bounding_box=BoundingBox(ulx=10, uly=10, width=20, height=20, absolute_coords=True),
+        )
+        img.dump(ann)
+        img.image_ann_to_image(annotation_id=ann.annotation_id, crop_image=True)
+
+        def _raise(np_image: np.ndarray) -> str:
+            raise AssertionError("pixels must not be encoded")
+
+        monkeypatch.setattr(image_module, "convert_np_array_to_b64", _raise)
+        result = img.as_dict(pixel_policy="omit")
+
+        assert result["_image"] is None
+        assert result["annotations"][0]["image"]["_image"] is None
+
+    @staticmethod
+    def test_save_external_writes_png(white_image: WhiteImage, tmp_path: Path) -> None:
+        """save(pixel_policy="external") writes the pixels to a png file next to the JSON file"""
+        img = Image(file_name=white_image.file_name, location=str(tmp_path))
+        img.image = white_image.image
+
+        file_path = img.save(path=tmp_path / "page", pixel_policy="external")
+
+        assert file_path == str(tmp_path / "page.json")
+        assert Image.from_file(file_path).image is None  # type: ignore
+        assert np.array_equal(viz_handler.read_image(str(tmp_path / "page.png")), white_image.image)
+
+    @staticmethod
+    def test_from_trusted_equals_constructor(white_image: WhiteImage) -> None:
+        """from_trusted restores the same image from its dict as the constructor"""
+        img = Image(file_name=white_image.file_name, location=white_image.location)
+        img.image = white_image.image
+        ann = ImageAnnotation(
+            category_name="test_cat_1",
+            bounding_box=BoundingBox(ulx=10, uly=10, width=20, height=20, absolute_coords=True),
+        )
+        img.dump(ann)
+        img.image_ann_to_image(annotation_id=ann.annotation_id, crop_image=True)
+        img.summary.dump_sub_category("test_cat_2", CategoryAnnotation(category_name="test_cat_2"))
+        data = img.as_dict()
+
+        trusted = Image.from_trusted(**data)
+        validated = Image(**data)
+
+        assert trusted.as_dict() == validated.as_dict() == data
+        assert trusted.state_id == validated.state_id == img.state_id
+        assert np.array_equal(trusted.image, white_image.image)  # type: ignore
+        assert trusted.annotations[0].image.image is not None  # type: ignore
+
     @staticmethod
     def test_from_file_loads_image(white_image: WhiteImage, tmp_path: Path) -> None:
         """from_file() loads Image from JSON file"""
@@ -124,6 +186,25 @@ class TestImageSerialization:
         assert isinstance(img2, Image)
         assert img2.file_name == img1.file_name
 
+    @staticmethod
+    def test_from_file_validates_unless_trusted(white_image: WhiteImage, tmp_path: Path) -> None:
+        """from_file() validates the file and only skips validation with trusted=True"""
+        img = Image(file_name=white_image.file_name, location=str(tmp_path))
+        img.dump(
+            ImageAnnotation(
+                category_name="test_cat_1",
+                bounding_box=BoundingBox(ulx=10, uly=10, width=20, height=20, absolute_coords=True),
+            )
+        )
+        data = img.as_dict()
+        data["annotations"][0]["bounding_box"].update({"ulx": 1, "lrx": -5})
+        file_path = tmp_path / "page.json"
+        file_path.write_text(json.dumps(data), encoding="UTF-8")
+
+        with pytest.raises(BoundingBoxError):
+            Image.from_file(str(file_path))
+        assert Image.from_file(str(file_path), trusted=True).annotations[0].bounding_box.lrx == -5  # type: ignore
+
     @staticmethod
     def test_roundtrip_preserves_embeddings(white_image: WhiteImage) -> None:
         """Embeddings are preserved in roundtrip"""
@@ -20,8 +20,12 @@ Testing Image state_id and state management
 """
 
 import numpy as np
+from pytest import MonkeyPatch
 
-from dd_core.datapoint import BoundingBox, Image, ImageAnnotation
+from dd_core.datapoint import BoundingBox, CategoryAnnotation, Image, ImageAnnotation
+from dd_core.datapoint import image as image_module
+from dd_core.utils.object_types import get_type
+from dd_core.utils.types import PixelValues
 
 from ..conftest import WhiteImage
 
@@ -162,3 +166,56 @@ class TestImageState:
         img2.dump(ann2)
 
         assert img1.state_id != img2.state_id
+
+    @staticmethod
+    def test_state_id_hashes_pixels_once(monkeypatch: MonkeyPatch) -> None:
+        """The content hash of the pixel values is computed once and recomputed only after a new image is set"""
+        calls = []
+        digest_func = image_module.get_np_array_digest
+
+        def _counting_digest(np_array: PixelValues) -> str:
+            calls.append(1)
+            return digest_func(np_array)
+
+        monkeypatch.setattr(image_module, "get_np_array_digest", _counting_digest)
+        img = Image(file_name="test.png")
+        img.image = np.ones([10, 10, 3], dtype=np.uint8)
+
+        state_id1 = img.state_id
+        assert img.state_id == state_id1
+        assert len(calls) == 1
+
+        img.image = np.zeros([10, 10, 3], dtype=np.uint8)
+        assert img.state_id != state_id1
+        assert len(calls) == 2
+
+    @staticmethod
+    def test_state_id_reflects_in_place_changes_of_pixels() -> None:
+        """state_id changes when the pixels returned by image are modified in place"""
+        img = Image(file_name="test.png")
+        img.image = np.ones([10, 10, 3], dtype=np.uint8)
+        state_id = img.state_id
+
+        img.image[0, 0, 0] = 255  # type: ignore
+
+        assert img.state_id != state_id
+
+    @staticmethod
+    def test_state_id_reflects_changes_of_nested_annotations(white_image: WhiteImage) -> None:
+        """state_id changes when a sub category or a relationship of a dumped annotation changes"""
+        img = Image(file_name=white_image.file_name)
+        ann = ImageAnnotation(
+            category_name="test_cat_1",
+            bounding_box=BoundingBox(ulx=10, uly=10, width=20, height=20, absolute_coords=True),
+        )
+        img.dump(ann)
+        state_id1 = img.state_id
+
+        ann.dump_sub_category("sub_cat_1", CategoryAnnotation(category_name="test_cat_2"))
+        state_id2 = img.state_id
+        ann.get_sub_category(get_type("sub_cat_1")).deactivate()
+        state_id3 = img.state_id
+        ann.dump_relationship("child", ann.annotation_id)
+        state_id4 = img.state_id
+
+        assert len({state_id1, state_id2, state_id3, state_id4}) == 4
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+# File: test_columnar.py
+
+# Copyright 2025 Dr. Janis Meyer. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Testing module datapoint.columnar
+"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from dd_core.datapoint import (
+    BoundingBox,
+    CategoryAnnotation,
+    ColumnarReader,
+    ContainerAnnotation,
+    Image,
+    ImageAnnotation,
+    Page,
+    load_columnar,
+    save_columnar,
+)
+from dd_core.datapoint.annotation import LLMContainerAnnotation
+from dd_core.utils.error import BoundingBoxError
+from dd_core.utils.object_types import LayoutLabel, PageKey, RelationshipKey, WordKey
+
+from ..conftest import WhiteImage
+
+
+def _get_image(white_image: WhiteImage) -> Image:
+    image = Image(file_name=white_image.file_name, location=white_image.location, external_id=white_image.external_id)
+    image.image = white_image.image
+    for idx, category_name in enumerate((LayoutLabel.TEXT, LayoutLabel.WORD, LayoutLabel.WORD)):
+        ann = ImageAnnotation(
+            category_name=category_name,
+            category_id=idx + 1,
+            score=0.8 if idx else None,
+            bounding_box=BoundingBox(ulx=10 * idx, uly=20, width=50, height=30.5, absolute_coords=True),
+        )
+        image.dump(ann)
+    text, word_1, word_2 = image.annotations
+    word_1.dump_sub_category(WordKey.CHARACTERS, ContainerAnnotation(category_name=WordKey.CHARACTERS, value="ab"))
+    word_2.dump_sub_category(
+        WordKey.TOKEN_CLASS,
+        LLMContainerAnnotation(
+            category_name=WordKey.TOKEN_CLASS,
+            value={"label": "other", "scores": [0.5, 1]},
+            task_id="t",
+            prompt_id="p",
+            output_format_id="o",
+        ),
+    )
+    word_2.dump_sub_category(WordKey.TOKEN_TAG, CategoryAnnotation(category_name=WordKey.TOKEN_TAG, category_id=3))
+    word_2.deactivate()
+    text.dump_relationship(RelationshipKey.CHILD, word_1.annotation_id)
+    text.dump_relationship(RelationshipKey.CHILD, word_2.annotation_id)
+    image.image_ann_to_image(text.annotation_id, crop_image=True)
+    text.image.summary.dump_sub_category(  # type: ignore
+        PageKey.DOCUMENT_TYPE, CategoryAnnotation(category_name=LayoutLabel.TITLE, score=0.25)
+    )
+    image.summary.dump_sub_category(
+        PageKey.DOCUMENT_TYPE, ContainerAnnotation(category_name=PageKey.DOCUMENT_TYPE, value=1.5)
+    )
+    return image
+
+
+def test_columnar_round_trip_equals_json_round_trip(white_image: WhiteImage, tmp_path: Path) -> None:
+    """Images loaded from the columnar format are the same as images loaded from JSON"""
+    image = _get_image(white_image)
+    with open(tmp_path / "image.json", "w", encoding="UTF-8") as file:
+        json.dump(image.as_dict(), file)
+    save_columnar([image], tmp_path / "image.npz")
+
+    from_json = Image.from_file(str(tmp_path / "image.json"))
+    (from_npz,) = load_columnar(tmp_path / "image.npz")
+
+    assert from_npz.as_dict() == from_json.as_dict()
+    assert from_npz.state_id == from_json.state_id
+    assert np.array_equal(from_npz.image, white_image.image)  # type: ignore
+    text = from_npz.annotations[0]
+    assert text.image.image is not None  # type: ignore
+    assert isinstance(from_npz.annotations[2].get_sub_category(WordKey.TOKEN_CLASS), LLMContainerAnnotation)
+
+
+def test_columnar_round_trip_of_page_json(page_json_path: Path, tmp_path: Path) -> None:
+    """A processed page from JSON can be saved and loaded with the columnar format without any loss"""
+    image = Image.from_file(str(page_json_path))
+
+    json_path = image.save(path=tmp_path / "page")
+    npz_path = image.save(path=tmp_path / "page", file_format="npz")
+    page = Page.from_file(npz_path)  # type: ignore
+
+    assert npz_path == str(tmp_path / "page.npz")
+    assert page.base_image.as_dict() == Image.from_file(json_path).as_dict()  # type: ignore
+
+
+def test_columnar_reader_reads_single_columns(white_image: WhiteImage, tmp_path: Path) -> None:
+    """Columns can be read without building images"""
+    image = _get_image(white_image)
+    save_columnar([image, Image(file_name="empty.png")], tmp_path / "images.npz", image_to_blob=False)
+
+    with ColumnarReader(tmp_path / "images.npz") as reader:
+        category_names = reader.column("annotation.category_name")
+        boxes = reader.column("annotation.box")
+        scores = reader.column("annotation.score")
+        values = reader.column("annotation.value")
+        file_names = reader.column("image.file_name")
+        assert reader.get_pixels(0) is None
+        assert len(reader) == 2
+
+    text, word, characters = (category_names.index(name) for name in ("text", "word", "characters"))
+    assert category_names.count("word") == 2
+    assert boxes.shape == (len(category_names), 4)  # type: ignore
+    assert boxes[text].tolist() == [0.0, 20.0, 50.0, 51.0]  # type: ignore
+    assert np.isnan(boxes[characters]).all()  # type: ignore
+    assert scores[word] == 0.8 and np.isnan(scores[text])  # type: ignore
+    assert values[characters] == "ab"
+    assert file_names == [white_image.file_name, white_image.file_name, "empty.png"]
+
+
+def test_load_columnar_validates_unless_trusted(white_image: WhiteImage, tmp_path: Path) -> None:
+    """load_columnar validates the images and only skips validation with trusted=True"""
+    data = _get_image(white_image).as_dict()
+    data["annotations"][0]["bounding_box"].update({"ulx": 1, "lrx": -5})
+    save_columnar([Image.from_trusted(**data)], tmp_path / "images.npz")
+
+    with pytest.raises(BoundingBoxError):
+        load_columnar(tmp_path / "images.npz")
+    assert load_columnar(tmp_path / "images.npz", trusted=True)[0].annotations[0].bounding_box.lrx == -5  # type: ignore
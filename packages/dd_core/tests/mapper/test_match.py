@@ -22,9 +22,11 @@ The tests ensure properties like monotonicity of thresholds, uniqueness in assig
 and correct alignments of parent-child pairs in various matching scenarios.
 """
 
+import numpy as np
 import pytest
 
-from dd_core.mapper.match import match_anns_by_distance, match_anns_by_intersection
+from dd_core.datapoint import BoundingBox, Image, ImageAnnotation
+from dd_core.mapper.match import match_anns_by_distance, match_anns_by_intersection, match_boxes_by_intersection
 from dd_core.utils.file_utils import scipy_available
 from dd_core.utils.object_types import LayoutLabel
 
@@ -72,6 +74,81 @@ def test_iou_threshold_monotonicity(annotations) -> None:  # type: ignore
     assert len(child_idx_low) >= len(child_idx_high)
 
 
+@pytest.mark.parametrize(
+    "matching_rule, threshold, use_weighted_intersections, max_parent_only",
+    [
+        ("iou", 0.0, False, False),
+        ("iou", 0.1, False, False),
+        ("ioa", 0.5, False, False),
+        ("ioa", 0.3, True, False),
+        ("ioa", 0.0, False, True),
+        ("ioa", 0.6, False, True),
+    ],
+)
+def test_spatial_index_equals_dense_matching(
+    matching_rule: str, threshold: float, use_weighted_intersections: bool, max_parent_only: bool
+) -> None:
+    """
+    use_spatial_index returns the same child and parent indices as the dense iou/ioa-matrix.
+    """
+    rng = np.random.default_rng(7)
+    dp = Image(file_name="page.png")
+    dp.set_width_height(1000, 1000)
+    for category_name, num_anns, max_side in ((LayoutLabel.WORD, 300, 40), (LayoutLabel.TEXT, 40, 300)):
+        for ulx, uly, width, height in zip(
+            *rng.integers(0, 900, (2, num_anns)), *rng.integers(1, max_side, (2, num_anns))
+        ):
+            dp.dump(
+                ImageAnnotation(
+                    category_name=category_name,
+                    bounding_box=BoundingBox(ulx=ulx, uly=uly, lrx=ulx + width, lry=uly + height, absolute_coords=True),
+                )
+            )
+
+    outputs = [
+        match_anns_by_intersection(
+            dp,
+            matching_rule=matching_rule,  # type: ignore
+            threshold=threshold,
+            use_weighted_intersections=use_weighted_intersections,
+            parent_ann_category_names=LayoutLabel.TEXT,
+            child_ann_category_names=LayoutLabel.WORD,
+            max_parent_only=max_parent_only,
+            use_spatial_index=use_spatial_index,
+        )
+        for use_spatial_index in (False, True)
+    ]
+
+    assert len(outputs[0][0]) > 0
+    assert list(outputs[0][0]) == list(outputs[1][0])
+    assert list(outputs[0][1]) == list(outputs[1][1])
+
+
+@pytest.mark.skipif(not scipy_available(), reason="Scipy is not installed")
+def test_distance_uses_centers_in_coordinates_of_relative_boxes() -> None:
+    """
+    Distances between relative boxes are measured in relative coordinates and are not scaled with the image size
+    """
+    dp = Image(file_name="test.png")
+    dp.set_width_height(1000, 100)
+    for category_name, ulx, uly, lrx, lry in (
+        (LayoutLabel.TABLE, 0.45, 0.1, 0.55, 0.3),
+        (LayoutLabel.CAPTION, 0.5, 0.1, 0.6, 0.3),
+        (LayoutLabel.CAPTION, 0.45, 0.5, 0.55, 0.7),
+    ):
+        dp.dump(
+            ImageAnnotation(
+                category_name=category_name,
+                bounding_box=BoundingBox(ulx=ulx, uly=uly, lrx=lrx, lry=lry, absolute_coords=False),
+            )
+        )
+    table, first_caption, _ = dp.annotations
+
+    output = match_anns_by_distance(dp, LayoutLabel.TABLE, LayoutLabel.CAPTION)
+
+    assert output == [(table, first_caption)]
+
+
 @pytest.mark.skipif(not scipy_available(), reason="Scipy is not installed")
 def test_distance_assigned_child_is_closest(annotations) -> None:  # type: ignore
     """
@@ -89,3 +166,24 @@ def test_distance_assigned_child_is_closest(annotations) -> None:  # type: ignor
     }
 
     assert output_ids == expected_output_ids
+
+
+def test_match_boxes_by_intersection_example() -> None:
+    """
+    match_boxes_by_intersection on boxes returns the pairs of the docstring example of match_anns_by_intersection
+    """
+    child_boxes = np.array([[0, 0, 10, 10], [20, 0, 30, 10]], dtype=np.float32)
+    parent_boxes = np.array([[0, 0, 10, 3], [0, 3, 10, 10], [18, 0, 32, 12]], dtype=np.float32)
+
+    child_index, parent_index = match_boxes_by_intersection(child_boxes, parent_boxes, "ioa", 0.5)
+    assert child_index.tolist() == [0, 1]
+    assert parent_index.tolist() == [1, 2]
+
+    child_index, parent_index = match_boxes_by_intersection(
+        child_boxes, parent_boxes, "ioa", 0.5, use_weighted_intersections=True
+    )
+    assert child_index.tolist() == [0, 0, 1]
+    assert parent_index.tolist() == [0, 1, 2]
+
+    child_index, parent_index = match_boxes_by_intersection(child_boxes, parent_boxes[:0], "iou", 0.1)
+    assert len(child_index) == 0 and len(parent_index) == 0
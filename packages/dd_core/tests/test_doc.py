@@ -23,7 +23,14 @@ from pathlib import Path
 
 import pytest
 
-from dd_core.datapoint.annotation import AnnotationRef, CategoryAnnotation, ContainerAnnotation, ReferencePayload
+from dd_core.datapoint.annotation import (
+    AnnotationRef,
+    CategoryAnnotation,
+    ContainerAnnotation,
+    ImageAnnotation,
+    ReferencePayload,
+)
+from dd_core.datapoint.box import BoundingBox
 from dd_core.datapoint.image import Image
 from dd_core.datapoint.view import Page
 from dd_core.doc import Document, PageReference
@@ -268,7 +275,90 @@ def test_pdf_iteration_yields_pages_in_order(pdf_file_path_two_pages: Path) -> N
 
 
 @pytest.mark.skipif(not fu.pypdf_available(), reason="Pypdf is not installed")
-def test_pdf_images_dict_non_empty_after_init(pdf_file_path_two_pages: Path) -> None:
-    """_images is populated after Document init for a PDF"""
+def test_pdf_pages_are_loaded_lazily(pdf_file_path_two_pages: Path) -> None:
+    """only page references with media boxes are created on init, pages are loaded on access"""
     doc = Document(location=pdf_file_path_two_pages)
-    assert len(doc._images) > 0
+    assert len(doc._images) == 0
+    ref = doc.get_page_reference(2)
+    assert (ref.width, ref.height) == (612.0, 792.0)
+
+    img = doc.get_image(page_number=2)
+
+    assert img.image_id == ref.image_id
+    assert list(doc._images) == [ref.image_id]
+    assert doc.get_image(image_id=ref.image_id) is img
+
+
+@pytest.mark.skipif(not fu.pypdf_available(), reason="Pypdf is not installed")
+def test_pdf_page_cache_releases_pixels_of_least_recently_used_page(pdf_file_path_two_pages: Path) -> None:
+    """pages beyond max_cached_pages lose their pixels but stay in the document"""
+    doc = Document(location=pdf_file_path_two_pages, max_cached_pages=1)
+    first_img = doc.get_image(page_number=1, load_pixels=True)
+    second_img = doc.get_image(page_number=2, load_pixels=True)
+
+    assert first_img.image is None
+    assert second_img.image is not None
+    assert list(doc._cached_pages) == [2]
+    assert doc.get_image(page_number=1) is first_img
+
+
+@pytest.mark.skipif(not fu.pypdf_available(), reason="Pypdf is not installed")
+def test_pdf_pages_held_beyond_max_cached_pages_keep_annotations(pdf_file_path_two_pages: Path) -> None:
+    """annotations dumped on held pages are not lost when more than max_cached_pages pages are held"""
+    doc = Document(location=pdf_file_path_two_pages, max_cached_pages=1)
+    df = doc.get_image_dataflow()
+    df.reset_state()
+    images = list(df)
+    for img in images:
+        img.dump(
+            ImageAnnotation(
+                category_name=get_type("text"),
+                bounding_box=BoundingBox(ulx=1.0, uly=1.0, width=10.0, height=10.0, absolute_coords=True),
+            )
+        )
+
+    assert doc.get_image(page_number=1) is images[0]
+    assert len(doc.get_image(page_number=1).annotations) == 1
+    assert len(doc.as_dict()["_images"]) == 2
+
+
+@pytest.mark.skipif(not fu.pypdf_available(), reason="Pypdf is not installed")
+def test_pdf_evict_page_keeps_annotated_pages(pdf_file_path_two_pages: Path) -> None:
+    """evict_page drops unannotated pages and only releases the pixels of pages with annotations"""
+    doc = Document(location=pdf_file_path_two_pages)
+    img = doc.get_image(page_number=1, load_pixels=True)
+    img.dump(
+        ImageAnnotation(
+            category_name=get_type("text"),
+            bounding_box=BoundingBox(ulx=1.0, uly=1.0, width=10.0, height=10.0, absolute_coords=True),
+        )
+    )
+    doc.get_image(page_number=2)
+
+    doc.evict_all_pages()
+
+    assert list(doc._images) == [img.image_id]
+    assert img.image is None
+    assert doc.get_image(page_number=1) is img
+
+
+@pytest.mark.skipif(not fu.pypdf_available(), reason="Pypdf is not installed")
+def test_save_npz_round_trip_preserves_pages(pdf_file_path_two_pages: Path, tmp_path: Path) -> None:
+    """save(file_format="npz") and from_file restore the loaded pages and the document metadata"""
+    doc = Document(location=pdf_file_path_two_pages)
+    img = doc.get_image(page_number=1)
+    ann = ImageAnnotation(
+        category_name=get_type("text"),
+        bounding_box=BoundingBox(ulx=1.0, uly=1.0, width=10.0, height=10.0, absolute_coords=True),
+        score=0.5,
+    )
+    img.dump(ann)
+    ann.dump_sub_category(get_type("characters"), ContainerAnnotation(category_name=get_type("characters"), value="a"))
+
+    file_path = doc.save(path=tmp_path / "doc", file_format="npz")
+    restored = Document.from_file(file_path)  # type: ignore
+
+    assert file_path == os.fspath(tmp_path / "doc.npz")
+    assert restored.document_id == doc.document_id
+    assert list(restored._images) == list(doc._images)
+    assert restored.get_image(page_number=1).as_dict() == img.as_dict()
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+# File: test_identifier.py
+
+# Copyright 2025 Dr. Janis Meyer. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Testing module utils.identifier
+"""
+
+import uuid
+
+import pytest
+
+from dd_core.utils.identifier import get_uuid, get_uuid_from_str, get_uuids, is_uuid_like
+
+
+@pytest.mark.parametrize("input_id", ["", "word", "Bounding Box ulx: 1.0, uly: 2.0, lrx: 3.0, lry: 4.0", "äöü€"])
+def test_get_uuid_from_str_is_compatible_with_uuid3(input_id: str) -> None:
+    """get_uuid_from_str generates the same ids as uuid.uuid3"""
+    assert get_uuid_from_str(input_id) == str(uuid.uuid3(uuid.NAMESPACE_DNS, input_id))
+
+
+def test_get_uuids_equals_get_uuid() -> None:
+    """get_uuids generates the same ids as get_uuid"""
+    inputs = [("word", "Bounding Box ulx: 1.0"), ("text",), ()]
+    assert get_uuids(inputs) == [get_uuid(*item) for item in inputs]
+
+
+@pytest.mark.parametrize(
+    "input_id,expected",
+    [
+        ("886313e1-3b8a-5372-9b90-0c9aee199e5d", True),
+        ("886313E1-3B8A-5372-9B90-0C9AEE199E5D", True),
+        ("886313e13b8a53729b900c9aee199e5d", True),
+        ("{886313e1-3b8a-5372-9b90-0c9aee199e5d}", True),
+        ("886313e1-3b8a-5372-9b90-0c9aee199e5g", False),
+        ("886313e1-3b8a-5372-9b90", False),
+        ("foo", False),
+    ],
+)
+def test_is_uuid_like(input_id: str, expected: bool) -> None:
+    """is_uuid_like accepts the same representations as uuid.UUID"""
+    assert is_uuid_like(input_id) is expected
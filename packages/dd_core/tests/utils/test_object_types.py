@@ -23,6 +23,7 @@ Testing the module utils.object_types
 from __future__ import annotations
 
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
@@ -241,6 +242,39 @@ def test_update_all_types_dict_rebuilds_lookup_index_without_breaking_existing_e
     assert get_type(value_b).value == value_b.lower()
 
 
+def test_get_type_memo_is_reset_when_registered_type_is_extended() -> None:
+    """Memoized lookups resolve to the members of the enum currently registered."""
+    type_name = _unique_name("memo_type")
+    value_a = _unique_name("Memo_A")
+    value_b = _unique_name("memo_b")
+
+    register_string_categories_from_list([value_a], type_name)
+    first = get_type(value_a)
+    assert get_type(value_a) is first
+
+    register_string_categories_from_list([value_b], type_name)
+    member = get_type(value_a)
+
+    assert member.value == value_a.lower()
+    assert member.__class__ is _registered_enum(type_name)
+    assert member is not first
+
+
+def test_get_type_registers_dynamic_types_from_concurrent_threads(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Concurrent lookups of unknown labels register every label exactly once."""
+    labels = [_unique_name("concurrent_label") for _ in range(20)]
+
+    monkeypatch.setenv("ENABLE_DYNAMIC_OBJECT_TYPES", "True")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        members = list(executor.map(get_type, labels * 10))
+
+    assert [member.value for member in members] == [label.lower() for label in labels * 10]
+    dynamic_enum = _registered_enum("DYNAMIC_OBJECT_TYPES")
+    assert all(get_type(label).__class__ is dynamic_enum for label in labels)
+    assert {label.lower() for label in labels} <= _registered_values("DYNAMIC_OBJECT_TYPES")
+
+
 def test_register_string_categories_from_list_deduplicates_values_within_single_call() -> None:
     """Values within a single call are de-duplicated stably."""
     type_name = _unique_name("dedupe_type")
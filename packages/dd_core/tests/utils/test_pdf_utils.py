@@ -19,16 +19,22 @@
 Testing the module utils.pdf_utils
 """
 
+import pickle
 from pathlib import Path
 
+import numpy as np
 import pytest
 from numpy import uint8
 
 from dd_core.utils import file_utils as fu
+from dd_core.utils.error import FileExtensionError
 from dd_core.utils.pdf_utils import (
+    PdfDocumentSession,
     PDFStreamer,
+    _parse_ppm_stream,
     get_pdf_file_reader,
     load_bytes_from_pdf_file,
+    pdf_pages_to_np_arrays_poppler,
     pdf_to_np_array_pdfmium,
     pdf_to_np_array_poppler,
 )
@@ -94,6 +100,38 @@ class TestPdfToNpArrayPoppler:
         assert len(np_array.shape) == 3
 
 
+class TestPdfPagesToNpArraysPoppler:
+    """Test pdf_pages_to_np_arrays_poppler"""
+
+    @staticmethod
+    @pytest.mark.skipif(not POPPLER_AVAILABLE, reason="Poppler is not installed")
+    def test_render_page_range_from_path_and_bytes(pdf_file_path_two_pages: Path) -> None:
+        """Test rendering a page range in one call"""
+
+        from_path = pdf_pages_to_np_arrays_poppler(pdf_file_path_two_pages, first_page=1, last_page=2, dpi=72)
+        from_bytes = pdf_pages_to_np_arrays_poppler(pdf_file_path_two_pages.read_bytes(), first_page=2, dpi=72)
+
+        assert len(from_path) == 2
+        assert len(from_bytes) == 1
+        assert from_path[1].shape == from_bytes[0].shape
+
+    @staticmethod
+    def test_parse_ppm_stream() -> None:
+        """Test splitting concatenated PPM/PGM output into BGR arrays"""
+
+        rgb = np.arange(2 * 3 * 3, dtype=uint8).reshape(2, 3, 3)
+        gray = np.array([[7, 8]], dtype=uint8)
+        stream = b"P6\n3 2\n255\n" + rgb.tobytes() + b"P5 2 1 255\n" + gray.tobytes()
+
+        images = _parse_ppm_stream(stream)
+
+        assert len(images) == 2
+        np.testing.assert_array_equal(images[0], rgb[:, :, ::-1])
+        assert images[0].flags.c_contiguous
+        assert images[1].shape == (1, 2, 3)
+        assert images[1][0, 1].tolist() == [8, 8, 8]
+
+
 class TestPdfToNpArrayPdfmium:
     """Test pdf_to_np_array_pdfmium"""
 
@@ -120,3 +158,104 @@ class TestLoadBytesFromPdfFile:
         pdf_bytes = load_bytes_from_pdf_file(pdf_file_path_two_pages, page_number=page_number)
         assert isinstance(pdf_bytes, bytes)
         assert len(pdf_bytes) > 0
+
+
+@pytest.mark.skipif(not fu.pypdfium2_available(), reason="pypdfium2 is not installed")
+class TestPdfDocumentSession:
+    """Test PdfDocumentSession and PdfPage"""
+
+    @staticmethod
+    def test_iter_yields_page_references(pdf_file_path_two_pages: Path) -> None:
+        """Iterating yields page references of one session together with 1-based page numbers"""
+
+        with PdfDocumentSession(pdf_file_path_two_pages) as session:
+            pages = list(session)
+
+        assert len(session) == 2
+        assert [page_number for _, page_number in pages] == [1, 2]
+        assert [page.index for page, _ in pages] == [0, 1]
+        assert all(page.session is session for page, _ in pages)
+
+    @staticmethod
+    def test_page_size_render_and_text(pdf_file_path_two_pages: Path) -> None:
+        """Page size, rendering and text extraction are served from the open document"""
+
+        session = PdfDocumentSession(pdf_file_path_two_pages)
+        page = session[0]
+        width, height = page.get_size()
+
+        np_array = session.render(0, dpi=144)
+        assert np_array.dtype == uint8
+        assert np_array.shape[:2] == (round(height * 2), round(width * 2))
+        assert session.render(0, width=int(width)).shape[1] == int(width)
+        assert isinstance(page.get_text_objects(), list)
+        session.close()
+
+    @staticmethod
+    def test_page_bytes_match_pdf_streamer(pdf_file_path_two_pages: Path) -> None:
+        """Single-page bytes of a page can be re-opened as a one-page document"""
+
+        session = PdfDocumentSession(pdf_file_path_two_pages)
+        page_session = PdfDocumentSession(session[1].to_bytes())
+
+        assert len(page_session) == 1
+        assert page_session[0].get_size() == session[1].get_size()
+
+    @staticmethod
+    def test_pickle_page_references(pdf_file_path_two_pages: Path) -> None:
+        """Pickled pages of a file share the open session, pages of a byte session only carry their page"""
+
+        session = PdfDocumentSession(pdf_file_path_two_pages)
+        page = pickle.loads(pickle.dumps(session[1]))
+        assert page.session is session
+        assert page.index == 1
+
+        byte_session = PdfDocumentSession(pdf_file_path_two_pages.read_bytes())
+        byte_page = pickle.loads(pickle.dumps(byte_session[1]))
+        assert byte_page.index == 0
+        assert len(byte_page.session) == 1
+        assert byte_page.get_size() == byte_session[1].get_size()
+
+    @staticmethod
+    @pytest.mark.parametrize("num_workers", [1, 2])
+    def test_render_pages_with_pdfium(
+        pdf_file_path_two_pages: Path, num_workers: int, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Rendering several pages returns the same arrays as rendering page by page"""
+
+        monkeypatch.setenv("USE_DD_PDFIUM", "True")
+        session = PdfDocumentSession(pdf_file_path_two_pages)
+
+        np_images = session.render_pages([1, 0], dpi=36, num_workers=num_workers)
+
+        assert len(np_images) == 2
+        np.testing.assert_array_equal(np_images[0], session.render(1, dpi=36))
+        np.testing.assert_array_equal(np_images[1], session.render(0, dpi=36))
+
+    @staticmethod
+    def test_render_pages_reuses_worker_processes(
+        pdf_file_path_two_pages: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Worker processes are started once per session and shut down when the session is closed"""
+
+        monkeypatch.setenv("USE_DD_PDFIUM", "True")
+        session = PdfDocumentSession(pdf_file_path_two_pages)
+
+        first_images = session.render_pages([0, 1], dpi=36, num_workers=2)
+        executor = session._executor  # pylint: disable=W0212
+        second_images = session.render_pages([1, 0], dpi=36, num_workers=2)
+
+        assert executor is not None
+        assert session._executor is executor  # pylint: disable=W0212
+        np.testing.assert_array_equal(first_images[0], second_images[1])
+        session.close()
+        assert session._executor is None  # pylint: disable=W0212
+
+    @staticmethod
+    def test_file_extension_and_index_errors(pdf_file_path_two_pages: Path) -> None:
+        """Wrong file extensions and page indices raise"""
+
+        with pytest.raises(FileExtensionError):
+            PdfDocumentSession(pdf_file_path_two_pages.with_suffix(".png"))
+        with pytest.raises(IndexError):
+            _ = PdfDocumentSession(pdf_file_path_two_pages)[2]
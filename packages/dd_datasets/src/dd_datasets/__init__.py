@@ -32,7 +32,7 @@ _IMPORT_STRUCTURE = {
     ],
     "info": ["DatasetInfo", "DatasetCategories", "get_merged_categories"],
     "registry": ["get_dataset", "print_dataset_infos"],
-    "save": ["dataflow_to_json"],
+    "save": ["dataflow_to_json", "dataflow_to_columnar"],
     "instances": [
         "DocLayNet",
         "DocLayNetSeq",
@@ -24,11 +24,10 @@ import os
 from pathlib import Path
 from typing import Optional
 
-from dd_core.dataflow import DataFlow, MapData, SerializerJsonlines
-from dd_core.datapoint.convert import convert_b64_to_np_array
+from dd_core.dataflow import DataFlow, MapData, SerializerColumnar, SerializerJsonlines
 from dd_core.datapoint.image import Image
 from dd_core.utils.file_utils import mkdir_p
-from dd_core.utils.types import ImageDict, PathLikeOrStr
+from dd_core.utils.types import ImageDict, PathLikeOrStr, PixelExportPolicy
 from dd_core.utils.viz import viz_handler
 
 
@@ -52,7 +51,8 @@ def dataflow_to_json(
                       dumped into a single `.jsonl` file.
         file_name: file name, only needed for `jsonl` files
         max_datapoints: Will stop saving after dumping max_datapoint images.
-        save_image_in_json: Will save the image to the `JSON` object
+        save_image_in_json: Will save the image to the `JSON` object. Otherwise, pixels are not encoded at all. With
+                            `single_files=True` they are written as `.png` files to the sub folder `image`.
         highest_hierarchy_only: If `True` it will remove all image attributes of `ImageAnnotation`s
     """
     path = Path(path)
@@ -67,30 +67,65 @@ def dataflow_to_json(
             return dp
 
         df = MapData(df, _remove_hh)
-    df = MapData(df, lambda dp: dp.as_dict())
+    pixel_policy: PixelExportPolicy = "embed" if save_image_in_json else "external"
 
-    def _path_to_str(dp: ImageDict) -> ImageDict:
-        dp["location"] = os.fspath(dp["location"])
-        return dp
+    def _to_dict(dp: Image) -> ImageDict:
+        export_dict = dp.as_dict(pixel_policy=pixel_policy)
+        export_dict["location"] = os.fspath(export_dict["location"])
+        return export_dict
 
-    df = MapData(df, _path_to_str)
-    df.reset_state()
     if single_files:
+        df.reset_state()
         for idx, dp in enumerate(df):
             if idx == max_datapoints:
                 break
-            target_file = path / (dp["file_name"].split(".")[0] + ".json")
+            target_file = path / (dp.file_name.split(".")[0] + ".json")
+            if not save_image_in_json and dp.image is not None:
+                target_file_png = path / "image" / (dp.file_name.split(".")[0] + ".png")
+                viz_handler.write_image(str(target_file_png), dp.image)
+            export_dict = _to_dict(dp)
             if not save_image_in_json:
-                target_file_png = path / "image" / (dp["file_name"].split(".")[0] + ".png")
-                image = dp.pop("_image")
-                image = convert_b64_to_np_array(image)
-
-                viz_handler.write_image(str(target_file_png), image)
+                export_dict.pop("_image")
 
             with open(target_file, "w", encoding="UTF-8") as file:
-                json.dump(dp, file, indent=2)
+                json.dump(export_dict, file, indent=2)
 
     else:
         if not file_name:
             raise ValueError("If single_files is set to False must pass a valid file name for .jsonl file")
-        SerializerJsonlines.save(df, path, file_name, max_datapoints)
+        SerializerJsonlines.save(MapData(df, _to_dict), path, file_name, max_datapoints)
+
+
+def dataflow_to_columnar(
+    df: DataFlow,
+    path: PathLikeOrStr,
+    file_name: str,
+    max_datapoints: Optional[int] = None,
+    save_image: bool = True,
+    highest_hierarchy_only: bool = False,
+) -> None:
+    """
+    Save a dataflow consisting of `datapoint.Image` to a single `.npz` file in the binary columnar format of
+    `dd_core.datapoint.columnar`. Pixels are saved as raw arrays instead of `base64` encodings. Load the file with
+    `SerializerColumnar.load`.
+
+    Args:
+        df: Input dataflow
+        path: Path to save the file to
+        file_name: file name of the `.npz` file
+        max_datapoints: Will stop saving after dumping max_datapoint images.
+        save_image: Will save the pixels of the images
+        highest_hierarchy_only: If `True` it will remove all image attributes of `ImageAnnotation`s
+    """
+    path = Path(path)
+    mkdir_p(path)
+
+    def _remove_images(dp: Image) -> Image:
+        if highest_hierarchy_only:
+            dp.remove_image_from_lower_hierarchy()
+        else:
+            dp.remove_image_from_lower_hierarchy(pixel_values_only=True)
+        return dp
+
+    df = MapData(df, _remove_images)
+    SerializerColumnar.save(df, path, file_name, max_datapoints, image_to_blob=save_image)
@@ -39,6 +39,7 @@ _IMPORT_STRUCTURE = {
         "NerModelCategories",
         "PredictorBase",
         "DetectionResult",
+        "detection_results_from_arrays",
         "ObjectDetector",
         "PdfMiner",
         "TextRecognizer",
@@ -49,6 +50,11 @@ _IMPORT_STRUCTURE = {
         "LanguageDetector",
         "ImageTransformer",
         "DeterministicImageTransformer",
+        "PredictionCache",
+        "CachedObjectDetector",
+        "CachedTextRecognizer",
+        "CachedPdfMiner",
+        "get_config_digest",
         "InferenceResize",
         "D2FrcnnDetector",
         "D2FrcnnTracingDetector",
@@ -77,6 +83,7 @@ _IMPORT_STRUCTURE = {
         "PdfPlumberTextDetector",
         "Pdfmium2TextDetector",
         "TesseractOcrDetector",
+        "TesseractPool",
         "TesseractRotationTransformer",
         "TextractOcrDetector",
     ],
@@ -97,6 +104,8 @@ _IMPORT_STRUCTURE = {
         "PageParsingService",
         "AnnotationNmsService",
         "MultiThreadPipelineComponent",
+        "StagedPipelineData",
+        "MultiProcessPipelineData",
         "DoctectionPipe",
         "LanguageDetectionService",
         "skip_if_category_or_service_extracted",
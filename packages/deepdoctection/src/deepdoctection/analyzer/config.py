@@ -96,6 +96,10 @@ Attributes:
          Enables line matching in post-processing. Useful when synthetic line elements are created
          (e.g., by grouping orphan text containers). Only applicable if list items were previously grouped.
 
+     USE_PREDICTION_CACHE:
+         Enables an on-disk cache for the results of layout detectors, PDF miners and OCR. Re-running the analyzer on
+         the same documents skips model inference of all cached components. Configure via PREDICTION_CACHE.*
+
 ---
 ## Layout Detection Models
 
@@ -375,6 +379,10 @@ The following weights configure each stage for TensorFlow and PyTorch.
         setting this to True will assign it only to the best-matching (i.e., highest-overlapping) section.
         Prevents duplication of text in the output.
 
+    WORD_MATCHING.USE_SPATIAL_INDEX:
+        If set to True, only text containers and layout sections with intersecting boxes are compared
+        instead of computing the full overlap matrix. Gives the same result and is faster on dense pages.
+
     TEXT_ORDERING.TEXT_BLOCK_CATEGORIES:
         Specifies which layout categories must be ordered (e.g., paragraphs, list items). These are layout blocks
         that will be processed by the TextOrderingService.
@@ -419,6 +427,23 @@ The distance is calculated using the center points of the layout elements.
         Specifies the child layout categories in the link relationship.
         These are typically smaller or subordinate elements (e.g., captions).
 
+---
+## Prediction Cache Configuration
+
+Results are stored under a hash of the predictor input (page or crop pixels, PDF page) together with the model and
+its config. Changing settings of components without models (e.g. TEXT_ORDERING.*) therefore re-uses all cached
+results.
+
+    PREDICTION_CACHE.PATH:
+        Path of the sqlite database. Defaults to DEEPDOCTECTION_CACHE/predictions/cache.sqlite if set to None.
+
+    PREDICTION_CACHE.MAX_SIZE_MB:
+        Maximum size of the cache. Least recently used entries are evicted when the cache grows beyond this size.
+
+    PREDICTION_CACHE.COMPONENTS:
+        Components whose predictors are cached. Choose from 'LAYOUT', 'ITEM', 'CELL', 'PDF_MINER', 'WORD' (DocTr word
+        detection) and 'OCR'.
+
 """
 
 from dd_core.datapoint.view import IMAGE_DEFAULTS
@@ -492,6 +517,10 @@ cfg.USE_LM_SEQUENCE_CLASS = False
 # Enables a token classification pipeline component, e.g. a LayoutLM or Bert-like model
 cfg.USE_LM_TOKEN_CLASS = False
 
+# Enables an on-disk cache for the results of layout detectors, PDF miners and OCR. Re-running the analyzer on
+# the same documents skips model inference of all cached components. Configure via PREDICTION_CACHE.*
+cfg.USE_PREDICTION_CACHE = False
+
 # Specifies the selection of the rotation model. There are two models available: A rotation estimator
 # based on Tesseract ('tesseract'), and a rotation estimator based on DocTr ('doctr').
 cfg.ROTATOR.MODEL = "tesseract"
@@ -805,6 +834,10 @@ cfg.WORD_MATCHING.THRESHOLD = 0.3
 # Prevents duplication of text in the output.
 cfg.WORD_MATCHING.MAX_PARENT_ONLY = True
 
+# If set to True, only text containers and layout sections with intersecting boxes are compared
+# instead of computing the full overlap matrix. Gives the same result and is faster on dense pages.
+cfg.WORD_MATCHING.USE_SPATIAL_INDEX = False
+
 # Specifies which layout categories must be ordered (e.g., paragraphs, list items).
 # These are layout blocks that will be processed by the TextOrderingService.
 cfg.TEXT_ORDERING.TEXT_BLOCK_CATEGORIES = IMAGE_DEFAULTS.TEXT_BLOCK_CATEGORIES
@@ -881,6 +914,17 @@ cfg.LM_TOKEN_CLASS.SEGMENT_POSITIONS = None
 # the right.
 cfg.LM_TOKEN_CLASS.SLIDING_WINDOW_STRIDE = 0
 
+# Path of the sqlite database of the prediction cache.
+# Defaults to DEEPDOCTECTION_CACHE/predictions/cache.sqlite if set to None.
+cfg.PREDICTION_CACHE.PATH = None
+
+# Maximum size of the prediction cache. Least recently used entries are evicted when the cache grows beyond this size.
+cfg.PREDICTION_CACHE.MAX_SIZE_MB = 1024
+
+# Components whose predictors are cached. Choose from 'LAYOUT', 'ITEM', 'CELL', 'PDF_MINER', 'WORD' (DocTr word
+# detection) and 'OCR'.
+cfg.PREDICTION_CACHE.COMPONENTS = ["LAYOUT", "ITEM", "CELL", "PDF_MINER", "WORD", "OCR"]
+
 
 # Freezes the configuration to make it immutable.
 # This prevents accidental modification at runtime.
@@ -21,17 +21,19 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Literal, Mapping, Optional, Sequence, Union
+from typing import TYPE_CHECKING, Any, Literal, Mapping, Optional, Sequence, Union, overload
 
 from lazy_imports import try_import
 
 from dd_core.utils.env_info import SETTINGS
 from dd_core.utils.error import DependencyError
+from dd_core.utils.identifier import get_md5_hash
 from dd_core.utils.metacfg import AttrDict
 from dd_core.utils.object_types import CellLabel, LayoutLabel, ObjectTypes, RelationshipKey
 from dd_core.utils.transform import PadTransform
 
-from ..extern.base import ImageTransformer, ObjectDetector, PdfMiner
+from ..extern.base import ImageTransformer, ObjectDetector, PdfMiner, TextRecognizer
+from ..extern.cache import CachedObjectDetector, CachedPdfMiner, CachedTextRecognizer, PredictionCache
 from ..extern.d2detect import D2FrcnnDetector, D2FrcnnTracingDetector
 from ..extern.doctrocr import DocTrRotationTransformer, DoctrTextlineDetector, DoctrTextRecognizer
 from ..extern.hfdetr import HFDetrDerivedDetector
@@ -420,10 +422,13 @@ class ServiceFactory:
         Extracting sub image service kwargs from config.
 
         Args:
+            detector: The detector of the service. Cached detectors are resolved to the wrapped detector.
             mode: Either `LAYOUT`, `CELL`, or `ITEM`.
         """
 
         exclude_category_names = []
+        if isinstance(detector, CachedObjectDetector):
+            detector = detector.predictor
         if mode == "ITEM":
             if detector.__class__.__name__ in ("HFDetrDerivedDetector",):
                 exclude_category_names.extend(
@@ -914,12 +919,12 @@ class ServiceFactory:
         return ServiceFactory._build_pdf_miner_text_service(detector)
 
     @staticmethod
-    def _build_doctr_word_detector_service(detector: DoctrTextlineDetector) -> ImageLayoutService:
+    def _build_doctr_word_detector_service(detector: ObjectDetector) -> ImageLayoutService:
         """
         Building a Doctr word detector service.
 
         Args:
-            detector: DoctrTextlineDetector instance.
+            detector: DoctrTextlineDetector instance, possibly wrapped into a `CachedObjectDetector`.
 
         Returns:
             ImageLayoutService: Word detector service instance.
@@ -927,12 +932,12 @@ class ServiceFactory:
         return ImageLayoutService(layout_detector=detector, to_image=True, crop_image=True)
 
     @staticmethod
-    def build_doctr_word_detector_service(detector: DoctrTextlineDetector) -> ImageLayoutService:
+    def build_doctr_word_detector_service(detector: ObjectDetector) -> ImageLayoutService:
         """
         Building a Doctr word detector service.
 
         Args:
-            detector: DoctrTextlineDetector instance.
+            detector: DoctrTextlineDetector instance, possibly wrapped into a `CachedObjectDetector`.
 
         Returns:
             ImageLayoutService: Word detector service instance.
@@ -953,7 +958,7 @@ class ServiceFactory:
 
     @staticmethod
     def _build_text_extraction_service(
-        detector: Union[TesseractOcrDetector, DoctrTextRecognizer, TextractOcrDetector],
+        detector: Union[ObjectDetector, TextRecognizer],
         extract_from_roi: Union[Sequence[ObjectTypes], ObjectTypes, None] = None,
     ) -> TextExtractionService:
         """
@@ -970,7 +975,7 @@ class ServiceFactory:
 
     @staticmethod
     def build_text_extraction_service(
-        config: AttrDict, detector: Union[TesseractOcrDetector, DoctrTextRecognizer, TextractOcrDetector]
+        config: AttrDict, detector: Union[ObjectDetector, TextRecognizer]
     ) -> TextExtractionService:
         """
         Building a text extraction service.
@@ -997,6 +1002,7 @@ class ServiceFactory:
             "matching_rule": config.WORD_MATCHING.RULE,
             "threshold": config.WORD_MATCHING.THRESHOLD,
             "max_parent_only": config.WORD_MATCHING.MAX_PARENT_ONLY,
+            "use_spatial_index": config.WORD_MATCHING.USE_SPATIAL_INDEX,
             "parental_categories": config.WORD_MATCHING.PARENTAL_CATEGORIES,
             "text_container": config.TEXT_CONTAINER,
         }
@@ -1008,6 +1014,7 @@ class ServiceFactory:
         max_parent_only: bool,
         parental_categories: Union[Sequence[ObjectTypes], ObjectTypes, None],
         text_container: Union[Sequence[ObjectTypes], ObjectTypes, None],
+        use_spatial_index: bool = False,
     ) -> MatchingService:
         """
         Building a word matching service.
@@ -1018,6 +1025,7 @@ class ServiceFactory:
             max_parent_only: Whether to use max parent only.
             parental_categories: Parent categories for matching.
             text_container: Text container categories.
+            use_spatial_index: Whether to only evaluate intersecting pairs of boxes.
 
         Returns:
             MatchingService: Word matching service instance.
@@ -1026,6 +1034,7 @@ class ServiceFactory:
             matching_rule=matching_rule,
             threshold=threshold,
             max_parent_only=max_parent_only,
+            use_spatial_index=use_spatial_index,
         )
         family_compounds = [
             FamilyCompound(
@@ -1129,11 +1138,12 @@ class ServiceFactory:
             "matching_rule": config.WORD_MATCHING.RULE,
             "threshold": config.WORD_MATCHING.THRESHOLD,
             "max_parent_only": config.WORD_MATCHING.MAX_PARENT_ONLY,
+            "use_spatial_index": config.WORD_MATCHING.USE_SPATIAL_INDEX,
         }
 
     @staticmethod
     def _build_line_matching_service(
-        matching_rule: Literal["iou", "ioa"], threshold: float, max_parent_only: bool
+        matching_rule: Literal["iou", "ioa"], threshold: float, max_parent_only: bool, use_spatial_index: bool = False
     ) -> MatchingService:
         """
         Building a line matching service.
@@ -1142,6 +1152,7 @@ class ServiceFactory:
             matching_rule: Matching rule for intersection matcher.
             threshold: Threshold for intersection matcher.
             max_parent_only: Whether to use max parent only.
+            use_spatial_index: Whether to only evaluate intersecting pairs of boxes.
 
         Returns:
             MatchingService: Line matching service instance.
@@ -1150,6 +1161,7 @@ class ServiceFactory:
             matching_rule=matching_rule,
             threshold=threshold,
             max_parent_only=max_parent_only,
+            use_spatial_index=use_spatial_index,
         )
         family_compounds = [
             FamilyCompound(
@@ -1704,6 +1716,123 @@ class ServiceFactory:
         page_parsing_service_kwargs = ServiceFactory._get_page_parsing_service_kwargs_from_config(config)
         return ServiceFactory._build_page_parsing_service(**page_parsing_service_kwargs)
 
+    @staticmethod
+    def _get_prediction_cache_kwargs_from_config(config: AttrDict) -> dict[str, Any]:
+        """
+        Extracting prediction cache kwargs from config.
+
+        Args:
+            config: Configuration object.
+        """
+        path = config.PREDICTION_CACHE.PATH
+        if path is None or path == "None":
+            path = SETTINGS.DEEPDOCTECTION_CACHE / "predictions" / "cache.sqlite"
+        return {
+            "path": path,
+            "max_size_bytes": int(config.PREDICTION_CACHE.MAX_SIZE_MB * 1024**2),
+        }
+
+    @staticmethod
+    def _build_prediction_cache(path: str, max_size_bytes: int) -> PredictionCache:
+        """
+        Building a prediction cache.
+
+        Args:
+            path: Path of the sqlite database.
+            max_size_bytes: Maximum size of the cache in bytes.
+
+        Returns:
+            PredictionCache: Prediction cache instance.
+        """
+        return PredictionCache(path=path, max_size_bytes=max_size_bytes)
+
+    @staticmethod
+    def build_prediction_cache(config: AttrDict) -> PredictionCache:
+        """
+        Building a prediction cache.
+
+        Args:
+            config: Configuration object.
+
+        Returns:
+            PredictionCache: Prediction cache instance.
+        """
+        prediction_cache_kwargs = ServiceFactory._get_prediction_cache_kwargs_from_config(config)
+        return ServiceFactory._build_prediction_cache(**prediction_cache_kwargs)
+
+    @staticmethod
+    def _get_cached_predictor_config_from_config(config: AttrDict, component: str) -> dict[str, Any]:
+        """
+        Extracting the part of the config that determines the results of the predictor of a component. It becomes part
+        of the cache key.
+
+        Args:
+            config: Configuration object.
+            component: One of `LAYOUT`, `ITEM`, `CELL`, `PDF_MINER`, `WORD` or `OCR`.
+        """
+        if component in ("LAYOUT", "ITEM", "CELL"):
+            return {
+                "enforce_weights": getattr(config.ENFORCE_WEIGHTS, component),
+                component: getattr(config, component).to_dict(),
+            }
+        if component == "PDF_MINER":
+            return config.PDF_MINER.to_dict()
+        if component == "WORD":
+            return {"weights": config.OCR.WEIGHTS.DOCTR_WORD}
+        if component == "OCR":
+            predictor_config = {"language": config.LANGUAGE, "OCR": config.OCR.to_dict()}
+            if config.OCR.USE_TESSERACT:
+                predictor_config["tesseract_config"] = get_md5_hash(SETTINGS.CONFIGS_DIR / config.OCR.CONFIG.TESSERACT)
+            return predictor_config
+        raise ValueError(f"Cannot cache predictions of component: {component}")
+
+    @overload
+    @staticmethod
+    def maybe_cache_predictor(
+        config: AttrDict, predictor: ObjectDetector, component: str, cache: Optional[PredictionCache]
+    ) -> ObjectDetector: ...
+
+    @overload
+    @staticmethod
+    def maybe_cache_predictor(
+        config: AttrDict, predictor: TextRecognizer, component: str, cache: Optional[PredictionCache]
+    ) -> TextRecognizer: ...
+
+    @overload
+    @staticmethod
+    def maybe_cache_predictor(
+        config: AttrDict, predictor: PdfMiner, component: str, cache: Optional[PredictionCache]
+    ) -> PdfMiner: ...
+
+    @staticmethod
+    def maybe_cache_predictor(
+        config: AttrDict,
+        predictor: Union[ObjectDetector, TextRecognizer, PdfMiner],
+        component: str,
+        cache: Optional[PredictionCache],
+    ) -> Union[ObjectDetector, TextRecognizer, PdfMiner]:
+        """
+        Wraps a predictor into a cached predictor, if a cache is given and `component` is listed in
+        `PREDICTION_CACHE.COMPONENTS`. Otherwise, returns the predictor unchanged.
+
+        Args:
+            config: Configuration object.
+            predictor: `ObjectDetector`, `TextRecognizer` or `PdfMiner`.
+            component: One of `LAYOUT`, `ITEM`, `CELL`, `PDF_MINER`, `WORD` or `OCR`.
+            cache: Prediction cache.
+
+        Returns:
+            The cached predictor or `predictor`.
+        """
+        if cache is None or component not in config.PREDICTION_CACHE.COMPONENTS:
+            return predictor
+        predictor_config = ServiceFactory._get_cached_predictor_config_from_config(config, component)
+        if isinstance(predictor, ObjectDetector):
+            return CachedObjectDetector(predictor, cache, predictor_config)
+        if isinstance(predictor, TextRecognizer):
+            return CachedTextRecognizer(predictor, cache, predictor_config)
+        return CachedPdfMiner(predictor, cache, predictor_config)
+
     @staticmethod
     def build_analyzer(config: AttrDict) -> DoctectionPipe:
         """
@@ -1716,6 +1845,7 @@ class ServiceFactory:
             DoctectionPipe: Analyzer pipeline instance.
         """
         pipe_component_list: list[PipelineComponent] = []
+        cache = ServiceFactory.build_prediction_cache(config) if config.USE_PREDICTION_CACHE else None
 
         if config.USE_ROTATOR:
             rotation_detector = ServiceFactory.build_rotation_detector(config.ROTATOR.MODEL)
@@ -1723,7 +1853,9 @@ class ServiceFactory:
             pipe_component_list.append(transform_service)
 
         if config.USE_LAYOUT:
-            layout_detector = ServiceFactory.build_layout_detector(config, mode="LAYOUT")
+            layout_detector = ServiceFactory.maybe_cache_predictor(
+                config, ServiceFactory.build_layout_detector(config, mode="LAYOUT"), "LAYOUT", cache
+            )
             layout_service = ServiceFactory.build_layout_service(config, detector=layout_detector, mode="LAYOUT")
             pipe_component_list.append(layout_service)
 
@@ -1735,11 +1867,15 @@ class ServiceFactory:
         # setup tables service
         if config.USE_TABLE_SEGMENTATION:
             item_detector = ServiceFactory.build_layout_detector(config, mode="ITEM")
-            item_service = ServiceFactory.build_sub_image_service(config, detector=item_detector, mode="ITEM")
+            item_service = ServiceFactory.build_sub_image_service(
+                config, detector=ServiceFactory.maybe_cache_predictor(config, item_detector, "ITEM", cache), mode="ITEM"
+            )
             pipe_component_list.append(item_service)
 
             if item_detector.__class__.__name__ not in ("HFDetrDerivedDetector",):
-                cell_detector = ServiceFactory.build_layout_detector(config, mode="CELL")
+                cell_detector = ServiceFactory.maybe_cache_predictor(
+                    config, ServiceFactory.build_layout_detector(config, mode="CELL"), "CELL", cache
+                )
                 cell_service = ServiceFactory.build_sub_image_service(config, detector=cell_detector, mode="CELL")
                 pipe_component_list.append(cell_service)
 
@@ -1752,7 +1888,9 @@ class ServiceFactory:
 
         d_text_service_id = ""
         if config.USE_PDF_MINER:
-            pdf_miner = ServiceFactory.build_pdf_text_detector(config)
+            pdf_miner = ServiceFactory.maybe_cache_predictor(
+                config, ServiceFactory.build_pdf_text_detector(config), "PDF_MINER", cache
+            )
             d_text = ServiceFactory.build_pdf_miner_text_service(pdf_miner)
             d_text_service_id = d_text.service_id
             pipe_component_list.append(d_text)
@@ -1761,12 +1899,16 @@ class ServiceFactory:
         if config.USE_OCR:
             # the extra mile for DocTr
             if config.OCR.USE_DOCTR:
-                word_detector = ServiceFactory.build_doctr_word_detector(config)
+                word_detector = ServiceFactory.maybe_cache_predictor(
+                    config, ServiceFactory.build_doctr_word_detector(config), "WORD", cache
+                )
                 word_service = ServiceFactory.build_doctr_word_detector_service(word_detector)
                 word_service.set_inbound_filter(skip_if_category_or_service_extracted(service_ids=d_text_service_id))
                 pipe_component_list.append(word_service)
 
-            ocr_detector = ServiceFactory.build_ocr_detector(config)
+            ocr_detector = ServiceFactory.maybe_cache_predictor(
+                config, ServiceFactory.build_ocr_detector(config), "OCR", cache
+            )
             text_extraction_service = ServiceFactory.build_text_extraction_service(config, ocr_detector)
             text_extraction_service.set_inbound_filter(
                 skip_if_category_or_service_extracted(service_ids=d_text_service_id)
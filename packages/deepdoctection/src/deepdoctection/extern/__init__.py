@@ -20,6 +20,7 @@
 """
 
 from .base import *
+from .cache import *
 from .d2detect import *
 from .deskew import *
 from .doctrocr import *
@@ -28,6 +28,7 @@ from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, Literal, Mapping, Optional, Sequence, Union, overload
 
 import numpy as np
+import numpy.typing as npt
 from lazy_imports import try_import
 
 from dd_core.utils.identifier import get_uuid_from_str
@@ -44,6 +45,8 @@ from dd_core.utils.transform import BaseTransform
 from dd_core.utils.types import JsonDict, PixelValues, Requirement
 
 if TYPE_CHECKING:
+    from dd_core.utils.pdf_utils import PdfPage
+
     with try_import() as import_guard:
         import torch
 
@@ -356,6 +359,37 @@ class DetectionResult:
     image_height: Optional[Union[int, float]] = None
 
 
+def detection_results_from_arrays(
+    boxes: npt.NDArray[np.float32], scores: npt.NDArray[np.float32], class_ids: npt.NDArray[np.int_]
+) -> list[DetectionResult]:
+    """
+    Generating `DetectionResult`s from the columnar output of an object detector, i.e. from one array for all boxes,
+    one for all scores and one for all class ids of an image. Each array is converted to a list only once, instead of
+    converting every detection separately.
+
+    Example:
+        ```python
+        detect_results = detection_results_from_arrays(
+            boxes.cpu().numpy(), scores.cpu().numpy(), classes.cpu().numpy()
+        )
+        ```
+
+    Args:
+        boxes: Array of shape `(N,4)` with boxes in `xyxy` format
+        scores: Array of shape `(N,)`
+        class_ids: Array of shape `(N,)`
+
+    Returns:
+        List of `DetectionResult`s
+    """
+    return [
+        DetectionResult(box=box, score=score, class_id=class_id)
+        for box, score, class_id in zip(
+            np.reshape(boxes, (-1, 4)).tolist(), np.ravel(scores).tolist(), np.ravel(class_ids).tolist()
+        )
+    ]
+
+
 class ObjectDetector(PredictorBase, ABC):
     """
     Abstract base class for object detection. This can be anything ranging from layout detection to OCR.
@@ -384,6 +418,21 @@ class ObjectDetector(PredictorBase, ABC):
         """
         raise NotImplementedError()
 
+    def predict_batch(self, np_imgs: Sequence[PixelValues]) -> list[list[DetectionResult]]:
+        """
+        Predict a batch of images.
+
+        The default implementation calls `predict` for every image. Detectors that can run a forward pass on several
+        images at once should override this method and set `accepts_batch` to `True`.
+
+        Args:
+            np_imgs: A sequence of numpy arrays, each representing an image.
+
+        Returns:
+            A list with one list of `DetectionResult` per image, in the same order as `np_imgs`.
+        """
+        return [self.predict(np_img) for np_img in np_imgs]
+
     @property
     def accepts_batch(self) -> bool:
         """
@@ -420,12 +469,13 @@ class PdfMiner(PredictorBase, ABC):
     _pdf_bytes: Optional[bytes] = None
 
     @abstractmethod
-    def predict(self, pdf_bytes: bytes) -> list[DetectionResult]:
+    def predict(self, pdf_bytes: Union[bytes, PdfPage]) -> list[DetectionResult]:
         """
         Abstract method predict
 
         Args:
-            pdf_bytes: A bytes stream representing the PDF document page to be processed by the predictor.
+            pdf_bytes: A bytes stream representing the PDF document page to be processed by the predictor or a
+                       `PdfPage` reference to a page of an open `PdfDocumentSession`.
 
         Returns:
             A list of DetectionResult objects containing the results of the prediction.
@@ -433,12 +483,12 @@ class PdfMiner(PredictorBase, ABC):
         raise NotImplementedError()
 
     @abstractmethod
-    def get_width_height(self, pdf_bytes: bytes) -> tuple[float, float]:
+    def get_width_height(self, pdf_bytes: Union[bytes, PdfPage]) -> tuple[float, float]:
         """
         Abstract method get_width_height
 
         Args:
-            pdf_bytes: A bytes stream representing the PDF document page.
+            pdf_bytes: A bytes stream representing the PDF document page or a `PdfPage` reference.
 
         Returns:
             A tuple containing the width and height of the PDF document page.
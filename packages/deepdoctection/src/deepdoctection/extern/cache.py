@@ -0,0 +1,437 @@
+# -*- coding: utf-8 -*-
+# File: cache.py
+
+# Copyright 2024 Dr. Janis Meyer. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Content-addressed cache for predictor results.
+
+Results of `ObjectDetector`, `TextRecognizer` and `PdfMiner` predictors are stored in a local sqlite database. Keys are
+derived from a hash of the predictor input (pixels or PDF page) together with the `model_id`, the name and the config
+of the predictor, so that re-processing the same documents does not run any model inference again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Mapping, Optional, Sequence, Union
+
+from dd_core.utils.fs import mkdir_p
+from dd_core.utils.identifier import get_np_array_digest
+from dd_core.utils.object_types import ObjectTypes
+from dd_core.utils.pdf_utils import PdfPage
+from dd_core.utils.types import JsonDict, PathLikeOrStr, PixelValues, Requirement
+
+from .base import DetectionResult, ObjectDetector, PdfMiner, PredictorBase, TextRecognizer
+
+__all__ = ["PredictionCache", "CachedObjectDetector", "CachedTextRecognizer", "CachedPdfMiner", "get_config_digest"]
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS predictions "
+    "(key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, last_access REAL NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS predictions_last_access ON predictions (last_access)",
+    "CREATE TABLE IF NOT EXISTS cache_size (total INTEGER NOT NULL)",
+    "INSERT INTO cache_size (total) SELECT 0 WHERE NOT EXISTS (SELECT 1 FROM cache_size)",
+    "CREATE TRIGGER IF NOT EXISTS predictions_insert AFTER INSERT ON predictions "
+    "BEGIN UPDATE cache_size SET total = total + new.size; END",
+    "CREATE TRIGGER IF NOT EXISTS predictions_delete AFTER DELETE ON predictions "
+    "BEGIN UPDATE cache_size SET total = total - old.size; END",
+    "CREATE TRIGGER IF NOT EXISTS predictions_update AFTER UPDATE OF size ON predictions "
+    "BEGIN UPDATE cache_size SET total = total - old.size + new.size; END",
+)
+
+
+def get_config_digest(config: Optional[Mapping[str, Any]]) -> str:
+    """
+    Stable hash of a predictor config. Values that are not JSON serializable are represented by their string.
+
+    Args:
+        config: A mapping of config values, e.g. the kwargs a predictor has been built with.
+
+    Returns:
+        A hex digest
+    """
+    dumped = json.dumps(config or {}, sort_keys=True, default=str)
+    return hashlib.blake2b(dumped.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _get_input_digest(predictor_input: Union[PixelValues, bytes, PdfPage]) -> str:
+    if isinstance(predictor_input, PdfPage):
+        return f"{predictor_input.session.get_source_digest()}-{predictor_input.index}"
+    if isinstance(predictor_input, bytes):
+        return hashlib.blake2b(predictor_input, digest_size=16).hexdigest()
+    return get_np_array_digest(predictor_input)
+
+
+class PredictionCache:
+    """
+    On-disk key-value store for predictor results backed by sqlite.
+
+    The store is bounded by `max_size_bytes`. When a new entry exceeds the bound, the least recently used entries are
+    evicted. Hits and misses are counted for every lookup.
+
+    Example:
+        ```python
+        cache = PredictionCache("/path/to/cache.sqlite", max_size_bytes=512 * 1024**2)
+        detector = CachedObjectDetector(D2FrcnnDetector(...), cache)
+        ...
+        print(cache.get_stats())
+        ```
+
+    Note:
+        The cache can be shared between threads and processes. When pickled, the connection is re-opened lazily in
+        the receiving process and the counters start from zero.
+    """
+
+    def __init__(self, path: PathLikeOrStr, max_size_bytes: int = 1024**3) -> None:
+        """
+        Args:
+            path: Path of the sqlite database file. Parent directories are created if they do not exist.
+            max_size_bytes: Maximum size of all stored values in bytes.
+        """
+        self.path = Path(path)
+        self.max_size_bytes = max_size_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        mkdir_p(self.path.parent)
+        self._get_connection()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            connection = sqlite3.connect(os.fspath(self.path), check_same_thread=False, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            for statement in _SCHEMA:
+                connection.execute(statement)
+            self._connection = connection
+        return self._connection
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Returns the value stored under `key` and marks it as recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The stored value or `None` if there is no entry.
+        """
+        with self._lock:
+            connection = self._get_connection()
+            row = connection.execute("SELECT value FROM predictions WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            connection.execute("UPDATE predictions SET last_access = ? WHERE key = ?", (time.time(), key))
+            self.hits += 1
+        return pickle.loads(row[0])
+
+    def put(self, key: str, value: Any) -> None:
+        """
+        Stores `value` under `key` and evicts least recently used entries if the cache exceeds `max_size_bytes`.
+
+        Args:
+            key: Cache key
+            value: Any picklable value
+        """
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            connection = self._get_connection()
+            connection.execute(
+                "INSERT INTO predictions (key, value, size, last_access) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value, size = excluded.size, "
+                "last_access = excluded.last_access",
+                (key, blob, len(blob), time.time()),
+            )
+            self._evict(connection)
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        excess = self._get_size_bytes(connection) - self.max_size_bytes
+        if excess <= 0:
+            return
+        evicted_keys = []
+        for key, size in connection.execute("SELECT key, size FROM predictions ORDER BY last_access"):
+            evicted_keys.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        connection.execute("BEGIN")
+        connection.executemany("DELETE FROM predictions WHERE key = ?", evicted_keys)
+        connection.execute("COMMIT")
+
+    @staticmethod
+    def _get_size_bytes(connection: sqlite3.Connection) -> int:
+        return connection.execute("SELECT total FROM cache_size").fetchone()[0]
+
+    @property
+    def size_bytes(self) -> int:
+        """Size of all stored values in bytes"""
+        with self._lock:
+            return self._get_size_bytes(self._get_connection())
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._get_connection().execute("SELECT COUNT(*) FROM predictions").fetchone()[0]
+
+    def get_stats(self) -> JsonDict:
+        """
+        Returns:
+            A dict with `hits`, `misses`, number of `entries` and `size_bytes` of the cache
+        """
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self), "size_bytes": self.size_bytes}
+
+    def clear(self) -> None:
+        """Removes all entries and resets the counters"""
+        with self._lock:
+            self._get_connection().execute("DELETE FROM predictions")
+            self.hits = 0
+            self.misses = 0
+
+    def close(self) -> None:
+        """Closes the connection. It will be re-opened on the next access."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_connection"] = None
+        state["_lock"] = None
+        state["hits"] = 0
+        state["misses"] = 0
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+class _CachedPredictorMixin:
+    """
+    Shared setup of the cached predictor wrappers. The wrapper takes over `name`, `model_id` and `categories` of the
+    wrapped predictor, so that pipeline components built with the wrapper are indistinguishable from components built
+    with the predictor itself.
+    """
+
+    predictor: Any
+    cache: PredictionCache
+    predictor_config: Optional[Mapping[str, Any]]
+    _key_prefix: str
+
+    def _set_up(
+        self, predictor: PredictorBase, cache: PredictionCache, predictor_config: Optional[Mapping[str, Any]]
+    ) -> None:
+        self.predictor = predictor
+        self.cache = cache
+        self.predictor_config = predictor_config
+        self.name = predictor.name
+        self.model_id = predictor.model_id
+        if hasattr(predictor, "categories"):
+            self.categories = predictor.categories
+        self._key_prefix = (
+            f"{predictor.__class__.__name__}-{predictor.name}-{predictor.model_id}-"
+            f"{get_config_digest(predictor_config)}"
+        )
+
+    def get_cache_key(self, predictor_input: Union[PixelValues, bytes, PdfPage]) -> str:
+        """
+        Cache key of a predictor input
+
+        Args:
+            predictor_input: Image, PDF bytes or `PdfPage`
+
+        Returns:
+            A key combining the wrapped predictor and the content hash of the input
+        """
+        return f"{self._key_prefix}-{_get_input_digest(predictor_input)}"
+
+    @classmethod
+    def get_requirements(cls) -> list[Requirement]:
+        """The cache has no requirements. Requirements of the wrapped predictor are checked by the predictor itself."""
+        return []
+
+    def clear_model(self) -> None:
+        """Clears the model of the wrapped predictor. Cached results are kept."""
+        self.predictor.clear_model()
+
+
+class CachedObjectDetector(_CachedPredictorMixin, ObjectDetector):
+    """
+    `ObjectDetector` that looks up results of the wrapped detector in a `PredictionCache` before running inference.
+
+    Example:
+        ```python
+        cache = PredictionCache("/path/to/cache.sqlite")
+        layout_detector = CachedObjectDetector(D2FrcnnDetector(...), cache, predictor_config={"weights": weights})
+        layout_service = ImageLayoutService(layout_detector)
+        ```
+    """
+
+    def __init__(
+        self,
+        predictor: ObjectDetector,
+        cache: PredictionCache,
+        predictor_config: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        """
+        Args:
+            predictor: The detector to wrap
+            cache: The `PredictionCache`
+            predictor_config: Config the detector has been built with. It is part of the cache key, so that
+                              detectors with different settings do not share results.
+        """
+        self._set_up(predictor, cache, predictor_config)
+
+    def predict(self, np_img: PixelValues) -> list[DetectionResult]:
+        key = self.get_cache_key(np_img)
+        detect_results = self.cache.get(key)
+        if detect_results is None:
+            detect_results = self.predictor.predict(np_img)
+            self.cache.put(key, detect_results)
+        return detect_results
+
+    def predict_batch(self, np_imgs: Sequence[PixelValues]) -> list[list[DetectionResult]]:
+        keys = [self.get_cache_key(np_img) for np_img in np_imgs]
+        batch_detect_results = [self.cache.get(key) for key in keys]
+        missing = [idx for idx, detect_results in enumerate(batch_detect_results) if detect_results is None]
+        if missing:
+            predicted = self.predictor.predict_batch([np_imgs[idx] for idx in missing])
+            for idx, detect_results in zip(missing, predicted):
+                self.cache.put(keys[idx], detect_results)
+                batch_detect_results[idx] = detect_results
+        return batch_detect_results  # type: ignore
+
+    @property
+    def accepts_batch(self) -> bool:
+        return self.predictor.accepts_batch
+
+    def get_category_names(self) -> tuple[ObjectTypes, ...]:
+        return self.predictor.get_category_names()
+
+    def clone(self) -> CachedObjectDetector:
+        return self.__class__(self.predictor.clone(), self.cache, self.predictor_config)
+
+
+class CachedTextRecognizer(_CachedPredictorMixin, TextRecognizer):
+    """
+    `TextRecognizer` that looks up results of the wrapped recognizer in a `PredictionCache`. Every crop of a batch is
+    cached separately, and only crops without a cache entry are passed to the wrapped recognizer.
+    """
+
+    def __init__(
+        self,
+        predictor: TextRecognizer,
+        cache: PredictionCache,
+        predictor_config: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        """
+        Args:
+            predictor: The text recognizer to wrap
+            cache: The `PredictionCache`
+            predictor_config: Config the recognizer has been built with. It is part of the cache key.
+        """
+        self._set_up(predictor, cache, predictor_config)
+
+    def predict(self, images: list[tuple[str, PixelValues]]) -> list[DetectionResult]:
+        keys = [self.get_cache_key(np_img) for _, np_img in images]
+        cached = [self.cache.get(key) for key in keys]
+        missing = [(uuid, np_img) for (uuid, np_img), entry in zip(images, cached) if entry is None]
+        predicted: dict[Optional[str], list[DetectionResult]] = defaultdict(list)
+        if missing:
+            for detect_result in self.predictor.predict(missing):
+                predicted[detect_result.uuid].append(detect_result)
+
+        detect_results: list[DetectionResult] = []
+        for (uuid, _), key, entry in zip(images, keys, cached):
+            if entry is None:
+                entry = predicted.get(uuid, [])
+                self.cache.put(key, entry)
+            else:
+                # entries have been stored with the uuid of the crop that generated them
+                for detect_result in entry:
+                    detect_result.uuid = uuid
+            detect_results.extend(entry)
+        return detect_results
+
+    @property
+    def accepts_batch(self) -> bool:
+        return self.predictor.accepts_batch
+
+    def clone(self) -> CachedTextRecognizer:
+        return self.__class__(self.predictor.clone(), self.cache, self.predictor_config)
+
+
+class CachedPdfMiner(_CachedPredictorMixin, PdfMiner):
+    """
+    `PdfMiner` that looks up results of the wrapped miner in a `PredictionCache`. The page size is
+    stored together with the results, so that a cache hit does not need to parse the page at all.
+    """
+
+    def __init__(
+        self,
+        predictor: PdfMiner,
+        cache: PredictionCache,
+        predictor_config: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        """
+        Args:
+            predictor: The PDF miner to wrap
+            cache: The `PredictionCache`
+            predictor_config: Config the miner has been built with. It is part of the cache key.
+        """
+        self._set_up(predictor, cache, predictor_config)
+        self._last_key: Optional[str] = None
+        self._last_entry: Optional[tuple[list[DetectionResult], tuple[float, float]]] = None
+
+    def _get_entry(
+        self, pdf_bytes: Union[bytes, PdfPage], reuse_last: bool
+    ) -> tuple[list[DetectionResult], tuple[float, float]]:
+        key = self.get_cache_key(pdf_bytes)
+        if reuse_last and key == self._last_key and self._last_entry is not None:
+            return self._last_entry
+        entry = self.cache.get(key)
+        if entry is None:
+            entry = (self.predictor.predict(pdf_bytes), self.predictor.get_width_height(pdf_bytes))
+            self.cache.put(key, entry)
+        self._last_key, self._last_entry = key, entry
+        return entry
+
+    def predict(self, pdf_bytes: Union[bytes, PdfPage]) -> list[DetectionResult]:
+        return self._get_entry(pdf_bytes, reuse_last=False)[0]
+
+    def get_width_height(self, pdf_bytes: Union[bytes, PdfPage]) -> tuple[float, float]:
+        # usually called right after `predict` of the same page
+        return self._get_entry(pdf_bytes, reuse_last=True)[1]
+
+    @property
+    def accepts_batch(self) -> bool:
+        return self.predictor.accepts_batch
+
+    def get_category_names(self) -> tuple[ObjectTypes, ...]:
+        return self.predictor.get_category_names()
+
+    def clone(self) -> CachedPdfMiner:
+        return self.__class__(self.predictor.clone(), self.cache, self.predictor_config)
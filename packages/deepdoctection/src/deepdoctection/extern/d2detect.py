@@ -29,6 +29,7 @@ from pathlib import Path
 from typing import Literal, Mapping, Optional, Sequence, Union
 
 import numpy as np
+import numpy.typing as npt
 from lazy_imports import try_import
 
 from dd_core.datapoint.image import ImageFormats
@@ -40,7 +41,7 @@ from dd_core.utils.object_types import DefaultType, ObjectTypes, TypeOrStr, get_
 from dd_core.utils.transform import InferenceResize, ResizeTransform
 from dd_core.utils.types import PathLikeOrStr, PixelValues, Requirement
 
-from .base import DetectionResult, ModelCategories, ObjectDetector
+from .base import DetectionResult, ModelCategories, ObjectDetector, detection_results_from_arrays
 
 with try_import() as pt_import_guard:
     import torch
@@ -72,6 +73,48 @@ def _d2_post_processing(predictions: dict[str, Instances], nms_thresh_class_agno
     return {"instances": fg_instances_keep}
 
 
+def _d2_instances_to_detection_results(instances: Instances) -> list[DetectionResult]:
+    """
+    Converting D2 `Instances` into `DetectionResult`s. Boxes, scores and classes are transferred with one call per
+    tensor.
+
+    Args:
+        instances: Prediction outputs after post-processing
+
+    Returns:
+        list of `DetectionResult`s
+    """
+    return detection_results_from_arrays(
+        instances.pred_boxes.tensor.cpu().numpy(),
+        instances.scores.cpu().numpy(),
+        instances.pred_classes.cpu().numpy(),
+    )
+
+
+def _d2_keep_to_numpy(
+    boxes: torch.Tensor, classes: torch.Tensor, scores: torch.Tensor, keep: torch.Tensor
+) -> tuple[npt.NDArray[np.float32], npt.NDArray[np.int_], npt.NDArray[np.float32]]:
+    """
+    Selecting the outputs of a Torchscript model that survive NMS and transferring them with one call per tensor.
+    Outputs that have been removed by NMS are never copied from the device.
+
+    Args:
+        boxes: Boxes of shape `(N,4)`
+        classes: Classes of shape `(N,)`
+        scores: Scores of shape `(N,)`
+        keep: Indices of the outputs to keep
+
+    Returns:
+        Tuple of boxes, classes and scores as `np.array`s
+    """
+    keep = keep.to(boxes.device)
+    return (
+        boxes[keep].reshape(-1, 4).cpu().numpy(),
+        classes[keep].cpu().numpy(),
+        scores[keep].cpu().numpy(),
+    )
+
+
 def d2_predict_image(
     np_img: PixelValues,
     predictor: nn.Module,
@@ -91,24 +134,42 @@ def d2_predict_image(
     Returns:
        list of `DetectionResult`s
     """
-    height, width = np_img.shape[:2]
-    resized_img = resizer.get_transform(np_img).apply_image(np_img)
-    image = torch.as_tensor(resized_img.astype(np.float32).transpose(2, 0, 1))
+    return d2_predict_images([np_img], predictor, resizer, nms_thresh_class_agnostic)[0]
 
-    with torch.no_grad():
-        inputs = {"image": image, "height": height, "width": width}
-        predictions = predictor([inputs])[0]
-        predictions = _d2_post_processing(predictions, nms_thresh_class_agnostic)
-    instances = predictions["instances"]
-    results = [
-        DetectionResult(
-            box=instances[k].pred_boxes.tensor.tolist()[0],
-            score=instances[k].scores.tolist()[0],
-            class_id=instances[k].pred_classes.tolist()[0],
-        )
-        for k in range(len(instances))
-    ]
-    return results
+
+def d2_predict_images(
+    np_imgs: Sequence[PixelValues],
+    predictor: nn.Module,
+    resizer: InferenceResize,
+    nms_thresh_class_agnostic: float,
+) -> list[list[DetectionResult]]:
+    """
+    Run detection on a batch of images with one forward pass. Every image is resized individually within some bounds,
+    padding the images of the batch to a common size is done by the model. Boxes are returned in the coordinates of
+    the original images.
+
+    Args:
+        np_imgs: sequence of ndarrays
+        predictor: torch nn module implemented in Detectron2
+        resizer: instance for resizing the input images
+        nms_thresh_class_agnostic: class agnostic NMS threshold
+
+    Returns:
+       list with one list of `DetectionResult`s per image
+    """
+    inputs = []
+    for np_img in np_imgs:
+        height, width = np_img.shape[:2]
+        resized_img = resizer.get_transform(np_img).apply_image(np_img)
+        image = torch.as_tensor(resized_img.astype(np.float32).transpose(2, 0, 1))
+        inputs.append({"image": image, "height": height, "width": width})
+
+    with torch.inference_mode():
+        batch_predictions = predictor(inputs)
+        return [
+            _d2_instances_to_detection_results(_d2_post_processing(predictions, nms_thresh_class_agnostic)["instances"])
+            for predictions in batch_predictions
+        ]
 
 
 def d2_torch_predict_image(
@@ -132,20 +193,11 @@ def d2_torch_predict_image(
     resized_img = resizer.get_transform(torch_img).apply_torch_image(torch_img)
     image = resized_img.permute(2, 0, 1)
 
-    with torch.no_grad():
+    with torch.inference_mode():
         inputs = {"image": image, "height": height, "width": width}
         predictions = predictor([inputs])[0]
         predictions = _d2_post_processing(predictions, nms_thresh_class_agnostic)
-    instances = predictions["instances"]
-    results = [
-        DetectionResult(
-            box=instances[k].pred_boxes.tensor.tolist()[0],
-            score=instances[k].scores.tolist()[0],
-            class_id=instances[k].pred_classes.tolist()[0],
-        )
-        for k in range(len(instances))
-    ]
-    return results
+    return _d2_instances_to_detection_results(predictions["instances"])
 
 
 def d2_torch_jit_predict_image(
@@ -176,31 +228,17 @@ def d2_torch_jit_predict_image(
 
     image = resized_img.permute(2, 0, 1).to(dtype=torch.float32)
 
+    # Torchscript modules are not guaranteed to run under inference mode, so we stay with no_grad here
     with torch.no_grad():
         boxes, classes, scores, _ = d2_predictor(image)
         class_masks = torch.ones(classes.shape, dtype=torch.uint8, device=boxes.device)
-        keep = batched_nms(boxes, scores, class_masks, nms_thresh_class_agnostic).cpu()
-
-        inverse_resizer = ResizeTransform(new_height, new_width, height, width, "VIZ")
-
-        np_boxes = boxes.cpu().numpy().reshape(-1, 2)
-        np_boxes = inverse_resizer.apply_coords(np_boxes)
-        np_boxes = np_boxes.reshape(-1, 4)
+        keep = batched_nms(boxes, scores, class_masks, nms_thresh_class_agnostic)
+        np_boxes, np_classes, np_scores = _d2_keep_to_numpy(boxes, classes, scores, keep)
 
-        np_boxes, classes, scores = np_boxes[keep], classes[keep], scores[keep]
-        if np_boxes.ndim == 1:
-            np_boxes = np.expand_dims(np_boxes, axis=0)
-
-    detect_result_list: list[DetectionResult] = []
-    for box, label, score in zip(np_boxes, classes, scores):
-        detect_result_list.append(
-            DetectionResult(
-                box=box.tolist(),
-                class_id=label.item(),
-                score=score.item(),
-            )
-        )
-    return detect_result_list
+    # The exported model does not contain the final resize step, so we need to add it manually here
+    inverse_resizer = ResizeTransform(new_height, new_width, height, width, "VIZ")
+    np_boxes = inverse_resizer.apply_coords(np_boxes.reshape(-1, 2)).reshape(-1, 4)
+    return detection_results_from_arrays(np_boxes, np_scores, np_classes)
 
 
 def d2_jit_predict_image(
@@ -224,25 +262,17 @@ def d2_jit_predict_image(
     resized_img = resizer.get_transform(np_img).apply_image(np_img)
     new_height, new_width = resized_img.shape[:2]
     image = torch.as_tensor(resized_img.astype("float32").transpose(2, 0, 1))
+    # Torchscript modules are not guaranteed to run under inference mode, so we stay with no_grad here
     with torch.no_grad():
         boxes, classes, scores, _ = d2_predictor(image)
-        class_masks = torch.ones(classes.shape, dtype=torch.uint8)
-        keep = batched_nms(boxes, scores, class_masks, nms_thresh_class_agnostic).cpu()
-
-        # The exported model does not contain the final resize step, so we need to add it manually here
-        inverse_resizer = ResizeTransform(new_height, new_width, height, width, "VIZ")
-        np_boxes = np.reshape(boxes.cpu().numpy(), (-1, 2))
-        np_boxes = inverse_resizer.apply_coords(np_boxes)
-        np_boxes = np.reshape(np_boxes, (-1, 4))
+        class_masks = torch.ones(classes.shape, dtype=torch.uint8, device=boxes.device)
+        keep = batched_nms(boxes, scores, class_masks, nms_thresh_class_agnostic)
+        np_boxes, np_classes, np_scores = _d2_keep_to_numpy(boxes, classes, scores, keep)
 
-        np_boxes, classes, scores = np_boxes[keep], classes[keep], scores[keep]
-        # If only one sample is left, it will squeeze np_boxes, so we need to expand it here
-        if np_boxes.ndim == 1:
-            np_boxes = np.expand_dims(np_boxes, axis=0)
-    detect_result_list = []
-    for box, label, score in zip(np_boxes, classes, scores):
-        detect_result_list.append(DetectionResult(box=box.tolist(), class_id=label.item(), score=score.item()))
-    return detect_result_list
+    # The exported model does not contain the final resize step, so we need to add it manually here
+    inverse_resizer = ResizeTransform(new_height, new_width, height, width, "VIZ")
+    np_boxes = inverse_resizer.apply_coords(np_boxes.reshape(-1, 2)).reshape(-1, 4)
+    return detection_results_from_arrays(np_boxes, np_scores, np_classes)
 
 
 class D2FrcnnDetectorMixin(ObjectDetector, ABC):
@@ -431,6 +461,30 @@ class D2FrcnnDetector(D2FrcnnDetectorMixin):
         )
         return self._map_category_names(detection_results)
 
+    def predict_batch(self, np_imgs: Sequence[PixelValues]) -> list[list[DetectionResult]]:
+        """
+        Prediction of a batch of images with one forward pass.
+
+        Args:
+            np_imgs: images as `np.array`
+
+        Returns:
+            A list with one list of `DetectionResult`s per image
+        """
+        if not np_imgs:
+            return []
+        batch_detection_results = d2_predict_images(
+            np_imgs,
+            self.d2_predictor,
+            self.resizer,
+            self.cfg.NMS_THRESH_CLASS_AGNOSTIC,
+        )
+        return [self._map_category_names(detection_results) for detection_results in batch_detection_results]
+
+    @property
+    def accepts_batch(self) -> bool:
+        return True
+
     @classmethod
     def get_requirements(cls) -> list[Requirement]:
         return [get_pytorch_requirement(), get_detectron2_requirement()]
@@ -508,6 +562,9 @@ class D2FrcnnTracingDetector(D2FrcnnDetectorMixin):
         by the standard D2 output that takes into account of the situation that detected objects are disjoint. For more
         infos on this topic, see <https://github.com/facebookresearch/detectron2/issues/978>.
 
+        The Torchscript model has been exported for single images. `predict_batch` therefore runs one forward pass
+        per image and `accepts_batch` is `False`.
+
     Example:
         ```python
         config_path = ModelCatalog.get_full_path_configs("dd/d2/item/CASCADE_RCNN_R_50_FPN_GN.yaml")
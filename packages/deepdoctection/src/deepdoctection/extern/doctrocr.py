@@ -79,16 +79,33 @@ def doctr_predict_text_lines(np_img: PixelValues, predictor: DetectionPredictor)
     Returns:
         A list of text line `DetectionResult` (without text)
     """
+    return doctr_predict_text_lines_batch([np_img], predictor)[0]
 
-    raw_output = predictor([np_img])
 
-    detection_results = [
-        DetectionResult(
-            box=box[:4].tolist(), class_id=1, score=box[4], absolute_coords=False, class_name=LayoutLabel.WORD
-        )
-        for box in raw_output[0]["words"]
+def doctr_predict_text_lines_batch(
+    np_imgs: Sequence[PixelValues], predictor: DetectionPredictor
+) -> list[list[DetectionResult]]:
+    """
+    Generating text line `DetectionResult` based on DocTr `DetectionPredictor` for a batch of images. The predictor
+    resizes and pads the images and runs the forward passes with its own batch size.
+
+    Args:
+        np_imgs: Images in `np.array`
+        predictor: `doctr.models.detection.predictor.DetectionPredictor`
+
+    Returns:
+        A list with one list of text line `DetectionResult` (without text) per image
+    """
+
+    raw_output = predictor(list(np_imgs))
+
+    return [
+        [
+            DetectionResult(box=box[:4], class_id=1, score=box[4], absolute_coords=False, class_name=LayoutLabel.WORD)
+            for box in page_output["words"].tolist()
+        ]
+        for page_output in raw_output
     ]
-    return detection_results
 
 
 def doctr_predict_text(
@@ -99,19 +116,26 @@ def doctr_predict_text(
     Calls DocTr text recognition model on a batch of `np.array`s (text lines predicted from a text line detector) and
     returns the recognized text as `DetectionResult`
 
+    The sub images are sorted by aspect ratio before they are passed to the predictor. The predictor splits its input
+    into batches of fixed size, so that every batch contains sub images of similar shape, e.g. long text lines that
+    need to be split are not mixed with short words.
+
     Args:
         inputs: list of tuples containing the `annotation_id` of the input image and the `np.array` of the cropped
                 text line
         predictor: `doctr.models.detection.predictor.RecognitionPredictor`
 
     Returns:
-        A list of `DetectionResult` containing recognized text
+        A list of `DetectionResult` containing recognized text, in the same order as `inputs`
     """
 
     uuids, images = list(zip(*inputs))
-    raw_output = predictor(list(images))
+    order = sorted(range(len(images)), key=lambda idx: images[idx].shape[1] / max(images[idx].shape[0], 1))
+    raw_output = predictor([images[idx] for idx in order])
+    raw_output_per_input = dict(zip(order, raw_output))
     detection_results = [
-        DetectionResult(score=output[1], text=output[0], uuid=uuid) for uuid, output in zip(uuids, raw_output)
+        DetectionResult(score=raw_output_per_input[idx][1], text=raw_output_per_input[idx][0], uuid=uuid)
+        for idx, uuid in enumerate(uuids)
     ]
     return detection_results
 
@@ -212,6 +236,24 @@ class DoctrTextlineDetector(DoctrTextlineDetectorMixin):
         """
         return doctr_predict_text_lines(np_img, self.doctr_predictor)
 
+    def predict_batch(self, np_imgs: Sequence[PixelValues]) -> list[list[DetectionResult]]:
+        """
+        Prediction of a batch of images.
+
+        Args:
+            np_imgs: images as `np.array`
+
+        Returns:
+            A list with one list of `DetectionResult` per image
+        """
+        if not np_imgs:
+            return []
+        return doctr_predict_text_lines_batch(np_imgs, self.doctr_predictor)
+
+    @property
+    def accepts_batch(self) -> bool:
+        return True
+
     @classmethod
     def get_requirements(cls) -> list[Requirement]:
         return [get_pytorch_requirement(), get_doctr_requirement()]
@@ -34,7 +34,7 @@ from dd_core.utils.file_utils import get_pytorch_requirement, get_transformers_r
 from dd_core.utils.object_types import DefaultType, ObjectTypes, TypeOrStr, get_type
 from dd_core.utils.types import PathLikeOrStr, PixelValues, Requirement
 
-from .base import DetectionResult, ModelCategories, ObjectDetector
+from .base import DetectionResult, ModelCategories, ObjectDetector, detection_results_from_arrays
 
 with try_import() as pt_import_guard:
     import torch
@@ -70,7 +70,8 @@ def detr_predict_image(
     nms_threshold: float,
 ) -> list[DetectionResult]:
     """
-    Calling predictor. Before, tensors must be transferred to the device where the model is loaded.
+    Calling predictor. Before, tensors must be transferred to the device where the model is loaded. Post-processing
+    and NMS run on the device as well, only the remaining detections are transferred to the CPU.
 
     Args:
         np_img: Image as `np.array`.
@@ -85,26 +86,55 @@ def detr_predict_image(
     Returns:
         List of `DetectionResult` after running prediction.
     """
-    target_sizes = [np_img.shape[:2]]
-    inputs = feature_extractor(images=np_img, return_tensors="pt")
+    return detr_predict_images([np_img], predictor, feature_extractor, device, threshold, nms_threshold)[0]
+
+
+def detr_predict_images(
+    np_imgs: Sequence[PixelValues],
+    predictor: EligibleDetrModel,
+    feature_extractor: DetrImageProcessor,
+    device: torch.device,
+    threshold: float,
+    nms_threshold: float,
+) -> list[list[DetectionResult]]:
+    """
+    Calling predictor on a batch of images with one forward pass. The feature extractor resizes every image and pads
+    the batch to a common size. The pixel mask ensures that the padding does not contribute to the prediction.
+
+    Args:
+        np_imgs: Images as `np.array`.
+        predictor: `TableTransformerForObjectDetection` instance.
+        feature_extractor: Feature extractor instance.
+        device: Device where the model is loaded.
+        threshold: Will filter all predictions with confidence score less threshold.
+        nms_threshold: Threshold to perform NMS on prediction outputs.
+
+    Returns:
+        List with one list of `DetectionResult` per image.
+    """
+    target_sizes = torch.tensor([np_img.shape[:2] for np_img in np_imgs], device=device)
+    inputs = feature_extractor(images=list(np_imgs), return_tensors="pt")
     inputs.data["pixel_values"] = inputs.data["pixel_values"].to(device)
     inputs.data["pixel_mask"] = inputs.data["pixel_mask"].to(device)
-    outputs = predictor(**inputs)
-    outputs["encoder_last_hidden_state"] = outputs["encoder_last_hidden_state"].to("cpu")
-    outputs["last_hidden_state"] = outputs["last_hidden_state"].to("cpu")
-    outputs["logits"] = outputs["logits"].to("cpu")
-    outputs["pred_boxes"] = outputs["pred_boxes"].to("cpu")
-    results = feature_extractor.post_process_object_detection(outputs, threshold=threshold, target_sizes=target_sizes)[
-        0
-    ]
-    keep = _detr_post_processing(results["boxes"], results["scores"], results["labels"], nms_threshold)
-    keep_boxes = results["boxes"][keep]
-    keep_scores = results["scores"][keep]
-    keep_labels = results["labels"][keep]
-    return [
-        DetectionResult(box=box.tolist(), score=score.item(), class_id=class_id.item())
-        for box, score, class_id in zip(keep_boxes, keep_scores, keep_labels)
-    ]
+    with torch.inference_mode():
+        outputs = predictor(**inputs)
+        # Only logits and boxes are needed for post-processing. Hidden states are released right away and never
+        # leave the device.
+        outputs = type(outputs)(logits=outputs.logits, pred_boxes=outputs.pred_boxes)
+        batch_results = feature_extractor.post_process_object_detection(
+            outputs, threshold=threshold, target_sizes=target_sizes
+        )
+        batch_detection_results = []
+        for results in batch_results:
+            keep = _detr_post_processing(results["boxes"], results["scores"], results["labels"], nms_threshold)
+            batch_detection_results.append(
+                detection_results_from_arrays(
+                    results["boxes"][keep].cpu().numpy(),
+                    results["scores"][keep].cpu().numpy(),
+                    results["labels"][keep].cpu().numpy(),
+                )
+            )
+        return batch_detection_results
 
 
 class HFDetrDerivedDetectorMixin(ObjectDetector, ABC):
@@ -252,6 +282,32 @@ class HFDetrDerivedDetector(HFDetrDerivedDetectorMixin):
         )
         return self._map_category_names(results)
 
+    def predict_batch(self, np_imgs: Sequence[PixelValues]) -> list[list[DetectionResult]]:
+        """
+        Predicts objects in a batch of images with one forward pass.
+
+        Args:
+            np_imgs: Images as `np.array`.
+
+        Returns:
+            List with one list of `DetectionResult` per image.
+        """
+        if not np_imgs:
+            return []
+        batch_results = detr_predict_images(
+            np_imgs,
+            self.hf_detr_predictor,
+            self.feature_extractor,
+            self.device,
+            self.config.threshold,
+            self.config.nms_threshold,
+        )
+        return [self._map_category_names(results) for results in batch_results]
+
+    @property
+    def accepts_batch(self) -> bool:
+        return True
+
     @staticmethod
     def get_model(path_weights: PathLikeOrStr, config: PretrainedConfig) -> EligibleDetrModel:
         """
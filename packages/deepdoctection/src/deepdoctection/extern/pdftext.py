@@ -19,13 +19,15 @@
 PDFPlumber text extraction engine
 """
 
-from typing import Optional
+from io import BytesIO
+from typing import Optional, Union
 
 from lazy_imports import try_import
 
 from dd_core.utils.context import save_tmp_file
 from dd_core.utils.file_utils import get_pdfplumber_requirement, get_pypdfium2_requirement
 from dd_core.utils.object_types import LayoutLabel, ObjectTypes
+from dd_core.utils.pdf_utils import PdfDocumentSession, PdfPage
 from dd_core.utils.types import Requirement
 
 from .base import DetectionResult, ModelCategories, PdfMiner
@@ -33,10 +35,6 @@ from .base import DetectionResult, ModelCategories, PdfMiner
 with try_import() as pdfplumber_import_guard:
     from pdfplumber.pdf import PDF, Page
 
-with try_import() as pypdfmium_import_guard:
-    import pypdfium2.raw as pypdfium_c
-    from pypdfium2 import PdfDocument
-
 
 def _to_detect_result(word: dict[str, str], class_name: ObjectTypes) -> DetectionResult:
     return DetectionResult(
@@ -59,7 +57,7 @@ class PdfPlumberTextDetector(PdfMiner):
         df.reset_state()
 
         for dp in df:
-            detection_results = pdf_plumber.predict(dp["pdf_bytes"])
+            detection_results = pdf_plumber.predict(dp["pdf_page"])
         ```
 
     To use it in a more integrated way:
@@ -86,23 +84,46 @@ class PdfPlumberTextDetector(PdfMiner):
         self.x_tolerance = x_tolerance
         self.y_tolerance = y_tolerance
         self._page: Optional[Page] = None
-
-    def predict(self, pdf_bytes: bytes) -> list[DetectionResult]:
+        self._pdf_page: Optional[PdfPage] = None
+        self._session: Optional[PdfDocumentSession] = None
+        self._session_pdf: Optional[PDF] = None
+
+    def _get_session_page(self, pdf_page: PdfPage) -> Page:
+        # The whole document is parsed once per session and not once per page
+        if self._session is not pdf_page.session or self._session_pdf is None:
+            if self._session_pdf is not None:
+                self._session_pdf.close()
+            self._session_pdf = PDF(BytesIO(pdf_page.session.get_source_bytes()))
+            self._session = pdf_page.session
+        self._page = self._session_pdf.pages[pdf_page.index]
+        self._pdf_page = pdf_page
+        self._pdf_bytes = None
+        return self._page
+
+    def predict(self, pdf_bytes: Union[bytes, PdfPage]) -> list[DetectionResult]:
         """
         Call `pdfminer.six` and returns detected text as `DetectionResult`
 
         Args:
-            pdf_bytes: bytes of a single pdf page
+            pdf_bytes: bytes of a single pdf page or a `PdfPage` reference
 
         Returns:
             A list of `DetectionResult`
         """
 
-        with save_tmp_file(pdf_bytes, "pdf_") as (tmp_name, _):
-            with open(tmp_name, "rb") as fin:
-                self._page = PDF(fin).pages[0]
-                self._pdf_bytes = pdf_bytes
-                words = self._page.extract_words(x_tolerance=self.x_tolerance, y_tolerance=self.y_tolerance)
+        if isinstance(pdf_bytes, PdfPage):
+            page = self._get_session_page(pdf_bytes)
+            words = page.extract_words(x_tolerance=self.x_tolerance, y_tolerance=self.y_tolerance)
+            # The session PDF stays open for the whole document. Releasing the parsed layout of every processed page
+            # keeps the memory from growing with the number of pages. The page size is not affected.
+            page.close()
+        else:
+            with save_tmp_file(pdf_bytes, "pdf_") as (tmp_name, _):
+                with open(tmp_name, "rb") as fin:
+                    self._page = PDF(fin).pages[0]
+                    self._pdf_bytes = pdf_bytes
+                    self._pdf_page = None
+                    words = self._page.extract_words(x_tolerance=self.x_tolerance, y_tolerance=self.y_tolerance)
         detect_results = [_to_detect_result(word, self.get_category_names()[0]) for word in words]
         return detect_results
 
@@ -110,17 +131,21 @@ class PdfPlumberTextDetector(PdfMiner):
     def get_requirements(cls) -> list[Requirement]:
         return [get_pdfplumber_requirement()]
 
-    def get_width_height(self, pdf_bytes: bytes) -> tuple[float, float]:
+    def get_width_height(self, pdf_bytes: Union[bytes, PdfPage]) -> tuple[float, float]:
         """
         Get the width and height of the full page
 
         Args:
-            pdf_bytes: `pdf_bytes` generating the pdf
+            pdf_bytes: `pdf_bytes` generating the pdf or a `PdfPage` reference
 
         Returns:
             `(width,height)`
         """
 
+        if isinstance(pdf_bytes, PdfPage):
+            if self._pdf_page != pdf_bytes or self._page is None:
+                self._get_session_page(pdf_bytes)
+            return self._page.bbox[2], self._page.bbox[3]  # type: ignore
         if self._pdf_bytes == pdf_bytes and self._page is not None:
             return self._page.bbox[2], self._page.bbox[3]
         # if the pdf bytes is not equal to the cached pdf, will recalculate values
@@ -129,6 +154,7 @@ class PdfPlumberTextDetector(PdfMiner):
                 _pdf = PDF(fin)
                 self._page = _pdf.pages[0]
                 self._pdf_bytes = pdf_bytes
+                self._pdf_page = None
         return self._page.bbox[2], self._page.bbox[3]
 
     def get_category_names(self) -> tuple[ObjectTypes, ...]:
@@ -146,7 +172,7 @@ class Pdfmium2TextDetector(PdfMiner):
         df.reset_state()
 
         for dp in df:
-            detection_results = pdfmium2.predict(dp["pdf_bytes"])
+            detection_results = pdfmium2.predict(dp["pdf_page"])
         ```
 
     To use it in a more integrated way:
@@ -170,63 +196,48 @@ class Pdfmium2TextDetector(PdfMiner):
         self.name = "Pdfmium"
         self.model_id = self.get_model_id()
         self.categories = ModelCategories(init_categories={1: LayoutLabel.LINE})
-        self._page: Optional[Page] = None
-
-    def predict(self, pdf_bytes: bytes) -> list[DetectionResult]:
+        self._pdf_page: Optional[PdfPage] = None
+
+    def _to_pdf_page(self, pdf_bytes: Union[bytes, PdfPage]) -> PdfPage:
+        if isinstance(pdf_bytes, PdfPage):
+            return pdf_bytes
+        # if the pdf bytes is not equal to the cached pdf, will open a new session
+        if self._pdf_bytes != pdf_bytes or self._pdf_page is None:
+            self._pdf_page = PdfDocumentSession(pdf_bytes)[0]
+            self._pdf_bytes = pdf_bytes
+        return self._pdf_page
+
+    def predict(self, pdf_bytes: Union[bytes, PdfPage]) -> list[DetectionResult]:
         """
         Call pypdfium2 and returns detected text as detection results
 
         Args:
-            pdf_bytes: bytes of a single pdf page
+            pdf_bytes: bytes of a single pdf page or a `PdfPage` reference
 
         Returns:
             A list of `DetectionResult`
         """
 
-        pdf = PdfDocument(pdf_bytes)
-        page = pdf.get_page(0)
-        text = page.get_textpage()
-        words = []
-        height = page.get_height()
-        for obj in page.get_objects((pypdfium_c.FPDF_PAGEOBJ_TEXT,)):
-            box = obj.get_pos()
-            if all(x > 0 for x in box):
-                words.append(
-                    {
-                        "text": text.get_text_bounded(*box),
-                        "x0": box[0],
-                        "x1": box[2],
-                        "top": height - box[3],
-                        "bottom": height - box[1],
-                    }
-                )
-        detect_results = [_to_detect_result(word, self.get_category_names()[0]) for word in words]
+        words = self._to_pdf_page(pdf_bytes).get_text_objects()
+        detect_results = [_to_detect_result(word, self.get_category_names()[0]) for word in words]  # type: ignore
         return detect_results
 
     @classmethod
     def get_requirements(cls) -> list[Requirement]:
         return [get_pypdfium2_requirement()]
 
-    def get_width_height(self, pdf_bytes: bytes) -> tuple[float, float]:
+    def get_width_height(self, pdf_bytes: Union[bytes, PdfPage]) -> tuple[float, float]:
         """
         Get the width and height of the full page
 
         Args:
-            pdf_bytes: `pdf_bytes` generating the pdf
+            pdf_bytes: `pdf_bytes` generating the pdf or a `PdfPage` reference
 
         Returns:
             `(width,height)`
         """
 
-        if self._pdf_bytes == pdf_bytes and self._page is not None:
-            return self._page.bbox[2], self._page.bbox[3]  # pylint: disable=E1101
-        # if the pdf bytes is not equal to the cached pdf, will recalculate values
-        pdf = PdfDocument(pdf_bytes)
-        self._page = pdf.get_page(0)
-        self._pdf_bytes = pdf_bytes
-        if self._page is not None:
-            return self._page.get_width(), self._page.get_height()
-        raise ValueError("Page not found")
+        return self._to_pdf_page(pdf_bytes).get_size()
 
     def get_category_names(self) -> tuple[ObjectTypes, ...]:
         return self.categories.get_categories(as_dict=False)
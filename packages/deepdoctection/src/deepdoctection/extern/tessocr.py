@@ -20,22 +20,28 @@ Tesseract OCR engine
 """
 from __future__ import annotations
 
+import queue
 import shlex
 import string
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from errno import ENOENT
+from io import BytesIO
 from itertools import groupby
 from os import environ, fspath
 from pathlib import Path
 from typing import Any, Mapping, Optional, Sequence, Union
 
 import numpy as np
+import numpy.typing as npt
+from lazy_imports import try_import
 from packaging.version import InvalidVersion, Version, parse
+from PIL import Image as PILImage
 
-from dd_core.utils.context import save_tmp_file, timeout_manager
+from dd_core.utils.context import save_tmp_file
 from dd_core.utils.error import DependencyError, TesseractError
-from dd_core.utils.file_utils import _TESS_PATH, get_tesseract_requirement
+from dd_core.utils.file_utils import _TESS_PATH, get_tesseract_requirement, tesserocr_available
 from dd_core.utils.metacfg import config_to_cli_str, set_config_by_yaml
 from dd_core.utils.object_types import LayoutLabel, ObjectTypes, PageKey
 from dd_core.utils.transform import RotationTransform
@@ -44,6 +50,9 @@ from dd_core.utils.viz import viz_handler
 
 from .base import DetectionResult, ImageTransformer, ModelCategories, ObjectDetector
 
+with try_import() as tesserocr_import_guard:
+    import tesserocr  # pylint: disable=E0401
+
 # copy and paste with some light modifications from https://github.com/madmaze/pytesseract/tree/master/pytesseract
 
 
@@ -100,20 +109,22 @@ def _input_to_cli_str(lang: str, config: str, nice: int, input_file_name: str, o
     return cmd_args
 
 
-def _run_tesseract(tesseract_args: list[str]) -> None:
+def _run_tesseract(tesseract_args: list[str], input_bytes: Optional[bytes] = None) -> bytes:
     try:
-        proc = subprocess.Popen(tesseract_args, **_subprocess_args())  # pylint: disable=R1732
+        proc = subprocess.Popen(tesseract_args, **_subprocess_args())
     except OSError as error:
         if error.errno != ENOENT:
             raise error from error
         raise DependencyError("Tesseract not found. Please install or add to your PATH.") from error
 
-    with timeout_manager(proc, 0) as error_string:
-        if proc.returncode:
-            raise TesseractError(
-                proc.returncode,
-                " ".join(line for line in error_string.decode("utf-8").splitlines()).strip(),  # type: ignore
-            )
+    with proc:
+        output, error_string = proc.communicate(input=input_bytes)
+    if proc.returncode:
+        raise TesseractError(
+            proc.returncode,
+            " ".join(line for line in error_string.decode("utf-8").splitlines()).strip(),
+        )
+    return output
 
 
 def get_tesseract_version() -> Version:
@@ -163,15 +174,113 @@ def image_to_angle(image: PixelValues) -> Mapping[str, str]:
     }
 
 
-def image_to_dict(image: PixelValues, lang: str, config: str) -> dict[str, list[Union[str, int, float]]]:
+TesseractColumns = dict[str, Union[npt.NDArray[Any], list[str]]]
+
+_TSV_HEADER = (
+    "level",
+    "page_num",
+    "block_num",
+    "par_num",
+    "line_num",
+    "word_num",
+    "left",
+    "top",
+    "width",
+    "height",
+    "conf",
+    "text",
+)
+
+
+def _tsv_to_columns(output: str, header: Optional[Sequence[str]] = None) -> TesseractColumns:
+    """
+    Parses Tesseract TSV output into columns. `text` is a list of strings, `conf` a float array and all other columns
+    are int arrays.
+
+    Args:
+        output: TSV output
+        header: Column names, if `output` does not start with a header row (e.g. output of the tesserocr API)
+
+    Returns:
+        Dict with one entry per column. Empty, if there is no header.
+    """
+    rows = [row.split("\t") for row in output.splitlines() if row]
+    if header is None:
+        if not rows:
+            return {}
+        header = rows.pop(0)
+    length = len(header)
+    # Fixes bug that occurs when the text string in TSV is null and the row is missing a final cell
+    rows = [row if len(row) == length else (row + [""] * length)[:length] for row in rows]
+    columns = list(zip(*rows)) if rows else [()] * length
+
+    result: TesseractColumns = {}
+    for head, column in zip(header, columns):
+        if head == "text":
+            result[head] = list(column)
+        elif head == "conf":
+            result[head] = np.asarray(column, dtype=np.float64)
+        else:
+            result[head] = np.asarray(column, dtype=np.int64)
+    return result
+
+
+def _images_to_tiff(images: Sequence[PixelValues]) -> bytes:
+    """Encodes BGR images as one uncompressed, multi-page TIFF"""
+    pil_images = [
+        PILImage.fromarray(np.ascontiguousarray(image[:, :, ::-1]) if image.ndim == 3 else image) for image in images
+    ]
+    with BytesIO() as buffer:
+        pil_images[0].save(buffer, format="TIFF", save_all=True, append_images=pil_images[1:])
+        return buffer.getvalue()
+
+
+def images_to_dicts(images: Sequence[PixelValues], lang: str, config: str) -> list[TesseractColumns]:
+    """
+    Runs Tesseract once for a batch of images.
+
+    The images are passed as one multi-page TIFF via stdin and the TSV output is read from stdout. No temporary files
+    are written. The output is split into one columnar result per image by its `page_num`.
+
+    Note:
+        Requires Tesseract or 3.05 or higher
+
+    Args:
+        images: Images in np.array.
+        lang: String of language
+        config: string of configs
+
+    Returns:
+        One dictionary per image with the columns of the Tesseract TSV output (see `image_to_dict`)
+    """
+    valid = [idx for idx, image in enumerate(images) if image.shape[0] > 0 and image.shape[1] > 0]
+    results: list[TesseractColumns] = [_tsv_to_columns("", _TSV_HEADER) for _ in images]
+    if not valid:
+        return results
+
+    output = _run_tesseract(
+        _input_to_cli_str(lang, config, 0, "stdin", "stdout"), _images_to_tiff([images[idx] for idx in valid])
+    ).decode("utf-8")
+    columns = _tsv_to_columns(output)
+    if not columns:
+        return results
+
+    page_num = np.asarray(columns["page_num"])
+    bounds = np.searchsorted(page_num, np.arange(1, len(valid) + 2), side="left")
+    for page_idx, idx in enumerate(valid):
+        start, end = int(bounds[page_idx]), int(bounds[page_idx + 1])
+        results[idx] = {head: column[start:end] for head, column in columns.items()}
+    return results
+
+
+def image_to_dict(image: PixelValues, lang: str, config: str) -> TesseractColumns:
     """
     This is more or less `pytesseract.image_to_data` with a dict as returned value.
     What happens under the hood is:
 
-    - saving an image file
+    - encoding the image and passing it to Tesseract via stdin
     - defining tesseracts command line
-    - saving a temp .tsv file with predicted results
-    - reading the .tsv file and returning the results as dict.
+    - reading the TSV results from stdout and returning the results as columns.
 
     Note:
         Requires Tesseract or 3.05 or higher
@@ -183,42 +292,126 @@ def image_to_dict(image: PixelValues, lang: str, config: str) -> dict[str, list[
 
     Returns:
         Dictionary with keys `left`, `top`, `width`, `height` (bounding box coords), `conf` (confidence), `text`
-        (captured text), `block_num` (block number) and `lin_num` (line number).
+        (captured text), `block_num` (block number) and `lin_num` (line number). Numeric columns are `np.array`s.
     """
+    return images_to_dicts([image], lang, config)[0]
+
+
+def _config_to_tesserocr_args(config: str) -> tuple[Optional[int], Optional[int], dict[str, str]]:
+    """Translates Tesseract CLI options into page segmentation mode, engine mode and variables of the tesserocr API"""
+    psm: Optional[int] = None
+    oem: Optional[int] = None
+    variables: dict[str, str] = {}
+    tokens = iter(shlex.split(config))
+    for token in tokens:
+        if token == "-c":
+            key, _, value = next(tokens).partition("=")
+            variables[key] = value
+        elif token.startswith("-"):
+            key, value = token.lstrip("-"), next(tokens)
+            if key == "psm":
+                psm = int(value)
+            elif key == "oem":
+                oem = int(value)
+            elif key == "dpi":
+                variables["user_defined_dpi"] = value
+            else:
+                variables[key] = value
+    return psm, oem, variables
+
+
+class TesseractPool:
+    """
+    Tesseract engine for batches of images with a fixed number of workers.
 
-    with save_tmp_file(image, "tess_") as (tmp_name, input_file_name):
-        _run_tesseract(_input_to_cli_str(lang, config, 0, input_file_name, tmp_name))
-        with open(tmp_name + ".tsv", "rb") as output_file:
-            output = output_file.read().decode("utf-8")
-        result: dict[str, list[Union[str, int, float]]] = {}
-        rows = [row.split("\t") for row in output.strip().split("\n")]
-        if len(rows) < 2:
-            return result
-        header = rows.pop(0)
-        length = len(header)
-        if len(rows[-1]) < length:
-            # Fixes bug that occurs when last text string in TSV is null, and
-            # last row is missing a final cell in TSV file
-            rows[-1].append("")
+    If `tesserocr` is installed, the pool keeps `num_workers` long-lived in-process Tesseract API instances. Images are
+    recognized concurrently, as `tesserocr` releases the GIL. Otherwise, every batch is split into `num_workers`
+    chunks and each chunk is recognized with one call of the Tesseract CLI, fed over stdin (see `images_to_dicts`).
+    This avoids spawning one process per image.
 
-        str_col_idx = -1
-        str_col_idx += length
+    Example:
+        ```python
+        pool = TesseractPool("eng", "--psm 11", num_workers=2)
+        results = pool.images_to_dicts([np_crop_1, np_crop_2, np_crop_3])
+        pool.close()
+        ```
+    """
 
-        val: Union[str, int]
-        for i, head in enumerate(header):
-            result[head] = []
-            for row in rows:
-                if len(row) <= i:
-                    continue
+    def __init__(self, lang: str, config: str, num_workers: int = 1) -> None:
+        """
+        Args:
+            lang: String of language
+            config: string of configs
+            num_workers: Number of Tesseract API instances or concurrent Tesseract processes
+        """
+        self.lang = lang
+        self.config = config
+        self.num_workers = max(1, num_workers)
+        self._apis: Optional[queue.Queue[Any]] = None
+        if tesserocr_available():
+            psm, oem, variables = _config_to_tesserocr_args(config)
+            self._apis = queue.Queue()
+            for _ in range(self.num_workers):
+                api = tesserocr.PyTessBaseAPI(
+                    lang=lang,
+                    psm=tesserocr.PSM.AUTO if psm is None else psm,
+                    oem=tesserocr.OEM.DEFAULT if oem is None else oem,
+                )
+                for key, value in variables.items():
+                    api.SetVariable(key, value)
+                self._apis.put(api)
+        self._executor = ThreadPoolExecutor(max_workers=self.num_workers) if self.num_workers > 1 else None
+
+    def _image_to_dict_in_process(self, image: PixelValues) -> TesseractColumns:
+        if image.shape[0] == 0 or image.shape[1] == 0:
+            return _tsv_to_columns("", _TSV_HEADER)
+        api = self._apis.get()  # type: ignore
+        try:
+            api.SetImage(PILImage.fromarray(np.ascontiguousarray(image[:, :, ::-1]) if image.ndim == 3 else image))
+            api.Recognize()
+            output = api.GetTSVText(0)
+        finally:
+            self._apis.put(api)  # type: ignore
+        return _tsv_to_columns(output, _TSV_HEADER)
+
+    def images_to_dicts(self, images: Sequence[PixelValues]) -> list[TesseractColumns]:
+        """
+        Recognizes a batch of images.
+
+        Args:
+            images: Images in np.array.
 
-                val = row[i]
-                if row[i].isdigit() and i != -1 and head != "text":
-                    val = int(row[i])
-                elif head == "text":
-                    val = str(row[i])
-                result[head].append(val)
+        Returns:
+            One dictionary per image with the columns of the Tesseract TSV output (see `image_to_dict`)
+        """
+        if not images:
+            return []
+        if self._apis is not None:
+            if self._executor is None:
+                return [self._image_to_dict_in_process(image) for image in images]
+            return list(self._executor.map(self._image_to_dict_in_process, images))
+
+        chunk_size = -(-len(images) // self.num_workers)
+        chunks = [images[k : k + chunk_size] for k in range(0, len(images), chunk_size)]
+        if self._executor is None or len(chunks) == 1:
+            return [result for chunk in chunks for result in images_to_dicts(chunk, self.lang, self.config)]
+        return [
+            result
+            for chunk_results in self._executor.map(
+                lambda chunk: images_to_dicts(chunk, self.lang, self.config), chunks
+            )
+            for result in chunk_results
+        ]
 
-        return result
+    def close(self) -> None:
+        """Releases the Tesseract API instances and worker threads"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        if self._apis is not None:
+            while not self._apis.empty():
+                self._apis.get().End()
+            self._apis = None
 
 
 def tesseract_line_to_detectresult(detect_result_list: list[DetectionResult]) -> list[DetectionResult]:
@@ -259,6 +452,43 @@ def tesseract_line_to_detectresult(detect_result_list: list[DetectionResult]) ->
     return detect_result_list
 
 
+def tesseract_dict_to_detectresult(results: TesseractColumns, text_lines: bool) -> list[DetectionResult]:
+    """
+    Converts the columnar output of `image_to_dict` into word (and optionally line) `DetectionResult`s. Rows with
+    confidence `-1` (page, block, paragraph and line rows) are dropped.
+
+    Args:
+        results: Columnar Tesseract output
+        text_lines: If `True`, it will return `DetectionResult`s of text lines as well.
+
+    Returns:
+        A list of Tesseract extractions wrapped in `DetectionResult`
+    """
+    if not results or len(results["conf"]) == 0:
+        return []
+    conf = np.asarray(results["conf"], dtype=np.float64)
+    keep = np.flatnonzero(conf.astype(np.int64) != -1)
+    left = np.asarray(results["left"])[keep]
+    top = np.asarray(results["top"])[keep]
+    boxes = np.stack(
+        [left, top, left + np.asarray(results["width"])[keep], top + np.asarray(results["height"])[keep]], 1
+    )
+    texts = results["text"]
+    all_results = [
+        DetectionResult(
+            box=box,
+            score=score,
+            text=texts[idx],
+            class_id=1,
+            class_name=LayoutLabel.WORD,
+        )
+        for idx, box, score in zip(keep.tolist(), boxes.tolist(), (conf[keep] / 100).tolist())
+    ]
+    if text_lines:
+        all_results = tesseract_line_to_detectresult(all_results)
+    return all_results
+
+
 def predict_text(np_img: PixelValues, supported_languages: str, text_lines: bool, config: str) -> list[DetectionResult]:
     """
     Calls Tesseract directly with some given configs. Requires Tesseract to be installed.
@@ -275,32 +505,7 @@ def predict_text(np_img: PixelValues, supported_languages: str, text_lines: bool
         A list of Tesseract extractions wrapped in `DetectionResult`
     """
 
-    results = image_to_dict(np_img, supported_languages, config)
-    all_results = []
-
-    for caption in zip(
-        results["left"],
-        results["top"],
-        results["width"],
-        results["height"],
-        results["conf"],
-        results["text"],
-        results["block_num"],
-        results["line_num"],
-    ):
-        score = float(caption[4])
-        if int(score) != -1:
-            word = DetectionResult(
-                box=[caption[0], caption[1], caption[0] + caption[2], caption[1] + caption[3]],
-                score=score / 100,
-                text=caption[5],
-                class_id=1,
-                class_name=LayoutLabel.WORD,
-            )
-            all_results.append(word)
-    if text_lines:
-        all_results = tesseract_line_to_detectresult(all_results)
-    return all_results
+    return tesseract_dict_to_detectresult(image_to_dict(np_img, supported_languages, config), text_lines)
 
 
 def predict_rotation(np_img: PixelValues) -> Mapping[str, str]:
@@ -355,6 +560,7 @@ class TesseractOcrDetector(ObjectDetector):
         self,
         path_yaml: PathLikeOrStr,
         config_overwrite: Optional[list[str]] = None,
+        num_workers: int = 1,
     ):
         """
         Set up the configuration which is stored in a `.yaml` file, that need to be passed through.
@@ -363,6 +569,7 @@ class TesseractOcrDetector(ObjectDetector):
             path_yaml: The path to the yaml config
             config_overwrite: Overwrite config parameters defined by the yaml file with new values.
                               E.g. `["oem=14"]`
+            num_workers: Number of workers of the `TesseractPool` used in `predict_batch`.
         """
         self.name = self.get_name()
         self.model_id = self.get_model_id()
@@ -379,6 +586,8 @@ class TesseractOcrDetector(ObjectDetector):
         self.path_yaml = Path(path_yaml)
         self.config_overwrite = config_overwrite
         self.config = hyper_param_config
+        self.num_workers = num_workers
+        self._pool: Optional[TesseractPool] = None
 
         if self.config.LINES:
             self.categories = ModelCategories(init_categories={1: LayoutLabel.WORD, 2: LayoutLabel.LINE})
@@ -403,12 +612,46 @@ class TesseractOcrDetector(ObjectDetector):
             config=config_to_cli_str(self.config, "LANGUAGES", "LINES"),
         )
 
+    def _get_pool(self) -> TesseractPool:
+        lang, config = self.config.LANGUAGES, config_to_cli_str(self.config, "LANGUAGES", "LINES")
+        if self._pool is None or self._pool.lang != lang or self._pool.config != config:
+            if self._pool is not None:
+                self._pool.close()
+            self._pool = TesseractPool(lang, config, self.num_workers)
+        return self._pool
+
+    def predict_batch(self, np_imgs: Sequence[PixelValues]) -> list[list[DetectionResult]]:
+        """
+        Recognizes a batch of images, e.g. all text block crops of a page, with a `TesseractPool`. Compared to calling
+        `predict` for every image, this does not spawn one Tesseract process per image.
+
+        Args:
+            np_imgs: images as `np.array`
+
+        Returns:
+            A list with one list of `DetectionResult` per image
+        """
+        return [
+            tesseract_dict_to_detectresult(results, self.config.LINES)
+            for results in self._get_pool().images_to_dicts(np_imgs)
+        ]
+
+    @property
+    def accepts_batch(self) -> bool:
+        return True
+
     @classmethod
     def get_requirements(cls) -> list[Requirement]:
         return [get_tesseract_requirement()]
 
     def clone(self) -> TesseractOcrDetector:
-        return self.__class__(self.path_yaml, self.config_overwrite)
+        return self.__class__(self.path_yaml, self.config_overwrite, self.num_workers)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The pool holds threads and Tesseract API handles. It will be re-created lazily.
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        return state
 
     def get_category_names(self) -> tuple[ObjectTypes, ...]:
         return self.categories.get_categories(as_dict=False)
@@ -32,9 +32,16 @@ from dd_core.datapoint.annotation import (
     ImageAnnotation,
     ReferencePayload,
 )
-from dd_core.datapoint.box import BoundingBox, local_to_global_coords, rescale_coords
+from dd_core.datapoint.box import (
+    BoundingBox,
+    local_to_global_coords,
+    np_round_box_coords,
+    np_valid_box_coords,
+    rescale_coords,
+)
 from dd_core.datapoint.image import Image
 from dd_core.mapper.maputils import MappingContextManager
+from dd_core.utils.logger import LoggingRecord, logger
 from dd_core.utils.object_types import ObjectTypes, RelationshipKey
 
 from ..extern.base import DetectionResult
@@ -191,7 +198,7 @@ class LocalDataPointCacheStore(DataPointCacheStore):
         cache_key = self._get_cache_key(document_id, job_id)
         pages = self._pages.get(cache_key) or {}
         keys = sorted(pages.keys(), reverse=True)[:last_d]
-        return tuple(Image(**pages[k]) for k in keys)
+        return tuple(Image.from_trusted(**pages[k]) for k in keys)
 
 
 class DatapointManager:
@@ -451,7 +458,7 @@ class DatapointManager:
                     dp.width,
                     dp.height,
                 )
-            ann = ImageAnnotation(
+            ann = ImageAnnotation.from_trusted(
                 category_name=detect_result.class_name,
                 bounding_box=box,
                 category_id=detect_result.class_id if detect_result.class_id is not None else DEFAULT_CATEGORY_ID,
@@ -497,6 +504,186 @@ class DatapointManager:
             return None
         return ann.annotation_id
 
+    def set_image_annotations(
+        self,
+        detect_results: Sequence[DetectionResult],
+        to_annotation_id: Optional[str] = None,
+        to_image: bool = False,
+        crop_image: bool = False,
+        detect_result_max_width: Optional[float] = None,
+        detect_result_max_height: Optional[float] = None,
+        job_id: str | None = None,
+    ) -> list[Optional[str]]:
+        """
+        Bulk version of `set_image_annotation` for the whole output of a detector.
+
+        Boxes are rounded, rescaled and validated as arrays, annotation ids are generated in one pass and all
+        annotations are appended to the image at once. Results that `set_image_annotation` would reject (e.g. boxes with
+        zero width) are skipped. As the boxes have been validated already, boxes and annotations are built with
+        `from_trusted`.
+
+        Args:
+            detect_results: `DetectionResult`s, generally coming from `ObjectDetector.predict`.
+            to_annotation_id: Dumps the created image annotations to `image` of the given `annotation_id`. Requires the
+                              target annotation to have a non-None image.
+            to_image: If True, will populate `image`.
+            crop_image: Only makes sense if `to_image` is True and if a numpy array is stored in the original image.
+                        Will generate `Image.image`.
+            detect_result_max_width: If the detect results have a different scaling scheme from the image they refer
+                                     to, pass the max width possible so coordinates can be rescaled. Results with a
+                                     coordinate not smaller than this width are skipped.
+            detect_result_max_height: Same as `detect_result_max_width` for the height.
+            job_id: Optional job identifier for async routing.
+
+        Returns:
+            The `annotation_id`s of the generated image annotations in the order of `detect_results`. The id is `None`
+            for every skipped result.
+
+        Raises:
+            TypeError: If the `box` of one of the detect results is not of type list or `np.ndarray`.
+        """
+        self.assert_datapoint_passed(job_id)
+        for detect_result in detect_results:
+            if not isinstance(detect_result.box, (list, np.ndarray)):
+                raise TypeError(
+                    f"detect_result.box must be of type list or np.ndarray, but is of type {(type(detect_result.box))}"
+                )
+        dp = self._resolve_datapoint(job_id)
+        cache_anns = self._resolve_cache_anns(job_id)
+        annotation_ids: list[Optional[str]] = [None] * len(detect_results)
+
+        boxes = np.zeros((len(detect_results), 4), dtype=np.float64)
+        has_four_coords = np.array([len(detect_result.box) == 4 for detect_result in detect_results], dtype=bool)  # type: ignore
+        if has_four_coords.any():
+            boxes[has_four_coords] = [
+                detect_result.box for detect_result, valid in zip(detect_results, has_four_coords) if valid
+            ]
+        absolute_coords = np.array([detect_result.absolute_coords for detect_result in detect_results], dtype=bool)
+        int_boxes = np.zeros((len(detect_results), 4), dtype=np.int64)
+        valid = has_four_coords.copy()
+        for is_absolute in (True, False):
+            mask = absolute_coords == is_absolute
+            if mask.any():
+                int_boxes[mask] = np_round_box_coords(boxes[mask], is_absolute)
+                valid[mask] &= np_valid_box_coords(int_boxes[mask], is_absolute)
+
+        if detect_result_max_width and detect_result_max_height:
+            valid &= np.all(boxes[:, [0, 2]] < detect_result_max_width, axis=1) & np.all(
+                boxes[:, [1, 3]] < detect_result_max_height, axis=1
+            )
+            # like `rescale_coords` on the rounded box, relative coordinates stay untouched
+            scale = np.array(
+                [dp.width / detect_result_max_width, dp.height / detect_result_max_height] * 2, dtype=np.float64
+            )
+            rescaled = np_round_box_coords(int_boxes[absolute_coords] * scale, True)
+            int_boxes[absolute_coords] = rescaled
+            valid[absolute_coords] &= np_valid_box_coords(rescaled, True)
+
+        if not valid.all():
+            logger.warning(
+                LoggingRecord(
+                    f"Will filter {int((~valid).sum())} of {len(detect_results)} detection results with invalid boxes",
+                    {"file_name": dp.file_name, "service_id": self.service_id},
+                )
+            )
+
+        scale_factor = BoundingBox.RELATIVE_COORD_SCALE_FACTOR
+        positions = np.flatnonzero(valid).tolist()
+        anns = []
+        for position, (ulx, uly, lrx, lry), is_absolute in zip(
+            positions, int_boxes[positions].tolist(), absolute_coords[positions].tolist()
+        ):
+            detect_result = detect_results[position]
+            if not is_absolute:
+                ulx, uly, lrx, lry = ulx / scale_factor, uly / scale_factor, lrx / scale_factor, lry / scale_factor
+            anns.append(
+                ImageAnnotation.from_trusted(
+                    category_name=detect_result.class_name,
+                    bounding_box=BoundingBox.from_trusted(is_absolute, ulx, uly, lrx, lry),
+                    category_id=detect_result.class_id if detect_result.class_id is not None else DEFAULT_CATEGORY_ID,
+                    score=detect_result.score,
+                    service_id=self.service_id,
+                    model_id=self.model_id,
+                )
+            )
+
+        if to_annotation_id is not None:
+            parent_ann = cache_anns[to_annotation_id]
+            if parent_ann.image is None:
+                raise ValueError("image cannot be None")
+            anns, positions = self._dump_to_parent_image(dp, parent_ann, anns, positions)
+        anns, positions = self._drop_existing_annotations(dp, anns, positions)
+
+        dp.dump_annotations(anns)
+        for position, ann in zip(positions, anns):
+            cache_anns[ann.annotation_id] = ann
+            annotation_ids[position] = ann.annotation_id
+            if to_image and to_annotation_id is None:
+                dp.image_ann_to_image(annotation_id=ann.annotation_id, crop_image=crop_image)
+        return annotation_ids
+
+    @staticmethod
+    def _drop_existing_annotations(
+        image: Image, anns: list[ImageAnnotation], positions: list[int]
+    ) -> tuple[list[ImageAnnotation], list[int]]:
+        """Generates missing annotation ids and removes annotations whose id already exists in `image`"""
+        existing_ids = set(image._get_annotation_index().by_id)
+        kept_anns, kept_positions = [], []
+        new_ids = iter(image.define_annotation_ids([ann for ann in anns if ann._annotation_id is None]))
+        annotation_ids = [ann._annotation_id if ann._annotation_id is not None else next(new_ids) for ann in anns]
+        for ann, position, annotation_id in zip(anns, positions, annotation_ids):
+            if annotation_id in existing_ids:
+                logger.warning(
+                    LoggingRecord(
+                        f"Will filter annotation with existing id {annotation_id}",
+                        {"file_name": image.file_name, "category_name": ann.category_name},
+                    )
+                )
+                continue
+            if ann._annotation_id is None:
+                ann.annotation_id = annotation_id
+            existing_ids.add(annotation_id)
+            kept_anns.append(ann)
+            kept_positions.append(position)
+        return kept_anns, kept_positions
+
+    def _dump_to_parent_image(
+        self, dp: Image, parent_ann: ImageAnnotation, anns: list[ImageAnnotation], positions: list[int]
+    ) -> tuple[list[ImageAnnotation], list[int]]:
+        """Dumps the annotations to the image of `parent_ann` and sets their embeddings, see `set_image_annotation`"""
+        parent_image: Image = parent_ann.image  # type: ignore
+        anns, positions = self._drop_existing_annotations(parent_image, anns, positions)
+        parent_image.dump_annotations(anns)
+        parent_box = parent_ann.get_bounding_box(dp.image_id).transform(
+            image_width=dp.width, image_height=dp.height, absolute_coords=True
+        )
+        kept_anns, kept_positions = [], []
+        for ann, position in zip(anns, positions):
+            with MappingContextManager(
+                dp_name=dp.file_name, filter_level="annotation", image_annotation={"annotation_id": ann.annotation_id}
+            ) as annotation_context:
+                parent_image.image_ann_to_image(ann.annotation_id)
+                local_box = ann.bounding_box.transform(  # type:ignore
+                    image_width=parent_image.width, image_height=parent_image.height, absolute_coords=True
+                )
+                ann_global_box = local_to_global_coords(local_box, parent_box)
+                if ann.image is None:
+                    raise ValueError("image cannot be None")
+                ann.image.set_embedding(
+                    parent_ann.annotation_id,
+                    ann.bounding_box.transform(  # type:ignore
+                        image_width=parent_image.width, image_height=parent_image.height
+                    ),
+                )
+                ann.image.set_embedding(
+                    dp.image_id, ann_global_box.transform(image_width=dp.width, image_height=dp.height)
+                )
+                parent_ann.dump_relationship(RelationshipKey.CHILD, ann.annotation_id)
+            if not annotation_context.context_error:
+                kept_anns.append(ann)
+                kept_positions.append(position)
+        return kept_anns, kept_positions
+
     def set_category_annotation(
         self,
         category_name: ObjectTypes,
@@ -544,6 +731,54 @@ class DatapointManager:
             return None
         return cat_ann.annotation_id
 
+    def set_category_annotations(
+        self,
+        category_name: ObjectTypes,
+        category_ids: Sequence[Optional[int]],
+        sub_cat_key: ObjectTypes,
+        annotation_ids: Sequence[str],
+        job_id: str | None = None,
+    ) -> list[Optional[str]]:
+        """
+        Bulk version of `set_category_annotation` for dumping the same sub category to many annotations, e.g. row
+        numbers to all cells of a table. The datapoint and the annotation cache are resolved once. Errors are still
+        caught and logged for every single annotation.
+
+        Args:
+            category_name: The category name.
+            category_ids: The category ids, one for each annotation.
+            sub_cat_key: The key to dump the created annotations to.
+            annotation_ids: The ids of the parent annotations.
+            job_id: Optional job identifier for async routing.
+
+        Returns:
+            The `annotation_id`s of the generated category annotations in the order of `annotation_ids`. The id is
+            `None` for every annotation with a context error.
+        """
+        self.assert_datapoint_passed(job_id)
+        dp = self._resolve_datapoint(job_id)
+        cache_anns = self._resolve_cache_anns(job_id)
+        cat_ann_ids: list[Optional[str]] = []
+        for category_id, annotation_id in zip(category_ids, annotation_ids):
+            with MappingContextManager(
+                dp_name=dp.file_name,
+                filter_level="annotation",
+                category_annotation={
+                    "category_name": category_name.value,
+                    "sub_cat_key": sub_cat_key.value,
+                    "annotation_id": annotation_id,
+                },
+            ) as annotation_context:
+                cat_ann = CategoryAnnotation(
+                    category_name=category_name,
+                    category_id=category_id if category_id is not None else DEFAULT_CATEGORY_ID,
+                    service_id=self.service_id,
+                    model_id=self.model_id,
+                )
+                cache_anns[annotation_id].dump_sub_category(sub_cat_key, cat_ann)
+            cat_ann_ids.append(None if annotation_context.context_error else cat_ann.annotation_id)
+        return cat_ann_ids
+
     def set_container_annotation(
         self,
         category_name: ObjectTypes,
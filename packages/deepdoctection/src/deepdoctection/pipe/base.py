@@ -23,9 +23,9 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from typing import Any, Callable, Mapping, Optional, Union
+from typing import Any, Callable, Mapping, Optional, Sequence, Union
 
-from dd_core.dataflow import DataFlow, MapData
+from dd_core.dataflow import DataFlow, FlattenData, MapData, TimedBatchData
 from dd_core.datapoint.image import Image, MetaAnnotation
 from dd_core.mapper.misc import curry
 from dd_core.utils.context import timed_operation
@@ -59,7 +59,8 @@ class PipelineComponent(ABC):
     set up first and then to be streamed to the processed data points.
 
     Note:
-        Currently, predictors can only process single images. Processing higher number of batches is not planned.
+        Components process one image at a time via `serve`. Components whose predictor can process several images in
+        one forward pass can override `serve_batch`, which is used when a pipeline runs in batching mode.
     """
 
     def __init__(self, name: str, model_id: Optional[str] = None, service_id: Optional[str] = None) -> None:
@@ -161,6 +162,63 @@ class PipelineComponent(ABC):
         """
         return MapData(df, self.pass_datapoint)
 
+    def serve_batch(self, dps: Sequence[Image]) -> None:
+        """
+        Processing a batch of images through the pipeline component.
+
+        The default implementation passes each image to `dp_manager` and calls `serve`. Components with a predictor
+        that accepts batches should override this method, run one batched prediction for all images and scatter the
+        results back to the images. Before creating annotations for an image, the image must be passed to
+        `dp_manager`.
+
+        Args:
+            dps: A sequence of image datapoints. Images that are rejected by the inbound filter are not part of the
+                 batch.
+        """
+        for dp in dps:
+            self.dp_manager.datapoint = dp
+            self.serve(dp)
+
+    def _pass_datapoints(self, dps: Sequence[Image]) -> None:
+        self.serve_batch([dp for dp in dps if not self.filter_func(dp)])
+
+    def pass_datapoints(self, dps: list[Image], job_id: str | None = None) -> list[Image]:
+        """
+        Acceptance, transformation and forwarding of a batch of datapoints.
+
+        Counterpart of `pass_datapoint` for the batching mode of a pipeline. The inbound filter is evaluated for every
+        datapoint and the remaining datapoints are processed with `serve_batch`.
+
+        Args:
+            dps: A list of datapoints.
+            job_id: Optional job identifier to distinguish caches between different processing runs.
+
+        Returns:
+            The list of datapoints in the same order.
+        """
+        if self.timer_on:
+            with timed_operation(self.__class__.__name__):
+                self._pass_datapoints(dps)
+        else:
+            self._pass_datapoints(dps)
+
+        for dp in dps:
+            self.dp_manager.maybe_cache_datapoint(dp, job_id=job_id)
+
+        return dps
+
+    def predict_batched_dataflow(self, df: DataFlow) -> DataFlow:
+        """
+        Mapping a batch of datapoints via `pass_datapoints` within a dataflow pipeline.
+
+        Args:
+            df: An input dataflow, where each datapoint is a list of images.
+
+        Returns:
+            An output dataflow, where each datapoint is a list of images.
+        """
+        return MapData(df, self.pass_datapoints)
+
     @abstractmethod
     def clone(self) -> PipelineComponent:
         """
@@ -449,20 +507,38 @@ class Pipeline(ABC):
         """
         raise NotImplementedError()
 
-    def _build_pipe(self, df: DataFlow) -> DataFlow:
+    def _build_pipe(self, df: DataFlow, batch_size: int = 1, max_batch_wait: Optional[float] = None) -> DataFlow:
         """
         Composition of the backbone.
 
+        If `batch_size > 1`, the pipeline runs in batching mode: Images are grouped into batches of at most
+        `batch_size` images in front of the first component, every component processes the whole batch with
+        `pass_datapoints` and the batches are flattened again after the last component. Components with a predictor
+        accepting batches will then run one prediction per batch instead of one prediction per image.
+
         Args:
             df: The input dataflow.
+            batch_size: Maximum number of images that are processed together by each component.
+            max_batch_wait: Maximum number of seconds an image waits for its batch to be completed. Only used in
+                            batching mode.
 
         Returns:
             The processed dataflow.
         """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be a positive integer, but is {batch_size}")
+        if batch_size == 1:
+            for component in self.pipe_component_list:
+                component.timer_on = True
+                df = component.predict_dataflow(df)
+            return df
+
+        df = TimedBatchData(df, batch_size=batch_size, max_wait=max_batch_wait)
         for component in self.pipe_component_list:
             component.timer_on = True
-            df = component.predict_dataflow(df)
-        return df
+            df = component.predict_batched_dataflow(df)
+        df = FlattenData(df)
+        return MapData(df, lambda dp: dp[0])
 
     def get_meta_annotation(self) -> MetaAnnotation:
         """
@@ -112,6 +112,7 @@ class IntersectionMatcher:
         threshold: float,
         use_weighted_intersections: bool = False,
         max_parent_only: bool = False,
+        use_spatial_index: bool = False,
     ) -> None:
         """
         Args:
@@ -122,6 +123,8 @@ class IntersectionMatcher:
                 cells will likely decrease the ioa value. By multiplying the ioa with the number of all intersection for
                 each child this value calibrate the ioa.
         max_parent_only: Will assign to each child at most one parent with maximum ioa.
+            use_spatial_index: Will only evaluate pairs of children and parents with intersecting boxes instead of
+                computing the full iou/ioa-matrix. Returns the same matches but is much faster on dense pages.
 
         Raises:
             ValueError: If `matching_rule` is not `iou` or `ioa`.
@@ -133,6 +136,7 @@ class IntersectionMatcher:
         self.threshold = threshold
         self.use_weighted_intersections = use_weighted_intersections
         self.max_parent_only = max_parent_only
+        self.use_spatial_index = use_spatial_index
 
     def match(
         self,
@@ -165,6 +169,7 @@ class IntersectionMatcher:
             threshold=self.threshold,
             use_weighted_intersections=self.use_weighted_intersections,
             max_parent_only=self.max_parent_only,
+            use_spatial_index=self.use_spatial_index,
             parent_ann_service_ids=parent_ann_service_ids,
             child_ann_service_ids=child_ann_service_ids,
         )
@@ -21,17 +21,23 @@ Module for multithreading tasks
 from __future__ import annotations
 
 import itertools
+import multiprocessing as mp
 import queue
+import threading
+import traceback
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import ExitStack
-from typing import Callable, Optional, Sequence, Union
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Mapping, Optional, Sequence, Union
 
 import tqdm
 
-from dd_core.dataflow import DataFlow, MapData
+from dd_core.dataflow import DataFlow, MapData, ProxyDataFlow
 from dd_core.datapoint.image import Image, MetaAnnotation
 from dd_core.datapoint.view import Page
+from dd_core.utils.concurrency import StoppableThread, enable_death_signal, start_proc_mask_signal
 from dd_core.utils.context import timed_operation
+from dd_core.utils.error import DataFlowResetStateNotCalledError
 from dd_core.utils.tqdm import get_tqdm
 from dd_core.utils.types import QueueType, TqdmType
 
@@ -74,8 +80,9 @@ class MultiThreadPipelineComponent(PipelineComponent):
         ```
 
     Info:
-        You cannot run `MultiThreadPipelineComponent` in `DoctectionPipe` as this requires batching datapoints and
-        neither can you run `MultiThreadPipelineComponent` in combination with a humble `PipelineComponent` unless you
+        You can only run `MultiThreadPipelineComponent` in `DoctectionPipe` in batching mode, e.g.
+        `pipe.analyze(path=..., batch_size=32)`, as this requires batching datapoints. Outside of a batching pipeline,
+        you cannot run `MultiThreadPipelineComponent` in combination with a humble `PipelineComponent` unless you
         take care of batching/unbatching between each component by yourself. The easiest way to build a pipeline with
         `MultiThreadPipelineComponent` can be accomplished as follows:
 
@@ -216,26 +223,29 @@ class MultiThreadPipelineComponent(PipelineComponent):
                     break
             self.input_queue.put(dp)
 
-    def pass_datapoints(self, dpts: list[Union[Image, Page]]) -> list[Union[Image, Page]]:
+    def pass_datapoints(  # type: ignore
+        self, dps: list[Union[Image, Page]], job_id: str | None = None
+    ) -> list[Union[Image, Page]]:
         """
         Put the list of datapoints into a thread-safe queue and start a separate thread for each pipeline component.
 
         The order of appearance of the output might not be the same as the input.
 
         Args:
-            dpts: List of `Image` datapoints.
+            dps: List of `Image` datapoints.
+            job_id: Not used. Only added to comply with the `PipelineComponent.pass_datapoints` signature.
 
         Returns:
             List of processed `Image` datapoints.
         """
-        for dp in dpts:
+        for dp in dps:
             self.input_queue.put(dp)
         if self.timer_on:
             with timed_operation(self.pipe_components[0].name):
-                dpts = self.start()
+                dps = self.start()
         else:
-            dpts = self.start()
-        return dpts
+            dps = self.start()
+        return dps
 
     def predict_dataflow(self, df: DataFlow) -> DataFlow:
         """
@@ -261,3 +271,403 @@ class MultiThreadPipelineComponent(PipelineComponent):
     def clear_predictor(self) -> None:
         for pipe in self.pipe_components:
             pipe.clear_predictor()
+
+
+class _StageSentinel:  # pylint: disable=R0903
+    """Marks the end of the stream for one worker of a stage"""
+
+
+@dataclass(frozen=True)
+class _StageFailure:
+    """Transports an exception raised in a stage worker to the consumer of `StagedPipelineData`"""
+
+    error: BaseException
+
+
+class _PipelineStage:
+    """
+    A stage of `StagedPipelineData`: A pool of identical pipeline components that consume datapoints from `in_queue`
+    and put the processed datapoints into `out_queue`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        components: Sequence[PipelineComponent],
+        in_queue: QueueType,
+        out_queue: QueueType,
+        batched: bool,
+    ) -> None:
+        self.name = name
+        self.components = components
+        self.in_queue = in_queue
+        self.out_queue = out_queue
+        self.batched = batched
+        self.num_downstream_workers = 1
+        self._num_running_workers = len(components)
+        self._lock = threading.Lock()
+
+    def process(self, component: PipelineComponent, dp: Any) -> Any:
+        """Process a datapoint (or a batch of datapoints) with one component of the stage"""
+        if self.batched:
+            return component.pass_datapoints(dp)
+        return component.pass_datapoint(dp)
+
+    def worker_done(self) -> bool:
+        """
+        Register that a worker has finished. Returns `True` if it was the last running worker of the stage.
+        """
+        with self._lock:
+            self._num_running_workers -= 1
+            return self._num_running_workers == 0
+
+
+class _StageWorker(StoppableThread):
+    """Worker thread running one component of a `_PipelineStage`"""
+
+    def __init__(
+        self, stage: _PipelineStage, component: PipelineComponent, evt: threading.Event, output_queue: QueueType
+    ) -> None:
+        super().__init__(evt)
+        self.daemon = True
+        self.name = f"StageWorker-{stage.name}"
+        self.stage = stage
+        self.component = component
+        self.output_queue = output_queue
+
+    def run(self) -> None:
+        try:
+            while not self.stopped():
+                item = self.queue_get_stoppable(self.stage.in_queue)
+                if item is None:
+                    return
+                if isinstance(item, _StageSentinel):
+                    if self.stage.worker_done():
+                        for _ in range(self.stage.num_downstream_workers):
+                            self.queue_put_stoppable(self.stage.out_queue, _StageSentinel())
+                    return
+                idx, dp = item
+                self.queue_put_stoppable(self.stage.out_queue, (idx, self.stage.process(self.component, dp)))
+        except Exception as err:  # pylint: disable=W0718
+            self.stop()
+            self.output_queue.put(_StageFailure(err))
+
+
+class _FeederThread(StoppableThread):
+    """Thread that pulls datapoints from the input dataflow (e.g. rendering pdf pages) and feeds the first stage"""
+
+    def __init__(
+        self, df: DataFlow, out_queue: QueueType, num_workers: int, evt: threading.Event, output_queue: QueueType
+    ) -> None:
+        super().__init__(evt)
+        self.daemon = True
+        self.name = "StageFeeder"
+        self.df = df
+        self.out_queue = out_queue
+        self.num_workers = num_workers
+        self.output_queue = output_queue
+
+    def run(self) -> None:
+        try:
+            for idx, dp in enumerate(self.df):
+                if self.stopped():
+                    return
+                self.queue_put_stoppable(self.out_queue, (idx, dp))
+            for _ in range(self.num_workers):
+                self.queue_put_stoppable(self.out_queue, _StageSentinel())
+        except Exception as err:  # pylint: disable=W0718
+            self.stop()
+            self.output_queue.put(_StageFailure(err))
+
+
+class StagedPipelineData(ProxyDataFlow):
+    """
+    Runs a sequence of pipeline components as a pipeline of stages. Every stage runs in its own thread(s) and stages
+    are connected with bounded queues. While page N is being processed by one component (e.g. OCR), page N+1 can
+    already be processed by the previous component (e.g. layout detection) and page N+2 can be rendered by the
+    input dataflow. This gives an overlap of I/O-bound stages (e.g. `pdftoppm` or `tesseract` subprocesses) and
+    compute-bound stages.
+
+    Each stage can run a pool of several workers. The additional workers are created with
+    `PipelineComponent.clone`. The order of the input dataflow is always preserved.
+
+    Example:
+        ```python
+        df = SerializerPdfDoc.load(path)
+        df = MapData(df, to_image(dpi=300))
+        df = StagedPipelineData(df, [layout_component, ocr_component], queue_size=4,
+                                num_workers={ocr_component.name: 2})
+        df.reset_state()
+
+        for dp in df:
+            print(df.get_queue_depths())
+        ```
+
+    Note:
+        The bounded queues limit the number of pages held in memory to roughly `queue_size` pages per stage.
+    """
+
+    def __init__(
+        self,
+        df: DataFlow,
+        pipeline_components: Sequence[PipelineComponent],
+        queue_size: int = 4,
+        num_workers: Optional[Mapping[str, int]] = None,
+        batched: bool = False,
+    ) -> None:
+        """
+        Args:
+            df: The input dataflow. It is pulled in a separate feeder thread.
+            pipeline_components: The pipeline components. Each component forms a stage.
+            queue_size: Maximum number of datapoints waiting in front of each stage.
+            num_workers: Number of workers for a stage, keyed by the `name` or the `service_id` of the component.
+                         Stages that are not listed run with one worker.
+            batched: If `True`, each datapoint of `df` is expected to be a list of images and components process them
+                     with `pass_datapoints`.
+        """
+        super().__init__(df)
+        if queue_size < 1:
+            raise ValueError(f"queue_size must be a positive integer, but is {queue_size}")
+        self.pipeline_components = pipeline_components
+        self.queue_size = queue_size
+        self.num_workers = dict(num_workers) if num_workers is not None else {}
+        self.batched = batched
+        self._pools: list[list[PipelineComponent]] = []
+        self._stages: list[_PipelineStage] = []
+        self._input_queue: Optional[QueueType] = None
+        self._output_queue: Optional[QueueType] = None
+
+    def _get_num_workers(self, component: PipelineComponent) -> int:
+        num_workers = self.num_workers.get(component.name, self.num_workers.get(component.service_id, 1))
+        if num_workers < 1:
+            raise ValueError(f"Number of workers for {component.name} must be a positive integer")
+        return num_workers
+
+    def reset_state(self) -> None:
+        super().reset_state()
+        self._pools = []
+        for component in self.pipeline_components:
+            pool = [component]
+            for _ in range(self._get_num_workers(component) - 1):
+                clone = component.clone()
+                clone.timer_on = component.timer_on
+                pool.append(clone)
+            self._pools.append(pool)
+
+    def get_queue_depths(self) -> dict[str, int]:
+        """
+        Returns the number of datapoints waiting in front of each stage as well as the number of processed datapoints
+        that have not been consumed yet (key `output`). Returns an empty dict, if the dataflow has not been started.
+
+        Returns:
+            A dict with stage names (i.e. the component names) as keys and queue sizes as values.
+        """
+        if self._output_queue is None:
+            return {}
+        depths = {stage.name: stage.in_queue.qsize() for stage in self._stages}
+        depths["output"] = self._output_queue.qsize()
+        return depths
+
+    def _start(self, evt: threading.Event) -> list[StoppableThread]:
+        queues: list[QueueType] = [queue.Queue(maxsize=self.queue_size) for _ in range(len(self._pools) + 1)]
+        # The output queue must never block a failing worker when putting its failure
+        output_queue: QueueType = queue.Queue()
+        queues[-1] = output_queue
+        self._stages = [
+            _PipelineStage(pool[0].name, pool, queues[idx], queues[idx + 1], self.batched)
+            for idx, pool in enumerate(self._pools)
+        ]
+        for stage, next_stage in zip(self._stages, self._stages[1:]):
+            stage.num_downstream_workers = len(next_stage.components)
+        self._input_queue, self._output_queue = queues[0], output_queue
+
+        threads: list[StoppableThread] = [
+            _FeederThread(
+                self.df,
+                queues[0],
+                len(self._stages[0].components) if self._stages else 1,
+                evt,
+                output_queue,
+            )
+        ]
+        for stage in self._stages:
+            threads.extend(_StageWorker(stage, component, evt, output_queue) for component in stage.components)
+        for thread in threads:
+            thread.start()
+        return threads
+
+    def __iter__(self) -> Iterator[Any]:
+        if not self._reset_called:
+            raise DataFlowResetStateNotCalledError()
+        evt = threading.Event()
+        self._start(evt)
+        assert self._output_queue is not None
+        buffer: dict[int, Any] = {}
+        next_idx = 0
+        try:
+            while True:
+                item = self._output_queue.get()
+                if isinstance(item, _StageSentinel):
+                    break
+                if isinstance(item, _StageFailure):
+                    raise item.error
+                idx, dp = item
+                buffer[idx] = dp
+                while next_idx in buffer:
+                    out = buffer.pop(next_idx)
+                    next_idx += 1
+                    if out is not None:
+                        yield out
+        finally:
+            evt.set()
+
+
+class _PipelineWorker(mp.Process):
+    """
+    Worker process of `MultiProcessPipelineData`. Clones the pipeline components once when started and processes
+    the received datapoints until it receives `None`.
+    """
+
+    def __init__(
+        self,
+        identity: int,
+        pipeline_components: Sequence[PipelineComponent],
+        pre_proc_func: Optional[Callable[[Any], Any]],
+        in_queue: Any,
+        out_queue: Any,
+    ) -> None:
+        super().__init__(daemon=True)
+        self.identity = identity
+        self.pipeline_components = pipeline_components
+        self.pre_proc_func = pre_proc_func
+        self.in_queue = in_queue
+        self.out_queue = out_queue
+
+    def run(self) -> None:
+        enable_death_signal(_warn=self.identity == 0)
+        components = []
+        for component in self.pipeline_components:
+            clone = component.clone()
+            clone.timer_on = component.timer_on
+            components.append(clone)
+        while True:
+            item = self.in_queue.get()
+            if item is None:
+                return
+            idx, dp = item
+            try:
+                if self.pre_proc_func is not None:
+                    dp = self.pre_proc_func(dp)
+                for component in components:
+                    if dp is None:
+                        break
+                    dp = component.pass_datapoint(dp)
+                self.out_queue.put((idx, dp, None))
+            except Exception:  # pylint: disable=W0718
+                self.out_queue.put((idx, None, traceback.format_exc()))
+
+
+class MultiProcessPipelineData(ProxyDataFlow):
+    """
+    Shards the datapoints of a dataflow across worker processes, each running its own clone of a sequence of
+    pipeline components. This allows to use several cores for Python-heavy components (e.g. `TextOrderService`,
+    `TableSegmentationService` or `MatchingService`) that are otherwise limited by the GIL.
+
+    Datapoints are transported to and from the workers by pickling them through `multiprocessing` queues, similar
+    to `MultiProcessMapData`. In contrast to `MultiProcessMapData`, the order of the input dataflow is preserved and
+    no additional dependencies are required.
+
+    Example:
+        ```python
+        df = SerializerPdfDoc.load(path)
+        df = MultiProcessPipelineData(df, [layout_component, ocr_component], num_proc=4,
+                                      pre_proc_func=to_image(dpi=300))
+        df.reset_state()
+
+        for dp in df:
+            ...
+        ```
+
+    Note:
+        Each worker calls `PipelineComponent.clone` once when it starts, so model weights are loaded once per worker.
+        When using the `spawn` or `forkserver` start method, pipeline components and `pre_proc_func` must be
+        picklable.
+    """
+
+    def __init__(
+        self,
+        df: DataFlow,
+        pipeline_components: Sequence[PipelineComponent],
+        num_proc: int,
+        pre_proc_func: Optional[Callable[[Any], Any]] = None,
+        buffer_size: Optional[int] = None,
+    ) -> None:
+        """
+        Args:
+            df: The input dataflow.
+            pipeline_components: The pipeline components, each worker runs all of them sequentially.
+            num_proc: Number of worker processes.
+            pre_proc_func: Function that is executed in the worker before the first component, e.g. converting a
+                           pdf page into an `Image`. Return `None` to discard a datapoint.
+            buffer_size: Maximum number of datapoints that are in flight at the same time. Defaults to
+                         `2 * num_proc`.
+        """
+        super().__init__(df)
+        if num_proc < 1:
+            raise ValueError(f"num_proc must be a positive integer, but is {num_proc}")
+        self.pipeline_components = pipeline_components
+        self.num_proc = num_proc
+        self.pre_proc_func = pre_proc_func
+        self.buffer_size = buffer_size if buffer_size is not None else 2 * num_proc
+        if self.buffer_size < 1:
+            raise ValueError(f"buffer_size must be a positive integer, but is {self.buffer_size}")
+
+    def _recv(self, out_queue: Any, procs: Sequence[mp.Process]) -> Any:
+        while True:
+            try:
+                return out_queue.get(timeout=5)
+            except queue.Empty as err:
+                if not all(proc.is_alive() for proc in procs):
+                    raise RuntimeError("A worker process of MultiProcessPipelineData died unexpectedly") from err
+
+    def __iter__(self) -> Iterator[Any]:
+        if not self._reset_called:
+            raise DataFlowResetStateNotCalledError()
+        ctx = mp.get_context()
+        in_queue, out_queue = ctx.Queue(), ctx.Queue()
+        procs = [
+            _PipelineWorker(idx, self.pipeline_components, self.pre_proc_func, in_queue, out_queue)
+            for idx in range(self.num_proc)
+        ]
+        start_proc_mask_signal(procs)
+        df_iter = iter(self.df)
+        num_sent, num_received, exhausted = 0, 0, False
+        buffer: dict[int, Any] = {}
+        next_idx = 0
+        try:
+            while True:
+                while not exhausted and num_sent - num_received < self.buffer_size:
+                    try:
+                        in_queue.put((num_sent, next(df_iter)))
+                        num_sent += 1
+                    except StopIteration:
+                        exhausted = True
+                if num_received == num_sent:
+                    break
+                idx, dp, error = self._recv(out_queue, procs)
+                num_received += 1
+                if error is not None:
+                    raise RuntimeError(f"Processing datapoint {idx} failed in a worker process:\n{error}")
+                buffer[idx] = dp
+                while next_idx in buffer:
+                    out = buffer.pop(next_idx)
+                    next_idx += 1
+                    if out is not None:
+                        yield out
+        finally:
+            for _ in procs:
+                in_queue.put(None)
+            for proc in procs:
+                proc.join(timeout=5)
+                if proc.is_alive():
+                    proc.terminate()
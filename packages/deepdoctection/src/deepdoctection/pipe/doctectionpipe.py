@@ -21,26 +21,37 @@ Module for document processing pipeline
 
 import os
 from pathlib import Path
-from typing import List, Mapping, Optional, Sequence, Tuple, Union
-
-from dd_core.dataflow import CustomDataFromIterable, DataFlow, DataFromList, MapData, SerializerFiles, SerializerPdfDoc
+from typing import Any, Callable, List, Mapping, Optional, Sequence, Tuple, Union
+
+from dd_core.dataflow import (
+    CustomDataFromIterable,
+    DataFlow,
+    DataFromList,
+    FlattenData,
+    MapData,
+    SerializerFiles,
+    SerializerPdfDoc,
+    TimedBatchData,
+)
 from dd_core.dataflow.custom_serialize import make_pdf_page_mapper
 from dd_core.datapoint.image import Image
 from dd_core.datapoint.view import IMAGE_DEFAULTS
 from dd_core.mapper.maputils import curry
 from dd_core.mapper.misc import to_image
+from dd_core.utils.file_utils import pypdfium2_available
 from dd_core.utils.fs import maybe_path_or_pdf
 from dd_core.utils.logger import LoggingRecord, logger
-from dd_core.utils.pdf_utils import PDFStreamer
+from dd_core.utils.pdf_utils import PdfDocumentSession, PDFStreamer
 from dd_core.utils.types import PathLikeOrStr
 from dd_core.utils.utils import is_file_extension
 
 from .base import Pipeline, PipelineComponent
 from .common import PageParsingService
+from .concurrency import MultiProcessPipelineData, StagedPipelineData
 
 
 def _collect_from_kwargs(
-    **kwargs: Union[Optional[str], bytes, DataFlow, bool, int, PathLikeOrStr, Union[str, List[str]]],
+    **kwargs: Union[Optional[str], bytes, DataFlow, bool, int, float, PathLikeOrStr, Union[str, List[str]]],
 ) -> Tuple[Optional[str], Union[str, Sequence[str]], bool, int, str, DataFlow, Optional[bytes], Optional[str]]:
     """
     Collects and validates keyword arguments for dataflow construction.
@@ -212,11 +223,30 @@ class DoctectionPipe(Pipeline):
             else page_parsing_service
         )
 
+        self.stage_workers: dict[str, int] = {}
+        self._staged_df: Optional[StagedPipelineData] = None
+
         super().__init__(pipeline_component_list)
 
     def _entry(
-        self, **kwargs: Union[str, bytes, DataFlow, bool, int, PathLikeOrStr, Union[str, List[str]]]
+        self, **kwargs: Union[str, bytes, DataFlow, bool, int, float, PathLikeOrStr, Union[str, List[str]]]
     ) -> DataFlow:
+        df, to_image_func = self._entry_and_image_mapper(**kwargs)
+        if to_image_func is not None:
+            df = MapData(df, to_image_func)
+        return df
+
+    def _entry_and_image_mapper(
+        self, **kwargs: Union[str, bytes, DataFlow, bool, int, float, PathLikeOrStr, Union[str, List[str]]]
+    ) -> Tuple[DataFlow, Optional[Callable[[Any], Optional[Image]]]]:
+        """
+        Builds the input dataflow and the function that converts its datapoints into `Image`s. The conversion is
+        returned separately, so that it can be executed in worker processes.
+
+        Returns:
+            The input dataflow and the conversion function. The conversion function is `None`, if the dataflow
+            already yields `Image`s (e.g. when passing a `dataset_dataflow`).
+        """
         path, file_type, shuffle, max_datapoints, doc_path, dataset_dataflow, b_bytes, document_id = (
             _collect_from_kwargs(**kwargs)
         )
@@ -244,10 +274,11 @@ class DoctectionPipe(Pipeline):
             raise BrokenPipeError("Cannot build Dataflow")
 
         df = MapData(df, _proto_process(path, doc_path))
+        to_image_func = None
         if dataset_dataflow is None:
             dpi = int(os.environ["DPI"])
             if dpi:
-                df = MapData(df, _to_image(dpi=dpi, document_id=document_id))  # pylint: disable=E1120
+                to_image_func = _to_image(dpi=dpi, document_id=document_id)  # pylint: disable=E1120
             else:
                 width, height = int(kwargs.get("width", 0)), int(kwargs.get("height", 0))
                 if not width or not height:
@@ -258,8 +289,8 @@ class DoctectionPipe(Pipeline):
                             "DPI, IMAGE_WIDTH and IMAGE_HEIGHT are all None or 0, but "
                             "either DPI or IMAGE_WIDTH and IMAGE_HEIGHT must be set"
                         )
-                df = MapData(df, _to_image(width=width, height=height, document_id=document_id))
-        return df
+                to_image_func = _to_image(width=width, height=height, document_id=document_id)
+        return df, to_image_func
 
     @staticmethod
     def path_to_dataflow(
@@ -335,7 +366,12 @@ class DoctectionPipe(Pipeline):
             if file_type == ".pdf":
                 prefix, suffix = os.path.splitext(file_name)
                 df: DataFlow
-                df = CustomDataFromIterable(PDFStreamer(path_or_bytes=b_bytes), max_datapoints=max_datapoints)
+                pages: Union[PdfDocumentSession, PDFStreamer]
+                if pypdfium2_available():
+                    pages = PdfDocumentSession(path_or_bytes=b_bytes)
+                else:
+                    pages = PDFStreamer(path_or_bytes=b_bytes)
+                df = CustomDataFromIterable(pages, max_datapoints=max_datapoints)
                 df = MapData(df, make_pdf_page_mapper(path, prefix, suffix, document_id))
             else:
                 df = DataFromList(lst=[{"path": path, "file_name": file_name, "image_bytes": b_bytes}])
@@ -357,8 +393,63 @@ class DoctectionPipe(Pipeline):
         """
         return self.page_parser.predict_dataflow(df)
 
+    def set_stage_workers(self, num_workers: int, service_id: Optional[str] = None, name: Optional[str] = None) -> None:
+        """
+        Set the number of workers of a pipeline component when running the pipeline in staged mode (i.e.
+        `analyze(..., staged=True)`). Additional workers are created by cloning the pipeline component.
+
+        Example:
+            ```python
+            pipe.set_stage_workers(2, name="text_extract_tesseract")
+            df = pipe.analyze(path="path/to/doc.pdf", staged=True)
+            ```
+
+        Args:
+            num_workers: Number of workers for the stage of the pipeline component.
+            service_id: Service id of the pipeline component.
+            name: Name of the pipeline component.
+        """
+        if num_workers < 1:
+            raise ValueError(f"num_workers must be a positive integer, but is {num_workers}")
+        component = self.get_pipeline_component(service_id=service_id, name=name)
+        self.stage_workers[component.name] = num_workers
+
+    def get_stage_queue_depths(self) -> dict[str, int]:
+        """
+        Returns the number of datapoints waiting in front of each stage of the most recent dataflow that has been
+        built with `analyze(..., staged=True)`.
+
+        Returns:
+            A dict with component names as keys and queue sizes as values. The key `output` counts the processed
+            datapoints that have not been consumed yet. Empty, if no staged dataflow is running.
+        """
+        if self._staged_df is None:
+            return {}
+        return self._staged_df.get_queue_depths()
+
+    def _build_staged_pipe(
+        self,
+        df: DataFlow,
+        pipeline_components: List[PipelineComponent],
+        queue_size: int,
+        batch_size: int = 1,
+        max_batch_wait: Optional[float] = None,
+    ) -> DataFlow:
+        for component in pipeline_components:
+            component.timer_on = True
+        if batch_size > 1:
+            df = TimedBatchData(df, batch_size=batch_size, max_wait=max_batch_wait)
+        self._staged_df = StagedPipelineData(
+            df, pipeline_components, queue_size=queue_size, num_workers=self.stage_workers, batched=batch_size > 1
+        )
+        df = self._staged_df
+        if batch_size > 1:
+            df = FlattenData(df)
+            df = MapData(df, lambda dp: dp[0])
+        return df
+
     def analyze(
-        self, **kwargs: Union[str, bytes, DataFlow, bool, int, PathLikeOrStr, Union[str, List[str]]]
+        self, **kwargs: Union[str, bytes, DataFlow, bool, int, float, PathLikeOrStr, Union[str, List[str]]]
     ) -> DataFlow:
         """
         Args:
@@ -371,6 +462,24 @@ class DoctectionPipe(Pipeline):
                  bytes: A bytes object of an image
                  file_type: Selection of the file type, if: args:`file_type` is passed
                  max_datapoints: Stops processing as soon as max_datapoints images have been processed
+                 batch_size: If larger than 1, pages are grouped into batches of at most `batch_size` pages and
+                             every pipeline component processes a whole batch at once. Components whose predictor
+                             accepts batches (e.g. `ImageLayoutService`) will run one batched prediction per batch.
+                             Defaults to 1.
+                 max_batch_wait: Maximum number of seconds a page waits for its batch to be completed. Only used if
+                                 `batch_size > 1`. Defaults to `None`, i.e. batches are only flushed once they are
+                                 complete or the input is exhausted.
+                 staged: If `True`, every pipeline component runs in its own stage (thread) and stages are connected
+                         with bounded queues, so that rendering, layout detection, OCR and the other components
+                         process different pages at the same time. The page order is preserved. Use
+                         `set_stage_workers` to run several workers for a stage and `get_stage_queue_depths` to
+                         monitor the stages. Defaults to `False`.
+                 stage_queue_size: Maximum number of pages waiting in front of each stage. Defaults to 4.
+                 num_workers: If larger than 1, pages of a document or files of a directory are sharded across
+                              `num_workers` worker processes. Every worker clones the pipeline components once
+                              (hence loads model weights once) and converts and processes the pages it receives.
+                              Results are returned in page order. Cannot be combined with `staged=True` or
+                              `batch_size > 1`. Defaults to 1.
 
         Returns:
             dataflow
@@ -378,11 +487,47 @@ class DoctectionPipe(Pipeline):
 
         output = kwargs.get("output", "page")
         assert output in ("page", "image", "dict"), "output must be either page image or dict"
-        df = self._entry(**kwargs)
-        df = self._build_pipe(df)
-        if output == "page":
-            df = self.dataflow_to_page(df)
-        elif output == "dict":
+        batch_size = kwargs.get("batch_size", 1)
+        if not isinstance(batch_size, int) or isinstance(batch_size, bool):
+            raise TypeError(f"batch_size must be of type int, but is of type {type(batch_size)}")
+        max_batch_wait = kwargs.get("max_batch_wait")
+        if not isinstance(max_batch_wait, (int, float, type(None))) or isinstance(max_batch_wait, bool):
+            raise TypeError(f"max_batch_wait must be of type float, but is of type {type(max_batch_wait)}")
+        staged = kwargs.get("staged", False)
+        if not isinstance(staged, bool):
+            raise TypeError(f"staged must be of type bool, but is of type {type(staged)}")
+        stage_queue_size = kwargs.get("stage_queue_size", 4)
+        if not isinstance(stage_queue_size, int) or isinstance(stage_queue_size, bool):
+            raise TypeError(f"stage_queue_size must be of type int, but is of type {type(stage_queue_size)}")
+
+        num_workers = kwargs.get("num_workers", 1)
+        if not isinstance(num_workers, int) or isinstance(num_workers, bool):
+            raise TypeError(f"num_workers must be of type int, but is of type {type(num_workers)}")
+        if num_workers > 1 and (staged or batch_size > 1):
+            raise ValueError("num_workers > 1 cannot be combined with staged=True or batch_size > 1")
+
+        to_page = output in ("page", "dict")
+        if num_workers > 1:
+            df, to_image_func = self._entry_and_image_mapper(**kwargs)
+            for component in self.pipe_component_list:
+                component.timer_on = True
+            df = MultiProcessPipelineData(
+                df, self.pipe_component_list, num_proc=num_workers, pre_proc_func=to_image_func
+            )
+        elif staged:
+            df = self._entry(**kwargs)
+            pipeline_components = list(self.pipe_component_list)
+            # Page parsing runs as last stage, unless pages are processed in batches
+            parse_in_stage = to_page and batch_size == 1
+            if parse_in_stage:
+                pipeline_components.append(self.page_parser)
+            df = self._build_staged_pipe(df, pipeline_components, stage_queue_size, batch_size, max_batch_wait)
+            to_page = to_page and not parse_in_stage
+        else:
+            df = self._entry(**kwargs)
+            df = self._build_pipe(df, batch_size=batch_size, max_batch_wait=max_batch_wait)
+        if to_page:
             df = self.dataflow_to_page(df)
+        if output == "dict":
             df = MapData(df, lambda dp: dp.base_image.as_dict())
         return df
@@ -29,8 +29,9 @@ from dd_core.mapper.misc import curry
 from dd_core.utils.error import ImageError
 from dd_core.utils.object_types import ObjectTypes
 from dd_core.utils.transform import PadTransform
+from dd_core.utils.types import PixelValues
 
-from ..extern.base import ObjectDetector, PdfMiner
+from ..extern.base import DetectionResult, ObjectDetector, PdfMiner
 from .base import PipelineComponent
 from .registry import pipeline_component_registry
 
@@ -123,20 +124,54 @@ class ImageLayoutService(PipelineComponent):
         Raises:
             ImageError: If `dp.image` is `None`.
         """
+        detect_result_list = self.predictor.predict(self._get_predictor_input(dp, self.padder))
+        self._dump_detect_results(detect_result_list, self.padder)
+
+    def serve_batch(self, dps: Sequence[Image]) -> None:
+        """
+        Serve the pipeline component on a batch of `Image`s.
+
+        All images are passed to `ObjectDetector.predict_batch` at once. The results are then scattered back to the
+        image they belong to.
+
+        Args:
+            dps: The `Image` datapoints to process.
+
+        Raises:
+            ImageError: If `dp.image` is `None` for one of the datapoints.
+        """
+        if not dps:
+            return
+        padders = [self._get_padder() for _ in dps]
+        batch_detect_result_list = self.predictor.predict_batch(
+            [self._get_predictor_input(dp, padder) for dp, padder in zip(dps, padders)]
+        )
+        for dp, padder, detect_result_list in zip(dps, padders, batch_detect_result_list):
+            self.dp_manager.datapoint = dp
+            self._dump_detect_results(detect_result_list, padder)
+
+    def _get_padder(self) -> Optional[PadTransform]:
+        # `PadTransform` stores the shape of the last padded image. Every image of a batch needs its own padder so that
+        # the padding of each image can be undone with its own shape.
+        return self.padder.clone() if self.padder else None
+
+    @staticmethod
+    def _get_predictor_input(dp: Image, padder: Optional[PadTransform]) -> PixelValues:
         if dp.image is None:
             raise ImageError("image cannot be None")
         np_image = dp.image
-        if self.padder:
-            np_image = self.padder.apply_image(np_image)
-        detect_result_list = self.predictor.predict(np_image)
-        if self.padder and detect_result_list:
+        if padder:
+            np_image = padder.apply_image(np_image)
+        return np_image
+
+    def _dump_detect_results(self, detect_result_list: list[DetectionResult], padder: Optional[PadTransform]) -> None:
+        if padder and detect_result_list:
             boxes = np.array([detect_result.box for detect_result in detect_result_list])
-            boxes_orig = self.padder.inverse_apply_coords(boxes)
+            boxes_orig = padder.inverse_apply_coords(boxes)
             for idx, detect_result in enumerate(detect_result_list):
                 detect_result.box = boxes_orig[idx, :].tolist()
 
-        for detect_result in detect_result_list:
-            self.dp_manager.set_image_annotation(detect_result, to_image=self.to_image, crop_image=self.crop_image)
+        self.dp_manager.set_image_annotations(detect_result_list, to_image=self.to_image, crop_image=self.crop_image)
 
     def get_meta_annotation(self) -> MetaAnnotation:
         if not isinstance(self.predictor, (ObjectDetector, PdfMiner)):
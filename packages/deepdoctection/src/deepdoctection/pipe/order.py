@@ -22,17 +22,19 @@ from __future__ import annotations
 
 import os
 from abc import ABC
+from bisect import bisect_left, bisect_right
 from copy import copy
 from itertools import chain
 from logging import DEBUG
 from typing import Any, Optional, Sequence, Union
 
 import numpy as np
+import numpy.typing as npt
 
 from dd_core.datapoint.annotation import ImageAnnotation
 from dd_core.datapoint.box import BoundingBox
 from dd_core.datapoint.box import ioa as np_ioa
-from dd_core.datapoint.box import merge_boxes
+from dd_core.datapoint.box import merge_boxes, np_round_box_coords
 from dd_core.datapoint.image import Image, MetaAnnotation
 from dd_core.datapoint.view import IMAGE_DEFAULTS
 from dd_core.utils.logger import LoggingRecord, logger
@@ -70,7 +72,9 @@ class OrderGenerator:
 
     @staticmethod
     def group_words_into_lines(
-        word_anns: Sequence[ImageAnnotation], image_id: Optional[str] = None
+        word_anns: Sequence[ImageAnnotation],
+        image_id: Optional[str] = None,
+        boxes: Optional[npt.NDArray[np.float32]] = None,
     ) -> list[tuple[int, int, str]]:
         """
         Arranges words into horizontal text lines and sorts text lines vertically to provide an enumeration of words
@@ -87,6 +91,8 @@ class OrderGenerator:
         Args:
             word_anns: Sequence of `ImageAnnotation` representing words.
             image_id: Optional image ID.
+            boxes: Optional `xyxy` boxes of `word_anns`, e.g. from `Image.get_annotation_boxes`. If not provided, the
+                   boxes will be taken from the annotations.
 
         Returns:
             List of triplets for every word annotation: (word reading order position, text line position, word
@@ -96,24 +102,41 @@ class OrderGenerator:
         """
         reading_lines = []
         rows: list[dict[str, float]] = []
-        for word in word_anns:
-            bounding_box = word.get_bounding_box(image_id)
-            row_found = False
-            for idx, row in enumerate(rows):
+        # centers of all rows in increasing order together with the row index. A row can only contain a word if the
+        # row center lies within the word or if the row center is at most half of the largest row height away from
+        # the center of the word. Only rows with centers in this window need to be checked.
+        row_centers: list[float] = []
+        row_center_indices: list[int] = []
+        max_half_row_height = 0.0
+        for word, (_, uly, _, lry, word_cx, word_cy) in zip(
+            word_anns, OrderGenerator._get_boxes(word_anns, image_id, boxes)
+        ):
+            margin = 1e-7 * (abs(word_cy) + max_half_row_height + 1.0)
+            window_start = bisect_left(row_centers, min(uly, word_cy - max_half_row_height) - margin)
+            window_end = bisect_right(row_centers, max(lry, word_cy + max_half_row_height) + margin)
+            row_idx = -1
+            for idx in row_center_indices[window_start:window_end]:
+                row = rows[idx]
                 row_cy = (row["upper"] + row["lower"]) / 2
                 # word belongs to row if center lies within the upper and lower bounds of the row or if the center y
                 # coordinate lies within the upper and lower bounds of the word bounding boxes.
                 # If word belongs to bound we do not update any row bounds. Thus, row bound are determined by the
-                # first word that defines the row
-                if (row["upper"] < bounding_box.cy < row["lower"]) or (bounding_box.uly < row_cy < bounding_box.lry):
-                    reading_lines.append((idx, word.annotation_id, bounding_box.cx))
-                    row_found = True
-                    break
+                # first word that defines the row. If several rows qualify, the word belongs to the row defined first.
+                if (row_idx == -1 or idx < row_idx) and (
+                    (row["upper"] < word_cy < row["lower"]) or (uly < row_cy < lry)
+                ):
+                    row_idx = idx
 
             # condition above not satisfied for any row, thus word defines a new row
-            if not row_found:
-                rows.append({"upper": bounding_box.uly, "lower": bounding_box.lry})
-                reading_lines.append((len(rows) - 1, word.annotation_id, bounding_box.cx))
+            if row_idx == -1:
+                row_idx = len(rows)
+                rows.append({"upper": uly, "lower": lry})
+                row_cy = (uly + lry) / 2
+                position = bisect_right(row_centers, row_cy)
+                row_centers.insert(position, row_cy)
+                row_center_indices.insert(position, row_idx)
+                max_half_row_height = max(max_half_row_height, (lry - uly) / 2)
+            reading_lines.append((row_idx, word.annotation_id, word_cx))
 
         rows_dict = {k: rows[k] for k in range(len(rows))}
         rows_dict = {
@@ -133,7 +156,9 @@ class OrderGenerator:
 
     @staticmethod
     def group_lines_into_lines(
-        line_anns: Sequence[ImageAnnotation], image_id: Optional[str] = None
+        line_anns: Sequence[ImageAnnotation],
+        image_id: Optional[str] = None,
+        boxes: Optional[npt.NDArray[np.float32]] = None,
     ) -> list[tuple[int, int, str]]:
         """
         Sorts reading lines.
@@ -144,6 +169,8 @@ class OrderGenerator:
         Args:
             line_anns: Sequence of text line `ImageAnnotation`.
             image_id: Image ID of underlying image (to get the bounding boxes).
+            boxes: Optional `xyxy` boxes of `line_anns`, e.g. from `Image.get_annotation_boxes`. If not provided, the
+                   boxes will be taken from the annotations.
 
         Returns:
             List of tuples (reading_order, reading_order, annotation_id).
@@ -153,14 +180,32 @@ class OrderGenerator:
             group_lines_into_lines(line_anns, image_id)
             ```
         """
-        reading_lines = []
-        for ann in line_anns:
-            bounding_box = ann.get_bounding_box(image_id)
-            reading_lines.append((bounding_box.cy, ann.annotation_id))
+        reading_lines = [
+            (cy, ann.annotation_id)
+            for ann, (*_, cy) in zip(line_anns, OrderGenerator._get_boxes(line_anns, image_id, boxes))
+        ]
         reading_lines.sort(key=lambda x: x[0])
         logger.debug(LoggingRecord("group_lines_into_lines", {"reading_lines": reading_lines}))
         return [(idx + 1, idx + 1, line[1]) for idx, line in enumerate(reading_lines)]
 
+    @staticmethod
+    def _get_boxes(
+        anns: Sequence[ImageAnnotation], image_id: Optional[str], boxes: Optional[npt.NDArray[np.float32]]
+    ) -> list[list[float]]:
+        """
+        `xyxy` boxes together with the centers `cx, cy`. Passed `boxes` are absolute and their centers are rounded like
+        `BoundingBox.cx` and `BoundingBox.cy`, so that the order does not depend on whether `boxes` are passed.
+        """
+        if boxes is None:
+            rows = []
+            for ann in anns:
+                bounding_box = ann.get_bounding_box(image_id)
+                rows.append([*bounding_box.to_list(mode="xyxy"), bounding_box.cx, bounding_box.cy])
+            return rows
+        np_boxes = np.asarray(boxes, dtype=np.float64)
+        centers = np.floor(np_boxes[:, :2] + 0.5 * (np_boxes[:, 2:] - np_boxes[:, :2]) + 0.5)
+        return np.concatenate([np_boxes, centers], axis=1).tolist()
+
     @staticmethod
     def _connected_components(columns: list[BoundingBox]) -> list[dict[str, Any]]:
         # building connected components of columns
@@ -184,22 +229,27 @@ class OrderGenerator:
             if not component_found:
                 connected_components.append({"top": col.uly, "bottom": col.lry, "left": col.ulx, "column": [col_dict]})
 
-            # next, sorting columns in connected components by increasing x-value. In order to be tolerant to
-            # nearby values we are rounding values we want to sort
-            for comp in connected_components:
-                for column in comp["column"]:
-                    column["box"].ulx = round(column["box"].ulx, 2)
-                    column["box"].uly = round(column["box"].uly, 2)
-                comp["column"].sort(key=lambda x: (x["box"].ulx, x["box"].uly))
-
-            # finally, sorting connected components by increasing y-value
+            # In order to be tolerant to nearby values when sorting columns, we are rounding values we want to sort.
+            # Columns are checked in order of their components, so components must be sorted by increasing y-value
+            # before the next column is added
+            col.ulx = round(col.ulx, 2)
+            col.uly = round(col.uly, 2)
             connected_components.sort(key=lambda x: x["top"])
+
+        # finally, sorting columns in connected components by increasing x-value
+        for comp in connected_components:
+            comp["column"].sort(key=lambda x: (x["box"].ulx, x["box"].uly))
         if logger.isEnabledFor(DEBUG):
             logger.debug(LoggingRecord("_connected_components", {"connected_components": str(connected_components)}))
         return connected_components
 
     def order_blocks(
-        self, anns: list[ImageAnnotation], image_width: float, image_height: float, image_id: Optional[str] = None
+        self,
+        anns: list[ImageAnnotation],
+        image_width: float,
+        image_height: float,
+        image_id: Optional[str] = None,
+        boxes: Optional[npt.NDArray[np.float32]] = None,
     ) -> Sequence[tuple[int, str]]:
         """
         Determines a text ordering of text blocks.
@@ -220,6 +270,8 @@ class OrderGenerator:
             image_width: Image width (to re-calculate bounding boxes into relative coordinates).
             image_height: Image height (to re-calculate bounding boxes into relative coordinates).
             image_id: Image ID.
+            boxes: Optional absolute `xyxy` boxes of `anns`, e.g. from `Image.get_annotation_boxes`. If not provided,
+                   the boxes will be taken from the annotations.
 
         Returns:
             List of tuples with reading order position and `annotation_id`.
@@ -228,19 +280,15 @@ class OrderGenerator:
             return []
         reading_blocks = []
         columns: list[BoundingBox] = []
-        anns.sort(
-            key=lambda x: (
-                x.get_bounding_box(image_id).transform(image_width, image_height).cy,
-                x.get_bounding_box(image_id).transform(image_width, image_height).cx,
-            )
+        rel_boxes = self._get_relative_boxes(anns, image_width, image_height, image_id, boxes)
+        order = sorted(
+            range(len(anns)),
+            key=lambda idx: (rel_boxes[idx][5], rel_boxes[idx][4]),
         )
-        for ann in anns:
-            bounding_box = ann.get_bounding_box(image_id)
-            if bounding_box.absolute_coords:
-                rel_coords_box = bounding_box.transform(image_width, image_height)
-            else:
-                rel_coords_box = bounding_box
-
+        anns[:] = [anns[idx] for idx in order]
+        rel_boxes = [rel_boxes[idx] for idx in order]
+        for ann, rel_coords_box in zip(anns, rel_boxes):
+            rel_ulx, rel_uly, rel_lrx, rel_lry, _, _, rel_height = rel_coords_box
             column_found = False
             for idx, col in enumerate(columns):
                 # if the x-coordinate left and right is within starting_point_tolerance (first_condition and
@@ -248,20 +296,20 @@ class OrderGenerator:
                 # then the annotation will belong to this column and column left/right will be re-adjusted
                 first_condition = all(
                     (
-                        col.ulx - self.starting_point_tolerance < rel_coords_box.ulx,
-                        rel_coords_box.lrx < col.lrx + self.starting_point_tolerance,
+                        col.ulx - self.starting_point_tolerance < rel_ulx,
+                        rel_lrx < col.lrx + self.starting_point_tolerance,
                     )
                 )
                 second_condition = all(
                     (
-                        rel_coords_box.ulx - self.starting_point_tolerance < col.ulx,
-                        col.lrx < rel_coords_box.lrx + self.starting_point_tolerance,
+                        rel_ulx - self.starting_point_tolerance < col.ulx,
+                        col.lrx < rel_lrx + self.starting_point_tolerance,
                     )
                 )
                 # broken line condition
-                third_condition = abs(rel_coords_box.ulx - col.lrx) < self.broken_line_tolerance
-                fourth_condition = abs(rel_coords_box.uly - col.lry) < self.height_tolerance * rel_coords_box.height
-                fifth_condition = abs(rel_coords_box.lry - col.uly) < self.height_tolerance * rel_coords_box.height
+                third_condition = abs(rel_ulx - col.lrx) < self.broken_line_tolerance
+                fourth_condition = abs(rel_uly - col.lry) < self.height_tolerance * rel_height
+                fifth_condition = abs(rel_lry - col.uly) < self.height_tolerance * rel_height
 
                 if (first_condition and (fourth_condition or fifth_condition)) or (  # pylint: disable=R0916
                     second_condition
@@ -270,23 +318,15 @@ class OrderGenerator:
                 ):
                     reading_blocks.append((idx, ann.annotation_id))
                     # update the top and right with the new line added.
-                    col.ulx = min(rel_coords_box.ulx, col.ulx)
-                    col.uly = min(rel_coords_box.uly, col.uly)
-                    col.lrx = max(rel_coords_box.lrx, col.lrx)
-                    col.lry = max(rel_coords_box.lry, col.lry)
+                    col.ulx = min(rel_ulx, col.ulx)
+                    col.uly = min(rel_uly, col.uly)
+                    col.lrx = max(rel_lrx, col.lrx)
+                    col.lry = max(rel_lry, col.lry)
                     column_found = True
                     break
 
             if not column_found:
-                columns.append(
-                    BoundingBox(
-                        absolute_coords=False,
-                        ulx=rel_coords_box.ulx,
-                        uly=rel_coords_box.uly,
-                        lrx=rel_coords_box.lrx,
-                        lry=rel_coords_box.lry,
-                    )
-                )
+                columns.append(BoundingBox(absolute_coords=False, ulx=rel_ulx, uly=rel_uly, lrx=rel_lrx, lry=rel_lry))
                 # update the top and right with the new reading block added.
                 reading_blocks.append((len(columns) - 1, ann.annotation_id))
         self.columns_detect_result = self._make_column_detect_results(columns)
@@ -311,9 +351,7 @@ class OrderGenerator:
         filtered_blocks: Sequence[tuple[int, str]]
         for idx in range(max_block_number + 1):
             filtered_blocks = list(filter(lambda x: x[0] == idx, blocks))  # type: ignore # pylint: disable=W0640
-            sorted_blocks.extend(
-                self._sort_anns_grouped_by_blocks(filtered_blocks, anns, image_width, image_height, image_id)
-            )
+            sorted_blocks.extend(self._sort_anns_grouped_by_blocks(filtered_blocks, anns, rel_boxes))
         reading_blocks = [(idx + 1, block[1]) for idx, block in enumerate(sorted_blocks)]
 
         if logger.isEnabledFor(DEBUG):
@@ -349,26 +387,46 @@ class OrderGenerator:
         return column_dict
 
     @staticmethod
-    def _sort_anns_grouped_by_blocks(
-        block: Sequence[tuple[int, str]],
+    def _get_relative_boxes(
         anns: Sequence[ImageAnnotation],
         image_width: float,
         image_height: float,
-        image_id: Optional[str] = None,
+        image_id: Optional[str],
+        boxes: Optional[npt.NDArray[np.float32]],
+    ) -> list[list[float]]:
+        """
+        Relative `xyxy` boxes together with the centers `cx, cy` and the height. The values are the same as the ones
+        of `BoundingBox.transform(image_width, image_height)`, including the rounding of relative coordinates, so that
+        the order does not depend on whether `boxes` are passed.
+        """
+        if boxes is None:
+            rows = []
+            for ann in anns:
+                rel_box = ann.get_bounding_box(image_id).transform(image_width, image_height)
+                rows.append([*rel_box.to_list(mode="xyxy"), rel_box.cx, rel_box.cy, rel_box.height])
+            return rows
+        # same clipping and rounding as `BoundingBox.transform`
+        scale = np.array([image_width, image_height, image_width, image_height], dtype=np.float64)
+        int_boxes = np_round_box_coords(np.clip(np.asarray(boxes, dtype=np.float64) / scale, 0.0, 1.0), False)
+        rel_boxes = int_boxes / BoundingBox.RELATIVE_COORD_SCALE_FACTOR
+        sizes = (int_boxes[:, 2:] - int_boxes[:, :2]) / BoundingBox.RELATIVE_COORD_SCALE_FACTOR
+        centers = rel_boxes[:, :2] + 0.5 * sizes
+        return np.concatenate([rel_boxes, centers, sizes[:, 1:]], axis=1).tolist()
+
+    @staticmethod
+    def _sort_anns_grouped_by_blocks(
+        block: Sequence[tuple[int, str]],
+        anns: Sequence[ImageAnnotation],
+        rel_boxes: Sequence[Sequence[float]],
     ) -> list[tuple[int, str]]:
         if not block:
             return []
         anns_and_blocks_numbers = list(zip(*block))
-        ann_ids = anns_and_blocks_numbers[1]
+        ann_ids = set(anns_and_blocks_numbers[1])
         block_number = anns_and_blocks_numbers[0][0]
-        block_anns = [ann for ann in anns if ann.annotation_id in ann_ids]
-        block_anns.sort(
-            key=lambda x: (
-                round(x.get_bounding_box(image_id).transform(image_width, image_height).uly, 2),
-                round(x.get_bounding_box(image_id).transform(image_width, image_height).ulx, 2),
-            )
-        )
-        return [(block_number, ann.annotation_id) for ann in block_anns]
+        block_anns = [(ann, rel_box) for ann, rel_box in zip(anns, rel_boxes) if ann.annotation_id in ann_ids]
+        block_anns.sort(key=lambda x: (round(x[1][1], 2), round(x[1][0], 2)))
+        return [(block_number, ann.annotation_id) for ann, _ in block_anns]
 
     @staticmethod
     def _make_column_detect_results(columns: Sequence[BoundingBox]) -> Sequence[DetectionResult]:
@@ -455,11 +513,12 @@ class TextLineGenerator:
         number_rows = max(word[1] for word in word_order_list)
         if number_rows == 1 and not highest_level:
             return []
+        # word annotation_ids for every text line
+        ann_ids_per_row: dict[int, list[str]] = {number_row: [] for number_row in range(1, number_rows + 1)}
+        for word_order in word_order_list:
+            ann_ids_per_row[word_order[1]].append(word_order[2])
         detection_result_list = []
-        for number_row in range(1, number_rows + 1):
-            # list of  (word index, text line, word annotation_id) for text line equal to number_row
-            ann_meta_per_row = [ann_meta for ann_meta in word_order_list if ann_meta[1] == number_row]
-            ann_ids = [ann_meta[2] for ann_meta in ann_meta_per_row]
+        for ann_ids in ann_ids_per_row.values():
             anns_per_row = [word_anns_dict[ann_id] for ann_id in ann_ids]
             anns_per_row.sort(key=lambda x: x.get_bounding_box(image_id).ulx)
 
@@ -474,19 +533,16 @@ class TextLineGenerator:
             else:
                 sub_line = []
                 sub_line_ann_ids = []
+                prev_box = None
                 for idx, ann in enumerate(anns_per_row):
-                    if idx == 0:
-                        sub_line = [ann]
-                        sub_line_ann_ids = [ann.annotation_id]
-                        continue
-
-                    prev_box = anns_per_row[idx - 1].get_bounding_box(image_id)
                     current_box = ann.get_bounding_box(image_id)
-
-                    if prev_box.absolute_coords:
-                        prev_box = prev_box.transform(image_width, image_height)
                     if current_box.absolute_coords:
                         current_box = current_box.transform(image_width, image_height)
+                    if prev_box is None:
+                        sub_line = [ann]
+                        sub_line_ann_ids = [ann.annotation_id]
+                        prev_box = current_box
+                        continue
 
                     # If distance between boxes is lower than paragraph break, same sub-line
                     if current_box.ulx - prev_box.lrx < self.paragraph_break:  # type: ignore
@@ -520,6 +576,7 @@ class TextLineGenerator:
                             merge_box = merge_boxes(*boxes)
                             detection_result = self._make_detect_result(merge_box, {"child": sub_line_ann_ids})
                             detection_result_list.append(detection_result)
+                    prev_box = current_box
 
         return detection_result_list
 
@@ -736,7 +793,7 @@ class TextOrderService(TextLineServiceMixin):
         text_container_anns = dp.get_annotation(category_names=self.text_container)
         text_block_anns = dp.get_annotation(category_names=self.text_block_categories)
         if self.include_residual_text_container:
-            mapped_text_container_ids = list(
+            mapped_text_container_ids = set(
                 chain(*[text_block.get_relationship(RelationshipKey.CHILD) for text_block in text_block_anns])
             )
             residual_text_container_anns = [
@@ -775,14 +832,12 @@ class TextOrderService(TextLineServiceMixin):
         text_container_ann = self.dp_manager.datapoint.get_annotation(
             annotation_ids=text_container_ids, category_names=self.text_container
         )
+        dp = self.dp_manager.datapoint
+        boxes = dp.get_annotation_boxes(text_container_ann)
         if self.text_container == LayoutLabel.WORD:
-            word_order_list = self.order_generator.group_words_into_lines(
-                text_container_ann, self.dp_manager.datapoint.image_id
-            )
+            word_order_list = self.order_generator.group_words_into_lines(text_container_ann, dp.image_id, boxes)
         else:
-            word_order_list = self.order_generator.group_lines_into_lines(
-                text_container_ann, self.dp_manager.datapoint.image_id
-            )
+            word_order_list = self.order_generator.group_lines_into_lines(text_container_ann, dp.image_id, boxes)
         for word_order in word_order_list:
             self.dp_manager.set_category_annotation(
                 RelationshipKey.READING_ORDER, word_order[0], RelationshipKey.READING_ORDER, word_order[2]
@@ -795,8 +850,9 @@ class TextOrderService(TextLineServiceMixin):
         Args:
             text_block_anns: List of `ImageAnnotation`.
         """
+        dp = self.dp_manager.datapoint
         block_order_list = self.order_generator.order_blocks(
-            text_block_anns, self.dp_manager.datapoint.width, self.dp_manager.datapoint.height
+            text_block_anns, dp.width, dp.height, boxes=dp.get_annotation_boxes(text_block_anns)
         )
         for word_order in block_order_list:
             self.dp_manager.set_category_annotation(
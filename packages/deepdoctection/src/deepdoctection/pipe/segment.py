@@ -26,6 +26,7 @@ from dataclasses import dataclass
 from typing import Literal, Optional, Sequence, Union
 
 import numpy as np
+from numpy.typing import NDArray
 
 from dd_core.datapoint.annotation import ImageAnnotation
 from dd_core.datapoint.box import (
@@ -38,7 +39,7 @@ from dd_core.datapoint.box import (
 )
 from dd_core.datapoint.image import Image, MetaAnnotation
 from dd_core.mapper.maputils import MappingContextManager
-from dd_core.mapper.match import match_anns_by_intersection
+from dd_core.mapper.match import match_anns_by_intersection, match_boxes_by_intersection
 from dd_core.utils.error import ImageError
 from dd_core.utils.object_types import (
     CellKey,
@@ -52,6 +53,7 @@ from dd_core.utils.object_types import (
 )
 
 from ..extern.base import DetectionResult
+from .anngen import DatapointManager
 from .base import PipelineComponent
 from .refine import generate_html_payload
 from .registry import pipeline_component_registry
@@ -489,6 +491,73 @@ def _default_segment_table(cells: list[ImageAnnotation]) -> list[SegmentationRes
     return raw_table_segments
 
 
+def _get_item_numbers(
+    items: Sequence[ImageAnnotation], item_index: NDArray[np.int64], sub_item_name: ObjectTypes
+) -> NDArray[np.int64]:
+    """
+    Row or column numbers of items as array. Only the numbers of items that have been matched with some cell are
+    queried, all other entries are 0.
+    """
+    item_numbers = np.zeros(len(items), dtype=np.int64)
+    for k in np.unique(item_index):
+        item_numbers[k] = items[k].get_sub_category(sub_item_name).category_id
+    return item_numbers
+
+
+def _aggregate_items_per_cell(
+    num_cells: int, cell_index: NDArray[np.int64], item_index: NDArray[np.int64], item_numbers: NDArray[np.int64]
+) -> tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.int64]]:
+    """
+    Reduces pairs of matched cells and items (rows or columns) to one result per cell.
+
+    Args:
+        num_cells: Number of cells.
+        cell_index: Cell indices of matched pairs.
+        item_index: Item indices of matched pairs.
+        item_numbers: Row or column numbers of all items.
+
+    Returns:
+        Number of matched items per cell, index of the matched item with the smallest number and index of the matched
+        item with the largest number. Among items with equal numbers, the one with the lowest index is chosen. Cells
+        without any item have index -1.
+    """
+    num_items = np.bincount(cell_index, minlength=num_cells)
+    min_item = np.full(num_cells, -1, dtype=np.int64)
+    max_item = np.full(num_cells, -1, dtype=np.int64)
+    if len(cell_index):
+        numbers = item_numbers[item_index]
+        for target, sign in ((min_item, 1), (max_item, -1)):
+            order = np.lexsort((item_index, sign * numbers, cell_index))
+            sorted_cells = cell_index[order]
+            first = np.ones(len(order), dtype=bool)
+            first[1:] = sorted_cells[1:] != sorted_cells[:-1]
+            target[sorted_cells[first]] = item_index[order][first]
+    return num_items, min_item, max_item
+
+
+def _match_cells_with_items(
+    dp: Image,
+    cells: Sequence[ImageAnnotation],
+    rows: Sequence[ImageAnnotation],
+    columns: Sequence[ImageAnnotation],
+    segment_rule: Literal["iou", "ioa"],
+    threshold_rows: float,
+    threshold_cols: float,
+) -> tuple[tuple[NDArray[np.int64], NDArray[np.int64]], tuple[NDArray[np.int64], NDArray[np.int64]]]:
+    """
+    Pairs of cell/row indices and pairs of cell/column indices with weighted `iou`/`ioa` above the thresholds. The
+    boxes of all cells, rows and columns of the table are taken from the box array of the image once.
+    """
+    cell_boxes = dp.get_annotation_boxes(cells)
+    rows_match = match_boxes_by_intersection(
+        cell_boxes, dp.get_annotation_boxes(rows), segment_rule, threshold_rows, use_weighted_intersections=True
+    )
+    cols_match = match_boxes_by_intersection(
+        cell_boxes, dp.get_annotation_boxes(columns), segment_rule, threshold_cols, use_weighted_intersections=True
+    )
+    return rows_match, cols_match
+
+
 def segment_table(
     dp: Image,
     table: ImageAnnotation,
@@ -521,54 +590,31 @@ def segment_table(
     """
 
     child_ann_ids = table.get_relationship(RelationshipKey.CHILD)
-    cell_index_rows, row_index, _, _ = match_anns_by_intersection(
-        dp,
-        parent_ann_category_names=item_names[0],
-        child_ann_category_names=cell_names,
-        matching_rule=segment_rule,
-        threshold=threshold_rows,
-        use_weighted_intersections=True,
-        # Rows and columns are child annotations of the table.
-        parent_ann_ids=child_ann_ids,
-        child_ann_ids=child_ann_ids,
-    )
-
-    cell_index_cols, col_index, _, _ = match_anns_by_intersection(
-        dp,
-        parent_ann_category_names=item_names[1],
-        child_ann_category_names=cell_names,
-        matching_rule=segment_rule,
-        threshold=threshold_cols,
-        use_weighted_intersections=True,
-        # Rows and columns are child annotations of the table.
-        parent_ann_ids=child_ann_ids,
-        child_ann_ids=child_ann_ids,
-    )
-
     cells = dp.get_annotation(annotation_ids=child_ann_ids, category_names=cell_names)
-
     rows = dp.get_annotation(annotation_ids=child_ann_ids, category_names=item_names[0])
     columns = dp.get_annotation(annotation_ids=child_ann_ids, category_names=item_names[1])
 
-    raw_table_segments = []
-    with MappingContextManager(dp_name=dp.file_name) as segment_mapping_context:
-        for idx, cell in enumerate(cells):
-            cell_positions_rows = cell_index_rows == idx
-            rows_of_cell = [rows[k] for k in row_index[cell_positions_rows]]
-            rs = np.count_nonzero(cell_index_rows == idx)
-            if len(rows_of_cell):
-                row_number = min(row.get_sub_category(CellKey.ROW_NUMBER).category_id for row in rows_of_cell)
-            else:
-                row_number = 0
+    if not cells:
+        return []
+    if not rows or not columns:
+        return _default_segment_table(cells)
 
-            cell_positions_cols = cell_index_cols == idx
-            cols_of_cell = [columns[k] for k in col_index[cell_positions_cols]]
-            cs = np.count_nonzero(cell_index_cols == idx)
-            if len(cols_of_cell):
-                col_number = min(col.get_sub_category(CellKey.COLUMN_NUMBER).category_id for col in cols_of_cell)
-            else:
-                col_number = 0
+    (cell_index_rows, row_index), (cell_index_cols, col_index) = _match_cells_with_items(
+        dp, cells, rows, columns, segment_rule, threshold_rows, threshold_cols
+    )
 
+    raw_table_segments = []
+    with MappingContextManager(dp_name=dp.file_name) as segment_mapping_context:
+        row_numbers = _get_item_numbers(rows, row_index, CellKey.ROW_NUMBER)
+        col_numbers = _get_item_numbers(columns, col_index, CellKey.COLUMN_NUMBER)
+        row_spans, min_rows, _ = _aggregate_items_per_cell(len(cells), cell_index_rows, row_index, row_numbers)
+        col_spans, min_cols, _ = _aggregate_items_per_cell(len(cells), cell_index_cols, col_index, col_numbers)
+        cell_row_numbers = np.where(row_spans > 0, row_numbers[min_rows], 0)
+        cell_col_numbers = np.where(col_spans > 0, col_numbers[min_cols], 0)
+
+        for cell, row_number, col_number, rs, cs in zip(
+            cells, cell_row_numbers.tolist(), cell_col_numbers.tolist(), row_spans.tolist(), col_spans.tolist()
+        ):
             raw_table_segments.append(
                 SegmentationResult(
                     annotation_id=cell.annotation_id,
@@ -612,6 +658,7 @@ def create_intersection_cells(
     idx = 0
     break_outer_loop = False
     for row in rows:
+        row_number = row.get_sub_category(sub_item_names[0]).category_id
         for col in cols:
             detect_result_cells.append(
                 DetectionResult(
@@ -623,7 +670,7 @@ def create_intersection_cells(
             segment_result_cells.append(
                 SegmentationResult(
                     annotation_id="",
-                    row_num=row.get_sub_category(sub_item_names[0]).category_id,
+                    row_num=row_number,
                     col_num=col.get_sub_category(sub_item_names[1]).category_id,
                     rs=1,
                     cs=1,
@@ -715,73 +762,51 @@ def segment_pubtables(
     """
 
     child_ann_ids = table.get_relationship(RelationshipKey.CHILD)
-    cell_index_rows, row_index, _, _ = match_anns_by_intersection(
-        dp,
-        parent_ann_category_names=item_names[0],
-        child_ann_category_names=spanning_cell_names,
-        matching_rule=segment_rule,
-        threshold=threshold_rows,
-        use_weighted_intersections=True,
-        # Rows and columns are child annotations of the table.
-        parent_ann_ids=child_ann_ids,
-        child_ann_ids=child_ann_ids,
-    )
-
-    cell_index_cols, col_index, _, _ = match_anns_by_intersection(
-        dp,
-        parent_ann_category_names=item_names[1],
-        child_ann_category_names=spanning_cell_names,
-        matching_rule=segment_rule,
-        threshold=threshold_cols,
-        use_weighted_intersections=True,
-        # Rows and columns are child annotations of the table.
-        parent_ann_ids=child_ann_ids,
-        child_ann_ids=child_ann_ids,
-    )
-
     spanning_cells = dp.get_annotation(annotation_ids=child_ann_ids, category_names=spanning_cell_names)
-
     rows = dp.get_annotation(annotation_ids=child_ann_ids, category_names=item_names[0])
     columns = dp.get_annotation(annotation_ids=child_ann_ids, category_names=item_names[1])
 
+    if not spanning_cells:
+        return []
+    if not rows or not columns:
+        return _default_segment_table(spanning_cells)
+
+    (cell_index_rows, row_index), (cell_index_cols, col_index) = _match_cells_with_items(
+        dp, spanning_cells, rows, columns, segment_rule, threshold_rows, threshold_cols
+    )
+
     raw_table_segments = []
 
     with MappingContextManager(dp_name=dp.file_name) as segment_mapping_context:
+        row_numbers = _get_item_numbers(rows, row_index, CellKey.ROW_NUMBER)
+        col_numbers = _get_item_numbers(columns, col_index, CellKey.COLUMN_NUMBER)
+        num_rows_of_cells, min_rows, max_rows = _aggregate_items_per_cell(
+            len(spanning_cells), cell_index_rows, row_index, row_numbers
+        )
+        num_cols_of_cells, min_cols, max_cols = _aggregate_items_per_cell(
+            len(spanning_cells), cell_index_cols, col_index, col_numbers
+        )
+
         for idx, cell in enumerate(spanning_cells):
-            cell_positions_rows = cell_index_rows == idx
-            rows_of_cell = [rows[k] for k in row_index[cell_positions_rows]]
-            if rows_of_cell:
-                min_row_cell = min(rows_of_cell, key=lambda row: row.get_sub_category(CellKey.ROW_NUMBER).category_id)
-                max_row_cell = max(rows_of_cell, key=lambda row: row.get_sub_category(CellKey.ROW_NUMBER).category_id)
-                max_row = max_row_cell.get_sub_category(CellKey.ROW_NUMBER).category_id
-                min_row = min_row_cell.get_sub_category(CellKey.ROW_NUMBER).category_id
-                rs = max_row - min_row + 1
-                row_number = min_row
+            if num_rows_of_cells[idx]:
+                row_number = int(row_numbers[min_rows[idx]])
+                rs = int(row_numbers[max_rows[idx]]) - row_number + 1
             else:
                 rs = 0
                 row_number = 0
 
-            cell_positions_cols = cell_index_cols == idx
-            cols_of_cell = [columns[k] for k in col_index[cell_positions_cols]]
-
-            if cols_of_cell:
-                min_col_cell = min(
-                    cols_of_cell, key=lambda col: col.get_sub_category(CellKey.COLUMN_NUMBER).category_id
-                )
-                max_col_cell = max(
-                    cols_of_cell, key=lambda col: col.get_sub_category(CellKey.COLUMN_NUMBER).category_id
-                )
-                max_col = max_col_cell.get_sub_category(CellKey.COLUMN_NUMBER).category_id
-                min_col = min_col_cell.get_sub_category(CellKey.COLUMN_NUMBER).category_id
-                cs = max_col - min_col + 1
-                col_number = min_col
+            if num_cols_of_cells[idx]:
+                col_number = int(col_numbers[min_cols[idx]])
+                cs = int(col_numbers[max_cols[idx]]) - col_number + 1
             else:
                 cs = 0
                 col_number = 0
 
-            if rows_of_cell and cols_of_cell:
+            if num_rows_of_cells[idx] and num_cols_of_cells[idx]:
                 # We resize all bounding boxes of spanning cells so that they match with the grid structure, determined
                 # by the rows ans columns.
+                min_row_cell, max_row_cell = rows[min_rows[idx]], rows[max_rows[idx]]
+                min_col_cell, max_col_cell = columns[min_cols[idx]], columns[max_cols[idx]]
                 merge_box_image_row = merge_boxes(
                     *[min_row_cell.get_bounding_box(dp.image_id), max_row_cell.get_bounding_box(dp.image_id)]
                 )
@@ -836,6 +861,24 @@ def segment_pubtables(
     return raw_table_segments
 
 
+def set_segment_results(dp_manager: DatapointManager, segment_results: Sequence[SegmentationResult]) -> None:
+    """
+    Dumps row number, column number, row span and column span of segmentation results as sub categories to the cells.
+
+    Args:
+        dp_manager: The `DatapointManager` of the pipeline component.
+        segment_results: `SegmentationResult`s with `annotation_id` of the cells.
+    """
+    annotation_ids = [segment_result.annotation_id for segment_result in segment_results]
+    for sub_cat_key, category_ids in (
+        (CellKey.ROW_NUMBER, [segment_result.row_num for segment_result in segment_results]),
+        (CellKey.COLUMN_NUMBER, [segment_result.col_num for segment_result in segment_results]),
+        (CellKey.ROW_SPAN, [segment_result.rs for segment_result in segment_results]),
+        (CellKey.COLUMN_SPAN, [segment_result.cs for segment_result in segment_results]),
+    ):
+        dp_manager.set_category_annotations(sub_cat_key, category_ids, sub_cat_key, annotation_ids)
+
+
 @pipeline_component_registry.register("TableSegmentationService")
 class TableSegmentationService(PipelineComponent):
     """
@@ -949,10 +992,12 @@ class TableSegmentationService(PipelineComponent):
                     )
                 )
 
-                for item_number, item in enumerate(items, 1):
-                    self.dp_manager.set_category_annotation(
-                        sub_item_name, item_number, sub_item_name, item.annotation_id
-                    )
+                self.dp_manager.set_category_annotations(
+                    sub_item_name,
+                    list(range(1, len(items) + 1)),
+                    sub_item_name,
+                    [item.annotation_id for item in items],
+                )
             raw_table_segments = segment_table(
                 dp,
                 table,
@@ -962,19 +1007,7 @@ class TableSegmentationService(PipelineComponent):
                 self.threshold_rows,
                 self.threshold_cols,
             )
-            for segment_result in raw_table_segments:
-                self.dp_manager.set_category_annotation(
-                    CellKey.ROW_NUMBER, segment_result.row_num, CellKey.ROW_NUMBER, segment_result.annotation_id
-                )
-                self.dp_manager.set_category_annotation(
-                    CellKey.COLUMN_NUMBER, segment_result.col_num, CellKey.COLUMN_NUMBER, segment_result.annotation_id
-                )
-                self.dp_manager.set_category_annotation(
-                    CellKey.ROW_SPAN, segment_result.rs, CellKey.ROW_SPAN, segment_result.annotation_id
-                )
-                self.dp_manager.set_category_annotation(
-                    CellKey.COLUMN_SPAN, segment_result.cs, CellKey.COLUMN_SPAN, segment_result.annotation_id
-                )
+            set_segment_results(self.dp_manager, raw_table_segments)
 
             if table.image:
                 cells = table.image.get_annotation(category_names=self.cell_names)
@@ -1208,27 +1241,19 @@ class PubtablesSegmentationService(PipelineComponent):
             detect_result_cells, segment_result_cells = create_intersection_cells(
                 rows, columns, table.annotation_id, self.sub_item_names
             )
-            cell_rn_cn_to_ann_id = {}
-            for detect_result, segment_result in zip(detect_result_cells, segment_result_cells):
-                segment_result.annotation_id = self.dp_manager.set_image_annotation(  # type: ignore
-                    detect_result,
-                    to_annotation_id=table.annotation_id,
-                    to_image=self.cell_to_image,
-                    crop_image=self.crop_cell_image,
-                )
-                self.dp_manager.set_category_annotation(
-                    CellKey.ROW_NUMBER, segment_result.row_num, CellKey.ROW_NUMBER, segment_result.annotation_id
-                )
-                self.dp_manager.set_category_annotation(
-                    CellKey.COLUMN_NUMBER, segment_result.col_num, CellKey.COLUMN_NUMBER, segment_result.annotation_id
-                )
-                self.dp_manager.set_category_annotation(
-                    CellKey.ROW_SPAN, segment_result.rs, CellKey.ROW_SPAN, segment_result.annotation_id
-                )
-                self.dp_manager.set_category_annotation(
-                    CellKey.COLUMN_SPAN, segment_result.cs, CellKey.COLUMN_SPAN, segment_result.annotation_id
-                )
-                cell_rn_cn_to_ann_id[(segment_result.row_num, segment_result.col_num)] = segment_result.annotation_id
+            cell_ann_ids = self.dp_manager.set_image_annotations(
+                detect_result_cells,
+                to_annotation_id=table.annotation_id,
+                to_image=self.cell_to_image,
+                crop_image=self.crop_cell_image,
+            )
+            for segment_result, cell_ann_id in zip(segment_result_cells, cell_ann_ids):
+                segment_result.annotation_id = cell_ann_id  # type: ignore
+            set_segment_results(self.dp_manager, segment_result_cells)
+            cell_rn_cn_to_ann_id = {
+                (segment_result.row_num, segment_result.col_num): segment_result.annotation_id
+                for segment_result in segment_result_cells
+            }
 
             spanning_cell_raw_segments = segment_pubtables(
                 dp,
@@ -228,25 +228,86 @@ class SubImageLayoutService(PipelineComponent):
         - Optionally invoke the `DetectResultGenerator`.
         - Generate `ImageAnnotations` and dump to parent image and sub image.
 
+        If the detector accepts batches, all sub images of the page are passed to `ObjectDetector.predict_batch` at
+        once.
+
         Args:
             dp: `Image` to process.
         """
         sub_image_anns = dp.get_annotation(category_names=self.sub_image_name, service_ids=self.service_ids)
+        if self.predictor.accepts_batch:
+            if sub_image_anns:
+                padders = [self._get_padder() for _ in sub_image_anns]
+                batch_detect_result_list = self.predictor.predict_batch(
+                    [
+                        self.prepare_np_image(sub_image_ann, padder)
+                        for sub_image_ann, padder in zip(sub_image_anns, padders)
+                    ]
+                )
+                for sub_image_ann, padder, detect_result_list in zip(sub_image_anns, padders, batch_detect_result_list):
+                    self._dump_detect_results(sub_image_ann, detect_result_list, padder)
+            return
         for sub_image_ann in sub_image_anns:
             np_image = self.prepare_np_image(sub_image_ann)
             detect_result_list = self.predictor.predict(np_image)
-            if self.padder and detect_result_list:
-                boxes = np.array([detect_result.box for detect_result in detect_result_list])
-                boxes_orig = self.padder.inverse_apply_coords(boxes)
-                for idx, detect_result in enumerate(detect_result_list):
-                    detect_result.box = boxes_orig[idx, :].tolist()
-            if self.detect_result_generator and sub_image_ann.image:
-                self.detect_result_generator.width = sub_image_ann.image.width
-                self.detect_result_generator.height = sub_image_ann.image.height
-                detect_result_list = self.detect_result_generator.create_detection_result(detect_result_list)
-
-            for detect_result in detect_result_list:
-                self.dp_manager.set_image_annotation(detect_result, sub_image_ann.annotation_id)
+            self._dump_detect_results(sub_image_ann, detect_result_list, self.padder)
+
+    def serve_batch(self, dps: Sequence[Image]) -> None:
+        """
+        Serve the pipeline component on a batch of `Image`s.
+
+        If the detector accepts batches, the sub images of all pages are passed to `ObjectDetector.predict_batch` at
+        once, e.g. all tables of a batch of pages are presented to a cell detector in one forward pass. The results are
+        then scattered back to the sub image annotations they belong to.
+
+        Args:
+            dps: The `Image` datapoints to process.
+        """
+        if not self.predictor.accepts_batch:
+            super().serve_batch(dps)
+            return
+        sub_image_anns_per_dp: list[list[ImageAnnotation]] = []
+        padders: list[Optional[PadTransform]] = []
+        predictor_inputs: list[PixelValues] = []
+        for dp in dps:
+            self.dp_manager.datapoint = dp
+            sub_image_anns = dp.get_annotation(category_names=self.sub_image_name, service_ids=self.service_ids)
+            sub_image_anns_per_dp.append(sub_image_anns)
+            for sub_image_ann in sub_image_anns:
+                padder = self._get_padder()
+                padders.append(padder)
+                predictor_inputs.append(self.prepare_np_image(sub_image_ann, padder))
+        batch_detect_result_list = self.predictor.predict_batch(predictor_inputs) if predictor_inputs else []
+
+        position = 0
+        for dp, sub_image_anns in zip(dps, sub_image_anns_per_dp):
+            self.dp_manager.datapoint = dp
+            for sub_image_ann in sub_image_anns:
+                self._dump_detect_results(sub_image_ann, batch_detect_result_list[position], padders[position])
+                position += 1
+
+    def _get_padder(self) -> Optional[PadTransform]:
+        # `PadTransform` stores the shape of the last padded image. Every sub image of a batch needs its own padder so
+        # that the padding of each sub image can be undone with its own shape.
+        return self.padder.clone() if self.padder else None
+
+    def _dump_detect_results(
+        self,
+        sub_image_ann: ImageAnnotation,
+        detect_result_list: list[DetectionResult],
+        padder: Optional[PadTransform],
+    ) -> None:
+        if padder and detect_result_list:
+            boxes = np.array([detect_result.box for detect_result in detect_result_list])
+            boxes_orig = padder.inverse_apply_coords(boxes)
+            for idx, detect_result in enumerate(detect_result_list):
+                detect_result.box = boxes_orig[idx, :].tolist()
+        if self.detect_result_generator and sub_image_ann.image:
+            self.detect_result_generator.width = sub_image_ann.image.width
+            self.detect_result_generator.height = sub_image_ann.image.height
+            detect_result_list = self.detect_result_generator.create_detection_result(detect_result_list)
+
+        self.dp_manager.set_image_annotations(detect_result_list, sub_image_ann.annotation_id)
 
     def get_meta_annotation(self) -> MetaAnnotation:
         if not isinstance(self.predictor, (ObjectDetector, PdfMiner)):
@@ -277,7 +338,7 @@ class SubImageLayoutService(PipelineComponent):
             padder_clone,
         )
 
-    def prepare_np_image(self, sub_image_ann: ImageAnnotation) -> PixelValues:
+    def prepare_np_image(self, sub_image_ann: ImageAnnotation, padder: Optional[PadTransform] = None) -> PixelValues:
         """
         Maybe crop and pad a `np_array` before passing it to the predictor.
 
@@ -287,6 +348,7 @@ class SubImageLayoutService(PipelineComponent):
 
         Args:
             sub_image_ann: `ImageAnnotation` to be processed.
+            padder: `PadTransform` to pad the `np_image` with. Defaults to the `padder` of the service.
 
         Returns:
             Processed `np_image`.
@@ -304,8 +366,9 @@ class SubImageLayoutService(PipelineComponent):
                 self.dp_manager.datapoint.width,
                 self.dp_manager.datapoint.height,
             )
-        if self.padder:
-            np_image = self.padder.apply_image(np_image)
+        padder = padder or self.padder
+        if padder:
+            np_image = padder.apply_image(np_image)
         return np_image
 
     def clear_predictor(self) -> None:
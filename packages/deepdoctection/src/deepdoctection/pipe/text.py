@@ -28,9 +28,10 @@ from dd_core.datapoint.annotation import ImageAnnotation
 from dd_core.datapoint.image import Image, MetaAnnotation
 from dd_core.utils.error import ImageError
 from dd_core.utils.object_types import ObjectTypes, PageKey, TypeOrStr, WordKey, get_type
+from dd_core.utils.pdf_utils import PdfPage
 from dd_core.utils.types import PixelValues
 
-from ..extern.base import ObjectDetector, PdfMiner, TextRecognizer
+from ..extern.base import DetectionResult, ObjectDetector, PdfMiner, TextRecognizer
 from ..extern.tessocr import TesseractOcrDetector
 from .base import PipelineComponent
 from .registry import pipeline_component_registry
@@ -112,6 +113,9 @@ class TextExtractionService(PipelineComponent):
 
     def serve(self, dp: Image) -> None:
         maybe_batched_text_rois = self.get_text_rois(dp)
+        if self.extract_from_category and isinstance(self.predictor, ObjectDetector) and self.predictor.accepts_batch:
+            self._serve_text_rois(dp, maybe_batched_text_rois)  # type: ignore
+            return
         for text_roi in maybe_batched_text_rois:
             ann_id = None
             if isinstance(text_roi, ImageAnnotation):
@@ -128,29 +132,87 @@ class TextExtractionService(PipelineComponent):
                 detect_result_list = self.predictor.predict(predictor_input)  # type: ignore
                 if isinstance(self.predictor, PdfMiner):
                     width, height = self.predictor.get_width_height(predictor_input)  # type: ignore
+                self._dump_detect_results(detect_result_list, ann_id, width, height)
 
-                for detect_result in detect_result_list:
-                    if width is not None and height is not None:
-                        box = detect_result.box
-                        if box:
-                            if box[0] >= width or box[1] >= height or box[2] >= width or box[3] >= height:
-                                continue
-
-                    if isinstance(self.predictor, TextRecognizer):
-                        detect_ann_id = detect_result.uuid
-                    else:
-                        detect_ann_id = self.dp_manager.set_image_annotation(
-                            detect_result, ann_id, True, detect_result_max_width=width, detect_result_max_height=height
-                        )
-                    if detect_ann_id is not None:
-                        self.dp_manager.set_container_annotation(
-                            WordKey.CHARACTERS,
-                            None,
-                            WordKey.CHARACTERS,
-                            detect_ann_id,
-                            detect_result.text if detect_result.text is not None else "",
-                            detect_result.score,
-                        )
+    def serve_batch(self, dps: Sequence[Image]) -> None:
+        """
+        Serve the pipeline component on a batch of `Image`s.
+
+        If the predictor is a `TextRecognizer` that accepts batches, the sub images of all pages are pooled and passed
+        to the recognizer in one call. Batches of the recognizer are therefore not bounded by the number of words on a
+        page. The results are routed back to the pages by the `annotation_id` of the sub images.
+
+        Args:
+            dps: The `Image` datapoints to process.
+        """
+        if not (
+            self.extract_from_category and isinstance(self.predictor, TextRecognizer) and self.predictor.accepts_batch
+        ):
+            super().serve_batch(dps)
+            return
+        text_rois_per_dp = [dp.get_annotation(category_names=self.extract_from_category) for dp in dps]
+        predictor_input: list[tuple[str, PixelValues]] = []
+        for text_rois in text_rois_per_dp:
+            predictor_input.extend(self.get_predictor_input(text_rois))  # type: ignore
+        if not predictor_input:
+            return
+        detect_results = {
+            detect_result.uuid: detect_result for detect_result in self.predictor.predict(predictor_input)
+        }
+        for dp, text_rois in zip(dps, text_rois_per_dp):
+            self.dp_manager.datapoint = dp
+            self._dump_detect_results(
+                [
+                    detect_results[text_roi.annotation_id]
+                    for text_roi in text_rois
+                    if text_roi.annotation_id in detect_results
+                ],
+                None,
+                None,
+                None,
+            )
+
+    def _serve_text_rois(self, dp: Image, text_rois: Sequence[ImageAnnotation]) -> None:
+        """
+        Passes all ROI crops of a page to `ObjectDetector.predict_batch` at once, so that detectors accepting batches
+        can process them together (e.g. one Tesseract call per page instead of one per ROI). ROIs without an input are
+        skipped.
+        """
+        text_rois_and_inputs = [(text_roi, self.get_predictor_input(text_roi)) for text_roi in text_rois]
+        text_rois_and_inputs = [(text_roi, inputs) for text_roi, inputs in text_rois_and_inputs if inputs is not None]
+        if not text_rois_and_inputs:
+            return
+        if self.run_time_ocr_language_selection:
+            self.predictor.set_language(dp.summary.get_sub_category(PageKey.LANGUAGE).value)  # type: ignore
+        predictor_inputs = [inputs for _, inputs in text_rois_and_inputs]
+        batch_detect_result_list = self.predictor.predict_batch(predictor_inputs)  # type: ignore
+        for (text_roi, _), detect_result_list in zip(text_rois_and_inputs, batch_detect_result_list):
+            self._dump_detect_results(detect_result_list, text_roi.annotation_id, None, None)
+
+    def _dump_detect_results(
+        self,
+        detect_result_list: Sequence[DetectionResult],
+        ann_id: Optional[str],
+        width: Optional[float],
+        height: Optional[float],
+    ) -> None:
+        if isinstance(self.predictor, TextRecognizer):
+            detect_ann_ids = [detect_result.uuid for detect_result in detect_result_list]
+        else:
+            # results with coordinates outside the page are skipped by the bulk method if width and height are given
+            detect_ann_ids = self.dp_manager.set_image_annotations(
+                detect_result_list, ann_id, True, detect_result_max_width=width, detect_result_max_height=height
+            )
+        for detect_result, detect_ann_id in zip(detect_result_list, detect_ann_ids):
+            if detect_ann_id is not None:
+                self.dp_manager.set_container_annotation(
+                    WordKey.CHARACTERS,
+                    None,
+                    WordKey.CHARACTERS,
+                    detect_ann_id,
+                    detect_result.text if detect_result.text is not None else "",
+                    detect_result.score,
+                )
 
     def get_text_rois(self, dp: Image) -> Sequence[Union[Image, ImageAnnotation, list[ImageAnnotation]]]:
         """
@@ -168,17 +230,17 @@ class TextExtractionService(PipelineComponent):
         """
 
         if self.extract_from_category:
-            if self.predictor.accepts_batch:
+            if isinstance(self.predictor, TextRecognizer) and self.predictor.accepts_batch:
                 return [dp.get_annotation(category_names=self.extract_from_category)]
             return dp.get_annotation(category_names=self.extract_from_category)
         return [dp]
 
     def get_predictor_input(
         self, text_roi: Union[Image, ImageAnnotation, list[ImageAnnotation]]
-    ) -> Optional[Union[bytes, PixelValues, list[tuple[str, PixelValues]], int]]:
+    ) -> Optional[Union[bytes, PdfPage, PixelValues, list[tuple[str, PixelValues]], int]]:
         """
-        Returns raw input for a given `text_roi`. The input can be a numpy array or PDF bytes, depending on the chosen
-        predictor.
+        Returns raw input for a given `text_roi`. The input can be a numpy array, a `PdfPage` reference or PDF bytes,
+        depending on the chosen predictor.
 
         Args:
             text_roi: The `Image`, `ImageAnnotation`, or list of `ImageAnnotation` to process.
@@ -204,8 +266,11 @@ class TextExtractionService(PipelineComponent):
             assert all(roi.image is not None for roi in text_roi)
             assert all(roi.image.image is not None for roi in text_roi)  # type: ignore
             return [(roi.annotation_id, roi.image.image) for roi in text_roi]  # type: ignore
-        if isinstance(self.predictor, PdfMiner) and text_roi.pdf_bytes is not None:
-            return text_roi.pdf_bytes
+        if isinstance(self.predictor, PdfMiner):
+            if text_roi.pdf_page is not None:
+                return text_roi.pdf_page
+            if text_roi.pdf_bytes is not None:
+                return text_roi.pdf_bytes
         return 1
 
     def get_meta_annotation(self) -> MetaAnnotation:
@@ -133,6 +133,8 @@ def sample_pdf_bytes() -> bytes:
     df = SerializerPdfDoc.load(stu.asset_path("pdf_file_two_pages"))
     df.reset_state()
     dp = next(iter(df))
+    if "pdf_page" in dp:
+        return dp["pdf_page"].to_bytes()
     return dp["pdf_bytes"]
 
 
@@ -35,6 +35,7 @@ from deepdoctection.extern.base import (
     DeterministicImageTransformer,
     ModelCategories,
     NerModelCategories,
+    detection_results_from_arrays,
 )
 
 
@@ -186,3 +187,19 @@ def test_predict(transformer: DeterministicImageTransformer) -> None:
     img = np.zeros((10, 10, 3))
     dr = transformer.predict(img)  # type: ignore
     assert dr.angle == 90
+
+
+def test_detection_results_from_arrays() -> None:
+    """test detection_results_from_arrays"""
+    boxes = np.array([[1.0, 2.0, 5.0, 6.0], [10.0, 10.0, 12.0, 14.0]], dtype=np.float32)
+    scores = np.array([0.5, 0.75], dtype=np.float32)
+    class_ids = np.array([0, 3], dtype=np.int64)
+
+    out = detection_results_from_arrays(boxes, scores, class_ids)
+
+    assert out == [
+        DetectionResult(box=[1.0, 2.0, 5.0, 6.0], score=0.5, class_id=0),
+        DetectionResult(box=[10.0, 10.0, 12.0, 14.0], score=0.75, class_id=3),
+    ]
+    assert isinstance(out[1].class_id, int)
+    assert detection_results_from_arrays(np.zeros((0, 4)), np.zeros(0), np.zeros(0, dtype=np.int64)) == []
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+# File: test_cache.py
+
+# Copyright 2025 Dr. Janis Meyer. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the prediction cache and the cached predictor wrappers
+"""
+
+import pickle
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from dd_core.utils.object_types import CellLabel, LayoutLabel
+from deepdoctection.analyzer.config import cfg
+from deepdoctection.analyzer.factory import ServiceFactory
+from deepdoctection.extern.base import DetectionResult, ModelCategories, ObjectDetector, PdfMiner, TextRecognizer
+from deepdoctection.extern.cache import (
+    CachedObjectDetector,
+    CachedPdfMiner,
+    CachedTextRecognizer,
+    PredictionCache,
+    get_config_digest,
+)
+from deepdoctection.extern.hfdetr import HFDetrDerivedDetector
+
+
+def _mock_predictor(spec: type, name: str = "mock") -> MagicMock:
+    predictor = MagicMock(spec=spec)
+    predictor.name = name
+    predictor.model_id = "1234abcd"
+    predictor.categories = ModelCategories(init_categories={1: LayoutLabel.WORD})
+    return predictor
+
+
+def _image(seed: int) -> np.ndarray:
+    return np.random.default_rng(seed).integers(0, 255, size=(20, 30, 3), dtype=np.uint8)
+
+
+@pytest.fixture(name="cache")
+def fixture_cache(tmp_path: Path) -> PredictionCache:
+    """PredictionCache in a temporary directory"""
+    return PredictionCache(tmp_path / "cache" / "cache.sqlite")
+
+
+def test_prediction_cache_put_get_and_counters(cache: PredictionCache, tmp_path: Path) -> None:
+    """values can be retrieved, also by a new instance, and lookups are counted"""
+    assert cache.get("a") is None
+    cache.put("a", [DetectionResult(box=[1.0, 2.0, 3.0, 4.0], class_name=LayoutLabel.WORD)])
+
+    value = cache.get("a")
+    assert value[0].box == [1.0, 2.0, 3.0, 4.0]
+    assert cache.get_stats()["hits"] == 1
+    assert cache.get_stats()["misses"] == 1
+    assert cache.get_stats()["entries"] == 1
+
+    other = PredictionCache(tmp_path / "cache" / "cache.sqlite")
+    assert other.get("a")[0].class_name == LayoutLabel.WORD
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.size_bytes == 0
+
+
+def test_prediction_cache_evicts_least_recently_used(cache: PredictionCache) -> None:
+    """exceeding max_size_bytes evicts the least recently used entries"""
+    value = b"x" * 1000
+    cache.put("first", value)
+    cache.max_size_bytes = 2 * cache.size_bytes
+    cache.put("second", value)
+    cache.get("first")
+    cache.put("third", value)
+
+    assert cache.get("second") is None
+    assert cache.get("first") == value
+    assert cache.get("third") == value
+    assert cache.size_bytes <= cache.max_size_bytes
+
+
+def test_prediction_cache_can_be_pickled(cache: PredictionCache) -> None:
+    """a pickled cache re-opens the database"""
+    cache.put("a", 1)
+    restored = pickle.loads(pickle.dumps(cache))
+    assert restored.get("a") == 1
+
+
+def test_cached_object_detector(cache: PredictionCache) -> None:
+    """results are served from the cache and only missing images are passed to the detector"""
+    detector = _mock_predictor(ObjectDetector)
+    detector.predict.side_effect = lambda np_img: [DetectionResult(box=[0.0, 0.0, 1.0, float(np_img.sum())])]
+    detector.predict_batch.side_effect = lambda np_imgs: [detector.predict(np_img) for np_img in np_imgs]
+    cached_detector = CachedObjectDetector(detector, cache, {"threshold": 0.5})
+
+    first = cached_detector.predict(_image(1))
+    second = cached_detector.predict(_image(1))
+    assert first[0].box == second[0].box
+    assert detector.predict.call_count == 1
+    assert cached_detector.name == detector.name
+    assert cached_detector.model_id == detector.model_id
+
+    batch = cached_detector.predict_batch([_image(1), _image(2)])
+    assert batch[0][0].box == first[0].box
+    detector.predict_batch.assert_called_once()
+    assert len(detector.predict_batch.call_args[0][0]) == 1
+
+    other_config = CachedObjectDetector(detector, cache, {"threshold": 0.7})
+    other_config.predict(_image(1))
+    assert detector.predict.call_count == 3
+
+
+def test_cached_text_recognizer_assigns_uuids_of_current_crops(cache: PredictionCache) -> None:
+    """cached results of a crop get the uuid of the crop they are returned for"""
+    recognizer = _mock_predictor(TextRecognizer)
+    recognizer.predict.side_effect = lambda images: [
+        DetectionResult(text=f"text_{int(np_img.sum())}", uuid=uuid) for uuid, np_img in images
+    ]
+    cached_recognizer = CachedTextRecognizer(recognizer, cache)
+
+    cached_recognizer.predict([("a", _image(1))])
+    detect_results = cached_recognizer.predict([("b", _image(1)), ("c", _image(2))])
+
+    assert [detect_result.uuid for detect_result in detect_results] == ["b", "c"]
+    assert detect_results[0].text == f"text_{int(_image(1).sum())}"
+    assert recognizer.predict.call_count == 2
+    assert recognizer.predict.call_args[0][0][0][0] == "c"
+
+
+def test_cached_pdf_miner_serves_page_size_from_cache(cache: PredictionCache) -> None:
+    """a cache hit neither calls predict nor get_width_height of the miner"""
+    pdf_miner = _mock_predictor(PdfMiner)
+    pdf_miner.predict.return_value = [DetectionResult(box=[0.0, 0.0, 5.0, 5.0], text="hello")]
+    pdf_miner.get_width_height.return_value = (612.0, 792.0)
+
+    for cached_pdf_miner in (CachedPdfMiner(pdf_miner, cache), CachedPdfMiner(pdf_miner, cache)):
+        assert cached_pdf_miner.predict(b"%PDF-1.4 page")[0].text == "hello"
+        assert cached_pdf_miner.get_width_height(b"%PDF-1.4 page") == (612.0, 792.0)
+
+    assert pdf_miner.predict.call_count == 1
+    assert pdf_miner.get_width_height.call_count == 1
+
+
+def test_get_config_digest_is_order_independent() -> None:
+    """config digests do not depend on the order of keys"""
+    assert get_config_digest({"a": 1, "b": [1, 2]}) == get_config_digest({"b": [1, 2], "a": 1})
+    assert get_config_digest({"a": 1}) != get_config_digest({"a": 2})
+
+
+def test_maybe_cache_predictor_respects_components(cache: PredictionCache) -> None:
+    """only components listed in PREDICTION_CACHE.COMPONENTS are wrapped"""
+    detector = _mock_predictor(ObjectDetector)
+    pdf_miner = _mock_predictor(PdfMiner)
+
+    assert isinstance(ServiceFactory.maybe_cache_predictor(cfg, detector, "LAYOUT", cache), CachedObjectDetector)
+    assert isinstance(ServiceFactory.maybe_cache_predictor(cfg, pdf_miner, "PDF_MINER", cache), CachedPdfMiner)
+    assert ServiceFactory.maybe_cache_predictor(cfg, detector, "LAYOUT", None) is detector
+
+    cfg.freeze(False)
+    components = cfg.PREDICTION_CACHE.COMPONENTS
+    cfg.PREDICTION_CACHE.COMPONENTS = ["OCR"]
+    try:
+        assert ServiceFactory.maybe_cache_predictor(cfg, detector, "LAYOUT", cache) is detector
+    finally:
+        cfg.PREDICTION_CACHE.COMPONENTS = components
+        cfg.freeze()
+
+
+def test_build_sub_image_service_with_cached_item_detector_excludes_categories(cache: PredictionCache) -> None:
+    """a cached TATR item detector excludes the same categories as the detector itself"""
+    detector = _mock_predictor(HFDetrDerivedDetector)
+    cached_detector = ServiceFactory.maybe_cache_predictor(cfg, detector, "ITEM", cache)
+
+    item_service = ServiceFactory.build_sub_image_service(cfg, detector=cached_detector, mode="ITEM")
+
+    assert isinstance(cached_detector, CachedObjectDetector)
+    assert item_service.detect_result_generator.exclude_category_names == [
+        LayoutLabel.TABLE,
+        CellLabel.COLUMN_HEADER,
+        CellLabel.PROJECTED_ROW_HEADER,
+        CellLabel.SPANNING,
+    ]
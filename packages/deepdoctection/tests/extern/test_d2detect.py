@@ -114,6 +114,42 @@ def test_d2_frcnn_predict_basic_mapping(monkeypatch: pytest.MonkeyPatch) -> None
     assert results[1].class_name == "list"
 
 
+@REQUIRES_PT_AND_D2
+def test_d2_frcnn_predict_batch(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Unit: mock model build and load, verify predict_batch() runs one forward pass for all images.
+    """
+    monkeypatch.setattr(
+        "deepdoctection.extern.d2detect.D2FrcnnDetector._set_model",
+        MagicMock(return_value=MagicMock),
+        raising=True,
+    )
+    monkeypatch.setattr(
+        "deepdoctection.extern.d2detect.D2FrcnnDetector._instantiate_d2_predictor",
+        MagicMock(),
+        raising=True,
+    )
+    monkeypatch.setattr(
+        "deepdoctection.extern.d2detect.D2FrcnnDetector._set_config",
+        lambda *_, **__: _stub_cfg(),
+        raising=True,
+    )
+
+    categories: Dict[int, ObjectTypes] = {1: LayoutLabel.FIGURE, 2: LayoutLabel.LIST, 3: LayoutLabel.TABLE}
+    det = D2FrcnnDetector(path_yaml="dummy.yaml", path_weights="dummy.pt", categories=categories, device="cpu")
+    batch_predictions = _get_mock_instances()[0] * 2
+    det.d2_predictor = MagicMock(return_value=batch_predictions)
+
+    np_images = [(np.random.rand(32, 32, 3) * 255).astype("uint8"), (np.random.rand(48, 40, 3) * 255).astype("uint8")]
+    results = det.predict_batch(np_images)
+
+    assert det.accepts_batch
+    det.d2_predictor.assert_called_once()
+    assert len(det.d2_predictor.call_args.args[0]) == 2
+    assert [len(page_results) for page_results in results] == [2, 2]
+    assert results[1][1].class_name == "list"
+
+
 @REQUIRES_PT_AND_D2
 def test_d2_frcnn_tracing_predict_basic_mapping(monkeypatch: pytest.MonkeyPatch) -> None:
     """
@@ -43,6 +43,7 @@ from deepdoctection.extern.doctrocr import (
     DocTrRotationTransformer,
     DoctrTextlineDetector,
     DoctrTextRecognizer,
+    doctr_predict_text,
 )
 
 REQUIRES_PT_AND_DOCTR = pytest.mark.skipif(
@@ -84,6 +85,33 @@ def test_doctr_textline_detector_predict_basic(monkeypatch: pytest.MonkeyPatch)
     assert results[0].class_name == "word"
 
 
+@REQUIRES_PT_AND_DOCTR
+def test_doctr_textline_detector_predict_batch(monkeypatch: pytest.MonkeyPatch) -> None:
+    """test that predict_batch passes all images to the doctr predictor at once."""
+    doctr_predictor = MagicMock(
+        return_value=[
+            {"words": np.array([[0.1, 0.1, 0.2, 0.2, 0.9], [0.3, 0.3, 0.5, 0.4, 0.8]])},
+            {"words": np.zeros((0, 5))},
+        ]
+    )
+    monkeypatch.setattr(
+        "deepdoctection.extern.doctrocr.DoctrTextlineDetector.get_wrapped_model",
+        MagicMock(return_value=doctr_predictor),
+        raising=True,
+    )
+
+    det = DoctrTextlineDetector("db_resnet50", "dummy.pt", {1: LayoutLabel.WORD}, "cpu")
+    np_images = [(np.random.rand(32, 32, 3) * 255).astype("uint8") for _ in range(2)]
+    results = det.predict_batch(np_images)
+
+    assert det.accepts_batch
+    doctr_predictor.assert_called_once()
+    assert [len(page_results) for page_results in results] == [2, 0]
+    assert results[0][0].box == [0.1, 0.1, 0.2, 0.2]
+    assert results[0][0].score == 0.9
+    assert not results[0][0].absolute_coords
+
+
 @REQUIRES_PT_AND_DOCTR
 def test_doctr_text_recognizer_predict_basic(monkeypatch: pytest.MonkeyPatch) -> None:
     """test text recognition using mocked model and custom prediction logic."""
@@ -117,6 +145,22 @@ def test_doctr_text_recognizer_predict_basic(monkeypatch: pytest.MonkeyPatch) ->
     assert results[1].text == "Bar"
 
 
+def test_doctr_predict_text_sorts_by_aspect_ratio() -> None:
+    """test that sub images are passed sorted by aspect ratio and results are returned in input order."""
+    predictor = MagicMock(side_effect=lambda images: [(f"width_{image.shape[1]}", 0.9) for image in images])
+    inputs = [
+        ("id1", np.zeros((16, 160, 3), dtype=np.uint8)),
+        ("id2", np.zeros((16, 32, 3), dtype=np.uint8)),
+        ("id3", np.zeros((16, 64, 3), dtype=np.uint8)),
+    ]
+
+    results = doctr_predict_text(inputs, predictor)
+
+    assert [image.shape[1] for image in predictor.call_args[0][0]] == [32, 64, 160]
+    assert [result.uuid for result in results] == ["id1", "id2", "id3"]
+    assert [result.text for result in results] == ["width_160", "width_32", "width_64"]
+
+
 @REQUIRES_PT_AND_DOCTR
 def test_doctr_rotation_transformer_predict_and_transform(monkeypatch: pytest.MonkeyPatch) -> None:
     """test image rotation predictions and transformations."""
@@ -33,11 +33,14 @@ from unittest.mock import MagicMock
 import numpy as np
 import pytest
 
+from dd_core.datapoint import BoundingBox, Image, ImageAnnotation
 from dd_core.utils import get_torch_device
 from dd_core.utils.file_utils import pytorch_available, transformers_available
 from dd_core.utils.object_types import LayoutLabel
+from dd_core.utils.transform import PadTransform
 from deepdoctection.extern.base import DetectionResult
 from deepdoctection.extern.hfdetr import HFDetrDerivedDetector
+from deepdoctection.pipe.sub_layout import SubImageLayoutService
 
 REQUIRES_PT_AND_TR = pytest.mark.skipif(
     not (pytorch_available() and transformers_available()),
@@ -105,6 +108,51 @@ def test_hfdetr_predict_basic(monkeypatch: pytest.MonkeyPatch) -> None:
     assert results[0].score > 0.9  # type: ignore
 
 
+@REQUIRES_PT_AND_TR
+def test_hfdetr_predict_batch(monkeypatch: pytest.MonkeyPatch) -> None:
+    """test batch prediction using mocked tokenizers and models."""
+
+    dummy_config = SimpleNamespace(
+        architectures=["TableTransformerForObjectDetection"],
+        threshold=0.1,
+        nms_threshold=0.05,
+    )
+    monkeypatch.setattr(
+        "deepdoctection.extern.hfdetr.HFDetrDerivedDetector.get_config",
+        MagicMock(return_value=dummy_config),
+        raising=True,
+    )
+    monkeypatch.setattr(
+        "deepdoctection.extern.hfdetr.HFDetrDerivedDetector.get_model",
+        MagicMock(return_value=MagicMock()),
+        raising=True,
+    )
+    monkeypatch.setattr(
+        "deepdoctection.extern.hfdetr.HFDetrDerivedDetector.get_pre_processor",
+        MagicMock(return_value=MagicMock()),
+        raising=True,
+    )
+
+    def _fake_predict_images(  # type: ignore
+        np_imgs, predictor, feature_extractor, device, threshold, nms_threshold  # pylint:disable=W0613
+    ):
+        return [[DetectionResult(box=[0, 0, 10, 10], class_id=0, score=0.95)] for _ in np_imgs]
+
+    fake_predict_images = MagicMock(side_effect=_fake_predict_images)
+    monkeypatch.setattr("deepdoctection.extern.hfdetr.detr_predict_images", fake_predict_images, raising=True)
+
+    det = HFDetrDerivedDetector("cfg.json", "w.bin", "fe.json", {1: LayoutLabel.TABLE}, "cpu")
+
+    np_images = [(np.random.rand(32, 32, 3) * 255).astype("uint8") for _ in range(3)]
+    results = det.predict_batch(np_images)
+
+    assert det.accepts_batch
+    fake_predict_images.assert_called_once()
+    assert len(results) == 3
+    assert all(page_results[0].class_id == 1 for page_results in results)
+    assert all(page_results[0].class_name == "table" for page_results in results)
+
+
 @REQUIRES_PT_AND_TR
 def test_hfdetr_category_filtering(monkeypatch: pytest.MonkeyPatch) -> None:
     """test category filtering using mocked tokenizers and models."""
@@ -199,3 +247,71 @@ def test_hfdetr_clear_model(monkeypatch: pytest.MonkeyPatch) -> None:
     assert det.hf_detr_predictor is not None
     det.clear_model()
     assert det.hf_detr_predictor is None
+
+
+@REQUIRES_PT_AND_TR
+def test_hfdetr_with_padder_in_sub_image_layout_service_for_several_tables(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    The batching detector receives all padded tables of a page at once. Rows are returned in the coordinates of their
+    own table, also if the tables have different sizes.
+    """
+
+    dummy_config = SimpleNamespace(
+        architectures=["TableTransformerForObjectDetection"],
+        threshold=0.1,
+        nms_threshold=0.05,
+    )
+    monkeypatch.setattr(
+        "deepdoctection.extern.hfdetr.HFDetrDerivedDetector.get_config",
+        MagicMock(return_value=dummy_config),
+        raising=True,
+    )
+    monkeypatch.setattr(
+        "deepdoctection.extern.hfdetr.HFDetrDerivedDetector.get_model",
+        MagicMock(return_value=MagicMock()),
+        raising=True,
+    )
+    monkeypatch.setattr(
+        "deepdoctection.extern.hfdetr.HFDetrDerivedDetector.get_pre_processor",
+        MagicMock(return_value=MagicMock()),
+        raising=True,
+    )
+
+    def _fake_predict_images(  # type: ignore
+        np_imgs, predictor, feature_extractor, device, threshold, nms_threshold  # pylint:disable=W0613
+    ):
+        # one row covering the whole table without its padding
+        return [
+            [DetectionResult(box=[10, 60, np_img.shape[1] - 10, np_img.shape[0] - 10], class_id=0, score=0.95)]
+            for np_img in np_imgs
+        ]
+
+    monkeypatch.setattr(
+        "deepdoctection.extern.hfdetr.detr_predict_images",
+        MagicMock(side_effect=_fake_predict_images),
+        raising=True,
+    )
+
+    dp = Image(file_name="page.png")
+    dp.image = np.ones((1000, 1000, 3), dtype=np.uint8)
+    for ulx, uly, lrx, lry in ((0.0, 0.0, 490.0, 590.0), (600.0, 700.0, 700.0, 750.0)):
+        table = ImageAnnotation(
+            category_name=LayoutLabel.TABLE,
+            bounding_box=BoundingBox(ulx=ulx, uly=uly, lrx=lrx, lry=lry, absolute_coords=True),
+        )
+        dp.dump(table)
+        dp.image_ann_to_image(table.annotation_id, True)
+
+    det = HFDetrDerivedDetector("cfg.json", "w.bin", "fe.json", {1: LayoutLabel.ROW}, "cpu")
+    SubImageLayoutService(det, LayoutLabel.TABLE, padder=PadTransform(60, 10, 10, 10)).pass_datapoint(dp)
+
+    row_boxes = [
+        row.get_bounding_box(dp.image_id)
+        for table in dp.get_annotation(category_names=LayoutLabel.TABLE)
+        for row in table.image.get_annotation()  # type: ignore
+    ]
+    assert det.accepts_batch
+    assert row_boxes == [
+        BoundingBox(ulx=0.0, uly=0.0, lrx=0.49, lry=0.59, absolute_coords=False),
+        BoundingBox(ulx=0.6, uly=0.7, lrx=0.7, lry=0.75, absolute_coords=False),
+    ]
@@ -27,6 +27,8 @@ retrieval.
 
 import pytest
 
+import shared_test_utils as stu
+from dd_core.utils.pdf_utils import PdfDocumentSession
 from deepdoctection.extern.pdftext import (
     Pdfmium2TextDetector,
     PdfPlumberTextDetector,
@@ -83,3 +85,33 @@ def test_pdfmium2_text_detector_get_width_height_real_pdf(sample_pdf_bytes: byte
     w, h = det.get_width_height(sample_pdf_bytes)
     assert w > 0
     assert h > 0
+
+
+def test_pdf_text_detectors_accept_page_references() -> None:
+    """test pdf text detectors return the same results for page references and page bytes"""
+    pytest.importorskip("pdfplumber")
+    pytest.importorskip("pypdfium2")
+
+    session = PdfDocumentSession(stu.asset_path("pdf_file_two_pages"))
+    page = session[0]
+
+    for det in (PdfPlumberTextDetector(), Pdfmium2TextDetector()):
+        from_page = det.predict(page)
+        from_bytes = det.predict(page.to_bytes())
+        assert [r.text for r in from_page] == [r.text for r in from_bytes]
+        assert det.get_width_height(page) == det.get_width_height(page.to_bytes())
+
+
+def test_pdfplumber_text_detector_releases_page_cache_of_session_pages() -> None:
+    """test the parsed layout of a page reference is released after prediction"""
+    pytest.importorskip("pdfplumber")
+
+    session = PdfDocumentSession(stu.asset_path("pdf_file_two_pages"))
+    det = PdfPlumberTextDetector()
+
+    for page, _ in session:
+        det.predict(page)
+        session_page = det._session_pdf.pages[page.index]  # type: ignore # pylint: disable=W0212
+        assert not any(hasattr(session_page, prop) for prop in session_page.cached_properties)
+
+    assert det.get_width_height(session[0]) == (612.0, 792.0)
@@ -33,7 +33,7 @@ from numpy.typing import NDArray
 from dd_core.utils.env_info import SETTINGS
 from dd_core.utils.file_utils import tesseract_available
 from dd_core.utils.object_types import LanguageCode, LayoutLabel
-from deepdoctection.extern.tessocr import TesseractOcrDetector
+from deepdoctection.extern.tessocr import TesseractOcrDetector, _tsv_to_columns, tesseract_dict_to_detectresult
 
 REQUIRES_TESSERACT = pytest.mark.skipif(
     not tesseract_available(),
@@ -133,3 +133,48 @@ def test_tesseract_ocr_get_requirements() -> None:
     reqs = det.get_requirements()
     assert isinstance(reqs, list)
     assert len(reqs) >= 1
+
+
+def test_tsv_to_columns_and_detect_results() -> None:
+    """test parsing tesseract tsv output into columns and detection results"""
+    output = (
+        "level\tpage_num\tblock_num\tpar_num\tline_num\tword_num\tleft\ttop\twidth\theight\tconf\ttext\n"
+        "1\t1\t0\t0\t0\t0\t0\t0\t100\t50\t-1\t\n"
+        "5\t1\t1\t1\t1\t1\t3\t4\t10\t8\t96.5\tHello\n"
+        "5\t1\t1\t1\t1\t2\t15\t4\t10\t8\t90\n"
+    )
+
+    columns = _tsv_to_columns(output)
+    results = tesseract_dict_to_detectresult(columns, text_lines=False)
+
+    assert columns["left"].tolist() == [0, 3, 15]
+    assert columns["conf"].tolist() == [-1.0, 96.5, 90.0]
+    assert columns["text"] == ["", "Hello", ""]
+    assert [r.box for r in results] == [[3, 4, 13, 12], [15, 4, 25, 12]]
+    assert [r.score for r in results] == [0.965, 0.9]
+    assert tesseract_dict_to_detectresult(_tsv_to_columns(""), text_lines=False) == []
+
+
+@REQUIRES_TESSERACT
+def test_tesseract_ocr_predict_batch_runs_one_batch(
+    monkeypatch: pytest.MonkeyPatch, sample_np_img: NDArray[Any]
+) -> None:
+    """test tesseract ocr predict batch passes all images to one tesseract call"""
+    calls = []
+
+    def _images_to_dicts(images, _lang, _cfg):  # type: ignore
+        calls.append(len(images))
+        return [
+            {"left": [1], "top": [2], "width": [3], "height": [4], "conf": [80.0], "text": [f"w{idx}"]}
+            for idx in range(len(images))
+        ]
+
+    monkeypatch.setattr("deepdoctection.extern.tessocr.tesserocr_available", lambda: False)
+    monkeypatch.setattr("deepdoctection.extern.tessocr.images_to_dicts", _images_to_dicts)
+
+    det = TesseractOcrDetector(SETTINGS.CONF_TESSERACT_SRC)
+    results = det.predict_batch([sample_np_img, sample_np_img, sample_np_img])
+
+    assert det.accepts_batch
+    assert calls == [3]
+    assert [[r.text for r in result] for result in results] == [["w0"], ["w1"], ["w2"]]
@@ -26,6 +26,10 @@ categories.
 
 """
 
+import json
+from copy import deepcopy
+from typing import Optional
+
 import numpy as np
 import pytest
 
@@ -71,6 +75,76 @@ def test_set_image_annotation_with_image_and_child_relationship(dp_image: Image)
     assert child.annotation_id == child_id
 
 
+def _detect_results_for_bulk() -> list[DetectionResult]:
+    return [
+        _detection_result([10.4, 10.5, 30.5, 30.6]),
+        _detection_result([12, 12, 12, 40]),
+        _detection_result([5, 5, 50, 50], name="table", cid=2),
+        _detection_result([10.4, 10.5, 30.5, 30.6]),
+        _detection_result([0, 0, 120, 40]),
+        DetectionResult(box=[0.1, 0.1, 0.3, 0.2], class_name=get_type("text"), class_id=1, absolute_coords=False),
+    ]
+
+
+@pytest.mark.parametrize("max_width, max_height", [(None, None), (100, 80)])
+def test_set_image_annotations_equals_set_image_annotation(
+    dp_image: Image, max_width: Optional[int], max_height: Optional[int]
+) -> None:
+    """set_image_annotations generates the same annotations as repeated set_image_annotation"""
+    mgr = DatapointManager(service_id="svc", model_id="m")
+    mgr.datapoint = deepcopy(dp_image)
+    other_mgr = DatapointManager(service_id="svc", model_id="m")
+    other_mgr.datapoint = deepcopy(dp_image)
+
+    ann_ids = mgr.set_image_annotations(
+        _detect_results_for_bulk(), detect_result_max_width=max_width, detect_result_max_height=max_height
+    )
+    other_ann_ids = []
+    for detect_result in _detect_results_for_bulk():
+        box = detect_result.box
+        if max_width and max_height and (box[0] >= max_width or box[2] >= max_width):
+            other_ann_ids.append(None)
+            continue
+        other_ann_ids.append(
+            other_mgr.set_image_annotation(
+                detect_result, detect_result_max_width=max_width, detect_result_max_height=max_height
+            )
+        )
+
+    assert ann_ids == other_ann_ids
+    assert ann_ids[1] is None
+    assert ann_ids[3] is None
+    assert [ann.as_dict() for ann in mgr.datapoint.annotations] == [
+        ann.as_dict() for ann in other_mgr.datapoint.annotations
+    ]
+
+
+def test_set_image_annotations_to_annotation_id(dp_image: Image) -> None:
+    """set_image_annotations dumps sub image annotations like set_image_annotation"""
+    mgr = DatapointManager(service_id="svc", model_id="m")
+    mgr.datapoint = deepcopy(dp_image)
+    other_mgr = DatapointManager(service_id="svc", model_id="m")
+    other_mgr.datapoint = deepcopy(dp_image)
+    parent_id = mgr.set_image_annotation(_detection_result([5, 5, 50, 50]), to_image=True)
+    other_mgr.set_image_annotation(_detection_result([5, 5, 50, 50]), to_image=True)
+    detect_results = [_detection_result([2, 2, 20, 20]), _detection_result([10, 10, 30, 40])]
+
+    child_ids = mgr.set_image_annotations(detect_results, to_annotation_id=parent_id)
+    other_child_ids = [
+        other_mgr.set_image_annotation(detect_result, to_annotation_id=parent_id) for detect_result in detect_results
+    ]
+
+    assert child_ids == other_child_ids
+    parent = mgr.get_annotation(parent_id)  # type: ignore
+    assert parent.get_relationship(RelationshipKey.CHILD) == child_ids
+    for child_id in child_ids:
+        child = mgr.get_annotation(child_id)  # type: ignore
+        other_child = other_mgr.get_annotation(child_id)  # type: ignore
+        assert child.image.get_embedding(mgr.datapoint.image_id) == other_child.image.get_embedding(  # type: ignore
+            other_mgr.datapoint.image_id
+        )
+
+
 def test_category_and_container_annotations(dp_image: Image) -> None:
     """test set_category_annotation and set_container_annotation"""
     mgr = DatapointManager(service_id="svc", model_id="m")
@@ -93,6 +167,47 @@ def test_category_and_container_annotations(dp_image: Image) -> None:
     assert cont_ann.category_id == 9
 
 
+def test_container_annotation_with_numpy_value_is_json_serializable(dp_image: Image) -> None:
+    """numpy scalars passed to set_container_annotation are converted to Python types"""
+    mgr = DatapointManager(service_id="svc", model_id="m")
+    mgr.datapoint = dp_image
+    ann_id = mgr.set_image_annotation(_detection_result([0, 0, 10, 10]))
+    assert ann_id is not None
+
+    mgr.set_container_annotation(get_type("test_cat_2"), 9, get_type("sub_cat_2"), ann_id, np.float32(0.5))  # type: ignore
+    cont_ann = mgr.get_annotation(ann_id).get_sub_category(get_type("sub_cat_2"))
+
+    assert type(cont_ann.value) is float  # pylint: disable=C0123
+    assert json.loads(json.dumps(cont_ann.as_dict()))["value"] == 0.5
+
+
+def test_set_category_annotations_equals_set_category_annotation(dp_image: Image) -> None:
+    """test set_category_annotations generates the same sub categories and skips unknown annotations"""
+    mgr = DatapointManager(service_id="svc", model_id="m")
+    mgr.datapoint = deepcopy(dp_image)
+    other_mgr = DatapointManager(service_id="svc", model_id="m")
+    other_mgr.datapoint = deepcopy(dp_image)
+    ann_ids: list[str] = []
+    for k in range(3):
+        ann_ids.append(mgr.set_image_annotation(_detection_result([0, 0, 10 + k, 10])))  # type: ignore
+        other_mgr.set_image_annotation(_detection_result([0, 0, 10 + k, 10]))
+
+    cat_ann_ids = mgr.set_category_annotations(
+        get_type("test_cat_1"), [1, None, 3, 4], get_type("sub_cat_1"), ann_ids + ["unknown"]
+    )
+    other_cat_ann_ids = [
+        other_mgr.set_category_annotation(get_type("test_cat_1"), category_id, get_type("sub_cat_1"), ann_id)
+        for category_id, ann_id in zip([1, None, 3], ann_ids)
+    ]
+
+    assert cat_ann_ids == other_cat_ann_ids + [None]
+    for ann_id in ann_ids:
+        cat_ann = mgr.get_annotation(ann_id).get_sub_category(get_type("sub_cat_1"))
+        assert cat_ann == other_mgr.get_annotation(ann_id).get_sub_category(get_type("sub_cat_1"))
+    # sub categories that already exist are not replaced
+    assert mgr.set_category_annotations(get_type("test_cat_1"), [4], get_type("sub_cat_1"), ann_ids[:1]) == [None]
+
+
 def test_summary_annotation(dp_image: Image) -> None:
     """test set_summary_annotation"""
     mgr = DatapointManager(service_id="svc", model_id="m")
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+# File: test_concurrency.py
+
+# Copyright 2025 Dr. Janis Meyer. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Testing the staged execution of pipeline components
+"""
+
+import random
+import time
+
+import pytest
+
+import shared_test_utils as stu
+from dd_core.dataflow import DataFromList
+from dd_core.datapoint.image import Image, MetaAnnotation
+from deepdoctection.pipe.base import PipelineComponent
+from deepdoctection.pipe.concurrency import MultiProcessPipelineData, StagedPipelineData
+
+
+class _TracingComponent(PipelineComponent):
+    """Appends its name to the file name of the image after a random delay"""
+
+    def __init__(self, name: str, fail_on: str = "") -> None:
+        self.fail_on = fail_on
+        super().__init__(name)
+
+    def serve(self, dp: Image) -> None:
+        time.sleep(random.random() * 0.01)
+        if dp.file_name == self.fail_on:
+            raise ValueError(f"cannot process {dp.file_name}")
+        dp.location = f"{dp.location}/{self.name}"
+
+    def clone(self) -> "_TracingComponent":
+        return self.__class__(self.name, self.fail_on)
+
+    def get_meta_annotation(self) -> MetaAnnotation:
+        return MetaAnnotation()
+
+    def clear_predictor(self) -> None:
+        pass
+
+
+def _images(num: int) -> list[Image]:
+    return [Image(file_name=f"page_{idx}.png", location="doc") for idx in range(num)]
+
+
+def test_staged_pipeline_data_preserves_order_with_worker_pools() -> None:
+    """
+    Test StagedPipelineData processes every image by every stage and preserves the order
+    """
+    # Arrange
+    first, second = _TracingComponent("first"), _TracingComponent("second")
+    df = StagedPipelineData(
+        DataFromList(_images(20), shuffle=False), [first, second], queue_size=2, num_workers={"second": 3}
+    )
+
+    # Act
+    output: list[Image] = stu.collect_datapoint_from_dataflow(df=df)
+
+    # Assert
+    assert [dp.file_name for dp in output] == [f"page_{idx}.png" for idx in range(20)]
+    assert all(dp.location == "doc/first/second" for dp in output)
+    assert set(df.get_queue_depths()) == {"first", "second", "output"}
+
+
+def test_staged_pipeline_data_raises_error_of_stage() -> None:
+    """
+    Test StagedPipelineData re-raises an exception of a stage worker
+    """
+    # Arrange
+    df = StagedPipelineData(
+        DataFromList(_images(5), shuffle=False), [_TracingComponent("first", fail_on="page_3.png")], queue_size=1
+    )
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="page_3.png"):
+        stu.collect_datapoint_from_dataflow(df=df)
+
+
+def test_multi_process_pipeline_data_preserves_order() -> None:
+    """
+    Test MultiProcessPipelineData processes every image in a worker process and preserves the order
+    """
+    # Arrange
+    df = MultiProcessPipelineData(
+        DataFromList(_images(8), shuffle=False),
+        [_TracingComponent("first"), _TracingComponent("second")],
+        num_proc=2,
+        pre_proc_func=lambda dp: None if dp.file_name == "page_5.png" else dp,
+    )
+
+    # Act
+    output: list[Image] = stu.collect_datapoint_from_dataflow(df=df)
+
+    # Assert
+    assert [dp.file_name for dp in output] == [f"page_{idx}.png" for idx in range(8) if idx != 5]
+    assert all(dp.location == "doc/first/second" for dp in output)
+
+
+def test_multi_process_pipeline_data_raises_error_of_worker() -> None:
+    """
+    Test MultiProcessPipelineData raises a RuntimeError with the traceback of the worker
+    """
+    # Arrange
+    df = MultiProcessPipelineData(
+        DataFromList(_images(4), shuffle=False), [_TracingComponent("first", fail_on="page_2.png")], num_proc=2
+    )
+
+    # Act & Assert
+    with pytest.raises(RuntimeError, match="page_2.png"):
+        stu.collect_datapoint_from_dataflow(df=df)
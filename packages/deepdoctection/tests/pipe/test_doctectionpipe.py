@@ -91,3 +91,30 @@ def test_analyze_path_pdf_dict(pdf_path: PathLikeOrStr) -> None:
     items: list[Image] = stu.collect_datapoint_from_dataflow(df)
     assert len(items) >= 1
     assert all(isinstance(d, dict) for d in items)
+
+
+def test_analyze_path_pdf_batched_keeps_page_order(pdf_path: PathLikeOrStr) -> None:
+    """test analyze pdf path in batching mode returns all pages in order"""
+    identity_pipe = DoctectionPipe(pipeline_component_list=[])
+    df = identity_pipe.analyze(path=pdf_path, output="image", batch_size=2, max_batch_wait=1.0)
+    items: list[Image] = stu.collect_datapoint_from_dataflow(df)
+    assert len(items) == 2
+    assert [img.page_number for img in items] == [1, 2]
+
+
+def test_analyze_path_pdf_staged_pages(pdf_path: PathLikeOrStr) -> None:
+    """test analyze pdf path in staged mode returns all pages in order"""
+    identity_pipe = DoctectionPipe(pipeline_component_list=[])
+    df = identity_pipe.analyze(path=pdf_path, output="page", staged=True, stage_queue_size=1)
+    items: list[Page] = stu.collect_datapoint_from_dataflow(df)
+    assert len(items) == 2
+    assert all(isinstance(p, Page) for p in items)
+    assert [p.page_number for p in items] == [1, 2]
+
+
+def test_analyze_path_pdf_num_workers_pages(pdf_path: PathLikeOrStr) -> None:
+    """test analyze pdf path with worker processes returns all pages in order"""
+    identity_pipe = DoctectionPipe(pipeline_component_list=[])
+    df = identity_pipe.analyze(path=pdf_path, output="page", num_workers=2)
+    items: list[Page] = stu.collect_datapoint_from_dataflow(df)
+    assert [p.page_number for p in items] == [1, 2]
@@ -28,11 +28,13 @@ assertions for thorough verification.
 from typing import List, cast
 from unittest.mock import create_autospec
 
+import numpy as np
 import pytest
 
 from dd_core.datapoint.annotation import CategoryAnnotation, ImageAnnotation
 from dd_core.datapoint.view import Image
 from dd_core.utils.object_types import get_type
+from dd_core.utils.transform import PadTransform
 from deepdoctection.extern.base import DetectionResult, ObjectDetector
 from deepdoctection.pipe.layout import ImageLayoutService, skip_if_category_or_service_extracted
 
@@ -89,3 +91,62 @@ def test_image_layout_service_rebuilds_annotations(image_without_anns: Image, an
         assert recreated.category_name == orig.category_name
         assert recreated.score == pytest.approx(orig.score if orig.score is not None else 1.0, rel=1e-6)
         assert recreated.bounding_box.to_list("xyxy") == orig.bounding_box.to_list("xyxy")  # type: ignore
+
+
+def test_image_layout_service_serves_batch_with_one_prediction(
+    image_without_anns: Image, anns: list[ImageAnnotation]
+) -> None:
+    """test image_layout_service runs one batched prediction and scatters results to the right image"""
+    second_image = Image(file_name="second_page.png", location="/path/to/second_page.png")
+    second_image.image = image_without_anns.image
+    det_results = [
+        DetectionResult(
+            box=ann.bounding_box.to_list("xyxy"),  # type: ignore
+            class_id=ann.category_id,
+            score=1.0,
+            class_name=ann.category_name.value,  # type: ignore
+            absolute_coords=ann.bounding_box.absolute_coords,  # type: ignore
+        )
+        for ann in anns
+    ]
+
+    mock_detector = create_autospec(ObjectDetector, instance=True)
+    mock_detector.name = "fake_layout"
+    mock_detector.model_id = "fake_model_id"
+    mock_detector.predict_batch.return_value = [det_results, det_results[:1]]
+
+    layout_service = ImageLayoutService(layout_detector=cast(ObjectDetector, mock_detector))
+    result_images = layout_service.pass_datapoints([image_without_anns, second_image])
+
+    mock_detector.predict_batch.assert_called_once()
+    mock_detector.predict.assert_not_called()
+    assert result_images[0] is image_without_anns
+    assert len(result_images[0].get_annotation()) == len(anns)
+    assert len(result_images[1].get_annotation()) == 1
+
+
+def test_image_layout_service_with_padder_undoes_padding_of_each_image_of_a_batch() -> None:
+    """test image_layout_service undoes the padding of every image of a batch with the shape of that image"""
+    large_image = Image(file_name="large_page.png", location="/path/to/large_page.png")
+    large_image.image = np.ones((1000, 800, 3), dtype=np.uint8)
+    small_image = Image(file_name="small_page.png", location="/path/to/small_page.png")
+    small_image.image = np.ones((100, 200, 3), dtype=np.uint8)
+
+    mock_detector = create_autospec(ObjectDetector, instance=True)
+    mock_detector.name = "fake_layout"
+    mock_detector.model_id = "fake_model_id"
+    mock_detector.predict_batch.return_value = [
+        [DetectionResult(box=[10.0, 10.0, 810.0, 1010.0], class_id=1, score=1.0, class_name=get_type("text"))],
+        [DetectionResult(box=[10.0, 10.0, 210.0, 110.0], class_id=1, score=1.0, class_name=get_type("text"))],
+    ]
+
+    layout_service = ImageLayoutService(
+        layout_detector=cast(ObjectDetector, mock_detector), padder=PadTransform(10, 10, 10, 10)
+    )
+    result_images = layout_service.pass_datapoints([large_image, small_image])
+
+    assert [np_image.shape[:2] for np_image in mock_detector.predict_batch.call_args[0][0]] == [(1020, 820), (120, 220)]
+    assert [
+        result_image.get_annotation()[0].get_bounding_box(result_image.image_id).to_list("xyxy")
+        for result_image in result_images
+    ] == [[0.0, 0.0, 800.0, 1000.0], [0.0, 0.0, 200.0, 100.0]]
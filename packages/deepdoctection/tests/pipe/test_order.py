@@ -25,8 +25,11 @@ to the processed datapoint.
 
 """
 
+import random
+
 from dd_core.datapoint import BoundingBox, ContainerAnnotation, Image, ImageAnnotation, get_type
-from deepdoctection.pipe.order import TextOrderService
+from dd_core.utils.object_types import LayoutLabel
+from deepdoctection.pipe.order import OrderGenerator, TextOrderService
 
 
 def test_integration_pipeline_component(dp_image_with_layout_and_word_annotations: Image) -> None:
@@ -174,3 +177,91 @@ def test_integration_pipeline_component_with_include_residual_text_container_to_
     assert sub_cat.category_id == 2
     sub_cat = word_anns[4].get_sub_category(get_type("reading_order"))
     assert sub_cat.category_id == 1
+
+
+def test_order_generator_with_box_array(dp_image_with_layout_and_word_annotations: Image) -> None:
+    """grouping with boxes from the box array of the image gives the same order as with the annotation boxes"""
+    dp = dp_image_with_layout_and_word_annotations
+    words = dp.get_annotation(category_names=LayoutLabel.WORD)
+    layouts = dp.get_annotation(category_names=[LayoutLabel.TEXT, LayoutLabel.TITLE])
+    order_generator = OrderGenerator(starting_point_tolerance=0.005, broken_line_tolerance=0.003, height_tolerance=2.0)
+
+    assert order_generator.group_words_into_lines(
+        words, dp.image_id, dp.get_annotation_boxes(words)
+    ) == order_generator.group_words_into_lines(words, dp.image_id)
+    assert order_generator.order_blocks(
+        list(layouts), dp.width, dp.height, boxes=dp.get_annotation_boxes(layouts)
+    ) == order_generator.order_blocks(list(layouts), dp.width, dp.height)
+
+
+def test_group_words_into_lines_assigns_word_to_first_matching_row() -> None:
+    """a word matching several rows is assigned to the row that has been defined first"""
+    dp = Image(file_name="test.png")
+    dp.set_width_height(200, 200)
+    for ulx, uly, lrx, lry in ((0, 0, 10, 10), (0, 30, 10, 40), (20, 4, 30, 36), (0, 100, 10, 110)):
+        dp.dump(
+            ImageAnnotation(
+                category_name=LayoutLabel.WORD,
+                bounding_box=BoundingBox(ulx=ulx, uly=uly, lrx=lrx, lry=lry, absolute_coords=True),
+            )
+        )
+    first, second, third, fourth = [ann.annotation_id for ann in dp.annotations]
+
+    word_order = OrderGenerator.group_words_into_lines(dp.annotations, dp.image_id)
+
+    assert word_order == [(1, 3, first), (2, 3, third), (3, 2, second), (4, 1, fourth)]
+
+
+def test_order_generator_with_box_array_rounds_centers_like_bounding_box() -> None:
+    """centers from the box array are rounded like `BoundingBox.cx` and `BoundingBox.cy` for random pages"""
+    rng = random.Random(0)
+    order_generator = OrderGenerator(starting_point_tolerance=0.005, broken_line_tolerance=0.003, height_tolerance=2.0)
+    for _ in range(30):
+        dp = Image(file_name="test.png")
+        dp.set_width_height(1000, 1400)
+        for _ in range(rng.randint(5, 60)):
+            ulx, uly = rng.uniform(0, 900), rng.choice(range(20, 1300, 25)) + rng.uniform(-6, 6)
+            dp.dump(
+                ImageAnnotation(
+                    category_name=LayoutLabel.WORD,
+                    bounding_box=BoundingBox(
+                        ulx=ulx,
+                        uly=uly,
+                        lrx=ulx + rng.uniform(5, 90),
+                        lry=uly + rng.uniform(8, 22) + rng.choice([0, 0.5]),
+                        absolute_coords=True,
+                    ),
+                )
+            )
+        words = dp.annotations
+        boxes = dp.get_annotation_boxes(words)
+
+        assert order_generator.group_words_into_lines(words, dp.image_id, boxes) == (
+            order_generator.group_words_into_lines(words, dp.image_id)
+        )
+        assert order_generator.group_lines_into_lines(words, dp.image_id, boxes) == (
+            order_generator.group_lines_into_lines(words, dp.image_id)
+        )
+        assert order_generator.order_blocks(list(words), dp.width, dp.height, boxes=boxes) == (
+            order_generator.order_blocks(list(words), dp.width, dp.height)
+        )
+
+
+def test_group_words_into_lines_with_box_array_uses_rounded_centers() -> None:
+    """a word whose rounded center lies on the lower row bound defines a new row on both paths"""
+    dp = Image(file_name="test.png")
+    dp.set_width_height(200, 200)
+    for ulx, uly, lrx, lry in ((0, 0, 10, 16), (20, 10, 30, 21)):
+        dp.dump(
+            ImageAnnotation(
+                category_name=LayoutLabel.WORD,
+                bounding_box=BoundingBox(ulx=ulx, uly=uly, lrx=lrx, lry=lry, absolute_coords=True),
+            )
+        )
+    first, second = [ann.annotation_id for ann in dp.annotations]
+
+    word_order = OrderGenerator.group_words_into_lines(
+        dp.annotations, dp.image_id, dp.get_annotation_boxes(dp.annotations)
+    )
+
+    assert word_order == [(1, 2, first), (2, 1, second)]
@@ -24,12 +24,16 @@ and processing of detection results, ensuring correct functionality
 of the sub-layout components when working with images and annotations.
 """
 
+from copy import deepcopy
 from typing import Mapping
 from unittest.mock import MagicMock
 
-from dd_core.datapoint import BoundingBox
+import numpy as np
+
+from dd_core.datapoint import BoundingBox, ImageAnnotation
 from dd_core.datapoint.image import Image
 from dd_core.utils.object_types import ObjectTypes, get_type
+from dd_core.utils.transform import PadTransform
 from deepdoctection.extern.base import DetectionResult, ObjectDetector
 from deepdoctection.pipe.sub_layout import DetectResultGenerator, SubImageLayoutService
 
@@ -79,7 +83,7 @@ class TestSubImageLayoutService:
         setup necessary components
         """
 
-        self._cell_detector = MagicMock(spec=ObjectDetector)
+        self._cell_detector = MagicMock(spec=ObjectDetector, accepts_batch=False)
         self._cell_detector.model_id = "test_model"
         self._cell_detector.name = "mock_cell_detector"
 
@@ -176,3 +180,136 @@ class TestSubImageLayoutService:
             self.sub_image_layout_service.pass_datapoint(dp_image)
         except ValueError:
             assert False, "ValueError was raised, because the sub image does not have a crop"
+
+    def test_pass_datapoint_with_batched_detector(  # type: ignore
+        self,
+        dp_image: Image,
+        layout_annotations,
+        cell_detect_results: list[list[DetectionResult]],
+    ) -> None:
+        """
+        All sub images of a page are passed to predict_batch at once and give the same annotations as predict
+        """
+        for img_ann in layout_annotations(segmentation=False):
+            dp_image.dump(img_ann)
+            dp_image.image_ann_to_image(img_ann.annotation_id, True)
+        other_dp_image = deepcopy(dp_image)
+
+        self._cell_detector.predict = MagicMock(side_effect=deepcopy(cell_detect_results))
+        expected = self.sub_image_layout_service.pass_datapoint(other_dp_image)
+
+        batch_cell_detector = MagicMock(spec=ObjectDetector, accepts_batch=True)
+        batch_cell_detector.model_id = "test_model"
+        batch_cell_detector.name = "mock_cell_detector"
+        batch_cell_detector.predict_batch = MagicMock(return_value=deepcopy(cell_detect_results))
+        dp = SubImageLayoutService(batch_cell_detector, get_type("table")).pass_datapoint(dp_image)
+
+        batch_cell_detector.predict_batch.assert_called_once()
+        assert len(batch_cell_detector.predict_batch.call_args[0][0]) == 2
+        batch_cell_detector.predict.assert_not_called()
+        assert [ann.as_dict() for ann in dp.annotations] == [ann.as_dict() for ann in expected.annotations]
+
+    def test_pass_datapoints_with_batched_detector(  # type: ignore
+        self,
+        dp_image: Image,
+        layout_annotations,
+        cell_detect_results: list[list[DetectionResult]],
+    ) -> None:
+        """
+        Sub images of several pages are passed to predict_batch at once and the results are scattered to their pages
+        """
+        for img_ann in layout_annotations(segmentation=False):
+            dp_image.dump(img_ann)
+            dp_image.image_ann_to_image(img_ann.annotation_id, True)
+        other_dp_image = deepcopy(dp_image)
+        other_dp_image.get_annotation(category_names=get_type("table"))[1].deactivate()
+
+        batch_cell_detector = MagicMock(spec=ObjectDetector, accepts_batch=True)
+        batch_cell_detector.model_id = "test_model"
+        batch_cell_detector.name = "mock_cell_detector"
+        batch_cell_detector.predict_batch = MagicMock(
+            return_value=deepcopy(cell_detect_results) + deepcopy(cell_detect_results[:1])
+        )
+        dps = SubImageLayoutService(batch_cell_detector, get_type("table")).pass_datapoints([dp_image, other_dp_image])
+
+        batch_cell_detector.predict_batch.assert_called_once()
+        assert len(batch_cell_detector.predict_batch.call_args[0][0]) == 3
+        first_tables = dps[0].get_annotation(category_names=get_type("table"))
+        second_tables = dps[1].get_annotation(category_names=get_type("table"))
+        assert [len(table.image.get_annotation()) for table in first_tables] == [2, 1]  # type: ignore
+        assert [len(table.image.get_annotation()) for table in second_tables] == [2]  # type: ignore
+        assert len(dps[1].get_annotation()) == len(dps[0].get_annotation()) - 2
+
+
+def _get_page_with_tables(table_boxes: list[tuple[float, float, float, float]]) -> Image:
+    dp = Image(file_name="page.png")
+    dp.image = np.ones((1000, 1000, 3), dtype=np.uint8)
+    for ulx, uly, lrx, lry in table_boxes:
+        table = ImageAnnotation(
+            category_name=get_type("table"),
+            bounding_box=BoundingBox(ulx=ulx, uly=uly, lrx=lrx, lry=lry, absolute_coords=True),
+        )
+        dp.dump(table)
+        dp.image_ann_to_image(table.annotation_id, True)
+    return dp
+
+
+def _get_batched_detector_detecting_padded_sub_images(padded_boxes: list[list[float]]) -> MagicMock:
+    detector = MagicMock(spec=ObjectDetector, accepts_batch=True)
+    detector.model_id = "test_model"
+    detector.name = "mock_row_detector"
+    detector.predict_batch = MagicMock(
+        return_value=[
+            [DetectionResult(box=box, score=0.9, class_id=1, class_name=get_type("row"))] for box in padded_boxes
+        ]
+    )
+    return detector
+
+
+def test_sub_image_layout_service_with_padder_undoes_padding_of_each_sub_image() -> None:
+    """
+    Sub images of different sizes are padded and passed to predict_batch at once. The padding of every sub image is
+    undone with the shape of that sub image.
+    """
+    dp = _get_page_with_tables([(0.0, 0.0, 490.0, 590.0), (600.0, 700.0, 700.0, 750.0)])
+    detector = _get_batched_detector_detecting_padded_sub_images(
+        [[10.0, 10.0, 500.0, 600.0], [10.0, 10.0, 110.0, 60.0]]
+    )
+
+    SubImageLayoutService(detector, get_type("table"), padder=PadTransform(10, 10, 10, 10)).pass_datapoint(dp)
+
+    assert [np_image.shape[:2] for np_image in detector.predict_batch.call_args[0][0]] == [(610, 510), (70, 120)]
+    row_boxes = [
+        row.get_bounding_box(dp.image_id)
+        for table in dp.get_annotation(category_names=get_type("table"))
+        for row in table.image.get_annotation()  # type: ignore
+    ]
+    assert row_boxes == [
+        BoundingBox(ulx=0.0, uly=0.0, lrx=0.49, lry=0.59, absolute_coords=False),
+        BoundingBox(ulx=0.6, uly=0.7, lrx=0.7, lry=0.75, absolute_coords=False),
+    ]
+
+
+def test_sub_image_layout_service_with_padder_undoes_padding_of_each_sub_image_of_a_batch() -> None:
+    """The padding of sub images of several pages of a batch is undone with the shape of each sub image"""
+    dps = [
+        _get_page_with_tables([(0.0, 0.0, 490.0, 590.0)]),
+        _get_page_with_tables([(600.0, 700.0, 700.0, 750.0)]),
+    ]
+    detector = _get_batched_detector_detecting_padded_sub_images(
+        [[10.0, 10.0, 500.0, 600.0], [10.0, 10.0, 110.0, 60.0]]
+    )
+
+    dps = SubImageLayoutService(detector, get_type("table"), padder=PadTransform(10, 10, 10, 10)).pass_datapoints(dps)
+
+    detector.predict_batch.assert_called_once()
+    row_boxes = [
+        row.get_bounding_box(dp.image_id)
+        for dp in dps
+        for table in dp.get_annotation(category_names=get_type("table"))
+        for row in table.image.get_annotation()  # type: ignore
+    ]
+    assert row_boxes == [
+        BoundingBox(ulx=0.0, uly=0.0, lrx=0.49, lry=0.59, absolute_coords=False),
+        BoundingBox(ulx=0.6, uly=0.7, lrx=0.7, lry=0.75, absolute_coords=False),
+    ]
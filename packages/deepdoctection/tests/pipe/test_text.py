@@ -25,8 +25,8 @@ from unittest.mock import MagicMock
 from pytest import mark, raises
 
 from dd_core.datapoint import BoundingBox, Image, ImageAnnotation
-from dd_core.utils.object_types import get_type
-from deepdoctection.extern.base import DetectionResult, ObjectDetector, PdfMiner
+from dd_core.utils.object_types import WordKey, get_type
+from deepdoctection.extern.base import DetectionResult, ObjectDetector, PdfMiner, TextRecognizer
 from deepdoctection.pipe.text import TextExtractionService
 
 
@@ -272,3 +272,107 @@ class TestTextExtractionServiceWithSubImage:
         )
         st_text_ann = second_table_ann.image.get_annotation(annotation_ids=fourth_word_ann.annotation_id)[0]
         assert isinstance(st_text_ann, ImageAnnotation)
+
+
+@mark.basic
+def test_text_extraction_service_batches_rois_of_a_page(dp_image: Image, layout_annotations) -> None:  # type: ignore
+    """
+    Detectors that accept batches receive all ROI crops of a page in one call of predict_batch
+    """
+    text_extract_detector = MagicMock(spec=ObjectDetector, accepts_batch=True)
+    text_extract_detector.name = "mock_text_extractor"
+    text_extract_detector.model_id = "test_model"
+    text_extraction_service = TextExtractionService(text_extract_detector, extract_from_roi=get_type("table"))
+
+    dp_image = deepcopy(dp_image)
+    for img_ann in layout_annotations():
+        dp_image.dump(img_ann)
+        dp_image.image_ann_to_image(img_ann.annotation_id, True)
+    word_detect_result = DetectionResult(
+        box=[10.0, 10.0, 24.0, 23.0], score=0.8, text="foo", class_id=1, class_name=get_type("word")
+    )
+    text_extract_detector.predict_batch = MagicMock(return_value=[[word_detect_result], [word_detect_result]])
+
+    dp = text_extraction_service.pass_datapoint(dp_image)
+
+    text_extract_detector.predict_batch.assert_called_once()
+    assert len(text_extract_detector.predict_batch.call_args[0][0]) == 2
+    text_extract_detector.predict.assert_not_called()
+    table_anns = dp.get_annotation(category_names=get_type("table"))
+    for table_ann in table_anns:
+        assert table_ann.image is not None
+        assert len(table_ann.image.get_annotation(category_names=get_type("word"))) == 1
+
+
+@mark.basic
+def test_text_extraction_service_skips_rois_without_input_when_batching(
+    dp_image: Image, layout_annotations  # type: ignore
+) -> None:
+    """
+    ROIs without predictor input are not passed to predict_batch
+    """
+    text_extract_detector = MagicMock(spec=ObjectDetector, accepts_batch=True)
+    text_extract_detector.name = "mock_text_extractor"
+    text_extract_detector.model_id = "test_model"
+    text_extraction_service = TextExtractionService(text_extract_detector, extract_from_roi=get_type("table"))
+
+    dp_image = deepcopy(dp_image)
+    for img_ann in layout_annotations():
+        dp_image.dump(img_ann)
+        dp_image.image_ann_to_image(img_ann.annotation_id, True)
+    first_table, second_table = dp_image.get_annotation(category_names=get_type("table"))
+    get_predictor_input = text_extraction_service.get_predictor_input
+    text_extraction_service.get_predictor_input = MagicMock(  # type: ignore
+        side_effect=lambda text_roi: None if text_roi is first_table else get_predictor_input(text_roi)
+    )
+    word_detect_result = DetectionResult(
+        box=[10.0, 10.0, 24.0, 23.0], score=0.8, text="foo", class_id=1, class_name=get_type("word")
+    )
+    text_extract_detector.predict_batch = MagicMock(return_value=[[word_detect_result]])
+
+    text_extraction_service.pass_datapoint(dp_image)
+
+    batch = text_extract_detector.predict_batch.call_args[0][0]
+    assert len(batch) == 1 and batch[0] is not None
+    assert not first_table.image.get_annotation(category_names=get_type("word"))  # type: ignore
+    assert len(second_table.image.get_annotation(category_names=get_type("word"))) == 1  # type: ignore
+
+
+@mark.basic
+def test_text_extraction_service_pools_text_rois_of_a_batch(
+    dp_image: Image, layout_annotations  # type: ignore
+) -> None:
+    """
+    Text recognizers receive the ROI crops of all pages of a batch in one call of predict. Results are routed back
+    to the pages by annotation_id
+    """
+    text_recognizer = MagicMock(spec=TextRecognizer, accepts_batch=True)
+    text_recognizer.name = "mock_text_recognizer"
+    text_recognizer.model_id = "test_model"
+    text_extraction_service = TextExtractionService(text_recognizer, extract_from_roi=get_type("table"))
+
+    dps = []
+    for page_number in range(2):
+        dp = Image(location=dp_image.location, file_name=f"page_{page_number}")
+        dp.image = dp_image.image
+        for img_ann in layout_annotations():
+            dp.dump(img_ann)
+            dp.image_ann_to_image(img_ann.annotation_id, True)
+        dps.append(dp)
+
+    def _recognize(images):  # type: ignore
+        # results are returned in reverse order, routing must only depend on the uuid
+        return [DetectionResult(score=0.9, text=f"text_{uuid}", uuid=uuid) for uuid, _ in reversed(images)]
+
+    text_recognizer.predict = MagicMock(side_effect=_recognize)
+
+    text_extraction_service.pass_datapoints(dps)
+
+    text_recognizer.predict.assert_called_once()
+    assert len(text_recognizer.predict.call_args[0][0]) == 4
+    for dp in dps:
+        table_anns = dp.get_annotation(category_names=get_type("table"))
+        assert len(table_anns) == 2
+        for table_ann in table_anns:
+            characters = table_ann.get_sub_category(WordKey.CHARACTERS)
+            assert characters.value == f"text_{table_ann.annotation_id}"  # type: ignore
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+bench_annotation_store.py
+
+Micro-benchmark of the annotation store of `Image` on a synthetic page with 10k words.
+
+Measured operations:
+- `dump` of all annotations of the page
+- `get_annotation` by `annotation_id` for every word, as done when resolving relationships
+- `get_annotation` by `category_name` and by `service_id`
+- `remove` of all annotations of one service
+
+As reference, the id lookups are also run with a linear scan over `Image.annotations`.
+
+Usage:
+- From repository root:
+    python scripts/benchmarks/bench_annotation_store.py --words 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from dd_core.datapoint.image import Image
+from dd_core.utils.object_types import LayoutLabel
+from synthetic import make_synthetic_page, timer
+from tabulate import tabulate
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--words", type=int, default=10000, help="Number of words of the synthetic page")
+    parser.add_argument("--lookups", type=int, default=100, help="Number of id lookups for the linear scan")
+    args = parser.parse_args()
+
+    page = make_synthetic_page(args.words)
+    annotations = page.annotations
+    for idx, ann in enumerate(annotations):
+        ann.service_id = "service_a" if idx % 2 else "service_b"
+    word_ids = [ann.annotation_id for ann in page.get_annotation(category_names=LayoutLabel.WORD)]
+
+    results: dict[str, float] = {}
+    image = Image(file_name="bench.png", location="bench")
+    with timer(results, "dump"):
+        for ann in annotations:
+            image.dump(ann)
+    with timer(results, "get_annotation(annotation_ids) per word"):
+        for ann_id in word_ids:
+            image.get_annotation(annotation_ids=ann_id)
+    with timer(results, f"linear scan per word ({args.lookups} words)"):
+        for ann_id in word_ids[: args.lookups]:
+            [ann for ann in image.annotations if ann.active and ann.annotation_id == ann_id]  # pylint: disable=W0106
+    with timer(results, "get_annotation(annotation_ids=all words)"):
+        image.get_annotation(annotation_ids=word_ids)
+    with timer(results, "get_annotation(category_names=text)"):
+        image.get_annotation(category_names=LayoutLabel.TEXT)
+    with timer(results, "get_annotation(service_ids=service_a)"):
+        image.get_annotation(service_ids="service_a")
+    with timer(results, "remove(service_ids=service_a)"):
+        image.remove(service_ids="service_a")
+
+    rows = [[key, f"{value * 1000:.2f}"] for key, value in results.items()]
+    print(f"{len(annotations)} annotations")
+    print(tabulate(rows, headers=["operation", "ms"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+bench_crop_memory.py
+
+Benchmark of memory and time for cropping sub images of all words and text blocks of a synthetic page with
+`Image.image_ann_to_image(crop_image=True)`, as done by `ImageCroppingService` or by layout services with
+`crop_image=True`.
+
+Crops are views into the pixels of the page. For comparison, the benchmark also materializes all crops into arrays of
+their own with `Image.materialize_image`, which is the memory that crops used to allocate.
+
+Memory is measured with `tracemalloc`, which tracks the allocations of NumPy arrays.
+
+Usage:
+- From repository root:
+    python scripts/benchmarks/bench_crop_memory.py --words 1000 5000 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import tracemalloc
+
+from dd_core.utils.object_types import LayoutLabel
+from synthetic import make_synthetic_page, timer
+from tabulate import tabulate
+
+
+def _mb(num_bytes: int) -> str:
+    return f"{num_bytes / 2**20:.1f}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--words", type=int, nargs="+", default=[1000, 5000, 10000], help="Number of words per page")
+    args = parser.parse_args()
+
+    rows = []
+    for num_words in args.words:
+        results: dict[str, float] = {}
+        page = make_synthetic_page(num_words, with_pixels=True)
+        anns = page.get_annotation(category_names=[LayoutLabel.TEXT, LayoutLabel.WORD])
+
+        tracemalloc.start()
+        with timer(results, "crop"):
+            for ann in anns:
+                page.image_ann_to_image(ann.annotation_id, crop_image=True)
+        _, crop_peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        with timer(results, "materialize"):
+            for ann in anns:
+                ann.image.materialize_image()  # type: ignore
+        materialized, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        rows.append(
+            [
+                num_words,
+                len(anns),
+                _mb(page.image.nbytes),  # type: ignore
+                _mb(crop_peak),
+                _mb(materialized),
+                f"{results['crop'] * 1000:.1f}",
+                f"{results['materialize'] * 1000:.1f}",
+            ]
+        )
+
+    print(
+        tabulate(
+            rows,
+            headers=[
+                "words",
+                "crops",
+                "page MB",
+                "crops (views) MB",
+                "crops (materialized) MB",
+                "crop ms",
+                "materialize ms",
+            ],
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+bench_document_open.py
+
+Benchmark of opening a synthetic many-page PDF with `Document` and reading all of its pages with `Document.get_image`.
+
+`Document` only reads the page count and the media boxes of the pages when it is constructed and loads pages on
+access into a cache of `max_cached_pages` pages. For comparison, the benchmark also builds an `Image` for every page
+from `PDFStreamer`, i.e. splits the PDF into single-page PDF bytes, which is how `Document` used to materialize every
+page at construction when `pypdfium2` is not installed.
+
+Memory is measured with `tracemalloc`, which does not track memory allocated by `pypdfium2`.
+
+Usage:
+- From repository root:
+    python scripts/benchmarks/bench_document_open.py --pages 100 500 2000 --max-cached-pages 32
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import tracemalloc
+
+from dd_core.datapoint.image import Image
+from dd_core.doc import Document
+from dd_core.utils.pdf_utils import PDFStreamer
+from pypdf import PdfWriter
+from synthetic import timer
+from tabulate import tabulate
+
+
+def _mb(num_bytes: int) -> str:
+    return f"{num_bytes / 2**20:.1f}"
+
+
+def _write_pdf(path: str, num_pages: int) -> None:
+    writer = PdfWriter()
+    for _ in range(num_pages):
+        writer.add_blank_page(width=612, height=792)
+    with open(path, "wb") as file:
+        writer.write(file)
+
+
+def _load_eager(path: str) -> list[Image]:
+    images = []
+    for pdf_bytes, page_number in PDFStreamer(path_or_bytes=path):
+        image = Image(file_name=f"synthetic_{page_number}.pdf", location=path, page_number=page_number)
+        image.pdf_bytes = pdf_bytes
+        images.append(image)
+    return images
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, nargs="+", default=[100, 500, 2000], help="Number of pages of the PDF")
+    parser.add_argument("--max-cached-pages", type=int, default=32, help="Page cache size of the Document")
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for num_pages in args.pages:
+            results: dict[str, float] = {}
+            path = os.path.join(tmp_dir, f"synthetic_{num_pages}.pdf")
+            _write_pdf(path, num_pages)
+
+            tracemalloc.start()
+            with timer(results, "open"):
+                doc = Document(location=path, max_cached_pages=args.max_cached_pages)
+            _, open_peak = tracemalloc.get_traced_memory()
+            with timer(results, "read all pages"):
+                for page_number in range(1, len(doc) + 1):
+                    doc.get_image(page_number=page_number)
+            lazy_memory, _ = tracemalloc.get_traced_memory()
+            del doc
+            tracemalloc.stop()
+
+            tracemalloc.start()
+            with timer(results, "eager load"):
+                pages = _load_eager(path)
+            eager_memory, _ = tracemalloc.get_traced_memory()
+            del pages
+            tracemalloc.stop()
+
+            rows.append(
+                [
+                    num_pages,
+                    f"{results['open'] * 1000:.1f}",
+                    f"{results['read all pages'] * 1000:.1f}",
+                    f"{results['eager load'] * 1000:.1f}",
+                    _mb(open_peak),
+                    _mb(lazy_memory),
+                    _mb(eager_memory),
+                ]
+            )
+
+    print(
+        tabulate(
+            rows,
+            headers=[
+                "pages",
+                "open ms",
+                "read all pages ms",
+                "eager load ms",
+                "open MB",
+                "after reading MB",
+                "eager MB",
+            ],
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
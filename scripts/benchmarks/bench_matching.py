@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+bench_matching.py
+
+Benchmark of `match_anns_by_intersection` with the dense iou/ioa-matrix and with the grid based spatial index
+(`use_spatial_index=True`) on synthetic pages of different densities.
+
+For every page, words are matched to text blocks with:
+- `ioa` and `max_parent_only=True` (the analyzer default)
+- `ioa` with weighted intersections
+- `iou`
+
+Every run also checks that both backends return the same child/parent indices.
+
+Usage:
+- From repository root:
+    python scripts/benchmarks/bench_matching.py --words 500 2000 5000 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+
+import numpy as np
+
+from dd_core.mapper.match import match_anns_by_intersection
+from dd_core.utils.object_types import LayoutLabel
+from synthetic import make_synthetic_page, timer
+from tabulate import tabulate
+
+_SETTINGS = {
+    "ioa, max_parent_only": {"matching_rule": "ioa", "threshold": 0.3, "max_parent_only": True},
+    "ioa, weighted": {"matching_rule": "ioa", "threshold": 0.6, "use_weighted_intersections": True},
+    "iou": {"matching_rule": "iou", "threshold": 0.01},
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--words", type=int, nargs="+", default=[500, 2000, 5000, 10000], help="Number of words per synthetic page"
+    )
+    parser.add_argument("--repeats", type=int, default=3, help="Number of runs per setting. The minimum is reported")
+    args = parser.parse_args()
+
+    rows = []
+    for num_words in args.words:
+        page = make_synthetic_page(num_words)
+        num_blocks = len(page.get_annotation(category_names=LayoutLabel.TEXT))
+        page.get_box_array()
+        for setting, kwargs in _SETTINGS.items():
+            results: dict[str, list[float]] = {"dense": [], "spatial index": []}
+            outputs = {}
+            for _ in range(args.repeats):
+                for backend, use_spatial_index in (("dense", False), ("spatial index", True)):
+                    timings: dict[str, float] = {}
+                    with timer(timings, backend):
+                        outputs[backend] = match_anns_by_intersection(
+                            page,
+                            parent_ann_category_names=LayoutLabel.TEXT,
+                            child_ann_category_names=LayoutLabel.WORD,
+                            use_spatial_index=use_spatial_index,
+                            **kwargs,  # type: ignore
+                        )
+                    results[backend].append(timings[backend])
+            assert np.array_equal(outputs["dense"][0], outputs["spatial index"][0])
+            assert np.array_equal(outputs["dense"][1], outputs["spatial index"][1])
+            dense, sparse = min(results["dense"]), min(results["spatial index"])
+            rows.append(
+                [
+                    num_words,
+                    num_blocks,
+                    setting,
+                    len(outputs["dense"][0]),
+                    f"{dense * 1000:.2f}",
+                    f"{sparse * 1000:.2f}",
+                    f"{dense / sparse:.1f}x",
+                ]
+            )
+
+    print(tabulate(rows, headers=["words", "blocks", "setting", "matches", "dense ms", "spatial index ms", "speedup"]))
+
+
+if __name__ == "__main__":
+    main()
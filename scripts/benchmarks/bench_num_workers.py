@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+bench_num_workers.py
+
+Measures the throughput of `DoctectionPipe.analyze(num_workers=K)` for different numbers of worker processes.
+
+The pipeline consists of the rule based components `MatchingService` and `TextOrderService` that run on synthetic
+pages with a few thousand words (see `synthetic.py`). No model weights are required.
+
+Usage:
+- From repository root:
+    python scripts/benchmarks/bench_num_workers.py --pages 32 --words 2000 --workers 1 2 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from dd_core.dataflow import DataFromList
+from dd_core.utils.object_types import LayoutLabel, RelationshipKey
+from deepdoctection.pipe.common import FamilyCompound, IntersectionMatcher, MatchingService
+from deepdoctection.pipe.doctectionpipe import DoctectionPipe
+from deepdoctection.pipe.order import TextOrderService
+from synthetic import make_synthetic_page
+from tabulate import tabulate
+
+
+def build_pipe() -> DoctectionPipe:
+    """Rule based pipeline: word matching and reading order"""
+    matching = MatchingService(
+        family_compounds=[
+            FamilyCompound(
+                parent_categories=[LayoutLabel.TEXT],
+                child_categories=[LayoutLabel.WORD],
+                relationship_key=RelationshipKey.CHILD,
+            )
+        ],
+        matcher=IntersectionMatcher(matching_rule="ioa", threshold=0.6),
+    )
+    order = TextOrderService(
+        text_container=LayoutLabel.WORD,
+        text_block_categories=[LayoutLabel.TEXT],
+        floating_text_block_categories=[LayoutLabel.TEXT],
+    )
+    return DoctectionPipe(pipeline_component_list=[matching, order])
+
+
+def run(num_pages: int, num_words: int, num_workers: int) -> float:
+    """Returns pages per second"""
+    pages = [make_synthetic_page(num_words, page_number=idx + 1) for idx in range(num_pages)]
+    pipe = build_pipe()
+    df = pipe.analyze(dataset_dataflow=DataFromList(pages, shuffle=False), output="image", num_workers=num_workers)
+    df.reset_state()
+    start = time.perf_counter()
+    count = sum(1 for _ in df)
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=32, help="Number of synthetic pages")
+    parser.add_argument("--words", type=int, default=2000, help="Number of words per page")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="Numbers of worker processes")
+    args = parser.parse_args()
+
+    rows = []
+    baseline = None
+    for num_workers in args.workers:
+        pages_per_sec = run(args.pages, args.words, num_workers)
+        baseline = baseline or pages_per_sec
+        rows.append([num_workers, f"{pages_per_sec:.2f}", f"{pages_per_sec / baseline:.2f}x"])
+    print(tabulate(rows, headers=["num_workers", "pages/sec", "speedup"]))
+
+
+if __name__ == "__main__":
+    main()
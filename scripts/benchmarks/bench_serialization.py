@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+bench_serialization.py
+
+Benchmark of saving and loading a processed synthetic document with the JSON format and with the binary columnar
+format of `dd_core.datapoint.columnar`.
+
+The JSON format is written as by `Document.save`, i.e. one indented JSON file with the dicts of all pages, and loaded
+as by `Document.from_json`, i.e. with `Image(**page_dict)` for every page. The columnar format is written with
+`save_columnar` and loaded with `load_columnar`. Reading a single column from the columnar file is measured as well.
+
+Pixels are left out by default, as synthetic pages have the size of a DIN A4 page at 300 dpi. Pass `--with-pixels`
+together with a small number of pages to include them.
+
+Usage:
+- From repository root:
+    python scripts/benchmarks/bench_serialization.py --pages 300 --words 500
+    python scripts/benchmarks/bench_serialization.py --pages 5 --words 500 --with-pixels
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import tempfile
+
+from dd_core.datapoint.columnar import ColumnarReader, load_columnar, save_columnar
+from dd_core.datapoint.image import Image
+from synthetic import make_synthetic_page, timer
+from tabulate import tabulate
+
+
+def _mb(num_bytes: int) -> str:
+    return f"{num_bytes / 2**20:.1f}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=300, help="Number of pages of the document")
+    parser.add_argument("--words", type=int, default=500, help="Number of words per page")
+    parser.add_argument("--with-pixels", action="store_true", help="Save the pixels of the pages")
+    args = parser.parse_args()
+
+    pages = [
+        make_synthetic_page(args.words, page_number=page_number, with_pixels=args.with_pixels)
+        for page_number in range(1, args.pages + 1)
+    ]
+    results: dict[str, float] = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        json_path = os.path.join(tmp_dir, "document.json")
+        npz_path = os.path.join(tmp_dir, "document.npz")
+
+        with timer(results, "json save"):
+            with open(json_path, "w", encoding="UTF-8") as file:
+                json.dump({"_images": {page.image_id: page.as_dict() for page in pages}}, file, indent=2)
+        with timer(results, "json load"):
+            with open(json_path, "r", encoding="UTF-8") as file:
+                json_pages = [Image(**page_dict) for page_dict in json.load(file)["_images"].values()]
+
+        with timer(results, "npz save"):
+            save_columnar(pages, npz_path)
+        with timer(results, "npz load"):
+            npz_pages = load_columnar(npz_path)
+        with timer(results, "npz read column"):
+            with ColumnarReader(npz_path) as reader:
+                reader.column("annotation.category_name")
+
+        if [page.as_dict() for page in npz_pages] != [page.as_dict() for page in json_pages]:
+            raise RuntimeError("Pages loaded from JSON and from the columnar format differ")
+
+        num_annotations = sum(len(page.annotations) for page in pages)
+        rows = [
+            [
+                "json",
+                f"{results['json save']:.2f}",
+                f"{results['json load']:.2f}",
+                "",
+                _mb(os.path.getsize(json_path)),
+            ],
+            [
+                "npz",
+                f"{results['npz save']:.2f}",
+                f"{results['npz load']:.2f}",
+                f"{results['npz read column']:.3f}",
+                _mb(os.path.getsize(npz_path)),
+            ],
+        ]
+
+    print(f"{args.pages} pages, {num_annotations} annotations, pixels: {args.with_pixels}")
+    print(tabulate(rows, headers=["format", "save s", "load s", "read column s", "size MB"]))
+
+
+if __name__ == "__main__":
+    main()
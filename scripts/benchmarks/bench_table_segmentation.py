@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+bench_table_segmentation.py
+
+Benchmark of table segmentation on synthetic pages with many large tables, e.g. financial reports. Every table has
+rows, columns and cells, some of the cells span two columns.
+
+Measured operations:
+- `segment_table` for all tables of the page, i.e. the assignment of cells to rows and columns
+- `TableSegmentationService` on the whole page, including stretching and tiling of rows and columns and writing all
+  row/column numbers and spans as sub categories
+
+Usage:
+- From repository root:
+    python scripts/benchmarks/bench_table_segmentation.py --tables 5 10 20 --rows 30 --cols 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+
+from dd_core.utils.object_types import CellKey, CellLabel, LayoutLabel
+from deepdoctection.pipe.segment import TableSegmentationService, segment_table
+from synthetic import make_synthetic_table_page, timer
+from tabulate import tabulate
+
+_CELL_NAMES = [CellLabel.COLUMN_HEADER, CellLabel.BODY, LayoutLabel.CELL]
+_ITEM_NAMES = [LayoutLabel.ROW, LayoutLabel.COLUMN]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tables", type=int, nargs="+", default=[5, 10, 20], help="Number of tables per page")
+    parser.add_argument("--rows", type=int, default=30, help="Number of rows per table")
+    parser.add_argument("--cols", type=int, default=8, help="Number of columns per table")
+    args = parser.parse_args()
+
+    # tiling with rule "equal" logs a warning for every last row and column of a table
+    logging.disable(logging.WARNING)
+    service = TableSegmentationService(
+        segment_rule="ioa",
+        threshold_rows=0.4,
+        threshold_cols=0.4,
+        tile_table_with_items=True,
+        remove_iou_threshold_rows=0.2,
+        remove_iou_threshold_cols=0.2,
+        table_name=LayoutLabel.TABLE,
+        cell_names=_CELL_NAMES,
+        item_names=_ITEM_NAMES,
+        sub_item_names=[CellKey.ROW_NUMBER, CellKey.COLUMN_NUMBER],
+        stretch_rule="equal",
+    )
+
+    rows = []
+    for num_tables in args.tables:
+        results: dict[str, float] = {}
+        page = make_synthetic_table_page(num_tables, num_rows=args.rows, num_cols=args.cols)
+        with timer(results, "TableSegmentationService"):
+            service.pass_datapoint(page)
+        with timer(results, "segment_table"):
+            for table in page.get_annotation(category_names=LayoutLabel.TABLE):
+                segment_table(page, table, _ITEM_NAMES, _CELL_NAMES, "ioa", 0.4, 0.4)
+
+        rows.append([num_tables, len(page.annotations), *(f"{value * 1000:.1f}" for value in results.values())])
+
+    print(tabulate(rows, headers=["tables", "annotations", *(f"{key} ms" for key in results)]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+bench_tesseract.py
+
+Benchmark of Tesseract OCR on text block crops, as produced when `TextExtractionService` runs OCR per layout block.
+
+Compared paths:
+- `TesseractOcrDetector.predict` for every block, i.e. one Tesseract process per block
+- `TesseractOcrDetector.predict_batch` for all blocks of a page with a `TesseractPool` of `num_workers` workers. Without
+  `tesserocr` this runs one Tesseract process per worker and page, otherwise it uses long-lived in-process APIs.
+
+Requires Tesseract to be installed.
+
+Usage:
+- From repository root:
+    python scripts/benchmarks/bench_tesseract.py --pages 4 --blocks 20 --num-workers 1 2 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+
+import numpy as np
+from dd_core.utils.env_info import SETTINGS
+from dd_core.utils.file_utils import tesseract_available, tesserocr_available
+from dd_core.utils.types import PixelValues
+from deepdoctection.extern.tessocr import TesseractOcrDetector
+from PIL import Image as PILImage
+from PIL import ImageDraw
+from synthetic import timer
+from tabulate import tabulate
+
+_WORDS = ("invoice", "total", "amount", "date", "customer", "number", "payment", "due", "net", "tax", "order", "item")
+
+
+def make_block_crop(rng: random.Random, lines: int = 3, words_per_line: int = 6) -> PixelValues:
+    """Renders a text block with a few lines of random words in BGR format"""
+    crop = PILImage.new("RGB", (60 * words_per_line, 24 * lines + 10), "white")
+    draw = ImageDraw.Draw(crop)
+    for line in range(lines):
+        text = " ".join(rng.choice(_WORDS) for _ in range(words_per_line))
+        draw.text((5, 5 + 24 * line), text, fill="black")
+    return np.asarray(crop)[:, :, ::-1].copy()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=4, help="Number of pages")
+    parser.add_argument("--blocks", type=int, default=20, help="Number of text blocks per page")
+    parser.add_argument("--num-workers", type=int, nargs="+", default=[1, 2, 4], help="Pool sizes to compare")
+    args = parser.parse_args()
+
+    if not tesseract_available():
+        raise SystemExit("Tesseract is not installed")
+
+    rng = random.Random(42)
+    pages = [[make_block_crop(rng) for _ in range(args.blocks)] for _ in range(args.pages)]
+    num_blocks = args.pages * args.blocks
+
+    results: dict[str, float] = {}
+    detector = TesseractOcrDetector(SETTINGS.CONF_TESSERACT_SRC)
+    with timer(results, "predict per block"):
+        for crops in pages:
+            for crop in crops:
+                detector.predict(crop)
+
+    for num_workers in args.num_workers:
+        detector = TesseractOcrDetector(SETTINGS.CONF_TESSERACT_SRC, num_workers=num_workers)
+        with timer(results, f"predict_batch per page, num_workers={num_workers}"):
+            for crops in pages:
+                detector.predict_batch(crops)
+
+    rows = [[key, f"{value:.2f}", f"{num_blocks / value:.1f}"] for key, value in results.items()]
+    print(f"{num_blocks} blocks, tesserocr available: {tesserocr_available()}")
+    print(tabulate(rows, headers=["path", "s", "blocks/s"]))
+
+
+if __name__ == "__main__":
+    main()
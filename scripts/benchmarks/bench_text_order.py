@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+bench_text_order.py
+
+Benchmark of reading order generation on dense multi-column pages, e.g. newspapers or bank statements with several
+thousand words. Lines of neighbouring columns are shifted against each other, so that they do not form common rows.
+
+Measured operations:
+- `OrderGenerator.group_words_into_lines` with all words of the page
+- `TextLineGenerator.create_detection_result` with all words of the page, as done for residual words
+- `TextOrderService` on a page where all words have been matched to text blocks by `MatchingService`
+- `TextOrderService` on a page without matched words, so that all words are residual words
+
+Usage:
+- From repository root:
+    python scripts/benchmarks/bench_text_order.py --words 3000 6000 10000 --columns 3 5
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from dd_core.utils.object_types import LayoutLabel, RelationshipKey
+from deepdoctection.pipe.common import FamilyCompound, IntersectionMatcher, MatchingService
+from deepdoctection.pipe.order import OrderGenerator, TextLineGenerator, TextOrderService
+from synthetic import make_synthetic_page, timer
+from tabulate import tabulate
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--words", type=int, nargs="+", default=[3000, 6000, 10000], help="Number of words per synthetic page"
+    )
+    parser.add_argument("--columns", type=int, nargs="+", default=[3, 5], help="Number of text columns")
+    parser.add_argument("--column-shift", type=float, default=0.37, help="Shift of lines between columns")
+    args = parser.parse_args()
+
+    matching_service = MatchingService(
+        family_compounds=[
+            FamilyCompound(
+                parent_categories=[LayoutLabel.TEXT],
+                child_categories=[LayoutLabel.WORD],
+                relationship_key=RelationshipKey.CHILD,
+            )
+        ],
+        matcher=IntersectionMatcher(matching_rule="ioa", threshold=0.3, max_parent_only=True),
+    )
+    text_order_service = TextOrderService(
+        text_container=LayoutLabel.WORD,
+        text_block_categories=[LayoutLabel.TEXT],
+        floating_text_block_categories=[LayoutLabel.TEXT],
+    )
+    text_line_generator = TextLineGenerator(make_sub_lines=True, paragraph_break=0.035)
+
+    rows = []
+    for num_columns in args.columns:
+        for num_words in args.words:
+            results: dict[str, float] = {}
+            page = make_synthetic_page(num_words, num_columns=num_columns, column_shift=args.column_shift)
+            word_anns = page.get_annotation(category_names=LayoutLabel.WORD)
+            with timer(results, "group_words_into_lines"):
+                word_order = OrderGenerator.group_words_into_lines(word_anns, page.image_id)
+            with timer(results, "create_detection_result"):
+                text_line_generator.create_detection_result(word_anns, page.width, page.height, page.image_id)
+
+            matching_service.pass_datapoint(page)
+            with timer(results, "TextOrderService (matched)"):
+                text_order_service.pass_datapoint(page)
+
+            page = make_synthetic_page(num_words, num_columns=num_columns, column_shift=args.column_shift)
+            with timer(results, "TextOrderService (residual)"):
+                text_order_service.pass_datapoint(page)
+
+            num_rows = max(word[1] for word in word_order)
+            rows.append([num_columns, num_words, num_rows, *(f"{value * 1000:.1f}" for value in results.values())])
+
+    print(tabulate(rows, headers=["columns", "words", "rows", *(f"{key} ms" for key in results)]))
+
+
+if __name__ == "__main__":
+    main()
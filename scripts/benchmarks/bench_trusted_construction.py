@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+bench_trusted_construction.py
+
+Benchmark of building annotations with the validating constructors and with the trusted construction path
+`from_trusted`, which skips field validation and coercion.
+
+Three workloads are measured:
+- prediction: `ImageAnnotation` with a `BoundingBox` built from detector output, as done by `DatapointManager`
+- category: `CategoryAnnotation` built from classifier output
+- load: `ImageAnnotation` built from its dict, including the `characters` sub category, as done by the JSON loaders
+
+Usage:
+- From repository root:
+    python scripts/benchmarks/bench_trusted_construction.py --annotations 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+
+from dd_core.datapoint.annotation import CategoryAnnotation, ImageAnnotation
+from dd_core.datapoint.box import BoundingBox
+from dd_core.utils.object_types import LayoutLabel, PageKey
+from synthetic import make_synthetic_page, timer
+from tabulate import tabulate
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--annotations", type=int, default=100_000, help="Number of annotations per workload")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    detections = []
+    for _ in range(args.annotations):
+        ulx, uly = rng.uniform(0, 2000), rng.uniform(0, 3000)
+        detections.append((ulx, uly, ulx + rng.uniform(1, 400), uly + rng.uniform(1, 400), rng.random()))
+    page = make_synthetic_page(500)
+    word_dicts = [ann.as_dict() for ann in page.get_annotation(category_names=LayoutLabel.WORD)]
+    ann_dicts = [word_dicts[idx % len(word_dicts)] for idx in range(args.annotations)]
+
+    results: dict[str, float] = {}
+    with timer(results, "prediction validated"):
+        for ulx, uly, lrx, lry, score in detections:
+            ImageAnnotation(
+                category_name=LayoutLabel.TEXT,
+                category_id=1,
+                score=score,
+                bounding_box=BoundingBox(ulx=ulx, uly=uly, lrx=lrx, lry=lry, absolute_coords=True),
+            )
+    with timer(results, "prediction trusted"):
+        for ulx, uly, lrx, lry, score in detections:
+            ImageAnnotation.from_trusted(
+                category_name=LayoutLabel.TEXT,
+                category_id=1,
+                score=score,
+                bounding_box=BoundingBox.from_trusted(True, ulx, uly, lrx, lry),
+            )
+
+    with timer(results, "category validated"):
+        for *_, score in detections:
+            CategoryAnnotation(category_name=PageKey.DOCUMENT_TYPE, category_id=2, score=score)
+    with timer(results, "category trusted"):
+        for *_, score in detections:
+            CategoryAnnotation.from_trusted(category_name=PageKey.DOCUMENT_TYPE, category_id=2, score=score)
+
+    with timer(results, "load validated"):
+        validated = [ImageAnnotation(**ann_dict) for ann_dict in ann_dicts]
+    with timer(results, "load trusted"):
+        trusted = [ImageAnnotation.from_trusted(**ann_dict) for ann_dict in ann_dicts]
+
+    if [ann.as_dict() for ann in trusted[: len(word_dicts)]] != [ann.as_dict() for ann in validated[: len(word_dicts)]]:
+        raise RuntimeError("Annotations built with the trusted path differ from validated annotations")
+
+    rows = []
+    for workload in ("prediction", "category", "load"):
+        validated_time, trusted_time = results[f"{workload} validated"], results[f"{workload} trusted"]
+        rows.append(
+            [
+                workload,
+                f"{validated_time:.2f}",
+                f"{trusted_time:.2f}",
+                f"{1e6 * validated_time / args.annotations:.1f}",
+                f"{1e6 * trusted_time / args.annotations:.1f}",
+                f"{validated_time / trusted_time:.2f}x",
+            ]
+        )
+
+    print(f"{args.annotations} annotations per workload")
+    print(
+        tabulate(
+            rows, headers=["workload", "validated s", "trusted s", "validated µs/ann", "trusted µs/ann", "speedup"]
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
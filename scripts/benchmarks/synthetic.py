@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Synthetic pages for benchmarks.
+
+A synthetic page is an `Image` of a multi-column document: Every column contains text blocks, every text block
+contains lines of words. Words have a `characters` sub category, so that the page can be processed by
+`MatchingService`, `TextOrderService` and `PageParsingService` without running any model.
+
+A synthetic table page contains tables with rows, columns and cells, so that it can be processed by
+`TableSegmentationService`.
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+import numpy as np
+from dd_core.datapoint.annotation import ContainerAnnotation, ImageAnnotation
+from dd_core.datapoint.box import BoundingBox, local_to_global_coords
+from dd_core.datapoint.image import Image
+from dd_core.utils.object_types import LayoutLabel, RelationshipKey, WordKey
+
+PAGE_WIDTH = 2480
+PAGE_HEIGHT = 3508
+
+
+def make_synthetic_page(
+    num_words: int,
+    num_columns: int = 3,
+    words_per_line: int = 8,
+    lines_per_block: int = 6,
+    page_number: int = 1,
+    with_pixels: bool = False,
+    column_shift: float = 0.0,
+) -> Image:
+    """
+    Generates a synthetic page with about `num_words` words distributed over `num_columns` columns.
+
+    Args:
+        num_words: Number of words.
+        num_columns: Number of text columns.
+        words_per_line: Number of words of each line.
+        lines_per_block: Number of lines of each text block.
+        page_number: Page number of the image.
+        with_pixels: Whether to attach a white pixel array. Otherwise, only width and height are set.
+        column_shift: Vertical shift of the lines of each column relative to the previous column, as fraction of the
+                      line height. With a shift, lines of neighbouring columns are not aligned, like in newspapers.
+
+    Returns:
+        An `Image` with `text` and `word` annotations.
+    """
+    image = Image(file_name=f"synthetic_{page_number}.png", location="synthetic", page_number=page_number)
+    if with_pixels:
+        image.image = np.full((PAGE_HEIGHT, PAGE_WIDTH, 3), 255, dtype=np.uint8)
+    else:
+        image.set_width_height(PAGE_WIDTH, PAGE_HEIGHT)
+    column_width = PAGE_WIDTH / num_columns
+    words_per_column = max(1, -(-num_words // num_columns))
+    num_lines = -(-words_per_column // words_per_line)
+    line_height = max(2.0, (PAGE_HEIGHT - 100) / (num_lines + num_lines // lines_per_block + 1))
+    word_width = (column_width - 40) / words_per_line
+
+    word_count = 0
+    for column in range(num_columns):
+        x_0 = column * column_width + 20
+        y_pos = 50.0 + (column * column_shift % 1) * line_height
+        for line in range(num_lines):
+            if line % lines_per_block == 0:
+                block_lines = min(lines_per_block, num_lines - line)
+                image.dump(
+                    ImageAnnotation(
+                        category_name=LayoutLabel.TEXT,
+                        bounding_box=BoundingBox(
+                            ulx=x_0 - 5,
+                            uly=y_pos - 5,
+                            lrx=x_0 + column_width - 35,
+                            lry=y_pos + block_lines * line_height + 5,
+                            absolute_coords=True,
+                        ),
+                        score=0.9,
+                    )
+                )
+            for word in range(words_per_line):
+                if word_count == num_words:
+                    break
+                ann = ImageAnnotation(
+                    category_name=LayoutLabel.WORD,
+                    bounding_box=BoundingBox(
+                        ulx=x_0 + word * word_width,
+                        uly=y_pos,
+                        lrx=x_0 + (word + 0.8) * word_width,
+                        lry=y_pos + 0.8 * line_height,
+                        absolute_coords=True,
+                    ),
+                    score=0.9,
+                )
+                image.dump(ann)
+                ann.dump_sub_category(
+                    WordKey.CHARACTERS,
+                    ContainerAnnotation(category_name=WordKey.CHARACTERS, value=f"w{word_count}"),
+                    image.image_id,
+                )
+                word_count += 1
+            y_pos += line_height
+            if (line + 1) % lines_per_block == 0:
+                y_pos += line_height
+    return image
+
+
+def _dump_table_item(image: Image, table: ImageAnnotation, category_name: LayoutLabel, box: list[float]) -> None:
+    """Dumps a row, column or cell with table coordinates like the sub image layout service does"""
+    assert table.image is not None
+    ann = ImageAnnotation(
+        category_name=category_name,
+        bounding_box=BoundingBox(ulx=box[0], uly=box[1], lrx=box[2], lry=box[3], absolute_coords=True),
+        score=0.9,
+        external_id=f"{table.annotation_id}_{len(table.get_relationship(RelationshipKey.CHILD))}",
+    )
+    image.dump(ann)
+    table.image.dump(ann)
+    table.image.image_ann_to_image(ann.annotation_id)
+    assert ann.image is not None and ann.bounding_box is not None
+    table_box = table.get_bounding_box(image.image_id).transform(image.width, image.height, absolute_coords=True)
+    ann.image.set_embedding(
+        table.annotation_id,
+        ann.bounding_box.transform(table.image.width, table.image.height, absolute_coords=False),
+    )
+    ann.image.set_embedding(
+        image.image_id,
+        local_to_global_coords(ann.bounding_box, table_box).transform(image.width, image.height, absolute_coords=False),
+    )
+    table.dump_relationship(RelationshipKey.CHILD, ann.annotation_id)
+
+
+def make_synthetic_table_page(num_tables: int, num_rows: int = 30, num_cols: int = 8, seed: int = 0) -> Image:
+    """
+    Generates a synthetic page with `num_tables` tables stacked vertically, e.g. like a page of a financial report. Every
+    table has rows, columns and cells with slightly jittered boxes, as predicted by a cell and an item detector. Some
+    cells span two columns.
+
+    Args:
+        num_tables: Number of tables.
+        num_rows: Number of rows of each table.
+        num_cols: Number of columns of each table.
+        seed: Seed for the jitter of boxes.
+
+    Returns:
+        An `Image` with `table`, `row`, `column` and `cell` annotations. Rows, columns and cells are children of their
+        table and have embeddings with respect to the table and the page.
+    """
+    rng = np.random.default_rng(seed)
+    image = Image(file_name="synthetic_tables.png", location="synthetic")
+    image.set_width_height(PAGE_WIDTH, PAGE_HEIGHT)
+    table_height = (PAGE_HEIGHT - 100) / num_tables
+    for table_idx in range(num_tables):
+        table = ImageAnnotation(
+            category_name=LayoutLabel.TABLE,
+            bounding_box=BoundingBox(
+                ulx=50,
+                uly=50 + table_idx * table_height,
+                lrx=PAGE_WIDTH - 50,
+                lry=50 + (table_idx + 0.9) * table_height,
+                absolute_coords=True,
+            ),
+            score=0.9,
+        )
+        image.dump(table)
+        image.image_ann_to_image(table.annotation_id)
+        assert table.image is not None
+        row_height, col_width = table.image.height / num_rows, table.image.width / num_cols
+
+        def jitter(size: float) -> float:
+            return float(rng.uniform(0.05, 0.15)) * size
+
+        for row in range(num_rows):
+            _dump_table_item(
+                image,
+                table,
+                LayoutLabel.ROW,
+                [
+                    jitter(col_width),
+                    row * row_height + jitter(row_height),
+                    table.image.width - jitter(col_width),
+                    (row + 1) * row_height - jitter(row_height),
+                ],
+            )
+        for col in range(num_cols):
+            _dump_table_item(
+                image,
+                table,
+                LayoutLabel.COLUMN,
+                [
+                    col * col_width + jitter(col_width),
+                    jitter(row_height),
+                    (col + 1) * col_width - jitter(col_width),
+                    table.image.height - jitter(row_height),
+                ],
+            )
+        for row in range(num_rows):
+            col = 0
+            while col < num_cols:
+                span = 2 if (row * num_cols + col) % 7 == 0 and col < num_cols - 1 else 1
+                _dump_table_item(
+                    image,
+                    table,
+                    LayoutLabel.CELL,
+                    [
+                        col * col_width + jitter(col_width),
+                        row * row_height + jitter(row_height),
+                        (col + span) * col_width - jitter(col_width),
+                        (row + 1) * row_height - jitter(row_height),
+                    ],
+                )
+                col += span
+    return image
+
+
+@contextmanager
+def timer(results: dict[str, float], key: str) -> Iterator[None]:
+    """Measures the wall time of the block and stores it under `key` in `results`"""
+    start = time.perf_counter()
+    yield
+    results[key] = time.perf_counter() - start